@@ -1197,3 +1197,33 @@ def sync_entity_portraits(
         summary=PortraitSyncSummary(**data["summary"]),
         results=[PortraitSyncEntityResult(**r) for r in data["results"]],
     )
+
+
+class SocialCirclesRebuildResult(BaseModel):
+    """Row counts written by a social circles store rebuild."""
+
+    books: int
+    nodes: int
+    edges: int
+
+
+@router.post(
+    "/maintenance/social-circles-rebuild",
+    response_model=SocialCirclesRebuildResult,
+    summary="Rebuild the social circles adjacency store",
+)
+def rebuild_social_circles_store(
+    db: Session = Depends(get_db),
+    _user=Depends(require_admin),
+):
+    """Recompute the social circles node/edge tables from the books table.
+
+    Repair tool for a store that has drifted (e.g. a bulk update that bypassed
+    bulk_book_change). Cached graphs are invalidated afterwards.
+    """
+    from app.services.social_circles_cache import invalidate_cache
+    from app.services.social_circles_store import rebuild_store
+
+    counts = rebuild_store(db)
+    invalidate_cache()
+    return SocialCirclesRebuildResult(**counts)
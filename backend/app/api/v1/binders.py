@@ -18,6 +18,7 @@ from app.schemas.reference import (
 )
 from app.services.entity_matching import invalidate_entity_cache
 from app.services.entity_validation import validate_entity_creation
+from app.services.social_circles_store import bulk_book_change
 from app.services.sqs import send_entity_enrichment_job
 
 router = APIRouter()
@@ -215,7 +216,8 @@ def reassign_binder_books(
 
     # Count and reassign books
     book_count = db.query(Book).filter(Book.binder_id == binder_id).count()
-    db.query(Book).filter(Book.binder_id == binder_id).update({"binder_id": body.target_id})
+    with bulk_book_change(db, Book.binder_id == binder_id):
+        db.query(Book).filter(Book.binder_id == binder_id).update({"binder_id": body.target_id})
 
     # Store names before deletion
     source_name = source.name
@@ -11,7 +11,9 @@ from typing import Any, Literal
 
 import boto3
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 from sqlalchemy import exists, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
@@ -21,7 +23,7 @@ from app.api.v1.images import (
     generate_thumbnail,
 )
 from app.auth import require_admin, require_editor, require_viewer
-from app.cache import get_redis
+from app.cache import TAG_BOOKS, TAG_ENTITIES, get_or_compute, get_redis, invalidate_tags
 from app.config import get_settings
 from app.db import get_db
 from app.enums import OWNED_STATUSES
@@ -56,6 +58,7 @@ from app.services.analysis_parser import (
     extract_analysis_metadata,
 )
 from app.services.archive import archive_url
+from app.services.batch_scoring import calculate_and_persist_all_scores
 from app.services.bedrock import (
     build_bedrock_messages,
     extract_structured_data,
@@ -64,7 +67,7 @@ from app.services.bedrock import (
     get_model_id,
     invoke_bedrock,
 )
-from app.services.book_queries import get_other_books_by_author
+from app.services.book_projection import parse_fields, project_query, row_to_item
 from app.services.entity_validation import (
     validate_and_associate_entities,
 )
@@ -74,14 +77,17 @@ from app.services.scoring import (
     author_tier_to_score,
     calculate_all_scores_with_breakdown,
     calculate_and_persist_book_scores,
-    calculate_title_similarity,
+    find_duplicate_title,
     get_author_owned_book_count,
-    is_duplicate_title,
+    normalize_title,
+    normalized_title_similarity,
     recalculate_discount_pct,
     recalculate_roi_pct,
+    stored_normalized_title,
 )
 from app.services.social_circles import get_book_social_circles_summary
 from app.services.social_circles_cache import invalidate_cache as invalidate_social_circles_cache
+from app.services.social_circles_store import bulk_book_change
 from app.services.sqs import send_analysis_job, send_eval_runbook_job
 from app.services.tracking import process_tracking
 from app.services.tracking_poller import refresh_single_book_tracking
@@ -96,6 +102,12 @@ from app.utils.errors import (
 )
 from app.utils.image_utils import get_thumbnail_key
 from app.utils.markdown_parser import parse_analysis_markdown, strip_structured_data
+from app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    estimate_count,
+    fetch_keyset_page,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -406,6 +418,13 @@ def list_books(
             detail="Cannot specify both 'condition_grade' and 'condition_grade__isnull' - they are mutually exclusive",
         )
 
+    sparse_fields = None
+    if params.fields:
+        try:
+            sparse_fields = parse_fields(params.fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid 'fields': {e}") from None
+
     query = db.query(Book)
 
     # Track IDs truncation info
@@ -532,32 +551,86 @@ def list_books(
             # Both year_start and year_end are NULL
             query = query.filter(Book.year_start.is_(None), Book.year_end.is_(None))
 
-    # Get total count
-    total = query.count()
+    # Get total count (skippable/estimable: it re-runs the whole filter plan)
+    if params.total_mode == "none":
+        total = None
+    elif params.total_mode == "estimate":
+        total = estimate_count(db, query)
+    else:
+        total = query.count()
 
     # Apply sorting
-    sort_column = getattr(Book, params.sort_by, Book.title)
-    if params.sort_order == "desc":
-        sort_column = sort_column.desc()
-    query = query.order_by(sort_column)
-
-    # Apply pagination with eager loading to avoid N+1 queries
-    # The list endpoint accesses: analysis, eval_runbook, images
-    offset = (params.page - 1) * params.per_page
-    books = (
-        query.options(
+    sort_attr = getattr(Book, params.sort_by, Book.title)
+    sort_desc = params.sort_order == "desc"
+    next_cursor = None
+
+    if sparse_fields:
+        # Column-only SELECT: rows are tuples labelled by field name
+        query = project_query(query, sparse_fields, params.sort_by, settings.is_aws_lambda)
+    else:
+        # Eager loading to avoid N+1 queries
+        # The list endpoint accesses: analysis, eval_runbook, images
+        query = query.options(
             selectinload(Book.analysis),
             selectinload(Book.eval_runbook),
             selectinload(Book.images),
         )
-        .offset(offset)
-        .limit(params.per_page)
-        .all()
-    )
+
+    if params.cursor is not None:
+        # Keyset pagination on (sort column, id): cost is O(per_page) at any depth
+        after = None
+        if params.cursor:
+            try:
+                after = decode_cursor(params.cursor, params.sort_by, params.sort_order, sort_attr)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid 'cursor': {e}") from None
+
+        # Fetch one extra row to learn whether another page exists
+        books = fetch_keyset_page(
+            query, sort_attr, Book.id, after, sort_desc, limit=params.per_page + 1
+        )
+        if len(books) > params.per_page:
+            books = books[: params.per_page]
+            last = books[-1]
+            next_cursor = encode_cursor(
+                params.sort_by, params.sort_order, getattr(last, params.sort_by), last.id
+            )
+    else:
+        sort_column = sort_attr.desc() if sort_desc else sort_attr
+        offset = (params.page - 1) * params.per_page
+        books = query.order_by(sort_column).offset(offset).limit(params.per_page).all()
 
     # Build response
     base_url = get_api_base_url()
 
+    if sparse_fields:
+
+        def primary_image_url(book_id: int, image: Any) -> str:
+            if settings.is_aws_lambda:
+                return get_cloudfront_url(image)
+            return f"{base_url}/api/v1/books/{book_id}/images/{image}/file"
+
+        # Skip BookResponse validation entirely; serialize like pydantic would
+        return JSONResponse(
+            to_jsonable_python(
+                {
+                    "items": [row_to_item(row, sparse_fields, primary_image_url) for row in books],
+                    "total": total,
+                    "page": 1 if params.cursor is not None else params.page,
+                    "per_page": params.per_page,
+                    "pages": (
+                        (total + params.per_page - 1) // params.per_page
+                        if total is not None
+                        else None
+                    ),
+                    "next_cursor": next_cursor,
+                    "ids_truncated": ids_truncated,
+                    "ids_requested": ids_requested,
+                    "ids_processed": ids_processed,
+                }
+            )
+        )
+
     # Batch fetch active job statuses to avoid N+1 queries
     book_ids = [book.id for book in books]
     active_eval_jobs = (
@@ -618,9 +691,10 @@ def list_books(
     return BookListResponse(
         items=items,
         total=total,
-        page=params.page,
+        page=1 if params.cursor is not None else params.page,
         per_page=params.per_page,
-        pages=(total + params.per_page - 1) // params.per_page,
+        pages=(total + params.per_page - 1) // params.per_page if total is not None else None,
+        next_cursor=next_cursor,
         ids_truncated=ids_truncated,
         ids_requested=ids_requested,
         ids_processed=ids_processed,
@@ -637,29 +711,25 @@ def get_top_books(
     """Get top books by value for Collection Spotlight feature.
 
     Returns lightweight book data optimized for spotlight display.
-    Results are cached for 5 minutes in Redis.
+    Results are cached for 5 minutes (Redis plus the in-process tier) and
+    invalidated by book and entity writes.
 
     Args:
         limit: Number of books to return (default 34, ~20% of ~170 books)
         inventory_type: Filter by inventory type (default PRIMARY)
     """
     cache_key = f"books:top:{inventory_type}:{limit}"
-    client = get_redis()
-
-    if client:
-        try:
-            cached_value = client.get(cache_key)
-            if cached_value:
-                logger.debug(f"Top books cache HIT: {cache_key}")
-                import json
-
-                cached_data = json.loads(cached_value)
-                return [BookSpotlightItem(**item) for item in cached_data]
-        except Exception as e:
-            logger.warning(f"Top books cache GET failed: {e}")
+    return get_or_compute(
+        get_redis(),
+        cache_key,
+        lambda: _query_top_books(db, limit, inventory_type),
+        ttl=300,
+        tags=(TAG_BOOKS, TAG_ENTITIES),
+    )
 
-    logger.debug(f"Top books cache MISS: {cache_key}")
 
+def _query_top_books(db: Session, limit: int, inventory_type: str) -> list[dict]:
+    """Build spotlight items for the top books by value (cache miss path)."""
     books = (
         db.query(Book)
         .outerjoin(Author, Book.author_id == Author.id)
@@ -714,17 +784,7 @@ def get_top_books(
             )
         )
 
-    if client:
-        try:
-            import json
-
-            serialized = json.dumps([item.model_dump(mode="json") for item in items])
-            client.setex(cache_key, 300, serialized)
-            logger.debug(f"Top books cached: {cache_key}")
-        except Exception as e:
-            logger.warning(f"Top books cache SET failed: {e}")
-
-    return items
+    return [item.model_dump(mode="json") for item in items]
 
 
 @router.get("/{book_id}", response_model=BookResponse)
@@ -759,9 +819,11 @@ def check_duplicate(
 
     existing_books = query.all()
 
+    # Normalize the requested title once; existing books carry stored keys
+    normalized = normalize_title(request.title)
     matches = []
     for book in existing_books:
-        similarity = calculate_title_similarity(request.title, book.title)
+        similarity = normalized_title_similarity(normalized, stored_normalized_title(book))
         if similarity >= similarity_threshold:
             matches.append(
                 DuplicateMatch(
@@ -852,6 +914,7 @@ def create_book(
             # Log but don't fail book creation if job queuing fails
             logger.warning(f"Failed to queue eval runbook job for book {book.id}: {e}")
 
+    invalidate_tags(TAG_BOOKS)
     # Invalidate social circles cache if book is in owned status (appears in graph)
     if book.status in [s.value for s in OWNED_STATUSES]:
         invalidate_social_circles_cache()
@@ -923,6 +986,7 @@ def update_book(
 
     db.commit()
     db.refresh(book)
+    invalidate_tags(TAG_BOOKS)
 
     return _build_book_response(book, db)
 
@@ -995,6 +1059,7 @@ def delete_book(
         db.delete(book)
         db.commit()
         logger.info("Successfully deleted book %s", book_id)
+        invalidate_tags(TAG_BOOKS)
 
         # Invalidate social circles cache if book was in owned status
         if was_owned:
@@ -1036,6 +1101,7 @@ def update_book_status(
     book.status = status
     db.commit()
     db.refresh(book)
+    invalidate_tags(TAG_BOOKS)
 
     # Invalidate social circles cache if status changed to/from owned
     old_was_owned = old_status in owned_status_values
@@ -1068,6 +1134,7 @@ def update_book_inventory_type(
     old_type = book.inventory_type
     book.inventory_type = inventory_type
     db.commit()
+    invalidate_tags(TAG_BOOKS)
 
     return {
         "message": "Inventory type updated",
@@ -1176,6 +1243,7 @@ def acquire_book(
     db.commit()
     db.refresh(book)
 
+    invalidate_tags(TAG_BOOKS)
     # Invalidate social circles cache (book entering owned status)
     invalidate_social_circles_cache()
 
@@ -1399,7 +1467,6 @@ def get_book_score_breakdown(
     binder_tier = None
     binder_name = None
     author_book_count = 0
-    duplicate_title = None
 
     if book.author:
         author_priority = author_tier_to_score(book.author.tier)
@@ -1415,12 +1482,8 @@ def get_book_score_breakdown(
         binder_tier = book.binder.tier
         binder_name = book.binder.name
 
-    is_duplicate = False
-    for other in get_other_books_by_author(book, db):
-        if is_duplicate_title(book.title, other.title):
-            is_duplicate = True
-            duplicate_title = other.title
-            break
+    duplicate_title = find_duplicate_title(book, db)
+    is_duplicate = duplicate_title is not None
 
     result = calculate_all_scores_with_breakdown(
         purchase_price=book.purchase_price,
@@ -1452,20 +1515,11 @@ def calculate_all_book_scores(
 ):
     """Calculate scores for all books. Admin only.
 
-    Iterates every book and runs the full scoring engine.  Useful after
-    bulk data changes (e.g. entity tier updates, FMV recalculations).
+    Runs the set-based scorer over the whole collection (one load query,
+    one bulk UPDATE).  Useful after bulk data changes (e.g. entity tier
+    updates, FMV recalculations).
     """
-    books = db.query(Book).all()
-    updated = 0
-    errors = []
-
-    for book in books:
-        try:
-            calculate_and_persist_book_scores(book, db)
-            updated += 1
-        except Exception as e:
-            errors.append({"book_id": book.id, "error": str(e)})
-
+    updated, errors = calculate_and_persist_all_scores(db)
     db.commit()
 
     return {"updated_count": updated, "errors": errors}
@@ -1487,20 +1541,22 @@ def bulk_update_status(
         )
 
     # Perform the update first
-    updated = (
-        db.query(Book)
-        .filter(Book.id.in_(book_ids))
-        .update(
-            {Book.status: status},
-            synchronize_session=False,
+    with bulk_book_change(db, Book.id.in_(book_ids)):
+        updated = (
+            db.query(Book)
+            .filter(Book.id.in_(book_ids))
+            .update(
+                {Book.status: status},
+                synchronize_session=False,
+            )
         )
-    )
     db.commit()
 
     # Invalidate social circles cache if any books were updated.
     # We invalidate conservatively because we can't know pre-update status after commit.
     # The cache has TTL so over-invalidation is acceptable for correctness.
     if updated > 0:
+        invalidate_tags(TAG_BOOKS)
         invalidate_social_circles_cache()
 
     return {"message": f"Updated {updated} books", "status": status}
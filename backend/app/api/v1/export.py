@@ -2,18 +2,93 @@
 
 import csv
 import io
-from datetime import datetime
+import json
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload
 
 from app.auth import CurrentUser, require_viewer
 from app.db import get_db
-from app.models import Book
+from app.models import Book, BookTombstone
+from app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_before,
+    keyset_order,
+)
+from app.utils.parquet_writer import Column, ParquetWriter
 
 router = APIRouter()
 
+# Rows fetched per server-side cursor batch and written per response chunk
+EXPORT_BATCH_SIZE = 500
+
+# Default and maximum change feed page size (per stream)
+CHANGES_PAGE_SIZE = 500
+CHANGES_MAX_PAGE_SIZE = 1000
+
+# Longest a transaction that writes books can stay open (the 600s worker
+# Lambda timeout) plus a margin. updated_at is the writing transaction's
+# start time, so a row can commit up to this long after its timestamp; the
+# change feed only returns rows older than this so its cursor never passes
+# a write that is still in flight.
+CHANGES_SETTLE_SECONDS = 660
+
+CSV_HEADERS = [
+    "Row",
+    "Title",
+    "Author",
+    "Publisher",
+    "Date",
+    "Volumes",
+    "Category",
+    "Value_Low",
+    "Value_Mid",
+    "Value_High",
+    "Purchase_Price",
+    "Purchase_Date",
+    "Discount_Pct",
+    "ROI_Pct",
+    "Status",
+    "Notes",
+]
+
+
+def _iter_book_batches(
+    db: Session, inventory_type: str, updated_since: datetime | None = None
+) -> Iterator[Sequence[Book]]:
+    """Yield books in id order, EXPORT_BATCH_SIZE at a time.
+
+    Streams from a server-side cursor (yield_per) with author, publisher and
+    binder joined in, so neither the result set nor per-row lazy loads
+    scale with the collection.
+
+    Args:
+        db: Database session.
+        inventory_type: Inventory to export.
+        updated_since: Only books updated at or after this time.
+    """
+    stmt = (
+        select(Book)
+        .options(
+            joinedload(Book.author),
+            joinedload(Book.publisher),
+            joinedload(Book.binder),
+        )
+        .where(Book.inventory_type == inventory_type)
+        .order_by(Book.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if updated_since is not None:
+        stmt = stmt.where(Book.updated_at >= updated_since)
+    yield from db.execute(stmt).scalars().partitions()
+
 
 @router.get("/csv")
 def export_csv(
@@ -22,68 +97,54 @@ def export_csv(
     _user: CurrentUser = Depends(require_viewer),
 ):
     """Export books to CSV format matching PRIMARY_COLLECTION.csv structure."""
-    books = db.query(Book).filter(Book.inventory_type == inventory_type).order_by(Book.id).all()
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header matching PRIMARY_COLLECTION.csv format
-    headers = [
-        "Row",
-        "Title",
-        "Author",
-        "Publisher",
-        "Date",
-        "Volumes",
-        "Category",
-        "Value_Low",
-        "Value_Mid",
-        "Value_High",
-        "Purchase_Price",
-        "Purchase_Date",
-        "Discount_Pct",
-        "ROI_Pct",
-        "Status",
-        "Notes",
-    ]
-    writer.writerow(headers)
-
-    # Write data rows
-    for i, book in enumerate(books, start=1):
-        row = [
-            i,
-            book.title,
-            book.author.name if book.author else "",
-            book.publisher.name if book.publisher else "",
-            book.publication_date or "",
-            book.volumes,
-            book.category or "",
-            f"${float(book.value_low):.2f}" if book.value_low else "",
-            f"${float(book.value_mid):.2f}" if book.value_mid else "",
-            f"${float(book.value_high):.2f}" if book.value_high else "",
-            f"${float(book.purchase_price):.2f}" if book.purchase_price else "",
-            book.purchase_date.isoformat() if book.purchase_date else "",
-            f"{float(book.discount_pct):.0f}%" if book.discount_pct else "",
-            f"{float(book.roi_pct):.0f}%" if book.roi_pct else "",
-            book.status or "ON_HAND",
-            _format_notes(book),
-        ]
-        writer.writerow(row)
-
-    # Reset stream position
-    output.seek(0)
-
-    # Generate filename with date
     filename = f"{inventory_type.lower()}_collection_{datetime.now().strftime('%Y%m%d')}.csv"
 
     return StreamingResponse(
-        iter([output.getvalue()]),
+        _stream_csv(db, inventory_type),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
 
 
+def _stream_csv(db: Session, inventory_type: str) -> Iterator[str]:
+    """Yield the CSV header, then one chunk of rows per batch."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_HEADERS)
+    yield output.getvalue()
+
+    row_number = 0
+    for books in _iter_book_batches(db, inventory_type):
+        output.seek(0)
+        output.truncate()
+        for book in books:
+            row_number += 1
+            writer.writerow(_csv_row(row_number, book))
+        yield output.getvalue()
+
+
+def _csv_row(row_number: int, book: Book) -> list:
+    """Build one CSV data row."""
+    return [
+        row_number,
+        book.title,
+        book.author.name if book.author else "",
+        book.publisher.name if book.publisher else "",
+        book.publication_date or "",
+        book.volumes,
+        book.category or "",
+        f"${float(book.value_low):.2f}" if book.value_low else "",
+        f"${float(book.value_mid):.2f}" if book.value_mid else "",
+        f"${float(book.value_high):.2f}" if book.value_high else "",
+        f"${float(book.purchase_price):.2f}" if book.purchase_price else "",
+        book.purchase_date.isoformat() if book.purchase_date else "",
+        f"{float(book.discount_pct):.0f}%" if book.discount_pct else "",
+        f"{float(book.roi_pct):.0f}%" if book.roi_pct else "",
+        book.status or "ON_HAND",
+        _format_notes(book),
+    ]
+
+
 def _format_notes(book: Book) -> str:
     """Format notes field including authenticated binder info."""
     parts = []
@@ -110,47 +171,248 @@ def _format_notes(book: Book) -> str:
 @router.get("/json")
 def export_json(
     inventory_type: str = Query(default="PRIMARY"),
+    updated_since: datetime | None = Query(default=None),
     db: Session = Depends(get_db),
     _user: CurrentUser = Depends(require_viewer),
 ):
-    """Export books to JSON format with all details."""
-    books = db.query(Book).filter(Book.inventory_type == inventory_type).order_by(Book.id).all()
+    """Export books as NDJSON (one JSON object per line) with all details."""
+    filename = f"{inventory_type.lower()}_collection_{datetime.now().strftime('%Y%m%d')}.ndjson"
+
+    return StreamingResponse(
+        _stream_ndjson(db, inventory_type, updated_since),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
 
+def _stream_ndjson(
+    db: Session, inventory_type: str, updated_since: datetime | None
+) -> Iterator[str]:
+    """Yield one chunk of NDJSON lines per batch."""
+    for books in _iter_book_batches(db, inventory_type, updated_since):
+        yield "".join(json.dumps(_book_record(book)) + "\n" for book in books)
+
+
+def _book_values(book: Book) -> dict:
+    """Export fields for one book with their database types (Decimal, date)."""
     return {
-        "export_date": datetime.now().isoformat(),
-        "inventory_type": inventory_type,
-        "total_items": len(books),
-        "books": [
-            {
-                "id": book.id,
-                "title": book.title,
-                "author": book.author.name if book.author else None,
-                "publisher": book.publisher.name if book.publisher else None,
-                "publisher_tier": book.publisher.tier if book.publisher else None,
-                "binder": book.binder.name if book.binder else None,
-                "binding_authenticated": book.binding_authenticated,
-                "publication_date": book.publication_date,
-                "year_start": book.year_start,
-                "year_end": book.year_end,
-                "edition": book.edition,
-                "volumes": book.volumes,
-                "category": book.category,
-                "binding_type": book.binding_type,
-                "binding_description": book.binding_description,
-                "condition_grade": book.condition_grade,
-                "condition_notes": book.condition_notes,
-                "value_low": float(book.value_low) if book.value_low else None,
-                "value_mid": float(book.value_mid) if book.value_mid else None,
-                "value_high": float(book.value_high) if book.value_high else None,
-                "purchase_price": float(book.purchase_price) if book.purchase_price else None,
-                "purchase_date": book.purchase_date.isoformat() if book.purchase_date else None,
-                "purchase_source": book.purchase_source,
-                "discount_pct": float(book.discount_pct) if book.discount_pct else None,
-                "roi_pct": float(book.roi_pct) if book.roi_pct else None,
-                "status": book.status,
-                "notes": book.notes,
-                "provenance": book.provenance,
-            }
-            for book in books
+        "id": book.id,
+        "title": book.title,
+        "author": book.author.name if book.author else None,
+        "publisher": book.publisher.name if book.publisher else None,
+        "publisher_tier": book.publisher.tier if book.publisher else None,
+        "binder": book.binder.name if book.binder else None,
+        "binding_authenticated": book.binding_authenticated,
+        "publication_date": book.publication_date,
+        "year_start": book.year_start,
+        "year_end": book.year_end,
+        "edition": book.edition,
+        "volumes": book.volumes,
+        "category": book.category,
+        "binding_type": book.binding_type,
+        "binding_description": book.binding_description,
+        "condition_grade": book.condition_grade,
+        "condition_notes": book.condition_notes,
+        "value_low": book.value_low,
+        "value_mid": book.value_mid,
+        "value_high": book.value_high,
+        "purchase_price": book.purchase_price,
+        "purchase_date": book.purchase_date,
+        "purchase_source": book.purchase_source,
+        "discount_pct": book.discount_pct,
+        "roi_pct": book.roi_pct,
+        "status": book.status,
+        "notes": book.notes,
+        "provenance": book.provenance,
+        "updated_at": book.updated_at,
+    }
+
+
+def _book_record(book: Book) -> dict:
+    """Build the JSON export record for one book."""
+    record = _book_values(book)
+    for key, value in record.items():
+        if isinstance(value, Decimal):
+            record[key] = float(value) if value else None
+        elif isinstance(value, date):
+            record[key] = value.isoformat()
+    return record
+
+
+# Parquet columns: the JSON export fields with exact types
+PARQUET_COLUMNS = [
+    Column("id", "int64"),
+    Column("title", "string"),
+    Column("author", "string"),
+    Column("publisher", "string"),
+    Column("publisher_tier", "string"),
+    Column("binder", "string"),
+    Column("binding_authenticated", "bool"),
+    Column("publication_date", "string"),
+    Column("year_start", "int32"),
+    Column("year_end", "int32"),
+    Column("edition", "string"),
+    Column("volumes", "int32"),
+    Column("category", "string"),
+    Column("binding_type", "string"),
+    Column("binding_description", "string"),
+    Column("condition_grade", "string"),
+    Column("condition_notes", "string"),
+    Column("value_low", "decimal", 10, 2),
+    Column("value_mid", "decimal", 10, 2),
+    Column("value_high", "decimal", 10, 2),
+    Column("purchase_price", "decimal", 10, 2),
+    Column("purchase_date", "date"),
+    Column("purchase_source", "string"),
+    Column("discount_pct", "decimal", 6, 2),
+    Column("roi_pct", "decimal", 7, 2),
+    Column("status", "string"),
+    Column("notes", "string"),
+    Column("provenance", "string"),
+    Column("updated_at", "timestamp"),
+]
+
+
+@router.get("/parquet")
+def export_parquet(
+    inventory_type: str = Query(default="PRIMARY"),
+    updated_since: datetime | None = Query(default=None),
+    db: Session = Depends(get_db),
+    _user: CurrentUser = Depends(require_viewer),
+):
+    """Export books as Parquet with decimal, date and timestamp columns.
+
+    Same fields as /json. Pass updated_since for incremental pulls.
+    """
+    filename = f"{inventory_type.lower()}_collection_{datetime.now().strftime('%Y%m%d')}.parquet"
+
+    return StreamingResponse(
+        _stream_parquet(db, inventory_type, updated_since),
+        media_type="application/vnd.apache.parquet",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+def _stream_parquet(
+    db: Session, inventory_type: str, updated_since: datetime | None
+) -> Iterator[bytes]:
+    """Write one row group per batch and yield the bytes as they are written."""
+    writer = ParquetWriter(PARQUET_COLUMNS)
+    yield writer.start()
+    for books in _iter_book_batches(db, inventory_type, updated_since):
+        yield writer.row_group([_book_values(book) for book in books])
+    yield writer.finish()
+
+
+def _encode_changes_cursor(book_after: str, tombstone_after: str) -> str:
+    """Join the per-stream keyset tokens ("" = stream not started)."""
+    return f"{book_after}.{tombstone_after}"
+
+
+def _decode_changes_cursor(
+    cursor: str,
+) -> tuple[tuple[datetime, int] | None, tuple[datetime, int] | None]:
+    """Split a change feed cursor into (updated_at, id) and (deleted_at, id) positions.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    book_token, sep, tombstone_token = cursor.partition(".")
+    if not sep:
+        raise ValueError("Malformed cursor")
+    book_after = (
+        decode_cursor(book_token, "updated_at", "asc", Book.updated_at) if book_token else None
+    )
+    tombstone_after = (
+        decode_cursor(tombstone_token, "deleted_at", "asc", BookTombstone.deleted_at)
+        if tombstone_token
+        else None
+    )
+    return book_after, tombstone_after
+
+
+@router.get("/changes")
+def export_changes(
+    since: datetime | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=CHANGES_PAGE_SIZE, ge=1, le=CHANGES_MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    _user: CurrentUser = Depends(require_viewer),
+):
+    """Change feed: books upserted or deleted since a watermark.
+
+    Start with ``since`` (omit it for a full initial sync), then pass back
+    ``next_cursor``. It is returned even when ``has_more`` is false, so
+    consumers can store it as the watermark for their next sync. Upserts
+    (by updated_at) and deletes (by tombstone deleted_at) page
+    independently, up to ``limit`` each. Applying a page's upserts, then its
+    deletes, is always correct because book IDs are never reused.
+
+    Only changes older than CHANGES_SETTLE_SECONDS (by the database clock)
+    are returned; newer ones appear once they have settled.
+    """
+    # since is the position just before (since, id 0) in both streams
+    book_after = tombstone_after = (since, 0) if since is not None else None
+    if cursor:
+        try:
+            book_after, tombstone_after = _decode_changes_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid 'cursor': {e}") from None
+
+    dialect_name = db.get_bind().dialect.name
+    horizon = db.execute(select(func.now())).scalar_one() - timedelta(
+        seconds=CHANGES_SETTLE_SECONDS
+    )
+    book_stmt = (
+        select(Book)
+        .options(
+            joinedload(Book.author),
+            joinedload(Book.publisher),
+            joinedload(Book.binder),
+        )
+        .where(keyset_before(Book.updated_at, horizon, dialect_name))
+        .order_by(*keyset_order(Book.updated_at, Book.id, False, dialect_name))
+        .limit(limit + 1)
+    )
+    if book_after is not None:
+        book_stmt = book_stmt.where(
+            keyset_after(Book.updated_at, Book.id, *book_after, False, dialect_name)
+        )
+    tombstone_stmt = (
+        select(BookTombstone)
+        .where(keyset_before(BookTombstone.deleted_at, horizon, dialect_name))
+        .order_by(*keyset_order(BookTombstone.deleted_at, BookTombstone.id, False, dialect_name))
+        .limit(limit + 1)
+    )
+    if tombstone_after is not None:
+        tombstone_stmt = tombstone_stmt.where(
+            keyset_after(
+                BookTombstone.deleted_at, BookTombstone.id, *tombstone_after, False, dialect_name
+            )
+        )
+
+    books = list(db.scalars(book_stmt))
+    tombstones = list(db.scalars(tombstone_stmt))
+    has_more = len(books) > limit or len(tombstones) > limit
+    books, tombstones = books[:limit], tombstones[:limit]
+
+    if books:
+        book_after = (books[-1].updated_at, books[-1].id)
+    if tombstones:
+        tombstone_after = (tombstones[-1].deleted_at, tombstones[-1].id)
+    next_cursor = _encode_changes_cursor(
+        encode_cursor("updated_at", "asc", *book_after) if book_after else "",
+        encode_cursor("deleted_at", "asc", *tombstone_after) if tombstone_after else "",
+    )
+
+    return {
+        "upserts": [
+            {**_book_record(book), "inventory_type": book.inventory_type} for book in books
+        ],
+        "deletes": [
+            {"id": tombstone.book_id, "deleted_at": tombstone.deleted_at.isoformat()}
+            for tombstone in tombstones
         ],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
     }
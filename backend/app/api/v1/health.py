@@ -34,6 +34,7 @@ from app.db.migration_sql import (
     MIGRATIONS as migrations,
 )
 from app.models import Book
+from app.services.title_keys import backfill_title_keys
 from app.version import get_version, get_version_info
 
 router = APIRouter()
@@ -1197,6 +1198,14 @@ async def run_migrations(
                 except Exception as e:
                     errors.append({"sql": f"setval({table}_id_seq)", "error": str(e)})
 
+        if version == "f7b2c5d4e1a6":
+            # Title keys come from Python regexes, so fill them after the columns exist
+            try:
+                count = backfill_title_keys(db)
+                results.append({"sql": f"backfill_title_keys ({count} books)", "status": "success"})
+            except Exception as e:
+                errors.append({"sql": "backfill_title_keys", "error": str(e)})
+
     # Update alembic_version to final version
     try:
         if current_version:
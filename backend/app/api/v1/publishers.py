@@ -18,6 +18,7 @@ from app.schemas.reference import (
 )
 from app.services.entity_matching import invalidate_entity_cache
 from app.services.entity_validation import validate_entity_creation
+from app.services.social_circles_store import bulk_book_change
 from app.services.sqs import send_entity_enrichment_job
 
 router = APIRouter()
@@ -225,9 +226,10 @@ def reassign_publisher_books(
 
     # Count and reassign books
     book_count = db.query(Book).filter(Book.publisher_id == publisher_id).count()
-    db.query(Book).filter(Book.publisher_id == publisher_id).update(
-        {"publisher_id": body.target_id}
-    )
+    with bulk_book_change(db, Book.publisher_id == publisher_id):
+        db.query(Book).filter(Book.publisher_id == publisher_id).update(
+            {"publisher_id": body.target_id}
+        )
 
     # Store names before deletion
     source_name = source.name
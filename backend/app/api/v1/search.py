@@ -1,96 +1,74 @@
 """Search API endpoints."""
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session, aliased, joinedload
 
 from app.db import get_db
 from app.models import Book, BookAnalysis
 
 router = APIRouter()
 
-# Max results per type when combining (prevents memory bomb on broad searches)
-_MAX_COMBINED_RESULTS_PER_TYPE = 500
+# Text search configuration - must match the search_vector triggers
+# (migration c4d9e2f1a8b3) or the GIN indexes won't match the query.
+_TS_CONFIG = "english"
+
+# Plain-text headlines: the frontend renders snippets as text, not HTML.
+_HEADLINE_OPTIONS = 'StartSel="", StopSel="", MaxWords=35, MinWords=15, MaxFragments=1'
+
+# Secondary sort key for scope=all: books before analyses, as before
+_TYPE_ORDER = {"book": 0, "analysis": 1}
 
 
 @router.get("")
 def search(
     q: str = Query(..., min_length=1),
     scope: str = Query(default="all", pattern="^(all|books|analyses)$"),
+    sort: str = Query(default="id", pattern="^(id|relevance)$"),
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
     db: Session = Depends(get_db),
 ):
     """Full-text search across books and analyses.
 
-    Note: Total count is computed before fetching results. In rare cases with
-    concurrent modifications, the actual result count may differ slightly.
+    On PostgreSQL, matches use the trigger-maintained ``search_vector`` columns
+    (GIN indexed), ``sort=relevance`` orders by ``ts_rank`` and snippets come
+    from ``ts_headline``. Other dialects (SQLite in tests), and queries made up
+    entirely of stop words, fall back to substring matching in ID order.
+
+    ``scope=all`` runs a single UNION ALL query: ordering, LIMIT/OFFSET and the
+    combined total (``COUNT(*) OVER ()``) are all computed in the database.
+
+    Note: For single-type scopes the total count is computed before fetching
+    results. In rare cases with concurrent modifications, the actual result
+    count may differ slightly.
     """
     offset = (page - 1) * per_page
-    results = []
-    total = 0
-
-    # Build book query with eager loading and deterministic ordering
-    book_query = None
-    if scope in ("all", "books"):
-        book_query = (
-            db.query(Book)
-            .options(joinedload(Book.author))
-            .filter(
-                or_(
-                    Book.title.ilike(f"%{q}%"),
-                    Book.notes.ilike(f"%{q}%"),
-                    Book.binding_description.ilike(f"%{q}%"),
-                )
-            )
-            .order_by(Book.id)
-        )
-        total += book_query.count()
 
-    # Build analysis query with eager loading and deterministic ordering
-    analysis_query = None
-    if scope in ("all", "analyses"):
-        analysis_query = (
-            db.query(BookAnalysis)
-            .options(joinedload(BookAnalysis.book))
-            .filter(
-                or_(
-                    BookAnalysis.executive_summary.ilike(f"%{q}%"),
-                    BookAnalysis.full_markdown.ilike(f"%{q}%"),
-                )
-            )
-            .order_by(BookAnalysis.id)
-        )
-        total += analysis_query.count()
+    tsquery = _build_tsquery(db, q)
+    by_relevance = sort == "relevance" and tsquery is not None
 
-    # Handle pagination based on scope
     if scope == "books":
-        books = book_query.offset(offset).limit(per_page).all()
-        for book in books:
-            results.append(_book_to_result(book, q))
+        book_query, total = _book_search(db, q, tsquery, by_relevance)
+        results = [
+            _book_to_result(book, q, snippet)
+            for book, snippet in book_query.offset(offset).limit(per_page).all()
+        ]
 
     elif scope == "analyses":
-        analyses = analysis_query.offset(offset).limit(per_page).all()
-        for analysis in analyses:
-            results.append(_analysis_to_result(analysis, q))
+        analysis_query, total = _analysis_search(db, q, tsquery, by_relevance)
+        results = [
+            _analysis_to_result(analysis, q, snippet)
+            for analysis, snippet in analysis_query.offset(offset).limit(per_page).all()
+        ]
 
     else:
-        # scope == "all": Combine results, then paginate in memory
-        # Cap results per type to prevent memory issues on broad searches
-        all_results = []
-        if book_query:
-            for book in book_query.limit(_MAX_COMBINED_RESULTS_PER_TYPE).all():
-                all_results.append(_book_to_result(book, q))
-        if analysis_query:
-            for analysis in analysis_query.limit(_MAX_COMBINED_RESULTS_PER_TYPE).all():
-                all_results.append(_analysis_to_result(analysis, q))
-
-        # Apply pagination to combined results
-        results = all_results[offset : offset + per_page]
+        results, total = _combined_search(db, q, tsquery, by_relevance, offset, per_page)
 
     return {
         "query": q,
         "scope": scope,
+        "sort": "relevance" if by_relevance else "id",
         "total": total,
         "page": page,
         "per_page": per_page,
@@ -98,30 +76,232 @@ def search(
     }
 
 
-def _book_to_result(book: Book, q: str) -> dict:
+def _build_tsquery(db: Session, q: str):
+    """Return a tsquery expression for q, or None to use substring matching.
+
+    websearch_to_tsquery accepts arbitrary user input (quotes, OR, -term)
+    without raising. A query consisting only of stop words compiles to an
+    empty tsquery that matches nothing, so those fall back to ILIKE.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+
+    tsquery = func.websearch_to_tsquery(_TS_CONFIG, q)
+    if not db.execute(select(func.numnode(tsquery))).scalar():
+        return None
+    return tsquery
+
+
+def _book_match(q: str, tsquery):
+    """Return (filter, rank) expressions for matching books."""
+    if tsquery is None:
+        match = or_(
+            Book.title.ilike(f"%{q}%"),
+            Book.notes.ilike(f"%{q}%"),
+            Book.binding_description.ilike(f"%{q}%"),
+        )
+        return match, literal(0.0)
+    return Book.search_vector.op("@@")(tsquery), func.ts_rank(Book.search_vector, tsquery)
+
+
+def _analysis_match(q: str, tsquery):
+    """Return (filter, rank) expressions for matching analyses."""
+    if tsquery is None:
+        match = or_(
+            BookAnalysis.executive_summary.ilike(f"%{q}%"),
+            BookAnalysis.full_markdown.ilike(f"%{q}%"),
+        )
+        return match, literal(0.0)
+    return (
+        BookAnalysis.search_vector.op("@@")(tsquery),
+        func.ts_rank(BookAnalysis.search_vector, tsquery),
+    )
+
+
+def _book_snippet_source(book):
+    """Text a book snippet is cut from (book may be an alias)."""
+    return func.coalesce(func.nullif(book.notes, ""), func.nullif(book.binding_description, ""), "")
+
+
+def _analysis_snippet_source(analysis):
+    """Text an analysis snippet is cut from (analysis may be an alias)."""
+    return func.coalesce(
+        func.nullif(analysis.executive_summary, ""), func.nullif(analysis.full_markdown, ""), ""
+    )
+
+
+def _snippet(source, tsquery):
+    """ts_headline over source, or NULL when the caller should use _get_snippet."""
+    if tsquery is None:
+        return literal(None)
+    return func.ts_headline(_TS_CONFIG, source, tsquery, _HEADLINE_OPTIONS)
+
+
+def _book_search(db: Session, q: str, tsquery, by_relevance: bool):
+    """Build the (Book, snippet) query and its match count."""
+    match, rank = _book_match(q, tsquery)
+    snippet = _snippet(_book_snippet_source(Book), tsquery)
+
+    query = db.query(Book, snippet.label("snippet")).options(joinedload(Book.author)).filter(match)
+    if by_relevance:
+        query = query.order_by(rank.desc(), Book.id)
+    else:
+        query = query.order_by(Book.id)
+
+    # Count over the bare filter so ts_headline isn't evaluated per row
+    count = db.query(func.count(Book.id)).filter(match).scalar()
+    return query, count
+
+
+def _analysis_search(db: Session, q: str, tsquery, by_relevance: bool):
+    """Build the (BookAnalysis, snippet) query and its match count."""
+    match, rank = _analysis_match(q, tsquery)
+    snippet = _snippet(_analysis_snippet_source(BookAnalysis), tsquery)
+
+    query = (
+        db.query(BookAnalysis, snippet.label("snippet"))
+        .options(joinedload(BookAnalysis.book))
+        .filter(match)
+    )
+    if by_relevance:
+        query = query.order_by(rank.desc(), BookAnalysis.id)
+    else:
+        query = query.order_by(BookAnalysis.id)
+
+    count = db.query(func.count(BookAnalysis.id)).filter(match).scalar()
+    return query, count
+
+
+def _combined_search(
+    db: Session, q: str, tsquery, by_relevance: bool, offset: int, limit: int
+) -> tuple[list[dict], int]:
+    """Search books and analyses with one UNION ALL query paginated in SQL.
+
+    The inner union carries only (type, id, rank) so sorting never drags
+    large text columns along. Only the page's books and analyses are then
+    loaded and converted with the same builders the single-type scopes use.
+    """
+    book_match, book_rank = _book_match(q, tsquery)
+    analysis_match, analysis_rank = _analysis_match(q, tsquery)
+
+    matches = union_all(
+        select(
+            literal("book").label("type"),
+            literal(_TYPE_ORDER["book"]).label("type_order"),
+            Book.id.label("id"),
+            book_rank.label("rank"),
+        ).where(book_match),
+        select(
+            literal("analysis").label("type"),
+            literal(_TYPE_ORDER["analysis"]).label("type_order"),
+            BookAnalysis.id.label("id"),
+            analysis_rank.label("rank"),
+        ).where(analysis_match),
+    ).subquery("matches")
+
+    if by_relevance:
+        ordering = [matches.c.rank.desc(), matches.c.type_order, matches.c.id]
+    else:
+        ordering = [matches.c.type_order, matches.c.id]
+
+    page = (
+        select(matches, func.count().over().label("total"))
+        .order_by(*ordering)
+        .offset(offset)
+        .limit(limit)
+        .subquery("page")
+    )
+
+    page_ordering = (
+        [page.c.rank.desc(), page.c.type_order, page.c.id]
+        if by_relevance
+        else [page.c.type_order, page.c.id]
+    )
+    page_query = select(page.c.type, page.c.id, page.c.total)
+    if tsquery is not None:
+        # ts_headline runs in SQL for just the page's rows
+        book = aliased(Book)
+        analysis = aliased(BookAnalysis)
+        source = case(
+            (page.c.type == "book", _book_snippet_source(book)),
+            else_=_analysis_snippet_source(analysis),
+        )
+        page_query = (
+            page_query.add_columns(_snippet(source, tsquery).label("snippet"))
+            .select_from(page)
+            .outerjoin(book, (page.c.type == "book") & (book.id == page.c.id))
+            .outerjoin(analysis, (page.c.type == "analysis") & (analysis.id == page.c.id))
+        )
+    else:
+        page_query = page_query.add_columns(literal(None).label("snippet"))
+    rows = db.execute(page_query.order_by(*page_ordering)).all()
+
+    if rows:
+        total = rows[0].total
+    else:
+        # Past the last page the window has no rows to report a count on
+        total = db.query(func.count()).select_from(matches).scalar() if offset else 0
+
+    book_ids = [row.id for row in rows if row.type == "book"]
+    analysis_ids = [row.id for row in rows if row.type == "analysis"]
+    books = (
+        {
+            book.id: book
+            for book in db.query(Book)
+            .options(joinedload(Book.author))
+            .filter(Book.id.in_(book_ids))
+        }
+        if book_ids
+        else {}
+    )
+    analyses = (
+        {
+            analysis.id: analysis
+            for analysis in db.query(BookAnalysis)
+            .options(joinedload(BookAnalysis.book))
+            .filter(BookAnalysis.id.in_(analysis_ids))
+        }
+        if analysis_ids
+        else {}
+    )
+
+    results = []
+    for row in rows:
+        if row.type == "book" and row.id in books:
+            results.append(_book_to_result(books[row.id], q, row.snippet))
+        elif row.type == "analysis" and row.id in analyses:
+            results.append(_analysis_to_result(analyses[row.id], q, row.snippet))
+    return results, total
+
+
+def _book_to_result(book: Book, q: str, snippet: str | None = None) -> dict:
     """Convert a Book to a search result dict."""
+    if snippet is None:
+        snippet = _get_snippet(book.notes or book.binding_description or "", q)
     return {
         "type": "book",
         "id": book.id,
         "title": book.title,
         "author": book.author.name if book.author else None,
-        "snippet": _get_snippet(book.notes or book.binding_description or "", q),
+        "snippet": snippet,
     }
 
 
-def _analysis_to_result(analysis: BookAnalysis, q: str) -> dict:
+def _analysis_to_result(analysis: BookAnalysis, q: str, snippet: str | None = None) -> dict:
     """Convert a BookAnalysis to a search result dict."""
+    if snippet is None:
+        snippet = _get_snippet(analysis.executive_summary or analysis.full_markdown or "", q)
     return {
         "type": "analysis",
         "id": analysis.id,
         "book_id": analysis.book_id,
         "title": analysis.book.title if analysis.book else "Unknown",
-        "snippet": _get_snippet(analysis.executive_summary or analysis.full_markdown or "", q),
+        "snippet": snippet,
     }
 
 
 def _get_snippet(text: str, query: str, context_chars: int = 100) -> str:
-    """Extract a snippet around the query match."""
+    """Extract a snippet around the query match (non-PostgreSQL fallback)."""
     if not text:
         return ""
 
@@ -4,7 +4,7 @@
 
 import time
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.auth import require_viewer
@@ -16,6 +16,7 @@ from app.schemas.social_circles import (
     SocialCirclesResponse,
 )
 from app.services.social_circles import build_social_circles_graph
+from app.services.social_circles_cache import get_graph_json
 
 router = APIRouter()
 
@@ -45,11 +46,11 @@ def get_social_circles(
         le=100,
         description="Minimum books for an entity to be included (max 100)",
     ),
-    max_books: int = Query(
-        5000,
+    max_books: int | None = Query(
+        None,
         ge=100,
         le=10000,
-        description="Maximum books to process (100-10000, default 5000)",
+        description="Optional cap on books processed (100-10000, default: no cap)",
     ),
     era: list[Era] | None = Query(
         None,
@@ -57,8 +58,20 @@ def get_social_circles(
     ),
     db: Session = Depends(get_db),
     _user_info=Depends(require_viewer),
-) -> SocialCirclesResponse:
-    """Get the social circles network graph."""
+) -> SocialCirclesResponse | Response:
+    """Get the social circles network graph.
+
+    Unfiltered requests (no era) are served from the Redis graph cache as
+    pre-serialized JSON, with an ``X-Cache: HIT|MISS`` header.
+    """
+    if not era:
+        body, is_hit = get_graph_json(db, include_binders, min_book_count, max_books)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"X-Cache": "HIT" if is_hit else "MISS"},
+        )
+
     return build_social_circles_graph(
         db=db,
         include_binders=include_binders,
@@ -81,8 +94,8 @@ def social_circles_health(
     start = time.monotonic()
 
     try:
-        # Build graph to measure performance (use smaller limit for health check)
-        result = build_social_circles_graph(db, max_books=1000)
+        # Build graph to measure performance
+        result = build_social_circles_graph(db)
         build_time = (time.monotonic() - start) * 1000
 
         # Count nodes by type
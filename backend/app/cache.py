@@ -1,23 +1,78 @@
-"""Redis caching utilities for dashboard stats.
+"""Redis caching utilities for dashboard stats and other expensive reads.
 
-Provides a simple caching decorator with graceful degradation.
-When Redis is unavailable, functions execute normally without caching.
+Provides a caching decorator (and the underlying get_or_compute helper) with
+graceful degradation. When Redis is unavailable, functions execute normally
+without caching.
+
+Features:
+- Argument-aware keys: decorated functions get one entry per distinct call
+  arguments (sessions and other excluded parameters don't affect the key).
+- Tag invalidation: entries are keyed by the current generation of each of
+  their tags (e.g. ``books``, ``entities``). Write paths call
+  invalidate_tags(), which bumps the generation so every dependent entry is
+  bypassed at once and left to expire by TTL.
+- Single-flight recompute: on a miss, one caller takes a short Redis lock and
+  recomputes; concurrent callers wait for its result instead of running the
+  same heavy queries.
+- Stale-while-revalidate: with ``stale_ttl``, an expired entry is kept for a
+  grace period. One caller refreshes it while the rest keep serving the
+  stale value.
+- In-process tier: hits are also kept in a small LRU/TTL cache inside the
+  warm container (see LocalCache), so repeated reads skip Redis I/O and JSON
+  parsing entirely. Every Redis-side invalidation bumps a shared generation
+  key that clears the local tier on all containers.
+
+Entries are encoded with app.utils.cache_codec: plain JSON when small,
+zlib-compressed behind a versioned header when large.
 """
 
+import hashlib
+import inspect
 import json
 import logging
-from collections.abc import Callable
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
 from functools import wraps
 from typing import Any
 
 import redis
 
 from app.config import get_settings
+from app.utils import cache_codec
 
 logger = logging.getLogger(__name__)
 
 _redis_client: redis.Redis | None = None
 
+# Cache tags - invalidated by the write paths that change the underlying data
+TAG_BOOKS = "books"
+TAG_ENTITIES = "entities"
+
+TAG_KEY_PREFIX = "cache:tag"
+
+# Bumped on every invalidation; containers drop their local tier when it changes
+LOCAL_GENERATION_KEY = "cache:local:generation"
+
+# Single-flight lock: held while one caller recomputes an entry
+LOCK_TIMEOUT_SECONDS = 30
+# How long other callers wait for the lock holder's result before computing themselves
+LOCK_WAIT_SECONDS = 5.0
+LOCK_POLL_SECONDS = 0.05
+
+# Sentinel for "nothing usable in the cache"
+_MISS = object()
+
+# Deletes the lock only if this caller still holds it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 def _reset_client() -> None:
     """Reset the cached client (for testing)."""
@@ -39,7 +94,8 @@ def get_redis() -> redis.Redis | None:
             try:
                 _redis_client = redis.from_url(
                     settings.redis_url,
-                    decode_responses=True,
+                    # Values are codec bytes (see app.utils.cache_codec)
+                    decode_responses=False,
                     socket_connect_timeout=2,
                     socket_timeout=2,
                 )
@@ -49,51 +105,322 @@ def get_redis() -> redis.Redis | None:
     return _redis_client
 
 
-def cached(key: str, ttl: int = 300) -> Callable:
+class LocalCache:
+    """Bounded in-process LRU cache with per-entry TTL.
+
+    Sits in front of Redis so hot keys are served from memory for the life of
+    a warm container. Consistency with Redis comes from LOCAL_GENERATION_KEY:
+    the tier re-reads it at most every ``check_interval`` seconds and clears
+    itself when it has moved, so a write on any container is visible
+    everywhere within that interval (immediately on the writing container).
+
+    Values are shared between callers and must be treated as read-only.
+    Only used when Redis is configured - without the generation key there
+    is no way to hear about invalidations.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, check_interval: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: int | None = None
+        self._checked_at = 0.0
+
+    def _sync_generation(self, client: redis.Redis) -> bool:
+        """Clear the tier if the shared generation moved; False if it can't be read."""
+        now = time.monotonic()
+        if self._generation is not None and now - self._checked_at < self.check_interval:
+            return True
+        try:
+            values: Any = client.mget([LOCAL_GENERATION_KEY])
+            (raw,) = values
+            generation = int(raw or 0)
+        except Exception as e:
+            logger.warning(f"Local cache generation check failed: {e}")
+            self.clear()
+            return False
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+            self._checked_at = now
+        return True
+
+    def get(self, client: redis.Redis, key: str) -> Any:
+        """Return the local value for key, or None on a miss."""
+        if self.max_entries <= 0 or not self._sync_generation(client):
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value for min(ttl, self.ttl) seconds, evicting the LRU entry if full."""
+        if self.max_entries <= 0 or self._generation is None:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + min(ttl, self.ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and force a generation re-check on next use."""
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+
+
+_settings = get_settings()
+local_cache = LocalCache(
+    max_entries=_settings.cache_local_max_entries,
+    ttl=_settings.cache_local_ttl_seconds,
+    check_interval=_settings.cache_local_generation_check_seconds,
+)
+
+
+def invalidate_local(client: redis.Redis | None = None) -> None:
+    """Clear the in-process tier here and, via the generation key, everywhere else."""
+    local_cache.clear()
+    client = client or get_redis()
+    if not client:
+        return
+    try:
+        client.incr(LOCAL_GENERATION_KEY)
+    except Exception as e:
+        logger.warning(f"Redis INCR failed for {LOCAL_GENERATION_KEY}: {e}")
+
+
+def invalidate_tags(*tags: str) -> None:
+    """Invalidate every cache entry carrying any of the given tags.
+
+    Bumps each tag's generation counter. Entries built under the old
+    generation are no longer looked up and expire on their own TTL.
+    """
+    client = get_redis()
+    if not client or not tags:
+        return
+    for tag in tags:
+        try:
+            client.incr(f"{TAG_KEY_PREFIX}:{tag}")
+            logger.debug(f"Cache tag invalidated: {tag}")
+        except Exception as e:
+            logger.warning(f"Redis INCR failed for tag {tag}: {e}")
+    invalidate_local(client)
+
+
+def _tagged_key(client: redis.Redis, key: str, tags: Sequence[str]) -> str:
+    """Append the current generation of each tag to key."""
+    if not tags:
+        return key
+    generations: Any = client.mget([f"{TAG_KEY_PREFIX}:{tag}" for tag in tags])
+    return f"{key}:g" + ".".join(str(int(g or 0)) for g in generations)
+
+
+def _store(client: redis.Redis, key: str, value: Any, ttl: int, stale_ttl: int) -> None:
+    """Write value (and its freshness marker when serving stale is enabled)."""
+    try:
+        serialized = cache_codec.encode(value)
+        client.setex(key, ttl + stale_ttl, serialized)
+        if stale_ttl:
+            client.set(f"{key}:fresh", "1", ex=ttl)
+        logger.debug(f"Cached {key} with TTL {ttl}s (+{stale_ttl}s stale)")
+    except Exception as e:
+        logger.warning(f"Redis SETEX failed for {key}: {e}")
+
+
+def _acquire_lock(client: redis.Redis, key: str) -> str | None:
+    """Try to take the recompute lock for key; return its token if acquired."""
+    token = uuid.uuid4().hex
+    try:
+        if client.set(f"{key}:lock", token, nx=True, ex=LOCK_TIMEOUT_SECONDS):
+            return token
+    except Exception as e:
+        logger.warning(f"Redis lock failed for {key}: {e}")
+        # Without Redis coordination every caller computes, as before
+        return token
+    return None
+
+
+def _release_lock(client: redis.Redis, key: str, token: str) -> None:
+    try:
+        client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{key}:lock", token)
+    except Exception as e:
+        logger.warning(f"Redis lock release failed for {key}: {e}")
+
+
+def _decode(key: str, cached_value: Any) -> Any:
+    """Deserialize a cached value, or return _MISS if it can't be read."""
+    try:
+        return cache_codec.decode(cached_value)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+        return _MISS
+
+
+def _wait_for_value(client: redis.Redis, key: str) -> Any:
+    """Poll for the lock holder's result, up to LOCK_WAIT_SECONDS."""
+    deadline = time.monotonic() + LOCK_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_SECONDS)
+        try:
+            value = client.get(key)
+        except Exception as e:
+            logger.warning(f"Redis GET failed for {key}: {e}")
+            return _MISS
+        if value:
+            return _decode(key, value)
+    return _MISS
+
+
+def get_or_compute(
+    client: redis.Redis | None,
+    key: str,
+    compute: Callable[[], Any],
+    ttl: int = 300,
+    tags: Sequence[str] = (),
+    stale_ttl: int = 0,
+    local: bool = True,
+) -> Any:
+    """Return the cached value for key, computing and storing it on a miss.
+
+    Args:
+        client: Redis client, or None to always compute.
+        key: Base cache key (tag generations are appended).
+        compute: Zero-argument callable producing a JSON-serializable value.
+        ttl: Seconds the value is considered fresh.
+        tags: Invalidation tags the value depends on.
+        stale_ttl: Extra seconds a stale value may be served while one caller
+            refreshes it. 0 disables stale serving.
+        local: Also keep fresh values in the in-process tier. The returned
+            object is then shared, so callers must not mutate it.
+
+    Returns:
+        The cached or freshly computed value.
+    """
+    if not client:
+        return compute()
+
+    # The local tier is keyed without tag generations: any tag bump also
+    # bumps the local generation, which clears it
+    base_key = key
+    if local:
+        value = local_cache.get(client, base_key)
+        if value is not None:
+            logger.debug(f"Local cache HIT: {base_key}")
+            return value
+
+    try:
+        key = _tagged_key(client, key, tags)
+        cached_value = client.get(key)
+    except Exception as e:
+        logger.warning(f"Redis GET failed for {key}: {e}")
+        return compute()
+
+    value = _decode(key, cached_value) if cached_value else _MISS
+    if value is not _MISS:
+        if not stale_ttl:
+            logger.debug(f"Cache HIT: {key}")
+            if local:
+                local_cache.set(base_key, value, ttl)
+            return value
+        try:
+            is_fresh = client.exists(f"{key}:fresh")
+        except Exception as e:
+            logger.warning(f"Redis EXISTS failed for {key}: {e}")
+            is_fresh = True
+        if is_fresh:
+            logger.debug(f"Cache HIT: {key}")
+            if local:
+                local_cache.set(base_key, value, ttl)
+            return value
+
+    token = _acquire_lock(client, key)
+    if token is None:
+        if value is not _MISS:
+            # Another caller is refreshing - serve the stale value meanwhile
+            logger.debug(f"Cache STALE: {key}")
+            return value
+        waited = _wait_for_value(client, key)
+        if waited is not _MISS:
+            logger.debug(f"Cache HIT after wait: {key}")
+            if local:
+                local_cache.set(base_key, waited, ttl)
+            return waited
+        logger.warning(f"Timed out waiting for {key}, computing without lock")
+
+    logger.debug(f"Cache MISS: {key}")
+    try:
+        result = compute()
+        if result is not None:
+            _store(client, key, result, ttl, stale_ttl)
+            if local:
+                local_cache.set(base_key, result, ttl)
+        return result
+    finally:
+        if token is not None:
+            _release_lock(client, key, token)
+
+
+def _args_key(func: Callable, args: tuple, kwargs: dict, exclude: Iterable[str]) -> str | None:
+    """Hash the call arguments of func, or None when there are none to hash."""
+    bound = inspect.signature(func).bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    params = {name: value for name, value in bound.arguments.items() if name not in exclude}
+    if not params:
+        return None
+    params_str = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(params_str.encode()).hexdigest()[:16]
+
+
+def cached(
+    key: str,
+    ttl: int = 300,
+    tags: Sequence[str] = (),
+    stale_ttl: int = 0,
+    exclude: Sequence[str] = ("db",),
+) -> Callable:
     """Cache decorator with TTL and graceful degradation.
 
     Args:
-        key: Redis key for caching
+        key: Redis key prefix for caching. Calls with arguments get
+            ``{key}:{hash of arguments}``; zero-argument calls use key as-is.
         ttl: Time-to-live in seconds (default 5 minutes)
+        tags: Invalidation tags (see invalidate_tags)
+        stale_ttl: Seconds to keep serving a stale value while it's refreshed
+        exclude: Parameter names left out of the key (e.g. the DB session)
 
     Returns:
         Decorator that caches function results.
 
     Example:
-        @cached(key="dashboard:stats", ttl=300)
-        def get_expensive_data():
+        @cached(key="dashboard:stats", ttl=300, tags=[TAG_BOOKS], stale_ttl=60)
+        def get_expensive_data(db: Session, days: int = 30):
             return {"data": "value"}
     """
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            client = get_redis()
-
-            # Try cache hit
-            if client:
-                try:
-                    cached_value = client.get(key)
-                    if cached_value:
-                        logger.debug(f"Cache HIT: {key}")
-                        return json.loads(cached_value)
-                except Exception as e:
-                    logger.warning(f"Redis GET failed for {key}: {e}")
-
-            # Cache miss - execute function
-            logger.debug(f"Cache MISS: {key}")
-            result = func(*args, **kwargs)
-
-            # Store in cache
-            if client and result is not None:
-                try:
-                    serialized = json.dumps(result, default=str)
-                    client.setex(key, ttl, serialized)
-                    logger.debug(f"Cached {key} with TTL {ttl}s")
-                except Exception as e:
-                    logger.warning(f"Redis SETEX failed for {key}: {e}")
-
-            return result
+            args_hash = _args_key(func, args, kwargs, exclude)
+            full_key = f"{key}:{args_hash}" if args_hash else key
+            return get_or_compute(
+                get_redis(),
+                full_key,
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                tags=tags,
+                stale_ttl=stale_ttl,
+            )
 
         return wrapper
 
@@ -11,6 +11,7 @@ Examples:
 import logging
 import os
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -44,6 +45,30 @@ class Settings(BaseSettings):
         default=None,
         validation_alias=AliasChoices("BMX_DATABASE_SECRET_NAME", "DATABASE_SECRET_NAME"),
     )
+    database_secret_ttl_seconds: int = Field(
+        default=1800,
+        description="How long fetched database credentials are reused before re-reading the secret",
+        validation_alias=AliasChoices(
+            "BMX_DATABASE_SECRET_TTL_SECONDS", "DATABASE_SECRET_TTL_SECONDS"
+        ),
+    )
+    database_pool_mode: Literal["null", "persistent"] = Field(
+        default="null",
+        description="'null' = new connection per session, 'persistent' = reuse per warm container",
+        validation_alias=AliasChoices("BMX_DATABASE_POOL_MODE", "DATABASE_POOL_MODE"),
+    )
+    database_pool_recycle_seconds: int = Field(
+        default=300,
+        description="Max age of a pooled connection before it is replaced (persistent mode)",
+        validation_alias=AliasChoices(
+            "BMX_DATABASE_POOL_RECYCLE_SECONDS", "DATABASE_POOL_RECYCLE_SECONDS"
+        ),
+    )
+    database_proxy_host: str | None = Field(
+        default=None,
+        description="RDS Proxy / pgbouncer host used instead of the host in the secret",
+        validation_alias=AliasChoices("BMX_DATABASE_PROXY_HOST", "DATABASE_PROXY_HOST"),
+    )
 
     # AWS
     aws_region: str = Field(
@@ -123,6 +148,23 @@ class Settings(BaseSettings):
         description="Redis URL for caching (empty = caching disabled)",
         validation_alias=AliasChoices("BMX_REDIS_URL", "REDIS_URL"),
     )
+    cache_local_max_entries: int = Field(
+        default=256,
+        description="Max entries in the in-process cache in front of Redis (0 = disabled)",
+        validation_alias=AliasChoices("BMX_CACHE_LOCAL_MAX_ENTRIES", "CACHE_LOCAL_MAX_ENTRIES"),
+    )
+    cache_local_ttl_seconds: int = Field(
+        default=30,
+        description="Upper bound on how long an entry is served from the in-process cache",
+        validation_alias=AliasChoices("BMX_CACHE_LOCAL_TTL_SECONDS", "CACHE_LOCAL_TTL_SECONDS"),
+    )
+    cache_local_generation_check_seconds: float = Field(
+        default=2.0,
+        description="How often the in-process cache re-reads the Redis generation key",
+        validation_alias=AliasChoices(
+            "BMX_CACHE_LOCAL_GENERATION_CHECK_SECONDS", "CACHE_LOCAL_GENERATION_CHECK_SECONDS"
+        ),
+    )
 
     # Editor access control
     allowed_editor_emails: str = Field(
@@ -176,11 +218,28 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("BMX_ANALYSIS_QUEUE_NAME", "ANALYSIS_QUEUE_NAME"),
     )
 
+    analysis_worker_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Analysis jobs an SQS batch runs at once (bounded by Bedrock throttling)",
+        validation_alias=AliasChoices(
+            "BMX_ANALYSIS_WORKER_CONCURRENCY", "ANALYSIS_WORKER_CONCURRENCY"
+        ),
+    )
+
     # Eval runbook worker queue
     eval_runbook_queue_name: str | None = Field(
         default=None,
         validation_alias=AliasChoices("BMX_EVAL_RUNBOOK_QUEUE_NAME", "EVAL_RUNBOOK_QUEUE_NAME"),
     )
+    eval_runbook_worker_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Eval runbook jobs an SQS batch runs at once (bounded by Bedrock throttling)",
+        validation_alias=AliasChoices(
+            "BMX_EVAL_RUNBOOK_WORKER_CONCURRENCY", "EVAL_RUNBOOK_WORKER_CONCURRENCY"
+        ),
+    )
 
     # Image processing worker queue
     image_processing_queue_name: str | None = Field(
@@ -1,5 +1,14 @@
 """Database module."""
 
-from app.db.session import SessionLocal, engine, get_db
+from typing import Any
 
-__all__ = ["get_db", "engine", "SessionLocal"]
+from app.db.session import SessionLocal, get_db, get_engine
+
+__all__ = ["get_db", "get_engine", "engine", "SessionLocal"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy ``engine`` attribute - avoids connecting/fetching secrets on import."""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
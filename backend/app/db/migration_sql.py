@@ -872,6 +872,138 @@ MIGRATION_B3C8D2E1F4A7_SQL = [
     "UPDATE binders SET founded_year = 1764 WHERE id = 27 AND name LIKE 'Leighton%' AND founded_year IS NULL",
 ]
 
+# Migration SQL for c4d9e2f1a8b3_add_search_vector_triggers
+# Maintains books.search_vector and book_analyses.search_vector from a BEFORE
+# INSERT/UPDATE trigger so /search can use the existing GIN indexes instead of
+# ILIKE sequential scans. Weights: title/executive_summary rank above body text.
+# Backfill only touches NULL vectors, so re-running is cheap.
+MIGRATION_C4D9E2F1A8B3_SQL = [
+    """CREATE OR REPLACE FUNCTION books_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.binding_description, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(NEW.notes, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS books_search_vector_trigger ON books",
+    """CREATE TRIGGER books_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, binding_description, notes ON books
+        FOR EACH ROW EXECUTE FUNCTION books_search_vector_update()""",
+    """CREATE OR REPLACE FUNCTION book_analyses_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.executive_summary, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.full_markdown, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS book_analyses_search_vector_trigger ON book_analyses",
+    """CREATE TRIGGER book_analyses_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF executive_summary, full_markdown ON book_analyses
+        FOR EACH ROW EXECUTE FUNCTION book_analyses_search_vector_update()""",
+    """UPDATE books SET search_vector =
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(binding_description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(notes, '')), 'C')
+    WHERE search_vector IS NULL""",
+    """UPDATE book_analyses SET search_vector =
+        setweight(to_tsvector('english', coalesce(executive_summary, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(full_markdown, '')), 'B')
+    WHERE search_vector IS NULL""",
+    "CREATE INDEX IF NOT EXISTS books_search_idx ON books USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS analyses_search_idx ON book_analyses USING gin (search_vector)",
+]
+
+# Migration SQL for d5e0f3a2b9c4_add_book_images_book_id_index
+# book_images.book_id had no index, so per-book image lookups (eager loading,
+# primary-image subquery for sparse book lists) scanned the whole table.
+MIGRATION_D5E0F3A2B9C4_SQL = [
+    "CREATE INDEX IF NOT EXISTS book_images_book_id_idx ON book_images (book_id)",
+]
+
+# Migration SQL for e6f1a4b3c0d5_add_social_circle_store
+# Incrementally maintained social circles adjacency (see
+# app.services.social_circles_store). The backfill mirrors rebuild_store():
+# owned books with an author, publishers/binders linked through that author.
+MIGRATION_E6F1A4B3C0D5_SQL = [
+    """CREATE TABLE IF NOT EXISTS social_circle_nodes (
+        entity_type VARCHAR(20) NOT NULL,
+        entity_id INTEGER NOT NULL,
+        book_ids JSON NOT NULL,
+        PRIMARY KEY (entity_type, entity_id)
+    )""",
+    """CREATE TABLE IF NOT EXISTS social_circle_edges (
+        author_id INTEGER NOT NULL,
+        target_type VARCHAR(20) NOT NULL,
+        target_id INTEGER NOT NULL,
+        book_ids JSON NOT NULL,
+        PRIMARY KEY (author_id, target_type, target_id)
+    )""",
+    """INSERT INTO social_circle_nodes (entity_type, entity_id, book_ids)
+    SELECT 'author', author_id, json_agg(id ORDER BY id)
+    FROM books
+    WHERE status IN ('IN_TRANSIT', 'ON_HAND') AND author_id IS NOT NULL
+    GROUP BY author_id
+    ON CONFLICT DO NOTHING""",
+    """INSERT INTO social_circle_nodes (entity_type, entity_id, book_ids)
+    SELECT 'publisher', publisher_id, json_agg(id ORDER BY id)
+    FROM books
+    WHERE status IN ('IN_TRANSIT', 'ON_HAND')
+        AND author_id IS NOT NULL AND publisher_id IS NOT NULL
+    GROUP BY publisher_id
+    ON CONFLICT DO NOTHING""",
+    """INSERT INTO social_circle_nodes (entity_type, entity_id, book_ids)
+    SELECT 'binder', binder_id, json_agg(id ORDER BY id)
+    FROM books
+    WHERE status IN ('IN_TRANSIT', 'ON_HAND')
+        AND author_id IS NOT NULL AND binder_id IS NOT NULL
+    GROUP BY binder_id
+    ON CONFLICT DO NOTHING""",
+    """INSERT INTO social_circle_edges (author_id, target_type, target_id, book_ids)
+    SELECT author_id, 'publisher', publisher_id, json_agg(id ORDER BY id)
+    FROM books
+    WHERE status IN ('IN_TRANSIT', 'ON_HAND')
+        AND author_id IS NOT NULL AND publisher_id IS NOT NULL
+    GROUP BY author_id, publisher_id
+    ON CONFLICT DO NOTHING""",
+    """INSERT INTO social_circle_edges (author_id, target_type, target_id, book_ids)
+    SELECT author_id, 'binder', binder_id, json_agg(id ORDER BY id)
+    FROM books
+    WHERE status IN ('IN_TRANSIT', 'ON_HAND')
+        AND author_id IS NOT NULL AND binder_id IS NOT NULL
+    GROUP BY author_id, binder_id
+    ON CONFLICT DO NOTHING""",
+]
+
+# Migration SQL for f7b2c5d4e1a6_add_book_title_keys
+# Persisted title lookup keys for duplicate and set detection (see
+# app.services.title_keys). They come from the app's Python regexes, so
+# run_migrations fills existing rows with backfill_title_keys() after these.
+MIGRATION_F7B2C5D4E1A6_SQL = [
+    "ALTER TABLE books ADD COLUMN IF NOT EXISTS normalized_title VARCHAR(500)",
+    "ALTER TABLE books ADD COLUMN IF NOT EXISTS set_title VARCHAR(500)",
+    "ALTER TABLE books ADD COLUMN IF NOT EXISTS volume_number INTEGER",
+    """CREATE INDEX IF NOT EXISTS books_author_normalized_title_idx
+    ON books (author_id, normalized_title)""",
+]
+
+# Migration SQL for a8c3d6e5f2b7_add_book_change_feed
+# Index on books.updated_at and a tombstone table for deleted books, read by
+# the /export/changes change feed.
+MIGRATION_A8C3D6E5F2B7_SQL = [
+    """CREATE INDEX IF NOT EXISTS books_updated_at_id_idx
+    ON books (updated_at, id)""",
+    """CREATE TABLE IF NOT EXISTS book_tombstones (
+        id SERIAL PRIMARY KEY,
+        book_id INTEGER NOT NULL,
+        deleted_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+    )""",
+    """CREATE INDEX IF NOT EXISTS book_tombstones_deleted_at_id_idx
+    ON book_tombstones (deleted_at, id)""",
+]
+
 MIGRATIONS: list[MigrationDef] = [
     {
         "id": "e44df6ab5669",
@@ -1164,4 +1296,29 @@ MIGRATIONS: list[MigrationDef] = [
         "name": "backfill_entity_founded_years",
         "sql_statements": MIGRATION_B3C8D2E1F4A7_SQL,
     },
+    {
+        "id": "c4d9e2f1a8b3",
+        "name": "add_search_vector_triggers",
+        "sql_statements": MIGRATION_C4D9E2F1A8B3_SQL,
+    },
+    {
+        "id": "d5e0f3a2b9c4",
+        "name": "add_book_images_book_id_index",
+        "sql_statements": MIGRATION_D5E0F3A2B9C4_SQL,
+    },
+    {
+        "id": "e6f1a4b3c0d5",
+        "name": "add_social_circle_store",
+        "sql_statements": MIGRATION_E6F1A4B3C0D5_SQL,
+    },
+    {
+        "id": "f7b2c5d4e1a6",
+        "name": "add_book_title_keys",
+        "sql_statements": MIGRATION_F7B2C5D4E1A6_SQL,
+    },
+    {
+        "id": "a8c3d6e5f2b7",
+        "name": "add_book_change_feed",
+        "sql_statements": MIGRATION_A8C3D6E5F2B7_SQL,
+    },
 ]
@@ -1,44 +1,143 @@
-"""Database session management."""
+"""Database session management.
+
+The engine is created lazily on first use rather than at import time, and the
+Secrets Manager credentials behind it are cached with a TTL (same pattern as
+lambdas/image_processor/handler.py:get_secret) so rotated passwords are picked
+up without a cold start.
+
+Pool modes (BMX_DATABASE_POOL_MODE):
+- "null": NullPool - a fresh TCP+TLS+auth connection per session (default,
+  safest when containers freeze/thaw unpredictably).
+- "persistent": keep one connection per warm container, validated with
+  pool_pre_ping on checkout and recycled after database_pool_recycle_seconds.
+  A small overflow allows the occasional nested session without blocking,
+  plus one connection per extra job a concurrent SQS worker runs at once.
+
+BMX_DATABASE_PROXY_HOST points either mode at an RDS Proxy or pgbouncer
+endpoint instead of the host in the secret. psycopg2 doesn't use server-side
+prepared statements, so transaction-pooling proxies are safe.
+"""
 
 import json
+import logging
+import threading
+import time
 from collections.abc import Generator
+from typing import Any
 
 import boto3
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
+# Extra connections allowed beyond the persistent one (closed when returned),
+# before adding one per additional concurrent worker job
+PERSISTENT_POOL_MAX_OVERFLOW = 2
+
+_engine: Engine | None = None
+_engine_url: str | None = None
+_secret_cache: dict | None = None
+_secret_cache_time: float = 0.0
+_lock = threading.Lock()
+
+
+def get_secret(secret_id: str) -> dict:
+    """Retrieve database credentials from Secrets Manager.
+
+    Caches the result with TTL to avoid repeated Secrets Manager calls on warm
+    invocations while ensuring rotated credentials are picked up.
+    """
+    global _secret_cache, _secret_cache_time
+    current_time = time.time()
+
+    if (
+        _secret_cache is not None
+        and (current_time - _secret_cache_time) < settings.database_secret_ttl_seconds
+    ):
+        return _secret_cache
+
+    client = boto3.client("secretsmanager", region_name=settings.aws_region)
+    response = client.get_secret_value(SecretId=secret_id)
+    _secret_cache = json.loads(response["SecretString"])
+    _secret_cache_time = current_time
+    return _secret_cache
+
 
 def get_database_url() -> str:
     """Get database URL, fetching from Secrets Manager if in AWS."""
     secret_id = settings.database_secret_arn or settings.database_secret_name
     if secret_id:
-        # Fetch credentials from Secrets Manager
-        client = boto3.client("secretsmanager", region_name=settings.aws_region)
-        response = client.get_secret_value(SecretId=secret_id)
-        secret = json.loads(response["SecretString"])
+        secret = get_secret(secret_id)
 
         # Support both 'dbname' and 'database' key names
         db_name = secret.get("dbname") or secret.get("database", "bluemoxon")
+        host = settings.database_proxy_host or secret["host"]
 
         return (
             f"postgresql://{secret['username']}:{secret['password']}"
-            f"@{secret['host']}:{secret['port']}/{db_name}"
+            f"@{host}:{secret['port']}/{db_name}"
         )
 
     return settings.database_url
 
 
-engine = create_engine(
-    get_database_url(),
-    poolclass=NullPool,
-)
+def _engine_kwargs() -> dict[str, Any]:
+    """create_engine() pool arguments for the configured pool mode."""
+    if settings.database_pool_mode == "persistent":
+        # Each concurrently running worker job holds its own session
+        job_concurrency = max(
+            settings.analysis_worker_concurrency, settings.eval_runbook_worker_concurrency
+        )
+        return {
+            "pool_size": 1,
+            "max_overflow": PERSISTENT_POOL_MAX_OVERFLOW + job_concurrency - 1,
+            "pool_pre_ping": True,
+            "pool_recycle": settings.database_pool_recycle_seconds,
+        }
+    # NullPool: pool_pre_ping would be pointless - there's no pool to check out from
+    return {"poolclass": NullPool}
+
+
+def get_engine() -> Engine:
+    """Get the shared engine, creating or replacing it when credentials change.
+
+    The URL is re-derived on every call, but that only hits Secrets Manager
+    once per TTL; in between it is a cached dict lookup. When a refreshed
+    secret yields a different URL (rotation), the old engine is disposed.
+    """
+    global _engine, _engine_url
+    url = get_database_url()
+    if _engine is not None and url == _engine_url:
+        return _engine
+
+    with _lock:
+        if _engine is not None and url == _engine_url:
+            return _engine
+        if _engine is not None:
+            logger.info("Database credentials changed, replacing engine")
+            _engine.dispose()
+        _engine = create_engine(url, **_engine_kwargs())
+        _engine_url = url
+        return _engine
+
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class _EngineSession(Session):
+    """Session bound to whatever get_engine() currently returns."""
+
+    def get_bind(self, *args: Any, **kwargs: Any) -> Engine | Connection:
+        if self.bind is not None:
+            return super().get_bind(*args, **kwargs)
+        return get_engine()
+
+
+SessionLocal = sessionmaker(class_=_EngineSession, autocommit=False, autoflush=False)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -48,3 +147,10 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy module attribute: ``engine`` resolves to get_engine()."""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,10 +8,12 @@ import json
 import logging
 from datetime import UTC, datetime
 
+from app.config import get_settings
 from app.db import SessionLocal
 from app.models import Book, EvalRunbookJob
 from app.services.eval_generation import detect_garbage_images, generate_eval_runbook
 from app.version import get_version
+from app.workers.sqs_batch import process_sqs_records
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -35,6 +37,10 @@ def handler(event: dict, context) -> dict:
     Returns:
         Dict with batch item failures for partial batch response,
         or version info if version check requested
+
+    Messages in a batch run concurrently, up to
+    EVAL_RUNBOOK_WORKER_CONCURRENCY at a time; each job opens its own DB
+    session.
     """
     # Handle version check (for smoke tests)
     if event.get("version"):
@@ -48,30 +54,27 @@ def handler(event: dict, context) -> dict:
             ),
         }
 
-    batch_item_failures = []
-
-    for record in event.get("Records", []):
-        message_id = record.get("messageId", "unknown")
-
-        try:
-            # Parse message body
-            body = json.loads(record["body"])
-            job_id = body["job_id"]
-            book_id = body["book_id"]
+    batch_item_failures = process_sqs_records(
+        event.get("Records", []),
+        _process_record,
+        get_settings().eval_runbook_worker_concurrency,
+    )
+    return {"batchItemFailures": batch_item_failures}
 
-            logger.info(f"Processing eval runbook job {job_id} for book {book_id}")
 
-            # Process the job
-            process_eval_runbook_job(job_id, book_id)
+def _process_record(record: dict) -> None:
+    """Process one SQS eval runbook job message."""
+    # Parse message body
+    body = json.loads(record["body"])
+    job_id = body["job_id"]
+    book_id = body["book_id"]
 
-            logger.info(f"Successfully processed eval runbook job {job_id}")
+    logger.info(f"Processing eval runbook job {job_id} for book {book_id}")
 
-        except Exception as e:
-            logger.error(f"Failed to process message {message_id}: {e}", exc_info=True)
-            # Report this message as failed for partial batch failure
-            batch_item_failures.append({"itemIdentifier": message_id})
+    # Process the job
+    process_eval_runbook_job(job_id, book_id)
 
-    return {"batchItemFailures": batch_item_failures}
+    logger.info(f"Successfully processed eval runbook job {job_id}")
 
 
 def process_eval_runbook_job(job_id: str, book_id: int) -> None:
@@ -11,6 +11,7 @@ from app.models.author import Author
 from app.models.base import Base
 from app.models.binder import Binder
 from app.models.book import Book
+from app.models.book_tombstone import BookTombstone
 from app.models.carrier_circuit import CarrierCircuit
 from app.models.cleanup_job import CleanupJob
 from app.models.entity_profile import EntityProfile
@@ -22,6 +23,7 @@ from app.models.notification import Notification
 from app.models.profile_generation_job import ProfileGenerationJob
 from app.models.publisher import Publisher
 from app.models.publisher_alias import PublisherAlias
+from app.models.social_circle import SocialCircleEdgeBooks, SocialCircleNodeBooks
 from app.models.user import User
 
 # Entity type to model class mapping, shared across services (immutable)
@@ -51,10 +53,13 @@ __all__ = [
     "Book",
     "BookAnalysis",
     "BookImage",
+    "BookTombstone",
     "EvalPriceHistory",
     "EvalRunbook",
     "EvalRunbookJob",
     "ImageProcessingJob",
     "ProfileGenerationJob",
+    "SocialCircleEdgeBooks",
+    "SocialCircleNodeBooks",
     "User",
 ]
@@ -3,7 +3,7 @@
 from sqlalchemy import JSON, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, SearchVector, TimestampMixin
 
 
 class BookAnalysis(Base, TimestampMixin):
@@ -39,8 +39,10 @@ class BookAnalysis(Base, TimestampMixin):
     # e.g., "us.anthropic.claude-opus-4-5-20251101-v1:0"
     model_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
-    # Full-text search (PostgreSQL only, nullable for SQLite tests)
-    search_vector: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Full-text search (PostgreSQL only, nullable for SQLite tests).
+    # Maintained by a database trigger (migration c4d9e2f1a8b3); deferred so
+    # normal loads don't ship the tsvector text over the wire.
+    search_vector: Mapped[str | None] = mapped_column(SearchVector, nullable=True, deferred=True)
 
     # Relationships
     book = relationship("Book", back_populates="analysis")
@@ -2,9 +2,14 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Full-text search vectors: TSVECTOR on PostgreSQL, plain text on SQLite (tests)
+# so create_all() builds a column the search triggers and ts_rank can use.
+SearchVector = TSVECTOR().with_variant(Text, "sqlite")
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
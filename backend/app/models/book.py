@@ -15,18 +15,9 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from app.models.base import Base, TimestampMixin
-
-# Use TSVECTOR for PostgreSQL, Text for SQLite (testing)
-# This allows tests to run with SQLite while production uses PostgreSQL
-try:
-    from sqlalchemy.dialects.postgresql import TSVECTOR
-
-    SearchVectorType = TSVECTOR
-except ImportError:
-    pass  # If not PostgreSQL, types not needed
+from app.models.base import Base, SearchVector, TimestampMixin
 
 
 class Book(Base, TimestampMixin):
@@ -38,9 +29,22 @@ class Book(Base, TimestampMixin):
 
     # Basic info
     title: Mapped[str] = mapped_column(String(500), nullable=False)
-    author_id: Mapped[int | None] = mapped_column(ForeignKey("authors.id"))
-    publisher_id: Mapped[int | None] = mapped_column(ForeignKey("publishers.id"))
-    binder_id: Mapped[int | None] = mapped_column(ForeignKey("binders.id"))
+    # active_history: the social circles store needs the old values on update
+    # (see app.models.social_circle), even when the attribute was expired
+    author_id: Mapped[int | None] = mapped_column(ForeignKey("authors.id"), active_history=True)
+    publisher_id: Mapped[int | None] = mapped_column(
+        ForeignKey("publishers.id"), active_history=True
+    )
+    binder_id: Mapped[int | None] = mapped_column(ForeignKey("binders.id"), active_history=True)
+
+    # Title lookup keys derived from title (see _maintain_title_keys), so
+    # duplicate and set detection don't re-run the title regexes per book.
+    # NULL until backfilled (migration f7b2c5d4e1a6).
+    normalized_title: Mapped[str | None] = mapped_column(String(500))  # scoring.normalize_title
+    set_title: Mapped[str | None] = mapped_column(String(500))  # set_detection.set_title_key
+    volume_number: Mapped[int | None] = mapped_column(
+        Integer
+    )  # set_detection.extract_volume_number
 
     # Publication
     publication_date: Mapped[str | None] = mapped_column(String(50))  # "1867-1880" or "1851"
@@ -81,7 +85,7 @@ class Book(Base, TimestampMixin):
     roi_pct: Mapped[Decimal | None] = mapped_column(Numeric(7, 2))  # Up to 99999.99%
 
     # Status: EVALUATING, IN_TRANSIT, ON_HAND, SOLD, REMOVED, CANCELED
-    status: Mapped[str] = mapped_column(String(20), default="ON_HAND")
+    status: Mapped[str] = mapped_column(String(20), default="ON_HAND", active_history=True)
 
     # Source tracking
     source_url: Mapped[str | None] = mapped_column(String(500))
@@ -129,8 +133,10 @@ class Book(Base, TimestampMixin):
     # Legacy reference (for migration)
     legacy_row: Mapped[int | None] = mapped_column(Integer)
 
-    # Full-text search (PostgreSQL only, nullable for SQLite tests)
-    search_vector: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Full-text search (PostgreSQL only, nullable for SQLite tests).
+    # Maintained by a database trigger (migration c4d9e2f1a8b3); deferred so
+    # normal loads don't ship the tsvector text over the wire.
+    search_vector: Mapped[str | None] = mapped_column(SearchVector, nullable=True, deferred=True)
 
     # Relationships
     author = relationship("Author", back_populates="books")
@@ -194,4 +200,19 @@ class Book(Base, TimestampMixin):
         Index("books_author_id_idx", "author_id"),
         Index("books_publisher_id_idx", "publisher_id"),
         Index("books_binder_id_idx", "binder_id"),
+        # Exact duplicate-title lookups within an author
+        Index("books_author_normalized_title_idx", "author_id", "normalized_title"),
+        # Change feed keyset pagination
+        Index("books_updated_at_id_idx", "updated_at", "id"),
     )
+
+    @validates("title")
+    def _maintain_title_keys(self, _key: str, title: str) -> str:
+        """Recompute the title lookup keys whenever the title is assigned."""
+        if title is not None:
+            # Local import: the services import this model
+            from app.services.title_keys import title_keys
+
+            for column, value in title_keys(title).items():
+                setattr(self, column, value)
+        return title
@@ -0,0 +1,38 @@
+"""Tombstones for deleted books, read by the export change feed.
+
+A row is written by the Book after_delete mapper event below, in the same
+transaction as the delete, so /export/changes can report deletions
+alongside upserts (books.updated_at).
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, event, func, insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.book import Book
+
+
+class BookTombstone(Base):
+    """Records that a book was deleted, and when."""
+
+    __tablename__ = "book_tombstones"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    book_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Change feed keyset pagination
+        Index("book_tombstones_deleted_at_id_idx", "deleted_at", "id"),
+    )
+
+
+@event.listens_for(Book, "after_delete")
+def _record_tombstone(mapper, connection, target: Book) -> None:
+    connection.execute(insert(BookTombstone).values(book_id=target.id))
@@ -1,6 +1,6 @@
 """Book Image model."""
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -28,3 +28,9 @@ class BookImage(Base):
 
     # Relationships
     book = relationship("Book", back_populates="images")
+
+    __table_args__ = (
+        # Per-book lookups: selectinload(Book.images) and the primary-image
+        # subquery in sparse book listings
+        Index("book_images_book_id_idx", "book_id"),
+    )
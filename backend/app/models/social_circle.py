@@ -0,0 +1,71 @@
+"""Social circles adjacency store - incrementally maintained graph inputs.
+
+These tables hold, per entity and per author->publisher/binder pair, the IDs
+of the owned books that connect them. They are kept current by the Book
+mapper events below, so the social circles graph can be assembled from
+entity-sized tables instead of rescanning every owned book. See
+app.services.social_circles_store for the delta logic and repair rebuild.
+"""
+
+from sqlalchemy import JSON, Integer, String, event
+from sqlalchemy.orm import Mapped, attributes, mapped_column
+
+from app.models.base import Base
+from app.models.book import Book
+
+
+class SocialCircleNodeBooks(Base):
+    """Owned books attributed to one author, publisher, or binder node."""
+
+    __tablename__ = "social_circle_nodes"
+
+    entity_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    entity_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    book_ids: Mapped[list[int]] = mapped_column(JSON, nullable=False)
+
+
+class SocialCircleEdgeBooks(Base):
+    """Owned books shared by an author and a publisher or binder."""
+
+    __tablename__ = "social_circle_edges"
+
+    author_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    target_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    target_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    book_ids: Mapped[list[int]] = mapped_column(JSON, nullable=False)
+
+
+# Book columns that decide a book's place in the graph
+_TRACKED_ATTRS = ("status", "author_id", "publisher_id", "binder_id")
+
+
+def _previous_value(target: Book, attr: str):
+    """Value of attr before the pending flush (current value if unchanged)."""
+    history = attributes.get_history(target, attr)
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, attr)
+
+
+@event.listens_for(Book, "after_insert")
+def _book_inserted(mapper, connection, target: Book) -> None:
+    from app.services.social_circles_store import apply_book_change, links_for
+
+    apply_book_change(connection, None, links_for(target))
+
+
+@event.listens_for(Book, "after_update")
+def _book_updated(mapper, connection, target: Book) -> None:
+    from app.services.social_circles_store import apply_book_change, links_for
+
+    if not any(attributes.get_history(target, attr).has_changes() for attr in _TRACKED_ATTRS):
+        return
+    before = links_for(target, **{attr: _previous_value(target, attr) for attr in _TRACKED_ATTRS})
+    apply_book_change(connection, before, links_for(target))
+
+
+@event.listens_for(Book, "after_delete")
+def _book_deleted(mapper, connection, target: Book) -> None:
+    from app.services.social_circles_store import apply_book_change, links_for
+
+    apply_book_change(connection, links_for(target), None)
@@ -107,6 +107,28 @@ class BookListParams(BaseModel):
     sort_by: ValidSortField = "title"
     sort_order: SortOrder = SortOrder.ASC
 
+    # Keyset pagination - opt-in alternative to page/per_page for deep scrolling
+    cursor: str | None = Field(
+        default=None,
+        description=(
+            "Keyset pagination cursor. Pass an empty value for the first page, then "
+            "next_cursor from each response. 'page' is ignored in cursor mode."
+        ),
+    )
+    # Sparse fieldsets - column-only projection for grid views
+    fields: str | None = Field(
+        default=None,
+        description=(
+            "Comma-separated BookResponse fields to return (e.g. "
+            "'title,author,status,value_mid,primary_image_url'). 'id' is always "
+            "included. Items contain only these keys."
+        ),
+    )
+    total_mode: Literal["exact", "estimate", "none"] = Field(
+        default="exact",
+        description="How to compute 'total': exact count, planner estimate, or skip",
+    )
+
 
 class _BookFieldsMixin(BaseModel):
     """Shared book fields that don't involve enum types.
@@ -322,6 +344,11 @@ class BookListResponse(PaginatedResponse):
     """Paginated list of books."""
 
     items: list[BookResponse]
+    # None when total_mode=none
+    total: int | None  # type: ignore[assignment]
+    pages: int | None  # type: ignore[assignment]
+    # Keyset pagination: token for the next page, None on the last page
+    next_cursor: str | None = None
     # IDs truncation indicator (for ?ids= parameter)
     ids_truncated: bool = False
     ids_requested: int | None = None
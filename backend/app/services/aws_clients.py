@@ -13,12 +13,31 @@ Usage:
 """
 
 import os
+import threading
 from functools import lru_cache
 
 import boto3
 
 from app.config import get_settings
 
+# boto3's default session is not thread-safe, and the worker Lambdas run jobs on
+# a thread pool: on a cold container the first jobs would create clients at once.
+_client_lock = threading.Lock()
+
+
+def create_client(service_name: str, **kwargs):
+    """Create a boto3 client, one at a time across threads.
+
+    Args:
+        service_name: AWS service name, e.g. "s3"
+        **kwargs: Passed through to boto3.client
+
+    Returns:
+        The new boto3 client.
+    """
+    with _client_lock:
+        return boto3.client(service_name, **kwargs)
+
 
 @lru_cache(maxsize=1)
 def get_s3_client():
@@ -29,7 +48,7 @@ def get_s3_client():
     """
     settings = get_settings()
     region = os.environ.get("AWS_REGION", settings.aws_region)
-    return boto3.client("s3", region_name=region)
+    return create_client("s3", region_name=region)
 
 
 @lru_cache(maxsize=1)
@@ -41,7 +60,7 @@ def get_sqs_client():
     """
     settings = get_settings()
     region = os.environ.get("AWS_REGION", settings.aws_region)
-    return boto3.client("sqs", region_name=region)
+    return create_client("sqs", region_name=region)
 
 
 @lru_cache(maxsize=1)
@@ -53,4 +72,4 @@ def get_lambda_client():
     """
     settings = get_settings()
     region = os.environ.get("AWS_REGION", settings.aws_region)
-    return boto3.client("lambda", region_name=region)
+    return create_client("lambda", region_name=region)
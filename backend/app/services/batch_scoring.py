@@ -0,0 +1,289 @@
+"""Set-based scoring for the whole collection.
+
+calculate_and_persist_book_scores() scores one book at a time and issues
+several queries per book (author owned count, other books by the author for
+duplicate detection, set members for set completion, plus lazy loads of the
+author/publisher/binder tiers). Rescoring the collection that way costs
+roughly five queries per book.
+
+load_scoring_rows() fetches the columns scoring needs in one joined query.
+score_collection() groups them by author once - owned counts, normalized
+titles for duplicate detection, set-normalized titles for set completion -
+and scores every book from those groups with the columnar scoring functions
+(same semantics as the scalar ones). The results are written back with a
+single executemany UPDATE keyed by primary key. Semantics match the
+per-book path exactly.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select, update
+
+from app.enums import OWNED_STATUSES
+from app.models import Author, Binder, Book, Publisher
+from app.services import set_detection
+from app.services.scoring import (
+    author_tier_to_score,
+    calculate_all_scores,
+    normalized_title_similarity,
+    stored_normalized_title,
+)
+from app.services.scoring_columns import all_scores_columns
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Same threshold as scoring.is_duplicate_title()
+DUPLICATE_TITLE_THRESHOLD = 0.8
+
+
+@dataclass(frozen=True)
+class ScoringRow:
+    """The columns of a book (and its entities' tiers) that scoring reads."""
+
+    id: int
+    title: str
+    status: str | None
+    author_id: int | None
+    has_author: bool
+    author_tier: str | None
+    publisher_tier: str | None
+    binder_tier: str | None
+    purchase_price: Decimal | None
+    value_mid: Decimal | None
+    year_start: int | None
+    is_complete: bool
+    condition_grade: str | None
+    volumes: int | None
+    normalized_title: str | None
+    set_title: str | None
+    volume_number: int | None
+
+
+class _AuthorBooks:
+    """Precomputed per-author lookups shared by all of that author's books."""
+
+    def __init__(self) -> None:
+        self.owned_count = 0
+        # (book_id, normalized title) of owned books - duplicate check
+        self.owned_titles: list[tuple[int, str]] = []
+        # (row, lowercased set-normalized title) of non-REMOVED books - set check
+        self.set_candidates: list[tuple[ScoringRow, str]] = []
+
+
+def load_scoring_rows(db: Session) -> list[ScoringRow]:
+    """Load every book's scoring inputs in one query."""
+    stmt = (
+        select(
+            Book.id,
+            Book.title,
+            Book.status,
+            Book.author_id,
+            Author.id.is_not(None).label("has_author"),
+            Author.tier.label("author_tier"),
+            Publisher.tier.label("publisher_tier"),
+            Binder.tier.label("binder_tier"),
+            Book.purchase_price,
+            Book.value_mid,
+            Book.year_start,
+            Book.is_complete,
+            Book.condition_grade,
+            Book.volumes,
+            Book.normalized_title,
+            Book.set_title,
+            Book.volume_number,
+        )
+        .outerjoin(Author, Book.author_id == Author.id)
+        .outerjoin(Publisher, Book.publisher_id == Publisher.id)
+        .outerjoin(Binder, Book.binder_id == Binder.id)
+        .order_by(Book.id)
+    )
+    return [ScoringRow(**row._asdict()) for row in db.execute(stmt)]
+
+
+def _index_by_author(rows: list[ScoringRow]) -> dict[int, _AuthorBooks]:
+    by_author: dict[int, _AuthorBooks] = defaultdict(_AuthorBooks)
+    for row in rows:
+        if not row.author_id:
+            continue
+        author_books = by_author[row.author_id]
+        if row.status in OWNED_STATUSES:
+            author_books.owned_count += 1
+            author_books.owned_titles.append((row.id, stored_normalized_title(row)))
+        if row.status != "REMOVED":
+            author_books.set_candidates.append((row, set_detection.stored_set_title(row)))
+    return by_author
+
+
+def _is_duplicate(row: ScoringRow, author_books: _AuthorBooks) -> bool:
+    """Mirror of the get_other_books_by_author + is_duplicate_title loop."""
+    normalized = stored_normalized_title(row)
+    return any(
+        normalized_title_similarity(normalized, other_normalized) >= DUPLICATE_TITLE_THRESHOLD
+        for other_id, other_normalized in author_books.owned_titles
+        if other_id != row.id
+    )
+
+
+def _completes_set(row: ScoringRow, author_books: _AuthorBooks) -> bool:
+    """Mirror of set_detection.detect_set_completion for an existing book."""
+    if set_detection.stored_volume_number(row) is None:
+        return False
+    normalized = set_detection.stored_set_title(row)
+    matches = [
+        other
+        for other, other_normalized in author_books.set_candidates
+        if other.id != row.id
+        and (
+            normalized == other_normalized
+            or normalized in other_normalized
+            or other_normalized in normalized
+        )
+    ]
+    return set_detection.completes_set_with(matches)
+
+
+def _collection_factors(
+    row: ScoringRow, author_books: _AuthorBooks | None
+) -> tuple[int, int, bool, bool]:
+    """(author priority, author book count, is duplicate, completes set) for a row."""
+    author_priority = 0
+    author_book_count = 0
+    if row.has_author and author_books is not None:
+        author_priority = author_tier_to_score(row.author_tier)
+        # Owned books by the author other than this one
+        author_book_count = author_books.owned_count - (1 if row.status in OWNED_STATUSES else 0)
+
+    is_duplicate = False
+    completes_set = False
+    if author_books is not None:
+        is_duplicate = _is_duplicate(row, author_books)
+        try:
+            completes_set = _completes_set(row, author_books)
+        except Exception as e:
+            # Same fail-safe as detect_set_completion: don't break scoring
+            logger.warning(f"Set detection failed: {e}")
+
+    return author_priority, author_book_count, is_duplicate, completes_set
+
+
+def score_collection(
+    rows: list[ScoringRow],
+) -> tuple[dict[int, dict[str, int]], list[dict[str, Any]]]:
+    """Score every book in a single pass over preloaded rows.
+
+    Collection factors are resolved per row from the author groups, then
+    all scores are computed column-wise (app.services.scoring_columns).
+
+    Args:
+        rows: Output of load_scoring_rows()
+
+    Returns:
+        Tuple of (scores by book ID, per-book errors as {"book_id", "error"}).
+    """
+    by_author = _index_by_author(rows)
+    scored: list[ScoringRow] = []
+    factors: list[tuple[int, int, bool, bool]] = []
+    errors: list[dict[str, Any]] = []
+    for row in rows:
+        try:
+            author_books = by_author.get(row.author_id) if row.author_id else None
+            factors.append(_collection_factors(row, author_books))
+            scored.append(row)
+        except Exception as e:
+            errors.append({"book_id": row.id, "error": str(e)})
+
+    try:
+        columns = all_scores_columns(
+            purchase_prices=[r.purchase_price for r in scored],
+            values_mid=[r.value_mid for r in scored],
+            publisher_tiers=[r.publisher_tier for r in scored],
+            binder_tiers=[r.binder_tier for r in scored],
+            year_starts=[r.year_start for r in scored],
+            is_complete=[r.is_complete for r in scored],
+            condition_grades=[r.condition_grade for r in scored],
+            author_priority_scores=[f[0] for f in factors],
+            author_book_counts=[f[1] for f in factors],
+            is_duplicate=[f[2] for f in factors],
+            completes_set=[f[3] for f in factors],
+        )
+    except Exception as e:
+        # One malformed row fails the whole column pass; rescore row by row
+        # so only that book lands in errors, as with the per-book endpoint
+        logger.warning(f"Columnar scoring failed, falling back to per-row scoring: {e}")
+        return _score_rows(scored, factors, errors), errors
+
+    scores = {
+        row.id: {name: column[i] for name, column in columns.items()}
+        for i, row in enumerate(scored)
+    }
+    return scores, errors
+
+
+def _score_rows(
+    rows: list[ScoringRow],
+    factors: list[tuple[int, int, bool, bool]],
+    errors: list[dict[str, Any]],
+) -> dict[int, dict[str, int]]:
+    """Score rows one at a time with the scalar functions, collecting errors."""
+    scores: dict[int, dict[str, int]] = {}
+    for row, (author_priority, author_book_count, is_duplicate, completes_set) in zip(
+        rows, factors, strict=True
+    ):
+        try:
+            scores[row.id] = calculate_all_scores(
+                purchase_price=row.purchase_price,
+                value_mid=row.value_mid,
+                publisher_tier=row.publisher_tier,
+                binder_tier=row.binder_tier,
+                year_start=row.year_start,
+                is_complete=row.is_complete,
+                condition_grade=row.condition_grade,
+                author_priority_score=author_priority,
+                author_book_count=author_book_count,
+                is_duplicate=is_duplicate,
+                completes_set=completes_set,
+                volume_count=row.volumes or 1,
+            )
+        except Exception as e:
+            errors.append({"book_id": row.id, "error": str(e)})
+    return scores
+
+
+def persist_scores(db: Session, scores: dict[int, dict[str, int]]) -> None:
+    """Write scores back with one bulk UPDATE (executemany by primary key).
+
+    Does NOT commit the session.
+    """
+    if not scores:
+        return
+    calculated_at = datetime.now()
+    db.execute(
+        update(Book),
+        [
+            {"id": book_id, **book_scores, "scores_calculated_at": calculated_at}
+            for book_id, book_scores in scores.items()
+        ],
+    )
+
+
+def calculate_and_persist_all_scores(db: Session) -> tuple[int, list[dict[str, Any]]]:
+    """Rescore the whole collection and persist the results.
+
+    Does NOT commit the session.
+
+    Returns:
+        Tuple of (number of books updated, per-book errors).
+    """
+    scores, errors = score_collection(load_scoring_rows(db))
+    persist_scores(db, scores)
+    return len(scores), errors
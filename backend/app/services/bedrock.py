@@ -10,7 +10,6 @@ import time
 from dataclasses import dataclass
 from functools import lru_cache, wraps
 
-import boto3
 import httpx
 from botocore.exceptions import ClientError
 from PIL import Image
@@ -18,7 +17,7 @@ from PIL import Image
 from app.config import get_settings
 from app.constants import DEFAULT_ANALYSIS_MODEL
 from app.models import BookImage
-from app.services.aws_clients import get_s3_client
+from app.services.aws_clients import create_client, get_s3_client
 from app.utils.image_utils import detect_content_type
 
 # Bedrock error codes that warrant a retry (transient rate/availability issues).
@@ -232,7 +231,7 @@ def get_bedrock_client():
     region = os.environ.get("AWS_REGION", settings.aws_region)
     # Extended read timeout for long Claude responses (default is 60s)
     config = Config(read_timeout=540, connect_timeout=10, retries={"max_attempts": 0})
-    return boto3.client("bedrock-runtime", region_name=region, config=config)
+    return create_client("bedrock-runtime", region_name=region, config=config)
 
 
 def get_model_id(model_name: str) -> str:
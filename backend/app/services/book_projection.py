@@ -0,0 +1,211 @@
+"""Sparse fieldsets (column projection) for the book list endpoint.
+
+GET /books?fields=title,status,primary_image_url compiles the requested fields
+into a column-only SELECT over the same filtered query the full list uses.
+Rows come back as plain tuples: no ORM hydration, no selectinload of
+analysis/eval_runbook/images, and no BookResponse validation pass.
+
+Relationship-derived fields are computed in SQL:
+- author/publisher/binder: LEFT JOINs against aliased entity tables
+- primary_image_url: correlated subquery (primary flag, then display order)
+- image_count: correlated COUNT subquery
+- has_analysis/has_eval_runbook: EXISTS subqueries
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Query, aliased
+
+from app.models import Author, Binder, Book, BookAnalysis, BookImage, EvalRunbook, Publisher
+from app.utils.date_parser import compute_era
+
+# BookResponse fields backed directly by a Book column
+COLUMN_FIELDS = frozenset(
+    {
+        "id",
+        "title",
+        "publication_date",
+        "year_start",
+        "year_end",
+        "edition",
+        "volumes",
+        "is_complete",
+        "category",
+        "inventory_type",
+        "binding_type",
+        "binding_authenticated",
+        "binding_description",
+        "condition_grade",
+        "condition_notes",
+        "value_low",
+        "value_mid",
+        "value_high",
+        "purchase_price",
+        "acquisition_cost",
+        "purchase_date",
+        "purchase_source",
+        "discount_pct",
+        "roi_pct",
+        "status",
+        "notes",
+        "provenance",
+        "is_first_edition",
+        "has_provenance",
+        "provenance_tier",
+        "source_url",
+        "source_item_id",
+        "estimated_delivery",
+        "estimated_delivery_end",
+        "tracking_number",
+        "tracking_carrier",
+        "tracking_url",
+        "tracking_status",
+        "tracking_last_checked",
+        "ship_date",
+        "source_archived_url",
+        "archive_status",
+        "scoring_snapshot",
+        "investment_grade",
+        "strategic_fit",
+        "collection_impact",
+        "overall_score",
+        "scores_calculated_at",
+        "created_at",
+        "updated_at",
+    }
+)
+
+# BookResponse fields computed from related tables or other columns
+COMPUTED_FIELDS = frozenset(
+    {
+        "author",
+        "publisher",
+        "binder",
+        "era",
+        "has_analysis",
+        "has_eval_runbook",
+        "image_count",
+        "primary_image_url",
+    }
+)
+
+SPARSE_FIELDS = COLUMN_FIELDS | COMPUTED_FIELDS
+
+# Entity summaries: field name -> (model, summary columns)
+_SUMMARY_FIELDS: dict[str, tuple[Any, tuple[str, ...]]] = {
+    "author": (Author, ("id", "name")),
+    "publisher": (Publisher, ("id", "name", "tier")),
+    "binder": (Binder, ("id", "name")),
+}
+
+
+def parse_fields(fields: str) -> list[str]:
+    """Parse a comma-separated fields parameter, preserving order.
+
+    ``id`` is always included so clients can key rows.
+
+    Raises:
+        ValueError: If any field is not supported in sparse mode.
+    """
+    requested = ["id"]
+    for name in (f.strip() for f in fields.split(",")):
+        if name and name not in requested:
+            requested.append(name)
+
+    unknown = [name for name in requested if name not in SPARSE_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unsupported field(s): {', '.join(unknown)}. "
+            f"Allowed: {', '.join(sorted(SPARSE_FIELDS))}"
+        )
+    return requested
+
+
+def project_query(query: Query, fields: Sequence[str], sort_by: str, use_cdn: bool) -> Query:
+    """Replace a Book query's entities with labelled columns for fields.
+
+    Filters and joins already on the query are preserved. The sort column is
+    always selected (under its own name) so keyset cursors can be built from
+    the last row. Entity tables are joined through aliases so they never
+    collide with joins added by filters (e.g. author search, publisher tier).
+    """
+    columns: dict[str, Any] = {"id": Book.id, sort_by: getattr(Book, sort_by)}
+    joins = []
+
+    for name in fields:
+        if name in COLUMN_FIELDS:
+            columns[name] = getattr(Book, name)
+        elif name in _SUMMARY_FIELDS:
+            model, attrs = _SUMMARY_FIELDS[name]
+            entity = aliased(model)
+            joins.append((entity, entity.id == getattr(Book, f"{name}_id")))
+            for attr in attrs:
+                columns[f"{name}__{attr}"] = getattr(entity, attr)
+        elif name == "era":
+            columns["year_start"] = Book.year_start
+            columns["year_end"] = Book.year_end
+        elif name == "has_analysis":
+            columns[name] = exists().where(BookAnalysis.book_id == Book.id)
+        elif name == "has_eval_runbook":
+            columns[name] = exists().where(EvalRunbook.book_id == Book.id)
+        elif name == "image_count":
+            columns[name] = (
+                select(func.count(BookImage.id))
+                .where(BookImage.book_id == Book.id)
+                .correlate(Book)
+                .scalar_subquery()
+            )
+        elif name == "primary_image_url":
+            # Same choice as the full list: first is_primary image, else lowest display_order
+            image_column = BookImage.s3_key if use_cdn else BookImage.id
+            columns["primary_image"] = (
+                select(image_column)
+                .where(BookImage.book_id == Book.id)
+                .order_by(BookImage.is_primary.desc(), BookImage.display_order, BookImage.id)
+                .limit(1)
+                .correlate(Book)
+                .scalar_subquery()
+            )
+
+    projected: Query = query.with_entities(
+        *(column.label(label) for label, column in columns.items())
+    )
+    for entity, onclause in joins:
+        projected = projected.outerjoin(entity, onclause)
+    return projected
+
+
+def row_to_item(
+    row: Any, fields: Sequence[str], image_url: Callable[[int, Any], str]
+) -> dict[str, Any]:
+    """Build a sparse item dict from a projected row.
+
+    Args:
+        row: Row returned by a project_query() query.
+        fields: Parsed field names, in response order.
+        image_url: Builds primary_image_url from (book_id, primary image
+            s3_key or id - whichever project_query selected).
+    """
+    mapping = row._mapping
+    item: dict[str, Any] = {}
+    for name in fields:
+        if name in _SUMMARY_FIELDS:
+            _model, attrs = _SUMMARY_FIELDS[name]
+            if mapping[f"{name}__id"] is None:
+                item[name] = None
+            else:
+                item[name] = {attr: mapping[f"{name}__{attr}"] for attr in attrs}
+        elif name == "era":
+            item[name] = compute_era(mapping["year_start"], mapping["year_end"]).value
+        elif name == "primary_image_url":
+            primary = mapping["primary_image"]
+            item[name] = image_url(mapping["id"], primary) if primary is not None else None
+        elif name == "has_analysis" or name == "has_eval_runbook":
+            item[name] = bool(mapping[name])
+        else:
+            item[name] = mapping[name]
+    return item
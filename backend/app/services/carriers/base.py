@@ -1,6 +1,7 @@
 """Base interface for carrier tracking clients."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
 from enum import StrEnum
@@ -48,10 +49,16 @@ class CarrierClient(ABC):
     1. Set the `name` class attribute
     2. Implement `fetch_tracking()` to retrieve status from carrier API
     3. Implement `can_handle()` to check if a tracking number matches the carrier's pattern
+
+    Carriers whose API accepts several tracking numbers per request also
+    override `fetch_tracking_batch()` and set `max_batch_size`.
     """
 
     name: str
 
+    # Most tracking numbers fetch_tracking_batch() is passed at once
+    max_batch_size: int = 1
+
     @abstractmethod
     def fetch_tracking(self, tracking_number: str) -> TrackingResult:
         """Fetch tracking information for a package.
@@ -64,6 +71,19 @@ class CarrierClient(ABC):
         """
         pass
 
+    def fetch_tracking_batch(self, tracking_numbers: Sequence[str]) -> dict[str, TrackingResult]:
+        """Fetch tracking information for several packages.
+
+        The default makes one fetch_tracking() call per number.
+
+        Args:
+            tracking_numbers: At most max_batch_size tracking numbers
+
+        Returns:
+            TrackingResult per tracking number, keyed as passed in
+        """
+        return {number: self.fetch_tracking(number) for number in tracking_numbers}
+
     @classmethod
     @abstractmethod
     def can_handle(cls, tracking_number: str) -> bool:
@@ -7,6 +7,7 @@ from datetime import date, datetime
 import httpx
 
 from app.services.carriers.base import CarrierClient, TrackingResult
+from app.services.carriers.pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -62,10 +63,10 @@ class DHLClient(CarrierClient):
         }
 
         try:
-            with httpx.Client(timeout=15) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client(self.name)
+            response = client.get(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
 
             return self._parse_response(data)
 
@@ -2,11 +2,13 @@
 
 import logging
 import re
+from collections.abc import Sequence
 from datetime import date, datetime
 
 import httpx
 
 from app.services.carriers.base import CarrierClient, TrackingResult
+from app.services.carriers.pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +25,15 @@ FEDEX_PATTERNS = [
 # FedEx public tracking API endpoint
 FEDEX_TRACKING_URL = "https://www.fedex.com/trackingCal/track"
 
+# Tracking numbers per track request (the FedEx tracking page accepts 30)
+FEDEX_BATCH_SIZE = 30
+
 
 class FedExClient(CarrierClient):
     """FedEx tracking client using public tracking endpoint."""
 
     name = "FedEx"
+    max_batch_size = FEDEX_BATCH_SIZE
 
     def fetch_tracking(self, tracking_number: str) -> TrackingResult:
         """Fetch tracking information from FedEx.
@@ -44,24 +50,34 @@ class FedExClient(CarrierClient):
         try:
             result = self._fetch_from_api(normalized)
             return result
-        except httpx.HTTPStatusError as e:
-            logger.warning(f"FedEx API HTTP error: {e.response.status_code}")
-            return TrackingResult(
-                status="Unknown",
-                error=f"FedEx API returned {e.response.status_code}",
-            )
-        except httpx.ConnectError as e:
-            logger.warning(f"FedEx API connection error: {e}")
-            return TrackingResult(
-                status="Unknown",
-                error=f"Connection error: {e}",
-            )
         except Exception as e:
-            logger.warning(f"Error fetching FedEx tracking: {e}")
-            return TrackingResult(
-                status="Unknown",
-                error=str(e),
-            )
+            return self._error_result(e)
+
+    def fetch_tracking_batch(self, tracking_numbers: Sequence[str]) -> dict[str, TrackingResult]:
+        """Fetch tracking for up to FEDEX_BATCH_SIZE numbers in one request.
+
+        Args:
+            tracking_numbers: FedEx tracking numbers
+
+        Returns:
+            TrackingResult per tracking number, keyed as passed in
+        """
+        normalized = {number: self._normalize(number) for number in tracking_numbers}
+
+        try:
+            data = self._request(list(dict.fromkeys(normalized.values())))
+        except Exception as e:
+            error = self._error_result(e)
+            return dict.fromkeys(tracking_numbers, error)
+
+        package_list = data.get("TrackPackagesResponse", {}).get("packageList", [])
+        packages = {package.get("trackingNbr"): package for package in package_list}
+        return {
+            number: self._parse_package(packages[key])
+            if key in packages
+            else TrackingResult(status="Unknown", error="Tracking number not found")
+            for number, key in normalized.items()
+        }
 
     def _fetch_from_api(self, tracking_number: str) -> TrackingResult:
         """Make the actual API request to FedEx.
@@ -72,6 +88,10 @@ class FedExClient(CarrierClient):
         Returns:
             TrackingResult parsed from API response
         """
+        return self._parse_response(self._request([tracking_number]))
+
+    def _request(self, tracking_numbers: list[str]) -> dict:
+        """POST a track request for normalized tracking numbers."""
         headers = {
             "Content-Type": "application/json",
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
@@ -81,23 +101,41 @@ class FedExClient(CarrierClient):
             "TrackPackagesRequest": {
                 "appType": "WTRK",
                 "trackingInfoList": [
-                    {
-                        "trackingNumber": tracking_number,
-                    }
+                    {"trackingNumber": tracking_number} for tracking_number in tracking_numbers
                 ],
             }
         }
 
-        with httpx.Client(timeout=15) as client:
-            response = client.post(
-                FEDEX_TRACKING_URL,
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client(self.name)
+        response = client.post(
+            FEDEX_TRACKING_URL,
+            json=payload,
+            headers=headers,
+        )
+        response.raise_for_status()
+        data: dict = response.json()
+        return data
 
-        return self._parse_response(data)
+    @staticmethod
+    def _error_result(e: Exception) -> TrackingResult:
+        """TrackingResult for a failed request."""
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.warning(f"FedEx API HTTP error: {e.response.status_code}")
+            return TrackingResult(
+                status="Unknown",
+                error=f"FedEx API returned {e.response.status_code}",
+            )
+        if isinstance(e, httpx.ConnectError):
+            logger.warning(f"FedEx API connection error: {e}")
+            return TrackingResult(
+                status="Unknown",
+                error=f"Connection error: {e}",
+            )
+        logger.warning(f"Error fetching FedEx tracking: {e}")
+        return TrackingResult(
+            status="Unknown",
+            error=str(e),
+        )
 
     def _parse_response(self, data: dict) -> TrackingResult:
         """Parse FedEx API response into TrackingResult.
@@ -108,18 +146,20 @@ class FedExClient(CarrierClient):
         Returns:
             TrackingResult with parsed information
         """
-        try:
-            track_response = data.get("TrackPackagesResponse", {})
-            package_list = track_response.get("packageList", [])
+        track_response = data.get("TrackPackagesResponse", {})
+        package_list = track_response.get("packageList", [])
 
-            if not package_list:
-                return TrackingResult(
-                    status="Unknown",
-                    error="Tracking number not found",
-                )
+        if not package_list:
+            return TrackingResult(
+                status="Unknown",
+                error="Tracking number not found",
+            )
 
-            package = package_list[0]
+        return self._parse_package(package_list[0])
 
+    def _parse_package(self, package: dict) -> TrackingResult:
+        """Parse one packageList entry into TrackingResult."""
+        try:
             # Extract status
             key_status = package.get("keyStatus", "Unknown")
             status = self._normalize_status(key_status)
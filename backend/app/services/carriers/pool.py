@@ -0,0 +1,139 @@
+"""Shared HTTP sessions and bounded-concurrency fetching for carrier clients.
+
+Carrier clients make their requests through get_http_client(), one pooled
+keep-alive httpx.Client per carrier (httpx clients are thread-safe), instead
+of opening a new connection per lookup.
+
+fetch_tracking_concurrently() is the fetch stage used by the tracking poller
+and worker: lookups are grouped by carrier into multi-number requests where
+the carrier supports them (CarrierClient.max_batch_size), and the requests
+run on a thread pool, at most CARRIER_CONCURRENCY in flight per carrier, so
+a poll takes about as long as its slowest round of calls rather than the
+sum of all calls. Only the carrier calls run on the pool
+threads; callers resolve carriers and apply results to the database on
+their own thread.
+"""
+
+import logging
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from app.services.carriers.base import CarrierClient, TrackingResult
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a carrier request times out
+HTTP_TIMEOUT_SECONDS = 15
+
+# Concurrent requests per carrier (public tracking endpoints rate-limit)
+DEFAULT_CARRIER_CONCURRENCY = 5
+CARRIER_CONCURRENCY: dict[str, int] = {}
+
+# Upper bound on fetch threads across all carriers
+MAX_FETCH_WORKERS = 16
+
+_lock = threading.Lock()
+_clients: dict[str, httpx.Client] = {}
+_slots: dict[str, threading.BoundedSemaphore] = {}
+
+
+def carrier_concurrency(carrier_name: str) -> int:
+    """Maximum concurrent requests to a carrier."""
+    return CARRIER_CONCURRENCY.get(carrier_name, DEFAULT_CARRIER_CONCURRENCY)
+
+
+def get_http_client(carrier_name: str) -> httpx.Client:
+    """Shared keep-alive HTTP client for a carrier, created on first use."""
+    client = _clients.get(carrier_name)
+    if client is None:
+        with _lock:
+            client = _clients.get(carrier_name)
+            if client is None:
+                limit = carrier_concurrency(carrier_name)
+                client = httpx.Client(
+                    timeout=HTTP_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+                )
+                _clients[carrier_name] = client
+    return client
+
+
+def _carrier_slot(carrier_name: str) -> threading.BoundedSemaphore:
+    with _lock:
+        slot = _slots.get(carrier_name)
+        if slot is None:
+            slot = threading.BoundedSemaphore(carrier_concurrency(carrier_name))
+            _slots[carrier_name] = slot
+    return slot
+
+
+def close_http_clients() -> None:
+    """Close and forget every shared client (tests, shutdown)."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _slots.clear()
+    for client in clients:
+        client.close()
+
+
+def fetch_tracking_concurrently(
+    lookups: Sequence[tuple[CarrierClient, str]],
+) -> list[TrackingResult | Exception]:
+    """Fetch tracking for many packages with bounded per-carrier concurrency.
+
+    Lookups are grouped by carrier and fetched in chunks of the carrier's
+    max_batch_size, one fetch_tracking_batch() call per chunk (fetch_tracking()
+    for a single number).
+
+    Args:
+        lookups: (carrier client, tracking number) pairs
+
+    Returns:
+        One entry per lookup, in order: the TrackingResult, or the exception
+        the carrier call raised
+    """
+    # Unique numbers per carrier, first client seen for each carrier name
+    carriers: dict[str, CarrierClient] = {}
+    numbers: dict[str, dict[str, None]] = {}
+    for carrier, tracking_number in lookups:
+        carriers.setdefault(carrier.name, carrier)
+        numbers.setdefault(carrier.name, {})[tracking_number] = None
+
+    chunks: list[tuple[CarrierClient, list[str]]] = []
+    for name, carrier in carriers.items():
+        unique = list(numbers[name])
+        size = max(1, carrier.max_batch_size)
+        chunks.extend((carrier, unique[i : i + size]) for i in range(0, len(unique), size))
+
+    def fetch(chunk: tuple[CarrierClient, list[str]]) -> dict[str, TrackingResult | Exception]:
+        carrier, tracking_numbers = chunk
+        try:
+            with _carrier_slot(carrier.name):
+                if len(tracking_numbers) == 1:
+                    return {tracking_numbers[0]: carrier.fetch_tracking(tracking_numbers[0])}
+                return dict(carrier.fetch_tracking_batch(tracking_numbers))
+        except Exception as e:
+            return dict.fromkeys(tracking_numbers, e)
+
+    if len(chunks) <= 1:
+        fetched = [fetch(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(chunks))) as executor:
+            fetched = list(executor.map(fetch, chunks))
+
+    results: dict[tuple[str, str], TrackingResult | Exception] = {}
+    for (carrier, _), chunk_results in zip(chunks, fetched, strict=True):
+        for tracking_number, result in chunk_results.items():
+            results[(carrier.name, tracking_number)] = result
+
+    return [
+        results.get(
+            (carrier.name, tracking_number),
+            LookupError(f"{carrier.name} returned no result for {tracking_number}"),
+        )
+        for carrier, tracking_number in lookups
+    ]
@@ -2,22 +2,28 @@
 
 import logging
 import re
+from collections.abc import Sequence
 from datetime import datetime
 
 import httpx
 
 from app.services.carriers.base import CarrierClient, TrackingResult
+from app.services.carriers.pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
 # UPS tracking pattern: 1Z + 16 alphanumeric characters
 UPS_PATTERN = re.compile(r"^1Z[A-Z0-9]{16}$")
 
+# Tracking numbers per status request (the UPS tracking page accepts 25)
+UPS_BATCH_SIZE = 25
+
 
 class UPSCarrier(CarrierClient):
     """UPS tracking client using public JSON API."""
 
     name = "UPS"
+    max_batch_size = UPS_BATCH_SIZE
 
     @classmethod
     def can_handle(cls, tracking_number: str) -> bool:
@@ -43,39 +49,74 @@ class UPSCarrier(CarrierClient):
         """
         normalized = self._normalize(tracking_number)
 
+        try:
+            return self._parse_response(self._request([normalized]))
+        except Exception as e:
+            return self._error_result(e)
+
+    def fetch_tracking_batch(self, tracking_numbers: Sequence[str]) -> dict[str, TrackingResult]:
+        """Fetch tracking for up to UPS_BATCH_SIZE numbers in one request.
+
+        Args:
+            tracking_numbers: UPS tracking numbers
+
+        Returns:
+            TrackingResult per tracking number, keyed as passed in
+        """
+        normalized = {number: self._normalize(number) for number in tracking_numbers}
+
+        try:
+            data = self._request(list(dict.fromkeys(normalized.values())))
+        except Exception as e:
+            error = self._error_result(e)
+            return dict.fromkeys(tracking_numbers, error)
+
+        details = {
+            self._normalize(detail.get("trackingNumber", "")): detail
+            for detail in data.get("trackDetails", [])
+        }
+        return {
+            number: self._parse_detail(details[key])
+            if key in details
+            else TrackingResult(status="Unknown", error="Tracking number not found")
+            for number, key in normalized.items()
+        }
+
+    def _request(self, tracking_numbers: list[str]) -> dict:
+        """POST a status request for normalized tracking numbers."""
         url = "https://www.ups.com/track/api/Track/GetStatus?loc=en_US"
         headers = {
             "Content-Type": "application/json",
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
         }
-        payload = {"Locale": "en_US", "TrackingNumber": [normalized]}
+        payload = {"Locale": "en_US", "TrackingNumber": tracking_numbers}
 
-        try:
-            with httpx.Client(timeout=15) as client:
-                response = client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+        client = get_http_client(self.name)
+        response = client.post(url, json=payload, headers=headers)
+        response.raise_for_status()
+        data: dict = response.json()
+        return data
 
-            return self._parse_response(data)
-
-        except httpx.HTTPStatusError as e:
+    @staticmethod
+    def _error_result(e: Exception) -> TrackingResult:
+        """TrackingResult for a failed request."""
+        if isinstance(e, httpx.HTTPStatusError):
             logger.warning(f"UPS API error: {e.response.status_code}")
             return TrackingResult(
                 status="Unknown",
                 error=f"UPS API returned {e.response.status_code}",
             )
-        except httpx.TimeoutException as e:
+        if isinstance(e, httpx.TimeoutException):
             logger.warning(f"UPS API timeout: {e}")
             return TrackingResult(
                 status="Unknown",
                 error="Connection timed out",
             )
-        except Exception as e:
-            logger.warning(f"Error fetching UPS tracking: {e}")
-            return TrackingResult(
-                status="Unknown",
-                error=str(e),
-            )
+        logger.warning(f"Error fetching UPS tracking: {e}")
+        return TrackingResult(
+            status="Unknown",
+            error=str(e),
+        )
 
     @staticmethod
     def _normalize(tracking_number: str) -> str:
@@ -95,7 +136,10 @@ class UPSCarrier(CarrierClient):
         if not track_details:
             return TrackingResult(status="Unknown")
 
-        detail = track_details[0]
+        return self._parse_detail(track_details[0])
+
+    def _parse_detail(self, detail: dict) -> TrackingResult:
+        """Parse one package's trackDetails entry into TrackingResult."""
         status = detail.get("packageStatus", "Unknown")
 
         # Parse estimated delivery date
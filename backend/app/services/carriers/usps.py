@@ -2,12 +2,14 @@
 
 import logging
 import re
+from collections.abc import Sequence
 from datetime import date, datetime
 
 import defusedxml.ElementTree as ET
 import httpx
 
 from app.services.carriers.base import CarrierClient, TrackingResult
+from app.services.carriers.pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +24,15 @@ USPS_PATTERNS = [
 # USPS public tracking endpoint (no auth required)
 USPS_TRACKING_URL = "https://tools.usps.com/go/TrackConfirmAction?tLabels={tracking_number}"
 
+# Comma-separated tracking numbers per request (tLabels accepts 35)
+USPS_BATCH_SIZE = 35
+
 
 class USPSClient(CarrierClient):
     """USPS tracking client using public tracking endpoint."""
 
     name = "USPS"
+    max_batch_size = USPS_BATCH_SIZE
 
     def __init__(self):
         """Initialize the USPS client."""
@@ -62,29 +68,45 @@ class USPSClient(CarrierClient):
             TrackingResult with current status and delivery information
         """
         # Normalize tracking number
-        normalized = tracking_number.upper().replace(" ", "").replace("-", "")
+        normalized = self._normalize(tracking_number)
 
         try:
             result = self._fetch_from_api(normalized)
             return result
-        except httpx.HTTPStatusError as e:
-            logger.warning(f"USPS API HTTP error: {e.response.status_code}")
-            return TrackingResult(
-                status="Unknown",
-                error=f"USPS API returned {e.response.status_code}",
-            )
-        except httpx.ConnectError as e:
-            logger.warning(f"USPS API connection error: {e}")
-            return TrackingResult(
-                status="Unknown",
-                error=f"Connection error: {e}",
-            )
         except Exception as e:
-            logger.warning(f"Error fetching USPS tracking: {e}")
-            return TrackingResult(
-                status="Unknown",
-                error=str(e),
-            )
+            return self._error_result(e)
+
+    def fetch_tracking_batch(self, tracking_numbers: Sequence[str]) -> dict[str, TrackingResult]:
+        """Fetch tracking for up to USPS_BATCH_SIZE numbers in one request.
+
+        Args:
+            tracking_numbers: USPS tracking numbers
+
+        Returns:
+            TrackingResult per tracking number, keyed as passed in
+        """
+        normalized = {number: self._normalize(number) for number in tracking_numbers}
+
+        try:
+            xml_text = self._request(list(dict.fromkeys(normalized.values())))
+            root = ET.fromstring(xml_text)
+        except ET.ParseError as e:
+            error = TrackingResult(status="Unknown", error=f"Failed to parse USPS response: {e}")
+            return dict.fromkeys(tracking_numbers, error)
+        except Exception as e:
+            error = self._error_result(e)
+            return dict.fromkeys(tracking_numbers, error)
+
+        track_infos = {
+            (track_info.get("ID") or "").upper(): track_info
+            for track_info in root.iterfind(".//TrackInfo")
+        }
+        return {
+            number: self._parse_track_info(track_infos[key])
+            if key in track_infos
+            else TrackingResult(status="Unknown", error="No tracking information in response")
+            for number, key in normalized.items()
+        }
 
     def _fetch_from_api(self, tracking_number: str) -> TrackingResult:
         """Make the actual API request and parse response.
@@ -95,13 +117,43 @@ class USPSClient(CarrierClient):
         Returns:
             TrackingResult parsed from XML response
         """
-        url = USPS_TRACKING_URL.format(tracking_number=tracking_number)
+        return self._parse_response(self._request([tracking_number]))
+
+    def _request(self, tracking_numbers: list[str]) -> str:
+        """GET the tracking XML for normalized tracking numbers."""
+        url = USPS_TRACKING_URL.format(tracking_number=",".join(tracking_numbers))
 
-        with httpx.Client(timeout=self._timeout) as client:
-            response = client.get(url)
-            response.raise_for_status()
+        client = get_http_client(self.name)
+        response = client.get(url, timeout=self._timeout)
+        response.raise_for_status()
 
-        return self._parse_response(response.text)
+        return response.text
+
+    @staticmethod
+    def _error_result(e: Exception) -> TrackingResult:
+        """TrackingResult for a failed request."""
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.warning(f"USPS API HTTP error: {e.response.status_code}")
+            return TrackingResult(
+                status="Unknown",
+                error=f"USPS API returned {e.response.status_code}",
+            )
+        if isinstance(e, httpx.ConnectError):
+            logger.warning(f"USPS API connection error: {e}")
+            return TrackingResult(
+                status="Unknown",
+                error=f"Connection error: {e}",
+            )
+        logger.warning(f"Error fetching USPS tracking: {e}")
+        return TrackingResult(
+            status="Unknown",
+            error=str(e),
+        )
+
+    @staticmethod
+    def _normalize(tracking_number: str) -> str:
+        """Normalize tracking number: uppercase, remove spaces/dashes."""
+        return tracking_number.upper().replace(" ", "").replace("-", "")
 
     def _parse_response(self, xml_text: str) -> TrackingResult:
         """Parse USPS XML response.
@@ -128,6 +180,10 @@ class USPSClient(CarrierClient):
                 error="No tracking information in response",
             )
 
+        return self._parse_track_info(track_info)
+
+    def _parse_track_info(self, track_info) -> TrackingResult:
+        """Parse one TrackInfo element into TrackingResult."""
         # Check for error in response
         error_elem = track_info.find("Error/Description")
         if error_elem is not None and error_elem.text:
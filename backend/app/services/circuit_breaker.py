@@ -1,6 +1,21 @@
-"""Circuit breaker for carrier APIs."""
+"""Circuit breaker for carrier APIs.
+
+Breaker state is kept in memory per process; the carrier_circuit_state
+table is the store shared between containers. Each carrier's state is
+synced with its row at most every SYNC_INTERVAL_SECONDS, so between syncs
+is_circuit_open() and record_success() on a healthy carrier do no I/O.
+
+Failures and resets apply locally at once and are written behind at the
+next sync: failures as a delta added to the row's count, so containers
+don't overwrite each other's counts. Opening a circuit is written through
+immediately, and other containers pick it up at their next sync. Lambda
+containers can be frozen before that sync, so the tracking worker calls
+flush_circuit_state() at the end of each message.
+"""
 
 import logging
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy.orm import Session
@@ -12,6 +27,82 @@ logger = logging.getLogger(__name__)
 FAILURE_THRESHOLD = 3
 OPEN_DURATION_MINUTES = 30
 
+# Max age of a carrier's in-memory state before it is re-synced with the table
+SYNC_INTERVAL_SECONDS = 5
+
+
+@dataclass
+class _CircuitState:
+    """A carrier's breaker state as last synced, plus unwritten changes."""
+
+    failure_count: int = 0
+    open_until: datetime | None = None
+    last_failure_at: datetime | None = None
+    pending_failures: int = 0
+    pending_reset: bool = False
+    synced_at: float | None = None
+
+    @property
+    def dirty(self) -> bool:
+        return self.pending_failures > 0 or self.pending_reset
+
+
+_states: dict[str, _CircuitState] = {}
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    # Handle both naive and aware datetimes
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _sync(db: Session, carrier_name: str, state: _CircuitState) -> None:
+    """Write pending changes to the carrier's row and reload state from it."""
+    circuit = db.get(
+        CarrierCircuit, carrier_name, populate_existing=True, with_for_update=state.dirty
+    )
+    if state.dirty and (circuit is not None or state.pending_failures):
+        now = datetime.now(UTC)
+        if circuit is None:
+            circuit = CarrierCircuit(carrier_name=carrier_name, failure_count=0)
+            db.add(circuit)
+        if state.pending_reset:
+            circuit.failure_count = 0
+            circuit.circuit_open_until = None
+        if state.pending_failures:
+            circuit.failure_count = (circuit.failure_count or 0) + state.pending_failures
+            circuit.last_failure_at = state.last_failure_at
+            if circuit.failure_count >= FAILURE_THRESHOLD:
+                circuit.circuit_open_until = now + timedelta(minutes=OPEN_DURATION_MINUTES)
+                logger.warning(
+                    f"Circuit opened for {carrier_name} after {circuit.failure_count} failures"
+                )
+        circuit.updated_at = now
+        db.commit()
+    state.pending_failures = 0
+    state.pending_reset = False
+
+    if circuit is None:
+        state.failure_count = 0
+        state.open_until = None
+        state.last_failure_at = None
+    else:
+        state.failure_count = circuit.failure_count or 0
+        state.open_until = _as_utc(circuit.circuit_open_until)
+        state.last_failure_at = _as_utc(circuit.last_failure_at)
+    state.synced_at = time.monotonic()
+
+
+def _get_state(db: Session, carrier_name: str) -> _CircuitState:
+    """In-memory state for a carrier, synced first if older than the interval."""
+    state = _states.get(carrier_name)
+    if state is None:
+        state = _states.setdefault(carrier_name, _CircuitState())
+    if state.synced_at is None or time.monotonic() - state.synced_at >= SYNC_INTERVAL_SECONDS:
+        _sync(db, carrier_name, state)
+    return state
+
 
 def is_circuit_open(db: Session, carrier_name: str) -> bool:
     """Check if circuit is open for a carrier.
@@ -23,14 +114,8 @@ def is_circuit_open(db: Session, carrier_name: str) -> bool:
     Returns:
         True if circuit is open (still within timeout), False otherwise
     """
-    circuit = db.get(CarrierCircuit, carrier_name)
-    if not circuit or not circuit.circuit_open_until:
-        return False
-    # Handle both naive and aware datetimes
-    open_until = circuit.circuit_open_until
-    if open_until.tzinfo is None:
-        open_until = open_until.replace(tzinfo=UTC)
-    return open_until > datetime.now(UTC)
+    open_until = _get_state(db, carrier_name).open_until
+    return open_until is not None and open_until > datetime.now(UTC)
 
 
 def record_failure(db: Session, carrier_name: str) -> None:
@@ -40,34 +125,52 @@ def record_failure(db: Session, carrier_name: str) -> None:
         db: Database session
         carrier_name: Name of the carrier
 
-    Opens the circuit if failure count reaches threshold.
+    Opens the circuit if failure count reaches threshold. Failures below the
+    threshold are written at the next sync.
     """
-    circuit = db.get(CarrierCircuit, carrier_name)
-    if not circuit:
-        circuit = CarrierCircuit(carrier_name=carrier_name, failure_count=0)
-        db.add(circuit)
-    circuit.failure_count += 1
-    circuit.last_failure_at = datetime.now(UTC)
-    circuit.updated_at = datetime.now(UTC)
-    if circuit.failure_count >= FAILURE_THRESHOLD:
-        circuit.circuit_open_until = datetime.now(UTC) + timedelta(minutes=OPEN_DURATION_MINUTES)
-        logger.warning(f"Circuit opened for {carrier_name} after {circuit.failure_count} failures")
-    db.commit()
+    state = _get_state(db, carrier_name)
+    state.failure_count += 1
+    state.pending_failures += 1
+    state.last_failure_at = datetime.now(UTC)
+    if state.failure_count >= FAILURE_THRESHOLD:
+        _sync(db, carrier_name, state)
 
 
 def record_success(db: Session, carrier_name: str) -> None:
     """Record a successful carrier API call.
 
-    Resets failure count and closes circuit if open.
+    Resets failure count and closes circuit if open. The reset is written
+    at the next sync; on a carrier with no failures this does nothing.
 
     Args:
         db: Database session
         carrier_name: Name of the carrier
     """
-    circuit = db.get(CarrierCircuit, carrier_name)
-    if not circuit:
+    state = _get_state(db, carrier_name)
+    if state.failure_count == 0 and state.open_until is None and not state.pending_failures:
         return
-    circuit.failure_count = 0
-    circuit.circuit_open_until = None
-    circuit.updated_at = datetime.now(UTC)
-    db.commit()
+    state.failure_count = 0
+    state.open_until = None
+    state.pending_failures = 0
+    state.pending_reset = True
+
+
+def flush_circuit_state(db: Session) -> None:
+    """Write every carrier's pending failures and resets now.
+
+    Best effort: on a database error the changes stay pending for the next
+    sync.
+    """
+    for carrier_name, state in list(_states.items()):
+        if not state.dirty:
+            continue
+        try:
+            _sync(db, carrier_name, state)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to write circuit state for {carrier_name}: {e}")
+
+
+def reset_circuit_state() -> None:
+    """Forget all in-memory state, dropping unwritten changes (tests)."""
+    _states.clear()
@@ -5,17 +5,18 @@ reducing database round trips by using GROUPING SETS and conditional
 aggregation.
 """
 
-import json
-import logging
-
 from sqlalchemy import case, func, literal
 from sqlalchemy.orm import Session
 
-from app.cache import get_redis
+from app.cache import TAG_BOOKS, TAG_ENTITIES, get_or_compute, get_redis
 from app.enums import OWNED_STATUSES
 from app.models import Book
 from app.utils import safe_float
 
+# Dashboard response cache: fresh for 5 minutes, then served stale while rebuilt
+DASHBOARD_CACHE_TTL = 300
+DASHBOARD_STALE_TTL = 600
+
 
 def get_dimension_stats(db: Session) -> dict:
     """Get condition, category, and era stats in a single query.
@@ -218,8 +219,11 @@ def get_overview_stats(db: Session) -> dict:
 def get_dashboard_optimized(db: Session, reference_date: str = None, days: int = 90) -> dict:
     """Get all dashboard stats with optimized queries and caching.
 
-    Caches the complete dashboard response for 5 minutes.
-    Falls back to direct queries when Redis is unavailable.
+    Caches the complete dashboard response for 5 minutes, tagged ``books`` and
+    ``entities`` so book/author/publisher/binder writes invalidate it. After
+    expiry the stale response keeps being served for DASHBOARD_STALE_TTL while
+    a single caller rebuilds it, so a cold dashboard never fans out duplicate
+    query sets. Falls back to direct queries when Redis is unavailable.
 
     Args:
         db: Database session
@@ -229,26 +233,23 @@ def get_dashboard_optimized(db: Session, reference_date: str = None, days: int =
     Returns:
         dict matching DashboardResponse schema
     """
-    logger = logging.getLogger(__name__)
-
     # Build cache key based on parameters
     # v2: Added OWNED_STATUSES filter to dimension stats queries
     cache_key = f"dashboard:v2:stats:{reference_date or 'default'}:{days}"
 
-    # Try cache first
-    client = get_redis()
-    if client:
-        try:
-            cached_value = client.get(cache_key)
-            if cached_value:
-                logger.debug(f"Dashboard cache HIT: {cache_key}")
-                return json.loads(cached_value)
-        except Exception as e:
-            logger.warning(f"Dashboard cache GET failed: {e}")
+    result: dict = get_or_compute(
+        get_redis(),
+        cache_key,
+        lambda: _build_dashboard(db, reference_date, days),
+        ttl=DASHBOARD_CACHE_TTL,
+        tags=(TAG_BOOKS, TAG_ENTITIES),
+        stale_ttl=DASHBOARD_STALE_TTL,
+    )
+    return result
 
-    logger.debug(f"Dashboard cache MISS: {cache_key}")
 
-    # Cache miss - execute queries
+def _build_dashboard(db: Session, reference_date: str | None, days: int) -> dict:
+    """Run the dashboard queries (cache miss path)."""
     # Import internal query functions (no auth param) instead of endpoint functions
     from app.api.v1.stats import (
         query_acquisitions_daily,
@@ -286,13 +287,4 @@ def get_dashboard_optimized(db: Session, reference_date: str = None, days: int =
         },
     }
 
-    # Store in cache
-    if client:
-        try:
-            serialized = json.dumps(result, default=str)
-            client.setex(cache_key, 300, serialized)  # 5 minute TTL
-            logger.debug(f"Dashboard cached: {cache_key}")
-        except Exception as e:
-            logger.warning(f"Dashboard cache SET failed: {e}")
-
     return result
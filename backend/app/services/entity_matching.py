@@ -6,29 +6,32 @@ that closely match new input.
 
 Key features:
 - Type-specific normalization before matching
-- Cached entity lists for performance (5-min TTL, thread-safe)
+- Cached entity lists shared with the other matchers (app.services.reference_cache:
+  5-min TTL, invalidated across containers via Redis)
 - Uses rapidfuzz token_sort_ratio for word-order-independent matching
+- Bigram index per cache snapshot narrows scoring to possible matches
 - Returns book counts to help identify canonical entries
 """
 
-import threading
-import time
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Literal
+from typing import TypeVar
 
 from rapidfuzz import fuzz
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.services.author_normalization import normalize_author_name
-from app.services.binder_normalization import normalize_binder_name_for_matching
-from app.services.publisher_validation import auto_correct_publisher_name
+from app.cache import TAG_ENTITIES, invalidate_tags
+from app.services.match_index import NgramIndex, sort_tokens
+from app.services.reference_cache import (
+    REFERENCE_CACHE_TTL_SECONDS,
+    EntityType,
+    ReferenceEntity,
+    normalize_for_entity_type,
+    reference_cache,
+)
 
-# Type alias for entity types
-EntityType = Literal["publisher", "binder", "author"]
-
-# Cache TTL: 5 minutes (matches existing publisher cache)
-ENTITY_CACHE_TTL_SECONDS = 300
+# Cache TTL: 5 minutes (the shared reference cache TTL)
+ENTITY_CACHE_TTL_SECONDS = REFERENCE_CACHE_TTL_SECONDS
 
 # Fuzzy matching threshold defaults (0.0 to 1.0)
 # These values were chosen based on empirical testing with Victorian-era book data:
@@ -53,12 +56,7 @@ DEFAULT_THRESHOLD_PUBLISHER = 0.80
 DEFAULT_THRESHOLD_BINDER = 0.80
 DEFAULT_THRESHOLD_AUTHOR = 0.75
 
-# Thread-safe caching for each entity type
-# Structure: {entity_type: [(id, name, normalized_name, tier, book_count), ...]}
-# Normalized names are pre-computed at cache time to avoid O(n) normalization per query
-_entity_caches: dict[str, list[tuple[int, str, str, str | None, int]]] = {}
-_entity_cache_times: dict[str, float] = {}
-_entity_cache_lock = threading.Lock()
+IndexT = TypeVar("IndexT")
 
 
 @dataclass
@@ -80,175 +78,48 @@ class EntityMatch:
     book_count: int
 
 
-def _query_entities_from_db(db: Session, entity_type: EntityType) -> list:
-    """Query entities from the database.
-
-    This function performs the DB query without holding any locks,
-    allowing other threads to proceed while the query executes.
-
-    Args:
-        db: Database session.
-        entity_type: Type of entity to query.
-
-    Returns:
-        List of query result rows with id, name, tier, and book_count.
-
-    Raises:
-        ValueError: If entity_type is not a valid type.
-    """
-    if entity_type == "publisher":
-        from app.models.book import Book
-        from app.models.publisher import Publisher
-
-        return (
-            db.query(
-                Publisher.id,
-                Publisher.name,
-                Publisher.tier,
-                func.count(Book.id).label("book_count"),
-            )
-            .outerjoin(Book, Book.publisher_id == Publisher.id)
-            .group_by(Publisher.id, Publisher.name, Publisher.tier)
-            .all()
-        )
-
-    elif entity_type == "author":
-        from app.models.author import Author
-        from app.models.book import Book
-
-        return (
-            db.query(
-                Author.id,
-                Author.name,
-                Author.tier,
-                func.count(Book.id).label("book_count"),
-            )
-            .outerjoin(Book, Book.author_id == Author.id)
-            .group_by(Author.id, Author.name, Author.tier)
-            .all()
-        )
-
-    elif entity_type == "binder":
-        from app.models.binder import Binder
-        from app.models.book import Book
-
-        return (
-            db.query(
-                Binder.id,
-                Binder.name,
-                Binder.tier,
-                func.count(Book.id).label("book_count"),
-            )
-            .outerjoin(Book, Book.binder_id == Binder.id)
-            .group_by(Binder.id, Binder.name, Binder.tier)
-            .all()
-        )
-
-    else:
-        raise ValueError(f"Unknown entity type: {entity_type}")
-
-
-def _get_cached_entities(
-    db: Session, entity_type: EntityType
-) -> list[tuple[int, str, str, str | None, int]]:
-    """Get entities from cache or DB, with TTL-based expiration.
-
-    Returns list of (id, name, normalized_name, tier, book_count) tuples.
-    Normalized names are pre-computed at cache time to avoid O(n) normalization per query.
-    Thread-safe with lock protection.
-
-    IMPORTANT: DB queries are performed OUTSIDE the lock to avoid blocking
-    other requests. Only cache read/write operations hold the lock.
-
-    Args:
-        db: Database session.
-        entity_type: Type of entity to cache.
-
-    Returns:
-        List of (id, name, normalized_name, tier, book_count) tuples.
-    """
-    current_time = time.monotonic()
-
-    # Fast path: check cache without lock first
-    if (
-        entity_type in _entity_caches
-        and (current_time - _entity_cache_times.get(entity_type, 0)) < ENTITY_CACHE_TTL_SECONDS
-    ):
-        return _entity_caches[entity_type]
-
-    # Slow path: need to refresh cache
-    # Do DB query OUTSIDE the lock to avoid blocking other requests
-    entities = _query_entities_from_db(db, entity_type)
-
-    # Now acquire lock just for cache update
-    with _entity_cache_lock:
-        # Double-check another thread didn't populate while we queried
-        if (
-            entity_type in _entity_caches
-            and (time.monotonic() - _entity_cache_times.get(entity_type, 0))
-            < ENTITY_CACHE_TTL_SECONDS
-        ):
-            return _entity_caches[entity_type]
-
-        # Convert to tuple list with pre-computed normalized names and cache
-        # This avoids O(n) normalization per query
-        _entity_caches[entity_type] = [
-            (
-                e.id,
-                e.name,
-                _normalize_for_entity_type(e.name, entity_type),
-                e.tier,
-                e.book_count,
-            )
-            for e in entities
-        ]
-        _entity_cache_times[entity_type] = time.monotonic()
-
-        return _entity_caches[entity_type]
-
-
 def invalidate_entity_cache(entity_type: EntityType) -> None:
     """Invalidate the cache for a specific entity type.
 
-    Call this when entities are created, updated, or deleted.
-    For publishers, also invalidates the legacy publisher_validation cache
-    to maintain consistency across both caching systems.
+    Call this when entities are created, updated, or deleted. Drops the
+    shared reference snapshot on every container (see reference_cache) and
+    invalidates Redis entries tagged ``entities`` (e.g. the dashboard).
 
     Args:
         entity_type: Type of entity cache to invalidate.
     """
-    with _entity_cache_lock:
-        if entity_type in _entity_caches:
-            del _entity_caches[entity_type]
-        if entity_type in _entity_cache_times:
-            del _entity_cache_times[entity_type]
-
-    # Also invalidate legacy publisher cache for backwards compatibility
-    # TODO(#971): Consolidate publisher caching into single system
-    if entity_type == "publisher":
-        from app.services.publisher_validation import invalidate_publisher_cache
+    reference_cache.invalidate(entity_type)
+    invalidate_tags(TAG_ENTITIES)
 
-        invalidate_publisher_cache()
 
+def get_entity_index(
+    db: Session,
+    entity_type: EntityType,
+    kind: str,
+    build: Callable[[list[ReferenceEntity]], IndexT],
+) -> tuple[list[ReferenceEntity], IndexT]:
+    """Get the cached entities together with an index built over them.
 
-def _normalize_for_entity_type(name: str, entity_type: EntityType) -> str:
-    """Apply type-specific normalization to a name.
+    The index is built once per cache snapshot: it is rebuilt only when
+    the entity cache is refreshed or invalidated.
 
     Args:
-        name: Raw entity name.
-        entity_type: Type of entity for normalization rules.
+        db: Database session.
+        entity_type: Type of entity.
+        kind: Name distinguishing this index from others on the same entities.
+        build: Builds the index from the cached (id, name, normalized_name,
+            tier, book_count) tuples; positions in the index must follow
+            the list order.
 
     Returns:
-        Normalized name for matching.
+        Tuple of (cached entities, index).
     """
-    if entity_type == "publisher":
-        return auto_correct_publisher_name(name)
-    elif entity_type == "author":
-        return normalize_author_name(name)
-    elif entity_type == "binder":
-        return normalize_binder_name_for_matching(name)
-    else:
-        raise ValueError(f"Unknown entity type: {entity_type}")
+    snapshot = reference_cache.get(db, entity_type)
+    return snapshot.entities, snapshot.index(kind, build)
+
+
+def _build_token_sort_index(entities: list[ReferenceEntity]) -> NgramIndex:
+    return NgramIndex(sort_tokens(normalized.lower()) for _, _, normalized, _, _ in entities)
 
 
 def fuzzy_match_entity(
@@ -271,8 +142,10 @@ def fuzzy_match_entity(
     1. Apply type-specific normalization to input name (handles location
        suffixes, honorifics, parentheticals, diacritics per entity type)
     2. Query all entities of the type (cached, 5-min TTL, with pre-normalized names)
-    3. Score with rapidfuzz token_sort_ratio (word-order independent)
-    4. Return matches above threshold, sorted by confidence descending
+    3. Narrow to entities sharing a bigram with the input (match_index), when
+       the threshold allows it
+    4. Score with rapidfuzz token_sort_ratio (word-order independent)
+    5. Return matches above threshold, sorted by confidence descending
 
     Args:
         db: Database session.
@@ -292,7 +165,7 @@ def fuzzy_match_entity(
         ValueError: If entity_type is not a valid type.
 
     See Also:
-        - _normalize_for_entity_type: The normalization function used internally.
+        - reference_cache.normalize_for_entity_type: The normalization function used internally.
         - TestNormalizationContract: Tests documenting this contract (issue #1016).
     """
     # Validate entity type
@@ -304,16 +177,21 @@ def fuzzy_match_entity(
         return []
 
     # Apply type-specific normalization before matching
-    normalized_name = _normalize_for_entity_type(name, entity_type)
+    normalized_name = normalize_for_entity_type(name, entity_type)
 
     if not normalized_name:
         return []
 
     # Get entities from cache (includes pre-computed normalized names)
-    cached_entities = _get_cached_entities(db, entity_type)
+    cached_entities, index = get_entity_index(
+        db, entity_type, "token_sort", _build_token_sort_index
+    )
+    # Only entities that can reach the threshold (None: too low to prune)
+    positions = index.candidates(sort_tokens(normalized_name.lower()), threshold)
+    candidates = cached_entities if positions is None else [cached_entities[p] for p in positions]
 
     matches = []
-    for entity_id, entity_name, normalized_entity_name, entity_tier, book_count in cached_entities:
+    for entity_id, entity_name, normalized_entity_name, entity_tier, book_count in candidates:
         # Use pre-computed normalized name from cache (avoids O(n) normalization per query)
         # Calculate similarity using token_sort_ratio (word-order independent)
         # rapidfuzz returns 0-100 scale, normalize to 0.0-1.0
@@ -43,6 +43,7 @@ from app.services.ai_profile_generator import (
 )
 from app.services.narrative_classifier import classify_connection
 from app.services.social_circles_cache import get_or_build_graph
+from app.services.social_circles_index import get_graph_index
 
 logger = logging.getLogger(__name__)
 
@@ -442,18 +443,9 @@ def _iter_connected_entities(
 
     Edges are sorted by strength descending so highest-strength connections
     come first.  Edges whose "other" node cannot be resolved are skipped.
+    Uses the graph's cached index, so this is O(degree) rather than O(edges).
     """
-    connected_edges = sorted(
-        (e for e in graph.edges if e.source == node_id or e.target == node_id),
-        key=lambda e: e.strength,
-        reverse=True,
-    )
-    node_map = {n.id: n for n in graph.nodes}
-    for edge in connected_edges:
-        other_id = edge.target if edge.source == node_id else edge.source
-        node = node_map.get(other_id)
-        if not node:
-            continue
+    for node, edge in get_graph_index(graph).neighbors(node_id):
         type_str = node.type.value if hasattr(node.type, "value") else str(node.type)
         yield type_str, node.entity_id, node.name, node, edge
 
@@ -486,12 +478,11 @@ def _build_connections(
     node_id = f"{entity_type}:{entity_id}"
     if graph is None:
         graph = get_or_build_graph(db)
+    index = get_graph_index(graph)
 
     # Resolve source node and count edges (needed before iterating)
-    source_node = next((n for n in graph.nodes if n.id == node_id), None)
-    source_connection_count = sum(
-        1 for e in graph.edges if e.source == node_id or e.target == node_id
-    )
+    source_node = index.node(node_id)
+    source_connection_count = index.degree(node_id)
 
     # Materialise connected entities so we can bulk-fetch shared books
     connected = list(_iter_connected_entities(node_id, graph))
@@ -639,11 +630,7 @@ def _build_connections(
             # fall back to DB so AI connections aren't silently dropped when
             # the target is missing from the cached graph (#1827).
             target_node_id = f"{other_type}:{other_id}"
-            target_node = (
-                next((n for n in graph.nodes if n.id == target_node_id), None)
-                if graph is not None
-                else None
-            )
+            target_node = index.node(target_node_id)
 
             if target_node:
                 entity_data = _node_to_profile_entity(target_node)
@@ -786,12 +773,11 @@ def generate_and_cache_profile(
     t0 = time.monotonic()
     if graph is None:
         graph = get_or_build_graph(db)
+    index = get_graph_index(graph)
 
     # Resolve source node and count edges (needed before iterating)
-    source_node = next((n for n in graph.nodes if n.id == node_id), None)
-    source_connection_count = sum(
-        1 for e in graph.edges if e.source == node_id or e.target == node_id
-    )
+    source_node = index.node(node_id)
+    source_connection_count = index.degree(node_id)
 
     # Materialise connected entities (sorted by strength descending)
     connected = list(_iter_connected_entities(node_id, graph))
@@ -22,10 +22,10 @@ from app.config import get_settings
 from app.schemas.entity_validation import EntitySuggestion, EntityValidationError
 from app.services.entity_matching import (
     EntityType,
-    _get_cached_entities,
-    _normalize_for_entity_type,
     fuzzy_match_entity,
+    get_entity_index,
 )
+from app.services.reference_cache import ReferenceEntity, normalize_for_entity_type
 
 
 @dataclass
@@ -100,16 +100,18 @@ def _get_entity_by_normalized_name(
     Returns:
         Tuple of (entity_id, entity_name) if found, None otherwise.
     """
-    # Use the cached entities which have pre-computed normalized names
-    # Cache format: (id, name, normalized_name, tier, book_count)
-    cached_entities = _get_cached_entities(db, entity_type)
-    normalized_lower = normalized_name.lower()
+    # Lookup table over the cached pre-computed normalized names, built once
+    # per cache snapshot
+    _, by_normalized = get_entity_index(db, entity_type, "normalized_exact", _build_exact_index)
+    return by_normalized.get(normalized_name.lower())
 
-    for entity_id, name, cached_normalized, _tier, _book_count in cached_entities:
-        if cached_normalized.lower() == normalized_lower:
-            return (entity_id, name)
 
-    return None
+def _build_exact_index(entities: list[ReferenceEntity]) -> dict[str, tuple[int, str]]:
+    """Map lowercased normalized name to the first (entity_id, name) with it."""
+    by_normalized: dict[str, tuple[int, str]] = {}
+    for entity_id, name, cached_normalized, _tier, _book_count in entities:
+        by_normalized.setdefault(cached_normalized.lower(), (entity_id, name))
+    return by_normalized
 
 
 def validate_entity_creation(
@@ -207,7 +209,7 @@ def _validate_entity_with_context(
     settings = get_settings()
 
     # Normalize input name using type-specific normalization
-    normalized_name = _normalize_for_entity_type(name, entity_type)
+    normalized_name = normalize_for_entity_type(name, entity_type)
 
     # First try exact match by normalized name (no fuzzy matching ambiguity)
     exact_match = _get_entity_by_normalized_name(db, entity_type, normalized_name)
@@ -25,7 +25,6 @@ from app.services.bedrock import (
     get_bedrock_client,
     get_model_id,
 )
-from app.services.book_queries import get_other_books_by_author
 from app.services.fmv_lookup import lookup_fmv
 from app.services.image_cleanup import delete_unrelated_images
 from app.services.scoring import get_author_owned_book_count
@@ -575,13 +574,9 @@ def generate_eval_runbook(
     author_book_count = get_author_owned_book_count(db, book.author_id, book.id)
 
     # Check for duplicates - only consider books actually in collection
-    is_duplicate = False
-    from app.services.scoring import is_duplicate_title
+    from app.services.scoring import find_duplicate_title
 
-    for other in get_other_books_by_author(book, db):
-        if is_duplicate_title(book.title, other.title):
-            is_duplicate = True
-            break
+    is_duplicate = find_duplicate_title(book, db) is not None
 
     # Calculate quality score
     tiered_quality_score = calculate_quality_score(
@@ -8,8 +8,9 @@ from urllib.parse import urlparse
 
 from sqlalchemy.orm import Session
 
-from app.models import Author, Binder, Publisher
 from app.services.bedrock import get_bedrock_client
+from app.services.entity_matching import EntityType, get_entity_index
+from app.services.match_index import TokenIndex
 
 logger = logging.getLogger(__name__)
 
@@ -188,26 +189,37 @@ def match_reference(
     name: str,
     records: list[tuple[int, str]],  # List of (id, name) tuples
     threshold: float = 0.9,
+    index: TokenIndex | None = None,
 ) -> dict | None:
     """Match a name against records using fuzzy matching.
 
+    Args:
+        name: Name to match
+        records: List of (id, name) tuples
+        threshold: Minimum Jaccard similarity for a fuzzy match
+        index: TokenIndex over normalize_name() of each record, in record
+            order. Built on the fly when omitted.
+
     Returns:
         Dict with id, name, similarity if match found, else None
     """
+    if index is None:
+        index = TokenIndex(normalize_name(record_name) for _, record_name in records)
     normalized_input = normalize_name(name)
-    best_match = None
-    best_similarity = 0.0
-
-    for record_id, record_name in records:
-        normalized_record = normalize_name(record_name)
 
-        # Exact match
-        if normalized_input == normalized_record:
-            return {"id": record_id, "name": record_name, "similarity": 1.0}
+    # Exact match
+    exact = index.exact(normalized_input)
+    if exact is not None:
+        record_id, record_name = records[exact]
+        return {"id": record_id, "name": record_name, "similarity": 1.0}
 
-        # Fuzzy match
-        similarity = jaccard_similarity(normalized_input, normalized_record)
+    # Fuzzy match: only records sharing a token can have non-zero similarity
+    best_match = None
+    best_similarity = 0.0
+    for position in index.candidates(normalized_input):
+        similarity = jaccard_similarity(normalized_input, index.keys[position])
         if similarity > best_similarity:
+            record_id, record_name = records[position]
             best_similarity = similarity
             best_match = {"id": record_id, "name": record_name, "similarity": similarity}
 
@@ -216,22 +228,34 @@ def match_reference(
     return None
 
 
+def _build_reference_index(
+    entities: list[tuple[int, str, str, str | None, int]],
+) -> tuple[list[tuple[int, str]], TokenIndex]:
+    records = [(entity_id, entity_name) for entity_id, entity_name, *_ in entities]
+    return records, TokenIndex(normalize_name(record_name) for _, record_name in records)
+
+
+def _match_entity(name: str, db: Session, entity_type: EntityType, threshold: float) -> dict | None:
+    """Match against the cached entity list, with its token index built once per generation."""
+    _, (records, index) = get_entity_index(
+        db, entity_type, "listing_reference", _build_reference_index
+    )
+    return match_reference(name, records, threshold, index=index)
+
+
 def match_author(name: str, db: Session, threshold: float = 0.7) -> dict | None:
     """Match author name against database."""
-    authors = db.query(Author.id, Author.name).all()
-    return match_reference(name, authors, threshold)
+    return _match_entity(name, db, "author", threshold)
 
 
 def match_publisher(name: str, db: Session, threshold: float = 0.7) -> dict | None:
     """Match publisher name against database."""
-    publishers = db.query(Publisher.id, Publisher.name).all()
-    return match_reference(name, publishers, threshold)
+    return _match_entity(name, db, "publisher", threshold)
 
 
 def match_binder(name: str, db: Session, threshold: float = 0.7) -> dict | None:
     """Match binder name against database."""
-    binders = db.query(Binder.id, Binder.name).all()
-    return match_reference(name, binders, threshold)
+    return _match_entity(name, db, "binder", threshold)
 
 
 # =============================================================================
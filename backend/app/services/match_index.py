@@ -0,0 +1,110 @@
+"""Inverted indexes for fuzzy name matching.
+
+The matchers in entity_matching, publisher_validation and listing score a
+name against every cached entity. These indexes narrow that to the entities
+that can possibly reach the threshold. Callers still compute the same
+rapidfuzz/Jaccard scores on the candidates, so the results are unchanged.
+
+NgramIndex (for fuzz.ratio and token_sort_ratio):
+    fuzz.ratio(a, b) = 2 * LCS / (len(a) + len(b)). Turning a into b takes
+    len(a) - LCS deletions and len(b) - LCS insertions. Pad both strings with
+    a sentinel and take bigrams. A deletion breaks at most two of a's
+    bigrams and an insertion at most one, so at least
+    3 * LCS - len(a) - len(b) + 1 of them survive in b. At ratio >= 2/3 that
+    is always >= 1. Every entity that can match therefore shares a padded
+    bigram with the query. Lower thresholds can't be pruned this way, so
+    candidates() returns None and the caller scans everything.
+
+TokenIndex (for token Jaccard similarity):
+    A non-zero Jaccard score needs a shared token.
+
+Indexes are immutable. Build one per cache generation, next to the cached
+entity list it indexes.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+# Below this fuzz.ratio threshold a match may share no padded bigram
+MIN_INDEXED_THRESHOLD = 2 / 3
+
+# Never appears in names; marks the start and end of a key
+_PAD = "\x00"
+
+# Slack on the length bounds so float rounding never drops a boundary match
+_LENGTH_EPSILON = 1e-9
+
+
+def sort_tokens(text: str) -> str:
+    """The form rapidfuzz token_sort_ratio compares (tokens sorted, space-joined)."""
+    return " ".join(sorted(text.split()))
+
+
+def _bigrams(text: str) -> set[str]:
+    padded = f"{_PAD}{text}{_PAD}"
+    return {padded[i : i + 2] for i in range(len(padded) - 1)}
+
+
+class NgramIndex:
+    """Padded-bigram inverted index over a list of keys."""
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.keys = list(keys)
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for position, key in enumerate(self.keys):
+            for gram in _bigrams(key):
+                self._postings[gram].append(position)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def candidates(self, query: str, threshold: float) -> list[int] | None:
+        """Positions of keys that may satisfy ``fuzz.ratio(query, key) >= threshold``.
+
+        Args:
+            query: String in the same form as the indexed keys
+            threshold: Score threshold on a 0.0 to 1.0 scale
+
+        Returns:
+            Sorted key positions, or None if the threshold is too low to
+            prune (caller must check every key)
+        """
+        if threshold < MIN_INDEXED_THRESHOLD:
+            return None
+        # ratio >= t bounds the key length: t * (n + m) <= 2 * min(n, m)
+        n = len(query)
+        min_len = n * threshold / (2 - threshold) - _LENGTH_EPSILON
+        max_len = n * (2 - threshold) / threshold + _LENGTH_EPSILON
+        positions: set[int] = set()
+        for gram in _bigrams(query):
+            positions.update(self._postings.get(gram, ()))
+        return sorted(p for p in positions if min_len <= len(self.keys[p]) <= max_len)
+
+
+class TokenIndex:
+    """Whitespace-token inverted index over a list of keys."""
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.keys = list(keys)
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        self._exact: dict[str, int] = {}
+        for position, key in enumerate(self.keys):
+            self._exact.setdefault(key, position)
+            for token in set(key.split()):
+                self._postings[token].append(position)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def exact(self, query: str) -> int | None:
+        """Position of the first key equal to query, if any."""
+        return self._exact.get(query)
+
+    def candidates(self, query: str) -> list[int]:
+        """Sorted positions of keys sharing at least one token with query."""
+        positions: set[int] = set()
+        for token in set(query.split()):
+            positions.update(self._postings.get(token, ()))
+        return sorted(positions)
@@ -1,8 +1,6 @@
 """Publisher validation service for normalizing and matching publisher names."""
 
 import re
-import threading
-import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -12,64 +10,45 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.publisher_alias import PublisherAlias
+from app.services.match_index import NgramIndex, sort_tokens
 
 if TYPE_CHECKING:
     from app.models.publisher import Publisher
 
 
-# Publisher cache for fuzzy matching - avoids O(n) DB queries per lookup
-# Cache is thread-safe and expires after 5 minutes
-_publisher_cache: list[tuple[int, str, str | None]] | None = None
-_publisher_cache_time: float = 0.0
-_publisher_cache_lock = threading.Lock()
-PUBLISHER_CACHE_TTL_SECONDS = 300  # 5 minutes
-
-
-def _get_cached_publishers(db: Session) -> list[tuple[int, str, str | None]]:
-    """Get publishers from cache or DB, with TTL-based expiration.
+def invalidate_publisher_cache() -> None:
+    """Invalidate the cached publisher list.
 
-    Returns list of (id, name, tier) tuples for fuzzy matching.
-    Thread-safe with lock protection.
+    Call this when publishers are created, updated, or deleted. Publishers
+    are read from the shared reference cache (app.services.reference_cache),
+    so this invalidates them for every matcher on every container.
     """
-    global _publisher_cache, _publisher_cache_time
-
-    current_time = time.monotonic()
-
-    # Check if cache is valid (double-checked locking pattern)
-    if (
-        _publisher_cache is not None
-        and (current_time - _publisher_cache_time) < PUBLISHER_CACHE_TTL_SECONDS
-    ):
-        return _publisher_cache
+    from app.services.reference_cache import reference_cache
 
-    with _publisher_cache_lock:
-        # Re-check inside lock (another thread may have refreshed)
-        if (
-            _publisher_cache is not None
-            and (current_time - _publisher_cache_time) < PUBLISHER_CACHE_TTL_SECONDS
-        ):
-            return _publisher_cache
+    reference_cache.invalidate("publisher")
 
-        from app.models.publisher import Publisher
 
-        # Query only the fields needed for fuzzy matching (more efficient)
-        publishers = db.query(Publisher.id, Publisher.name, Publisher.tier).all()
-        _publisher_cache = [(p.id, p.name, p.tier) for p in publishers]
-        _publisher_cache_time = time.monotonic()
+def _build_publisher_index(
+    entities: list[tuple[int, str, str, str | None, int]],
+) -> tuple[list[tuple[int, str, str | None]], NgramIndex, NgramIndex]:
+    """(id, name, tier) records with bigram indexes over their lowercased names."""
+    records = [(pub_id, name, tier) for pub_id, name, _, tier, _ in entities]
+    names = [name.lower() for _, name, _ in records]
+    return records, NgramIndex(names), NgramIndex(sort_tokens(n) for n in names)
 
-        return _publisher_cache
 
+def _get_publisher_index(
+    db: Session,
+) -> tuple[list[tuple[int, str, str | None]], NgramIndex, NgramIndex]:
+    """Get cached publishers with their match indexes.
 
-def invalidate_publisher_cache() -> None:
-    """Invalidate the publisher cache.
-
-    Call this when publishers are created, updated, or deleted.
+    Built once per reference cache snapshot.
     """
-    global _publisher_cache, _publisher_cache_time
+    from app.services.reference_cache import reference_cache
 
-    with _publisher_cache_lock:
-        _publisher_cache = None
-        _publisher_cache_time = 0.0
+    return reference_cache.get(db, "publisher").index(
+        "publisher_validation", _build_publisher_index
+    )
 
 
 # Location suffixes to remove (case-insensitive)
@@ -206,8 +185,9 @@ def fuzzy_match_publisher(
 ) -> list[PublisherMatch]:
     """Find existing publishers that fuzzy-match the given name.
 
-    Uses cached publisher list to avoid O(n) DB queries per lookup.
-    Cache expires after PUBLISHER_CACHE_TTL_SECONDS.
+    Uses the shared reference cache to avoid O(n) DB queries per lookup.
+    For thresholds of 2/3 and up, only publishers sharing a bigram with the
+    name are scored.
 
     Args:
         db: Database session
@@ -222,7 +202,15 @@ def fuzzy_match_publisher(
     corrected_name = auto_correct_publisher_name(name)
 
     # Get publishers from cache (avoids repeated DB queries)
-    cached_publishers = _get_cached_publishers(db)
+    cached_publishers, ratio_index, token_sort_index = _get_publisher_index(db)
+
+    # confidence is the max of two scores, so a match can come from either index
+    query = corrected_name.lower()
+    ratio_positions = ratio_index.candidates(query, threshold)
+    token_positions = token_sort_index.candidates(sort_tokens(query), threshold)
+    if ratio_positions is not None and token_positions is not None:
+        positions = sorted(set(ratio_positions) | set(token_positions))
+        cached_publishers = [cached_publishers[p] for p in positions]
 
     matches = []
     for pub_id, pub_name, pub_tier in cached_publishers:
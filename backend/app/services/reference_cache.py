@@ -0,0 +1,247 @@
+"""Shared in-process cache of author, publisher and binder reference data.
+
+Entity matching (entity_matching), publisher validation and listing
+extraction all match names against the full entity lists. They read them
+from this one cache. Each entity type is held as a ReferenceSnapshot: the
+(id, name, normalized_name, tier, book_count) rows, with type-specific
+normalized names computed once at load time, plus any indexes callers
+derive from them (built once per snapshot).
+
+Snapshots are invalidated across containers through a Redis generation
+counter per entity type. invalidate() bumps it, and every container
+re-reads the counters at most every ``check_interval`` seconds, dropping
+snapshots loaded under an older generation. Snapshots also expire after
+REFERENCE_CACHE_TTL_SECONDS: book counts change with book writes, which
+don't bump the counter, and without Redis the TTL is the only bound.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.cache import get_redis
+from app.config import get_settings
+from app.services.author_normalization import normalize_author_name
+from app.services.binder_normalization import normalize_binder_name_for_matching
+from app.services.publisher_validation import auto_correct_publisher_name
+
+logger = logging.getLogger(__name__)
+
+# Type alias for entity types
+EntityType = Literal["publisher", "binder", "author"]
+ENTITY_TYPES: tuple[EntityType, ...] = ("author", "publisher", "binder")
+
+# Cache TTL: 5 minutes
+REFERENCE_CACHE_TTL_SECONDS = 300
+
+# Redis generation counter per entity type
+GENERATION_KEY_PREFIX = "cache:reference"
+
+# (id, name, normalized_name, tier, book_count)
+ReferenceEntity = tuple[int, str, str, str | None, int]
+
+IndexT = TypeVar("IndexT")
+
+
+def generation_key(entity_type: EntityType) -> str:
+    """Redis key of the generation counter for an entity type."""
+    return f"{GENERATION_KEY_PREFIX}:{entity_type}"
+
+
+def normalize_for_entity_type(name: str, entity_type: EntityType) -> str:
+    """Apply type-specific normalization to a name.
+
+    Args:
+        name: Raw entity name.
+        entity_type: Type of entity for normalization rules.
+
+    Returns:
+        Normalized name for matching.
+    """
+    if entity_type == "publisher":
+        return auto_correct_publisher_name(name)
+    elif entity_type == "author":
+        return normalize_author_name(name)
+    elif entity_type == "binder":
+        return normalize_binder_name_for_matching(name)
+    else:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+
+
+def query_entities(db: Session, entity_type: EntityType) -> list:
+    """Query entities with their book counts.
+
+    Args:
+        db: Database session.
+        entity_type: Type of entity to query.
+
+    Returns:
+        List of query result rows with id, name, tier, and book_count.
+
+    Raises:
+        ValueError: If entity_type is not a valid type.
+    """
+    from app.models.author import Author
+    from app.models.binder import Binder
+    from app.models.book import Book
+    from app.models.publisher import Publisher
+
+    model: type[Publisher] | type[Author] | type[Binder]
+    if entity_type == "publisher":
+        model, book_fk = Publisher, Book.publisher_id
+    elif entity_type == "author":
+        model, book_fk = Author, Book.author_id
+    elif entity_type == "binder":
+        model, book_fk = Binder, Book.binder_id
+    else:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+
+    return (
+        db.query(
+            model.id,
+            model.name,
+            model.tier,
+            func.count(Book.id).label("book_count"),
+        )
+        .outerjoin(Book, book_fk == model.id)
+        .group_by(model.id, model.name, model.tier)
+        .all()
+    )
+
+
+@dataclass
+class ReferenceSnapshot:
+    """One load of an entity type's reference data.
+
+    Attributes:
+        entities: (id, name, normalized_name, tier, book_count) tuples.
+        generation: Redis generation the snapshot was loaded under (None
+            without Redis).
+        loaded_at: time.monotonic() at load.
+    """
+
+    entities: list[ReferenceEntity]
+    generation: int | None
+    loaded_at: float
+    _indexes: dict[str, Any] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def index(self, kind: str, build: Callable[[list[ReferenceEntity]], IndexT]) -> IndexT:
+        """Return the index named kind, building it from entities on first use.
+
+        Args:
+            kind: Name distinguishing this index from others on the snapshot.
+            build: Builds the index from the entity tuples; positions in the
+                index must follow the list order.
+        """
+        index: IndexT | None = self._indexes.get(kind)
+        if index is None:
+            # Build outside the lock; a concurrent duplicate build is harmless
+            index = build(self.entities)
+            with self._lock:
+                index = self._indexes.setdefault(kind, index)
+        return index
+
+
+class ReferenceCache:
+    """Per-entity-type snapshots, kept in step across containers via Redis."""
+
+    def __init__(self, ttl: float, check_interval: float):
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._snapshots: dict[str, ReferenceSnapshot] = {}
+        self._lock = threading.Lock()
+        self._generations: dict[str, int] | None = None
+        self._checked_at = 0.0
+
+    def _current_generations(self, now: float) -> dict[str, int] | None:
+        """Redis generations per entity type, re-read at most every check_interval."""
+        if self._generations is not None and now - self._checked_at < self.check_interval:
+            return self._generations
+        client = get_redis()
+        if not client:
+            return None
+        try:
+            values: Any = client.mget([generation_key(t) for t in ENTITY_TYPES])
+            generations: dict[str, int] = {
+                t: int(v or 0) for t, v in zip(ENTITY_TYPES, values, strict=True)
+            }
+        except Exception as e:
+            logger.warning(f"Reference cache generation check failed: {e}")
+            return None
+        with self._lock:
+            self._generations = generations
+            self._checked_at = now
+        return generations
+
+    def get(self, db: Session, entity_type: EntityType) -> ReferenceSnapshot:
+        """Return the current snapshot for entity_type, loading it if stale.
+
+        The DB query runs outside the lock so other requests aren't blocked.
+
+        Raises:
+            ValueError: If entity_type is not a valid type.
+        """
+        now = time.monotonic()
+        generations = self._current_generations(now)
+        generation = generations.get(entity_type) if generations is not None else None
+
+        snapshot = self._snapshots.get(entity_type)
+        if (
+            snapshot is not None
+            and now - snapshot.loaded_at < self.ttl
+            and (generation is None or snapshot.generation == generation)
+        ):
+            return snapshot
+
+        rows = query_entities(db, entity_type)
+        snapshot = ReferenceSnapshot(
+            entities=[
+                (
+                    row.id,
+                    row.name,
+                    normalize_for_entity_type(row.name, entity_type),
+                    row.tier,
+                    row.book_count,
+                )
+                for row in rows
+            ],
+            generation=generation,
+            loaded_at=time.monotonic(),
+        )
+        with self._lock:
+            self._snapshots[entity_type] = snapshot
+        return snapshot
+
+    def invalidate(self, entity_type: EntityType) -> None:
+        """Drop the snapshot here and, via the generation counter, everywhere else."""
+        with self._lock:
+            self._snapshots.pop(entity_type, None)
+            # Re-read generations next time so this container sees its own bump
+            self._generations = None
+
+        client = get_redis()
+        if not client:
+            return
+        try:
+            client.incr(generation_key(entity_type))
+        except Exception as e:
+            logger.warning(f"Redis INCR failed for {generation_key(entity_type)}: {e}")
+
+    def clear(self) -> None:
+        """Drop every local snapshot (does not touch Redis)."""
+        with self._lock:
+            self._snapshots.clear()
+            self._generations = None
+
+
+reference_cache = ReferenceCache(
+    ttl=REFERENCE_CACHE_TTL_SECONDS,
+    check_interval=get_settings().cache_local_generation_check_seconds,
+)
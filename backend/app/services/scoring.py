@@ -6,11 +6,12 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
 
 from app.constants import CONDITION_GRADE_DEFINITIONS
 from app.enums import OWNED_STATUSES
-from app.services.book_queries import get_other_books_by_author
 from app.services.set_detection import detect_set_completion
 
 # Condition grades that receive full points in strategic fit scoring.
@@ -18,6 +19,14 @@ from app.services.set_detection import detect_set_completion
 # Order (best to worst): FINE > NEAR_FINE > VERY_GOOD > GOOD > FAIR > POOR
 ACCEPTABLE_CONDITION_GRADES = frozenset({"FINE", "NEAR_FINE", "VERY_GOOD", "GOOD"})
 
+# Investment grade: (minimum discount %, score), highest band first.
+# Discounts below the last band (overpriced) score 0.
+INVESTMENT_GRADE_BANDS = ((70, 100), (60, 85), (50, 70), (40, 55), (30, 35), (20, 20), (0, 5))
+
+# Strategic fit points per publisher/binder tier (other tiers score 0)
+STRATEGIC_FIT_PUBLISHER_POINTS: dict[str | None, int] = {"TIER_1": 35, "TIER_2": 15}
+STRATEGIC_FIT_BINDER_POINTS: dict[str | None, int] = {"TIER_1": 40, "TIER_2": 20}
+
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
@@ -110,23 +119,11 @@ def calculate_investment_grade(
 
     discount_pct = float((value_mid - purchase_price) / value_mid * 100)
 
-    if discount_pct >= 70:
-        return 100
-    elif discount_pct >= 60:
-        return 85
-    elif discount_pct >= 50:
-        return 70
-    elif discount_pct >= 40:
-        return 55
-    elif discount_pct >= 30:
-        return 35
-    elif discount_pct >= 20:
-        return 20
-    elif discount_pct >= 0:
-        return 5
-    else:
-        # Overpriced - negative discount (paying more than market value)
-        return 0
+    for min_discount, score in INVESTMENT_GRADE_BANDS:
+        if discount_pct >= min_discount:
+            return score
+    # Overpriced - negative discount (paying more than market value)
+    return 0
 
 
 def recalculate_discount_pct(book: Book) -> None:
@@ -223,17 +220,9 @@ def calculate_strategic_fit(
     """
     score = 0
 
-    # Publisher tier
-    if publisher_tier == "TIER_1":
-        score += 35
-    elif publisher_tier == "TIER_2":
-        score += 15
-
-    # Binder tier
-    if binder_tier == "TIER_1":
-        score += 40
-    elif binder_tier == "TIER_2":
-        score += 20
+    # Publisher and binder tier
+    score += STRATEGIC_FIT_PUBLISHER_POINTS.get(publisher_tier, 0)
+    score += STRATEGIC_FIT_BINDER_POINTS.get(binder_tier, 0)
 
     # DOUBLE TIER 1 bonus - when both publisher AND binder are Tier 1
     if publisher_tier == "TIER_1" and binder_tier == "TIER_1":
@@ -286,9 +275,14 @@ def calculate_title_similarity(title1: str, title2: str) -> float:
     Returns:
         Similarity score between 0 and 1
     """
-    norm1 = normalize_title(title1)
-    norm2 = normalize_title(title2)
+    return normalized_title_similarity(normalize_title(title1), normalize_title(title2))
 
+
+def normalized_title_similarity(norm1: str, norm2: str) -> float:
+    """Similarity between two titles already passed through normalize_title().
+
+    Lets callers comparing one title against many normalize each title once.
+    """
     # Exact match after normalization
     if norm1 == norm2:
         return 1.0
@@ -320,6 +314,59 @@ def is_duplicate_title(title1: str, title2: str, threshold: float = 0.8) -> bool
     return calculate_title_similarity(title1, title2) >= threshold
 
 
+def stored_normalized_title(book: Any) -> str:
+    """normalize_title(book.title), read from the persisted Book.normalized_title.
+
+    Accepts a Book or a row with ``title`` and ``normalized_title``; rows not
+    yet backfilled are normalized on the fly.
+    """
+    normalized: str | None = book.normalized_title
+    if normalized is not None:
+        return normalized
+    return normalize_title(book.title)
+
+
+def find_duplicate_title(book: Book, db: Session, threshold: float = 0.8) -> str | None:
+    """Find an owned book by the same author whose title duplicates this one.
+
+    Same result as running is_duplicate_title() against every book from
+    get_other_books_by_author(), but reads the persisted normalized_title
+    keys: exact matches are one (author_id, normalized_title) index lookup,
+    and the similarity fallback compares stored keys without re-normalizing.
+
+    Args:
+        book: The book to check
+        db: Database session
+        threshold: Similarity threshold (0-1), default 0.8
+
+    Returns:
+        Title of a duplicate book, or None if there isn't one
+    """
+    if not book.author_id:
+        return None
+
+    from app.models import Book as BookModel
+
+    normalized = stored_normalized_title(book)
+    siblings = select(BookModel.title, BookModel.normalized_title).where(
+        BookModel.author_id == book.author_id,
+        BookModel.id != book.id,
+        BookModel.status.in_(OWNED_STATUSES),
+    )
+
+    exact = db.execute(siblings.where(BookModel.normalized_title == normalized).limit(1)).first()
+    title: str
+    if exact is not None:
+        title = exact.title
+        return title
+
+    for other in db.execute(siblings):
+        if normalized_title_similarity(normalized, stored_normalized_title(other)) >= threshold:
+            title = other.title
+            return title
+    return None
+
+
 def calculate_collection_impact(
     author_book_count: int,
     is_duplicate: bool,
@@ -445,19 +492,13 @@ def calculate_strategic_fit_breakdown(
     breakdown = ScoreBreakdown(score=0)  # Will update at end
 
     # Publisher tier
-    if publisher_tier == "TIER_1":
-        score += 35
-        breakdown.add(
-            "publisher_tier",
-            35,
-            f"Tier 1 publisher{f' ({publisher_name})' if publisher_name else ''}",
-        )
-    elif publisher_tier == "TIER_2":
-        score += 15
+    if publisher_tier and publisher_tier in STRATEGIC_FIT_PUBLISHER_POINTS:
+        points = STRATEGIC_FIT_PUBLISHER_POINTS[publisher_tier]
+        score += points
         breakdown.add(
             "publisher_tier",
-            15,
-            f"Tier 2 publisher{f' ({publisher_name})' if publisher_name else ''}",
+            points,
+            f"Tier {publisher_tier[-1]} publisher{f' ({publisher_name})' if publisher_name else ''}",
         )
     elif publisher_tier:
         breakdown.add(
@@ -469,19 +510,13 @@ def calculate_strategic_fit_breakdown(
         breakdown.add("publisher_tier", 0, "Publisher tier not specified")
 
     # Binder tier
-    if binder_tier == "TIER_1":
-        score += 40
-        breakdown.add(
-            "binder_tier",
-            40,
-            f"Tier 1 binder{f' ({binder_name})' if binder_name else ''}",
-        )
-    elif binder_tier == "TIER_2":
-        score += 20
+    if binder_tier and binder_tier in STRATEGIC_FIT_BINDER_POINTS:
+        points = STRATEGIC_FIT_BINDER_POINTS[binder_tier]
+        score += points
         breakdown.add(
             "binder_tier",
-            20,
-            f"Tier 2 binder{f' ({binder_name})' if binder_name else ''}",
+            points,
+            f"Tier {binder_tier[-1]} binder{f' ({binder_name})' if binder_name else ''}",
         )
     elif binder_tier:
         breakdown.add(
@@ -707,11 +742,7 @@ def calculate_and_persist_book_scores(book: Book, db: Session) -> dict[str, int]
     if book.binder:
         binder_tier = book.binder.tier
 
-    is_duplicate = False
-    for other in get_other_books_by_author(book, db):
-        if is_duplicate_title(book.title, other.title):
-            is_duplicate = True
-            break
+    is_duplicate = find_duplicate_title(book, db) is not None
 
     scores = calculate_all_scores(
         purchase_price=book.purchase_price,
@@ -0,0 +1,294 @@
+"""Columnar versions of the scoring functions.
+
+Each function takes equal-length sequences (one per scalar argument of the
+matching function in app.services.scoring or app.services.tiered_scoring)
+and returns a list of results with identical semantics. Factors are
+resolved with table lookups and bisect in a few tight comprehensions rather
+than one full function call per book, which keeps whole-collection
+rescoring and what-if runs (e.g. a different publisher tier column) cheap.
+Point tables and constants are shared with the scalar functions.
+
+The scalar functions remain the reference implementation; tests check the
+two agree on randomized inputs.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from decimal import Decimal
+
+from app.services import tiered_scoring as tiered
+from app.services.scoring import (
+    ACCEPTABLE_CONDITION_GRADES,
+    INVESTMENT_GRADE_BANDS,
+    STRATEGIC_FIT_BINDER_POINTS,
+    STRATEGIC_FIT_PUBLISHER_POINTS,
+)
+
+# INVESTMENT_GRADE_BANDS in ascending order, split for bisect
+_INVESTMENT_THRESHOLDS = tuple(min_discount for min_discount, _ in reversed(INVESTMENT_GRADE_BANDS))
+_INVESTMENT_POINTS = tuple(score for _, score in reversed(INVESTMENT_GRADE_BANDS))
+
+# tiered_scoring.calculate_quality_score point tables
+_QUALITY_PUBLISHER_POINTS: dict[str | None, int] = {
+    "TIER_1": tiered.QUALITY_TIER_1_PUBLISHER,
+    "TIER_2": tiered.QUALITY_TIER_2_PUBLISHER,
+}
+_QUALITY_BINDER_POINTS: dict[str | None, int] = {
+    "TIER_1": tiered.QUALITY_TIER_1_BINDER,
+    "TIER_2": tiered.QUALITY_TIER_2_BINDER,
+}
+_QUALITY_CONDITION_POINTS = {
+    **dict.fromkeys(tiered.FINE_CONDITIONS, tiered.QUALITY_CONDITION_FINE),
+    **dict.fromkeys(tiered.GOOD_CONDITIONS, tiered.QUALITY_CONDITION_GOOD),
+}
+
+
+def _check_lengths(*columns: Sequence) -> int:
+    """Return the common column length, raising ValueError on a mismatch."""
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns must have equal lengths, got {sorted(lengths)}")
+    return lengths.pop() if lengths else 0
+
+
+def _investment_grade(purchase_price: Decimal | None, value_mid: Decimal | None) -> int:
+    if purchase_price is None or value_mid is None or value_mid <= 0:
+        return 0
+    discount_pct = float((value_mid - purchase_price) / value_mid * 100)
+    index = bisect_right(_INVESTMENT_THRESHOLDS, discount_pct)
+    # Negative discount (overpriced) falls below the first threshold
+    return _INVESTMENT_POINTS[index - 1] if index else 0
+
+
+def investment_grade_columns(
+    purchase_prices: Sequence[Decimal | None],
+    values_mid: Sequence[Decimal | None],
+) -> list[int]:
+    """Columnar calculate_investment_grade."""
+    _check_lengths(purchase_prices, values_mid)
+    return [_investment_grade(p, v) for p, v in zip(purchase_prices, values_mid, strict=True)]
+
+
+def _era_points(year_starts: Sequence[int | None], points: int) -> list[int]:
+    return [
+        points if year is not None and tiered.ROMANTIC_START <= year <= tiered.VICTORIAN_END else 0
+        for year in year_starts
+    ]
+
+
+def strategic_fit_columns(
+    publisher_tiers: Sequence[str | None],
+    binder_tiers: Sequence[str | None],
+    year_starts: Sequence[int | None],
+    is_complete: Sequence[bool],
+    condition_grades: Sequence[str | None],
+    author_priority_scores: Sequence[int],
+) -> list[int]:
+    """Columnar calculate_strategic_fit (volume count doesn't affect the score)."""
+    _check_lengths(
+        publisher_tiers,
+        binder_tiers,
+        year_starts,
+        is_complete,
+        condition_grades,
+        author_priority_scores,
+    )
+    tier_points = [
+        STRATEGIC_FIT_PUBLISHER_POINTS.get(p, 0)
+        + STRATEGIC_FIT_BINDER_POINTS.get(b, 0)
+        + (15 if p == "TIER_1" and b == "TIER_1" else 0)
+        for p, b in zip(publisher_tiers, binder_tiers, strict=True)
+    ]
+    era = _era_points(year_starts, 20)
+    return [
+        t + e + (15 if complete else 0) + (15 if grade in ACCEPTABLE_CONDITION_GRADES else 0) + a
+        for t, e, complete, grade, a in zip(
+            tier_points, era, is_complete, condition_grades, author_priority_scores, strict=True
+        )
+    ]
+
+
+def _author_presence(count: int, new_author: int, second_work: int) -> int:
+    if count == 0:
+        return new_author
+    if count == 1:
+        return second_work
+    return 0
+
+
+def collection_impact_columns(
+    author_book_counts: Sequence[int],
+    is_duplicate: Sequence[bool],
+    completes_set: Sequence[bool],
+) -> list[int]:
+    """Columnar calculate_collection_impact."""
+    _check_lengths(author_book_counts, is_duplicate, completes_set)
+    return [
+        _author_presence(count, 30, 15) - (40 if duplicate else 0) + (25 if completes else 0)
+        for count, duplicate, completes in zip(
+            author_book_counts, is_duplicate, completes_set, strict=True
+        )
+    ]
+
+
+def all_scores_columns(
+    purchase_prices: Sequence[Decimal | None],
+    values_mid: Sequence[Decimal | None],
+    publisher_tiers: Sequence[str | None],
+    binder_tiers: Sequence[str | None],
+    year_starts: Sequence[int | None],
+    is_complete: Sequence[bool],
+    condition_grades: Sequence[str | None],
+    author_priority_scores: Sequence[int],
+    author_book_counts: Sequence[int],
+    is_duplicate: Sequence[bool],
+    completes_set: Sequence[bool],
+) -> dict[str, list[int]]:
+    """Columnar calculate_all_scores.
+
+    Returns:
+        Dict of investment_grade, strategic_fit, collection_impact and
+        overall_score columns.
+    """
+    investment = investment_grade_columns(purchase_prices, values_mid)
+    strategic = strategic_fit_columns(
+        publisher_tiers,
+        binder_tiers,
+        year_starts,
+        is_complete,
+        condition_grades,
+        author_priority_scores,
+    )
+    collection = collection_impact_columns(author_book_counts, is_duplicate, completes_set)
+    return {
+        "investment_grade": investment,
+        "strategic_fit": strategic,
+        "collection_impact": collection,
+        "overall_score": [
+            i + s + c for i, s, c in zip(investment, strategic, collection, strict=True)
+        ],
+    }
+
+
+def quality_score_columns(
+    publisher_tiers: Sequence[str | None],
+    binder_tiers: Sequence[str | None],
+    year_starts: Sequence[int | None],
+    condition_grades: Sequence[str | None],
+    is_complete: Sequence[bool],
+    author_priority_scores: Sequence[int],
+    is_duplicate: Sequence[bool],
+    author_preferred: Sequence[bool] | None = None,
+    publisher_preferred: Sequence[bool] | None = None,
+    binder_preferred: Sequence[bool] | None = None,
+) -> list[int]:
+    """Columnar tiered_scoring.calculate_quality_score.
+
+    Preferred-entity columns default to all False. Volume count is omitted:
+    the large-set penalty is 0 (Issue #587).
+    """
+    n = _check_lengths(
+        publisher_tiers,
+        binder_tiers,
+        year_starts,
+        condition_grades,
+        is_complete,
+        author_priority_scores,
+        is_duplicate,
+    )
+    no_flags = [False] * n
+    preferred_count = [
+        int(a) + int(p) + int(b)
+        for a, p, b in zip(
+            author_preferred if author_preferred is not None else no_flags,
+            publisher_preferred if publisher_preferred is not None else no_flags,
+            binder_preferred if binder_preferred is not None else no_flags,
+            strict=True,
+        )
+    ]
+    tier_points = [
+        _QUALITY_PUBLISHER_POINTS.get(p, 0)
+        + _QUALITY_BINDER_POINTS.get(b, 0)
+        + (tiered.QUALITY_DOUBLE_TIER_1_BONUS if p == "TIER_1" and b == "TIER_1" else 0)
+        for p, b in zip(publisher_tiers, binder_tiers, strict=True)
+    ]
+    era = _era_points(year_starts, tiered.QUALITY_ERA_BONUS)
+    scores = [
+        t
+        + e
+        + (_QUALITY_CONDITION_POINTS.get(grade, 0) if grade else 0)
+        + (tiered.QUALITY_COMPLETE_SET if complete else 0)
+        + min(a, tiered.QUALITY_AUTHOR_PRIORITY_CAP)
+        + preferred * tiered.PREFERRED_BONUS
+        + (tiered.QUALITY_DUPLICATE_PENALTY if duplicate else 0)
+        for t, e, grade, complete, a, preferred, duplicate in zip(
+            tier_points,
+            era,
+            condition_grades,
+            is_complete,
+            author_priority_scores,
+            preferred_count,
+            is_duplicate,
+            strict=True,
+        )
+    ]
+    return [max(0, min(100, score)) for score in scores]
+
+
+def strategic_fit_score_columns(
+    publisher_matches_author_requirement: Sequence[bool],
+    author_book_counts: Sequence[int],
+    completes_set: Sequence[bool],
+) -> list[int]:
+    """Columnar tiered_scoring.calculate_strategic_fit_score."""
+    _check_lengths(publisher_matches_author_requirement, author_book_counts, completes_set)
+    return [
+        max(
+            0,
+            min(
+                100,
+                (tiered.STRATEGIC_PUBLISHER_MATCH if match else 0)
+                + _author_presence(count, tiered.STRATEGIC_NEW_AUTHOR, tiered.STRATEGIC_SECOND_WORK)
+                + (tiered.STRATEGIC_COMPLETES_SET if completes else 0),
+            ),
+        )
+        for match, count, completes in zip(
+            publisher_matches_author_requirement, author_book_counts, completes_set, strict=True
+        )
+    ]
+
+
+def combined_score_columns(
+    quality_scores: Sequence[int],
+    strategic_fit_scores: Sequence[int],
+) -> list[int]:
+    """Columnar tiered_scoring.calculate_combined_score."""
+    _check_lengths(quality_scores, strategic_fit_scores)
+    return [
+        int(round(q * tiered.QUALITY_WEIGHT + s * tiered.STRATEGIC_FIT_WEIGHT))
+        for q, s in zip(quality_scores, strategic_fit_scores, strict=True)
+    ]
+
+
+def _price_position(ratio: Decimal) -> str:
+    if ratio < tiered.PRICE_EXCELLENT_THRESHOLD:
+        return "EXCELLENT"
+    if ratio < tiered.PRICE_GOOD_THRESHOLD:
+        return "GOOD"
+    if ratio <= tiered.PRICE_FAIR_THRESHOLD:
+        return "FAIR"
+    return "POOR"
+
+
+def price_position_columns(
+    asking_prices: Sequence[Decimal | None],
+    fmv_mids: Sequence[Decimal | None],
+) -> list[str | None]:
+    """Columnar tiered_scoring.calculate_price_position."""
+    _check_lengths(asking_prices, fmv_mids)
+    return [
+        None if fmv is None or asking is None or fmv <= 0 else _price_position(asking / fmv)
+        for asking, fmv in zip(asking_prices, fmv_mids, strict=True)
+    ]
@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Sequence
+from typing import Any
 
 from sqlalchemy.orm import Session
 
@@ -117,6 +119,37 @@ def normalize_title(title: str) -> str:
     return result.strip()
 
 
+def set_title_key(title: str) -> str:
+    """Title as compared for set membership (persisted as Book.set_title).
+
+    Args:
+        title: Full book title
+
+    Returns:
+        Lowercased title with volume indicators removed
+    """
+    return normalize_title(title).lower().strip()
+
+
+def stored_set_title(book: Any) -> str:
+    """set_title_key(book.title), read from the persisted Book.set_title.
+
+    Accepts a Book or a row with ``title`` and ``set_title``; rows not yet
+    backfilled are normalized on the fly.
+    """
+    return book.set_title if book.set_title is not None else set_title_key(book.title)
+
+
+def stored_volume_number(book: Any) -> int | None:
+    """extract_volume_number(book.title), read from Book.volume_number."""
+    # volume_number is written together with set_title; NULL is a valid value
+    # ("no volume indicator"), so set_title tells us whether it was computed
+    if book.set_title is not None:
+        volume: int | None = book.volume_number
+        return volume
+    return extract_volume_number(book.title)
+
+
 def titles_match(title_a: str, title_b: str) -> bool:
     """Check if two normalized titles represent the same work.
 
@@ -148,6 +181,9 @@ def find_set_members(
 ) -> list[Book]:
     """Find books that belong to the same set.
 
+    Compares against the persisted Book.set_title keys, so candidate titles
+    aren't re-normalized on every call.
+
     Args:
         db: Database session
         author_id: Author ID to match
@@ -169,13 +205,45 @@ def find_set_members(
 
     matches = []
     for book in candidates:
-        book_normalized = normalize_title(book.title)
-        if titles_match(normalized_title, book_normalized):
+        if titles_match(normalized_title, stored_set_title(book)):
             matches.append(book)
 
     return matches
 
 
+def completes_set_with(matches: Sequence[Any]) -> bool:
+    """Check whether one more volume completes the set formed by matches.
+
+    Args:
+        matches: The other members of the set (objects with ``title``,
+            ``volumes``, ``set_title`` and ``volume_number``), e.g. from
+            find_set_members()
+
+    Returns:
+        True if the owned volumes plus one equal the set size
+    """
+    if not matches:
+        return False
+
+    # Determine set size from max volumes field
+    set_size = max(book.volumes or 1 for book in matches)
+
+    # If set size is 1, not a multi-volume set
+    if set_size <= 1:
+        return False
+
+    # Collect owned volume numbers
+    owned_volumes = set()
+    for book in matches:
+        vol = stored_volume_number(book)
+        if vol is not None:
+            owned_volumes.add(vol)
+
+    # Check if adding this volume completes the set
+    # owned + 1 (this book) == set_size
+    return len(owned_volumes) + 1 == set_size
+
+
 def detect_set_completion(
     db: Session,
     author_id: int | None,
@@ -217,29 +285,7 @@ def detect_set_completion(
         # Find matching books in collection
         matches = find_set_members(db, author_id, normalized, book_id)
 
-        if not matches:
-            return False
-
-        # Determine set size from max volumes field
-        set_size = max(book.volumes or 1 for book in matches)
-
-        # If set size is 1, not a multi-volume set
-        if set_size <= 1:
-            return False
-
-        # Collect owned volume numbers
-        owned_volumes = set()
-        for book in matches:
-            vol = extract_volume_number(book.title)
-            if vol is not None:
-                owned_volumes.add(vol)
-
-        # Check if adding this volume completes the set
-        # owned + 1 (this book) == set_size
-        if len(owned_volumes) + 1 == set_size:
-            return True
-
-        return False
+        return completes_set_with(matches)
 
     except Exception as e:
         logger.warning(f"Set detection failed: {e}")
@@ -8,9 +8,12 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from itertools import combinations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
+
+from sqlalchemy import func, select
 
 from app.enums import OWNED_STATUSES
 from app.models.ai_connection import AIConnection
@@ -33,6 +36,9 @@ logger = logging.getLogger(__name__)
 # Frontend only displays first few anyway
 MAX_BOOK_IDS_PER_NODE = 10
 
+# Rows fetched per round trip when streaming the owned-books scan
+SCAN_BATCH_SIZE = 1000
+
 # Default date range for Victorian collection when no node years available.
 # These values are reasonable defaults for a Victorian book collection.
 # Could be moved to settings if configurability is needed.
@@ -89,59 +95,159 @@ def build_social_circles_graph(
     db: Session,
     include_binders: bool = True,
     min_book_count: int = 1,
-    max_books: int = 5000,
+    max_books: int | None = None,
     era_filter: list[Era] | None = None,
+    source: Literal["store", "books"] = "store",
 ) -> SocialCirclesResponse:
     """Build the social circles graph from book data.
 
+    By default relationships come from the incrementally maintained store
+    (app.services.social_circles_store), so no books are scanned. Pass
+    ``source="books"`` to derive them from the books table instead (used to
+    verify or repair the store).
+
     Args:
         db: Database session
         include_binders: Whether to include binder nodes/edges
         min_book_count: Minimum books for an entity to be included
-        max_books: Maximum number of books to process (prevents OOM in Lambda)
+        max_books: Optional cap on the number of books processed. Collections
+            larger than this are scanned and truncated instead of read from
+            the store. None (default) means no cap.
         era_filter: Optional list of eras to filter by
+        source: "store" (default) or "books"
 
     Returns:
         SocialCirclesResponse with nodes, edges, and metadata.
     """
-    from app.models import Author, Binder, Book, Publisher
+    from app.models import Book
+
+    inputs = None
+    if source == "store":
+        total_books = (
+            db.query(func.count(Book.id)).filter(Book.status.in_(OWNED_STATUSES)).scalar() or 0
+        )
+        # The store always covers every owned book; honour max_books by
+        # falling back to the (truncating) scan when the collection exceeds it
+        if max_books is None or total_books <= max_books:
+            inputs = _inputs_from_store(db, include_binders, total_books)
+    if inputs is None:
+        inputs = _inputs_from_books(db, include_binders, max_books)
+    return _assemble_graph(db, inputs, include_binders, min_book_count, era_filter)
+
+
+@dataclass
+class _GraphInputs:
+    """Entity/book relationships the graph is assembled from."""
+
+    total_books: int
+    truncated: bool = False
+    author_books: dict[int, list[int]] = field(default_factory=lambda: defaultdict(list))
+    publisher_books: dict[int, set[int]] = field(default_factory=lambda: defaultdict(set))
+    binder_books: dict[int, set[int]] = field(default_factory=lambda: defaultdict(set))
+    author_publishers: dict[int, set[int]] = field(default_factory=lambda: defaultdict(set))
+    publisher_authors: dict[int, set[int]] = field(default_factory=lambda: defaultdict(set))
+    author_binders: dict[int, set[int]] = field(default_factory=lambda: defaultdict(set))
+
+
+def _inputs_from_store(db: Session, include_binders: bool, total_books: int) -> _GraphInputs:
+    """Read relationships from the incrementally maintained store.
+
+    Cost is proportional to the number of entities and author links, not
+    to the number of books.
+    """
+    from app.models import SocialCircleEdgeBooks, SocialCircleNodeBooks
+
+    inputs = _GraphInputs(total_books=total_books)
+
+    node_books: dict[str, dict[int, set[int]]] = {
+        "publisher": inputs.publisher_books,
+        "binder": inputs.binder_books,
+    }
+    for entity_type, entity_id, book_ids in db.query(
+        SocialCircleNodeBooks.entity_type,
+        SocialCircleNodeBooks.entity_id,
+        SocialCircleNodeBooks.book_ids,
+    ):
+        if entity_type == "binder" and not include_binders:
+            continue
+        if entity_type == "author":
+            inputs.author_books[entity_id] = list(book_ids)
+        else:
+            node_books[entity_type][entity_id] = set(book_ids)
+
+    for author_id, target_type, target_id in db.query(
+        SocialCircleEdgeBooks.author_id,
+        SocialCircleEdgeBooks.target_type,
+        SocialCircleEdgeBooks.target_id,
+    ):
+        if target_type == "publisher":
+            inputs.author_publishers[author_id].add(target_id)
+            inputs.publisher_authors[target_id].add(author_id)
+        elif include_binders:
+            inputs.author_binders[author_id].add(target_id)
+
+    return inputs
+
+
+def _inputs_from_books(
+    db: Session, include_binders: bool, max_books: int | None = None
+) -> _GraphInputs:
+    """Derive relationships by scanning owned books (full rebuild).
+
+    Only the four ID columns are selected and rows are streamed in batches
+    of SCAN_BATCH_SIZE, so memory grows with the number of entities and
+    links rather than with the number (or width) of books.
+    """
+    from app.models import Book
 
-    # Fetch owned books (IN_TRANSIT, ON_HAND) - excludes REMOVED, EVALUATING
-    # Limit to max_books to prevent OOM in Lambda (1GB memory limit)
-    books_query = db.query(Book).filter(Book.status.in_(OWNED_STATUSES)).limit(max_books)
-    books = books_query.all()
+    # Owned books (IN_TRANSIT, ON_HAND) - excludes REMOVED, EVALUATING
+    stmt = (
+        select(Book.id, Book.author_id, Book.publisher_id, Book.binder_id)
+        .where(Book.status.in_(OWNED_STATUSES))
+        .execution_options(yield_per=SCAN_BATCH_SIZE)
+    )
+    if max_books is not None:
+        stmt = stmt.limit(max_books)
+
+    inputs = _GraphInputs(total_books=0)
+    for book_id, author_id, publisher_id, binder_id in db.execute(stmt):
+        inputs.total_books += 1
+        if author_id:
+            inputs.author_books[author_id].append(book_id)
+            if publisher_id:
+                inputs.author_publishers[author_id].add(publisher_id)
+                inputs.publisher_authors[publisher_id].add(author_id)
+                inputs.publisher_books[publisher_id].add(book_id)
+            if binder_id and include_binders:
+                inputs.author_binders[author_id].add(binder_id)
+                inputs.binder_books[binder_id].add(book_id)
 
     # Check if we hit the limit (truncation likely occurred)
-    truncated = len(books) == max_books
+    inputs.truncated = max_books is not None and inputs.total_books == max_books
+    return inputs
+
+
+def _assemble_graph(
+    db: Session,
+    inputs: _GraphInputs,
+    include_binders: bool,
+    min_book_count: int,
+    era_filter: list[Era] | None,
+) -> SocialCirclesResponse:
+    """Build nodes, edges and metadata from collected relationships."""
+    from app.models import Author, Binder, Publisher
+
+    author_books = inputs.author_books
+    publisher_books = inputs.publisher_books
+    binder_books = inputs.binder_books
+    author_publishers = inputs.author_publishers
+    publisher_authors = inputs.publisher_authors
+    author_binders = inputs.author_binders
 
     # Build node maps
     nodes: dict[str, SocialCircleNode] = {}
     edges: dict[str, SocialCircleEdge] = {}
 
-    # Track relationships for edge building
-    author_publishers: dict[int, set[int]] = defaultdict(set)  # author_id -> publisher_ids
-    publisher_authors: dict[int, set[int]] = defaultdict(set)  # publisher_id -> author_ids
-    author_binders: dict[int, set[int]] = defaultdict(set)  # author_id -> binder_ids
-    author_books: dict[int, list[int]] = defaultdict(list)  # author_id -> book_ids
-    publisher_books: dict[int, set[int]] = defaultdict(
-        set
-    )  # publisher_id -> book_ids (set for O(1) lookup)
-    binder_books: dict[int, set[int]] = defaultdict(
-        set
-    )  # binder_id -> book_ids (set for O(1) lookup)
-
-    # First pass: collect relationships
-    for book in books:
-        if book.author_id:
-            author_books[book.author_id].append(book.id)
-            if book.publisher_id:
-                author_publishers[book.author_id].add(book.publisher_id)
-                publisher_authors[book.publisher_id].add(book.author_id)
-                publisher_books[book.publisher_id].add(book.id)
-            if book.binder_id and include_binders:
-                author_binders[book.author_id].add(book.binder_id)
-                binder_books[book.binder_id].add(book.id)
-
     # Limit book IDs per node to control response size
     MAX_BOOK_IDS_PER_NODE = 10
 
@@ -387,13 +493,13 @@ def build_social_circles_graph(
 
     # Build metadata
     meta = SocialCirclesMeta(
-        total_books=len(books),
+        total_books=inputs.total_books,
         total_authors=sum(1 for n in nodes.values() if n.type == NodeType.author),
         total_publishers=sum(1 for n in nodes.values() if n.type == NodeType.publisher),
         total_binders=sum(1 for n in nodes.values() if n.type == NodeType.binder),
         date_range=date_range,
         generated_at=datetime.now(UTC),
-        truncated=truncated,
+        truncated=inputs.truncated,
     )
 
     return SocialCirclesResponse(
@@ -436,18 +542,17 @@ def get_book_social_circles_summary(
 
     # Use cached graph to avoid rebuilding
     from app.services.social_circles_cache import get_or_build_graph
+    from app.services.social_circles_index import get_graph_index
 
-    graph = get_or_build_graph(db)
+    index = get_graph_index(get_or_build_graph(db))
 
-    # Find all edges touching this book's entities
-    entity_set = set(entity_node_ids)
-    relevant_edges = [e for e in graph.edges if e.source in entity_set or e.target in entity_set]
+    # Edges touching this book's entities, strongest first
+    relevant_edges = index.edges_of_any(entity_node_ids)
 
     # Build highlights from top edges by strength
     highlights: list[dict] = []
-    node_map = {n.id: n for n in graph.nodes}
     seen_pairs: set[str] = set()
-    for edge in sorted(relevant_edges, key=lambda e: e.strength, reverse=True):
+    for edge in relevant_edges:
         if len(highlights) >= 3:
             break
         pair_key = f"{edge.source}:{edge.target}"
@@ -455,8 +560,8 @@ def get_book_social_circles_summary(
             continue
         seen_pairs.add(pair_key)
 
-        source_node = node_map.get(edge.source)
-        target_node = node_map.get(edge.target)
+        source_node = index.node(edge.source)
+        target_node = index.node(edge.target)
         if source_node and target_node:
             highlights.append(
                 {
@@ -471,7 +576,7 @@ def get_book_social_circles_summary(
             )
 
     # Only return entity IDs that are actually present in the graph
-    connected_entity_ids = [nid for nid in entity_node_ids if nid in node_map]
+    connected_entity_ids = [nid for nid in entity_node_ids if nid in index.nodes]
 
     return {
         "entity_count": len(connected_entity_ids),
@@ -3,22 +3,30 @@
 """Redis caching for social circles graph data.
 
 Provides caching with configurable TTL and graceful degradation when Redis
-is unavailable. Uses the existing Redis client from app.cache.
+is unavailable. Uses the existing Redis client from app.cache, with the
+in-process tier (app.cache.local_cache) in front of it for the sync
+get_or_build_graph path, so repeat lookups in a warm container skip Redis
+and re-validation entirely.
 
 Cache key format: social_circles:graph:{hash_of_params}
 Response headers: X-Cache: HIT|MISS
+
+Entries are stored with app.utils.cache_codec (zlib-compressed JSON behind a
+versioned header for anything but tiny graphs). get_graph_json() hands the
+cached JSON document back as bytes so the API can return it without a
+Pydantic validate/serialize round trip.
 """
 
 from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from app.cache import get_redis
+from app.cache import get_redis, invalidate_local, local_cache
 from app.schemas.social_circles import SocialCirclesResponse
+from app.utils import cache_codec
 
 if TYPE_CHECKING:
     from redis import Redis
@@ -37,7 +45,7 @@ CACHE_KEY_PREFIX = "social_circles:graph"
 MAX_CACHE_SIZE_BYTES = 10 * 1024 * 1024
 
 
-def get_cache_key(include_binders: bool, min_book_count: int, max_books: int) -> str:
+def get_cache_key(include_binders: bool, min_book_count: int, max_books: int | None) -> str:
     """Generate deterministic cache key from query parameters.
 
     Creates a hash of the parameters to ensure consistent key generation
@@ -46,7 +54,7 @@ def get_cache_key(include_binders: bool, min_book_count: int, max_books: int) ->
     Args:
         include_binders: Whether binder nodes are included.
         min_book_count: Minimum book count filter.
-        max_books: Maximum books limit.
+        max_books: Optional books cap (None for no cap).
 
     Returns:
         Cache key string in format: social_circles:graph:{hash}
@@ -72,18 +80,23 @@ def get_or_build_graph(db: Session) -> SocialCirclesResponse:
     """
     from app.services.social_circles import build_social_circles_graph
 
-    cache_key = get_cache_key(include_binders=True, min_book_count=1, max_books=5000)
+    cache_key = get_cache_key(include_binders=True, min_book_count=1, max_books=None)
     client = get_redis()
 
     if client:
+        local: SocialCirclesResponse | None = local_cache.get(client, cache_key)
+        if local is not None:
+            return local
         cached, is_hit = _get_cached_graph_sync(client, cache_key)
         if is_hit and cached:
+            local_cache.set(cache_key, cached, CACHE_TTL_SECONDS)
             return cached
 
     graph = build_social_circles_graph(db)
 
     if client:
         _set_cached_graph_sync(client, cache_key, graph)
+        local_cache.set(cache_key, graph, CACHE_TTL_SECONDS)
 
     return graph
 
@@ -100,17 +113,28 @@ def _get_cached_graph_sync(
     Returns:
         Tuple of (response or None, is_cache_hit).
     """
+    json_bytes = _get_cached_graph_json_sync(client, cache_key)
+    if json_bytes is None:
+        return None, False
     try:
-        cached_value = client.get(cache_key)
+        return SocialCirclesResponse.model_validate_json(json_bytes), True
+    except Exception as e:
+        logger.warning("Discarding unreadable cache entry %s: %s", cache_key, e)
+        return None, False
+
+
+def _get_cached_graph_json_sync(client: Redis, cache_key: str) -> bytes | None:
+    """Return the cached graph as JSON bytes, or None on a miss or error."""
+    try:
+        cached_value: Any = client.get(cache_key)
         if cached_value:
             logger.debug("Cache HIT: %s", cache_key)
-            data = json.loads(cached_value)
-            return SocialCirclesResponse.model_validate(data), True
+            return cache_codec.decode_json_bytes(cached_value)
         logger.debug("Cache MISS: %s", cache_key)
-        return None, False
+        return None
     except Exception as e:
         logger.warning("Redis GET failed for %s: %s", cache_key, e)
-        return None, False
+        return None
 
 
 async def get_cached_graph(cache_key: str) -> tuple[SocialCirclesResponse | None, bool]:
@@ -144,25 +168,75 @@ def _set_cached_graph_sync(client: Redis, cache_key: str, response: SocialCircle
         response: Response data to cache.
     """
     try:
-        # Serialize using Pydantic's model_dump with JSON-compatible output
-        serialized = json.dumps(response.model_dump(mode="json"), default=str)
-
-        # Skip caching if serialized data exceeds size limit
-        if len(serialized) > MAX_CACHE_SIZE_BYTES:
-            logger.warning(
-                "Skip caching %s: size %d bytes exceeds limit %d bytes",
-                cache_key,
-                len(serialized),
-                MAX_CACHE_SIZE_BYTES,
-            )
-            return
-
-        client.setex(cache_key, CACHE_TTL_SECONDS, serialized)
+        json_bytes = cache_codec.dumps_json(response.model_dump(mode="json"))
+    except Exception as e:
+        logger.warning("Failed to serialize %s for caching: %s", cache_key, e)
+        return
+    _set_cached_graph_json_sync(client, cache_key, json_bytes)
+
+
+def _set_cached_graph_json_sync(client: Redis, cache_key: str, json_bytes: bytes) -> None:
+    """Store an already-serialized graph, compressed per cache_codec."""
+    # Skip caching if serialized data exceeds size limit (checked before
+    # compression - it bounds the memory needed to decode the entry)
+    if len(json_bytes) > MAX_CACHE_SIZE_BYTES:
+        logger.warning(
+            "Skip caching %s: size %d bytes exceeds limit %d bytes",
+            cache_key,
+            len(json_bytes),
+            MAX_CACHE_SIZE_BYTES,
+        )
+        return
+
+    try:
+        client.setex(cache_key, CACHE_TTL_SECONDS, cache_codec.pack(json_bytes))
         logger.debug("Cached %s with TTL %ds", cache_key, CACHE_TTL_SECONDS)
     except Exception as e:
         logger.warning("Redis SETEX failed for %s: %s", cache_key, e)
 
 
+def get_graph_json(
+    db: Session, include_binders: bool, min_book_count: int, max_books: int | None
+) -> tuple[bytes, bool]:
+    """Get the graph as a JSON document, from cache when possible.
+
+    Cache hits are returned exactly as stored - no parsing, validation or
+    re-serialization. On a miss the graph is built, serialized once, and
+    that same document is cached and returned.
+
+    Args:
+        db: Database session for building the graph on cache miss.
+        include_binders: Whether binder nodes are included.
+        min_book_count: Minimum book count filter.
+        max_books: Optional books cap (None for no cap).
+
+    Returns:
+        Tuple of (JSON bytes, is_cache_hit).
+    """
+    from app.services.social_circles import build_social_circles_graph
+
+    cache_key = get_cache_key(include_binders, min_book_count, max_books)
+    client = get_redis()
+
+    if client:
+        json_bytes = _get_cached_graph_json_sync(client, cache_key)
+        if json_bytes is not None:
+            return json_bytes, True
+
+    graph = build_social_circles_graph(
+        db,
+        include_binders=include_binders,
+        min_book_count=min_book_count,
+        max_books=max_books,
+    )
+    json_bytes = cache_codec.dumps_json(graph)
+
+    if client:
+        _set_cached_graph_json_sync(client, cache_key, json_bytes)
+
+    return json_bytes, False
+
+
 async def set_cached_graph(cache_key: str, response: SocialCirclesResponse) -> None:
     """Cache graph response with TTL.
 
@@ -198,6 +272,8 @@ def _invalidate_cache_sync(client: Redis) -> int:
     Returns:
         Number of keys deleted.
     """
+    # Local tiers hold graphs too - clear them here and on other containers
+    invalidate_local(client)
     try:
         # Find all social circles cache keys using SCAN (cursor-based, safe for large keyspaces)
         pattern = f"{CACHE_KEY_PREFIX}:*"
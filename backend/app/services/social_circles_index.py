@@ -0,0 +1,96 @@
+"""Indexed view over a social circles graph for per-node lookups.
+
+SocialCirclesResponse stores nodes and edges as flat lists, so every "who is
+this entity connected to" question used to scan all edges and rebuild a
+node map. GraphIndex does that work once per graph and then answers node,
+neighbour and degree lookups in O(1) / O(degree).
+
+get_graph_index() memoizes the index of the most recently indexed graph
+object (keeping that one graph alive). Graph versions are distinct objects:
+a rebuild or cache refill produces a new one, while the in-process cache
+tier hands back the same one, so batch profile generation over one graph
+indexes it exactly once. The graph must not be mutated once indexed.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from app.schemas.social_circles import SocialCirclesResponse
+
+
+class GraphIndex:
+    """Node-by-id map and strength-sorted adjacency lists for one graph."""
+
+    def __init__(self, graph: SocialCirclesResponse):
+        self.graph = graph
+        self.nodes: dict[str, Any] = {node.id: node for node in graph.nodes}
+
+        edges = list(graph.edges)
+        adjacency: dict[str, list[int]] = defaultdict(list)
+        for position, edge in enumerate(edges):
+            adjacency[edge.source].append(position)
+            if edge.target != edge.source:
+                adjacency[edge.target].append(position)
+        # Strongest first; ties keep graph order (same as a stable sort of a scan)
+        for positions in adjacency.values():
+            positions.sort(key=lambda i: (-edges[i].strength, i))
+
+        self._edges = edges
+        self._adjacency = dict(adjacency)
+
+    def node(self, node_id: str) -> Any | None:
+        """Return the node with this ID, or None if it isn't in the graph."""
+        return self.nodes.get(node_id)
+
+    def degree(self, node_id: str) -> int:
+        """Number of edges touching node_id."""
+        return len(self._adjacency.get(node_id, ()))
+
+    def edges_of(self, node_id: str) -> list[Any]:
+        """Edges touching node_id, strongest first."""
+        return [self._edges[i] for i in self._adjacency.get(node_id, ())]
+
+    def edges_of_any(self, node_ids: Iterable[str]) -> list[Any]:
+        """Edges touching any of node_ids (each once), strongest first."""
+        positions: set[int] = set()
+        for node_id in node_ids:
+            positions.update(self._adjacency.get(node_id, ()))
+        edges = self._edges
+        return [edges[i] for i in sorted(positions, key=lambda i: (-edges[i].strength, i))]
+
+    def neighbors(self, node_id: str) -> Iterator[tuple[Any, Any]]:
+        """Yield (other_node, edge) for each edge of node_id, strongest first.
+
+        Edges whose other end isn't a node in the graph are skipped.
+        """
+        for edge in self.edges_of(node_id):
+            other_id = edge.target if edge.source == node_id else edge.source
+            other = self.nodes.get(other_id)
+            if other is not None:
+                yield other, edge
+
+
+_cached_index: GraphIndex | None = None
+
+
+def get_graph_index(graph: SocialCirclesResponse) -> GraphIndex:
+    """Return the GraphIndex for graph, building it on first use.
+
+    Args:
+        graph: The graph to index (treated as read-only from here on).
+
+    Returns:
+        GraphIndex wrapping graph.
+    """
+    global _cached_index
+    # Read once: another thread may swap the cached index concurrently
+    index = _cached_index
+    if index is not None and index.graph is graph:
+        return index
+
+    index = GraphIndex(graph)
+    _cached_index = index
+    return index
@@ -0,0 +1,270 @@
+"""Incremental maintenance of the social circles adjacency store.
+
+The graph only depends on which owned books connect which entities. That is
+kept in two small tables (app.models.social_circle):
+
+- social_circle_nodes: (entity_type, entity_id) -> owned book IDs
+- social_circle_edges: (author_id, target_type, target_id) -> shared book IDs
+
+Each book write is turned into a delta: the book's contribution before the
+change is removed and its contribution after is added, touching at most
+three node rows and two edge rows. ORM flushes are handled by the Book
+mapper events; bulk ``query(Book).update()`` calls (which bypass those
+events) must be wrapped in bulk_book_change().
+
+Contributions mirror build_social_circles_graph: only owned books with an
+author count, and publishers/binders are linked through that author.
+
+rebuild_store() recomputes both tables from the books table. It is a repair
+tool run from POST /admin/maintenance/social-circles-rebuild, not part of
+the request path.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import and_, delete, insert, select, update
+
+from app.enums import OWNED_STATUSES
+from app.models.book import Book
+from app.models.social_circle import SocialCircleEdgeBooks, SocialCircleNodeBooks
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BookLinks:
+    """The columns of an owned book that place it in the graph."""
+
+    book_id: int
+    author_id: int | None
+    publisher_id: int | None
+    binder_id: int | None
+
+
+_NodeKey = tuple[str, int]
+_EdgeKey = tuple[int, str, int]
+
+
+def links_for(book: Any, **overrides: Any) -> BookLinks | None:
+    """BookLinks for a book (or row), or None if it isn't owned.
+
+    Keyword overrides replace attribute values, e.g. the pre-update values
+    from attribute history.
+    """
+    values = {
+        attr: overrides.get(attr, getattr(book, attr))
+        for attr in ("status", "author_id", "publisher_id", "binder_id")
+    }
+    if values["status"] not in OWNED_STATUSES:
+        return None
+    return BookLinks(book.id, values["author_id"], values["publisher_id"], values["binder_id"])
+
+
+def _contributions(links: BookLinks | None) -> tuple[list[_NodeKey], list[_EdgeKey]]:
+    """Node and edge keys a book contributes its ID to."""
+    if links is None or not links.author_id:
+        return [], []
+    node_keys: list[_NodeKey] = [("author", links.author_id)]
+    edge_keys: list[_EdgeKey] = []
+    if links.publisher_id:
+        node_keys.append(("publisher", links.publisher_id))
+        edge_keys.append((links.author_id, "publisher", links.publisher_id))
+    if links.binder_id:
+        node_keys.append(("binder", links.binder_id))
+        edge_keys.append((links.author_id, "binder", links.binder_id))
+    return node_keys, edge_keys
+
+
+def apply_book_change(
+    connection: Connection, before: BookLinks | None, after: BookLinks | None
+) -> None:
+    """Apply one book's before/after contribution change to the store."""
+    apply_book_changes(connection, [(before, after)])
+
+
+def apply_book_changes(
+    connection: Connection, changes: Iterable[tuple[BookLinks | None, BookLinks | None]]
+) -> None:
+    """Apply a batch of (before, after) book contribution changes.
+
+    Deltas are merged per row first, so each affected node/edge row is read
+    (FOR UPDATE on PostgreSQL) and written once.
+    """
+    node_deltas: dict[_NodeKey, tuple[set[int], set[int]]] = defaultdict(lambda: (set(), set()))
+    edge_deltas: dict[_EdgeKey, tuple[set[int], set[int]]] = defaultdict(lambda: (set(), set()))
+
+    for before, after in changes:
+        if before == after:
+            continue
+        for links, slot in ((before, 1), (after, 0)):
+            if links is None:
+                continue
+            node_keys, edge_keys = _contributions(links)
+            for node_key in node_keys:
+                node_deltas[node_key][slot].add(links.book_id)
+            for edge_key in edge_keys:
+                edge_deltas[edge_key][slot].add(links.book_id)
+
+    for (entity_type, entity_id), (added, removed) in node_deltas.items():
+        _apply_delta(
+            connection,
+            SocialCircleNodeBooks,
+            {"entity_type": entity_type, "entity_id": entity_id},
+            added,
+            removed,
+        )
+    for (author_id, target_type, target_id), (added, removed) in edge_deltas.items():
+        _apply_delta(
+            connection,
+            SocialCircleEdgeBooks,
+            {"author_id": author_id, "target_type": target_type, "target_id": target_id},
+            added,
+            removed,
+        )
+
+
+def _apply_delta(
+    connection: Connection, model: Any, key: dict[str, Any], added: set[int], removed: set[int]
+) -> None:
+    """Add/remove book IDs on one store row, creating or deleting it as needed."""
+    # A book moved within the same row (e.g. status change only) is a no-op
+    added, removed = added - removed, removed - added
+    if not added and not removed:
+        return
+
+    table = model.__table__
+    match = and_(*(table.c[name] == value for name, value in key.items()))
+    existing = connection.execute(select(table.c.book_ids).where(match).with_for_update()).scalar()
+
+    if existing is None and added:
+        if _insert_if_absent(connection, table, key, sorted(added)):
+            return
+        # A concurrent transaction created the row first; merge into it
+        existing = connection.execute(
+            select(table.c.book_ids).where(match).with_for_update()
+        ).scalar()
+
+    book_ids = (set(existing or ()) - removed) | added
+    if not book_ids:
+        if existing is not None:
+            connection.execute(delete(table).where(match))
+    else:
+        connection.execute(update(table).where(match).values(book_ids=sorted(book_ids)))
+
+
+def _insert_if_absent(
+    connection: Connection, table: Any, key: dict[str, Any], book_ids: list[int]
+) -> bool:
+    """Create a store row, returning False if it already exists.
+
+    FOR UPDATE can't lock a row that isn't there yet, so two first writes to
+    the same node/edge would both INSERT. On PostgreSQL, ON CONFLICT DO NOTHING
+    waits for the other writer and reports the conflict instead of raising
+    IntegrityError inside the caller's book save.
+    """
+    if connection.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        stmt = pg_insert(table).values(**key, book_ids=book_ids).on_conflict_do_nothing()
+        return connection.execute(stmt).rowcount == 1
+
+    # SQLite (tests) serializes writers, so the SELECT above is authoritative
+    connection.execute(insert(table).values(**key, book_ids=book_ids))
+    return True
+
+
+def _current_links(db: Session, book_ids: Iterable[int]) -> dict[int, BookLinks | None]:
+    """Read the current graph placement of the given books."""
+    rows = db.execute(
+        select(Book.id, Book.status, Book.author_id, Book.publisher_id, Book.binder_id).where(
+            Book.id.in_(list(book_ids))
+        )
+    ).all()
+    return {row.id: links_for(row) for row in rows}
+
+
+@contextmanager
+def bulk_book_change(db: Session, *criterion: Any) -> Iterator[None]:
+    """Keep the store current across a bulk update of the matching books.
+
+    Bulk ``query(Book).update()`` skips mapper events, so the affected books'
+    placement is captured before the update and diffed against it after.
+
+    Example:
+        with bulk_book_change(db, Book.author_id == source_id):
+            db.query(Book).filter(Book.author_id == source_id).update(...)
+    """
+    book_ids = db.execute(select(Book.id).where(*criterion)).scalars().all()
+    before = _current_links(db, book_ids)
+    yield
+    if not book_ids:
+        return
+    after = _current_links(db, book_ids)
+    apply_book_changes(
+        db.connection(), [(before.get(book_id), after.get(book_id)) for book_id in book_ids]
+    )
+
+
+def rebuild_store(db: Session) -> dict[str, int]:
+    """Recompute the store from the books table (repair job).
+
+    Returns:
+        Row counts written: {"books", "nodes", "edges"}.
+    """
+    rows = db.execute(
+        select(Book.id, Book.status, Book.author_id, Book.publisher_id, Book.binder_id)
+        .where(Book.status.in_(OWNED_STATUSES))
+        .execution_options(yield_per=1000)
+    )
+
+    node_books: dict[_NodeKey, list[int]] = defaultdict(list)
+    edge_books: dict[_EdgeKey, list[int]] = defaultdict(list)
+    book_count = 0
+    for row in rows:
+        book_count += 1
+        links = links_for(row)
+        node_keys, edge_keys = _contributions(links)
+        for node_key in node_keys:
+            node_books[node_key].append(row.id)
+        for edge_key in edge_keys:
+            edge_books[edge_key].append(row.id)
+
+    db.execute(delete(SocialCircleNodeBooks))
+    db.execute(delete(SocialCircleEdgeBooks))
+    if node_books:
+        db.execute(
+            insert(SocialCircleNodeBooks),
+            [
+                {"entity_type": entity_type, "entity_id": entity_id, "book_ids": sorted(ids)}
+                for (entity_type, entity_id), ids in node_books.items()
+            ],
+        )
+    if edge_books:
+        db.execute(
+            insert(SocialCircleEdgeBooks),
+            [
+                {
+                    "author_id": author_id,
+                    "target_type": target_type,
+                    "target_id": target_id,
+                    "book_ids": sorted(ids),
+                }
+                for (author_id, target_type, target_id), ids in edge_books.items()
+            ],
+        )
+    db.commit()
+
+    counts = {"books": book_count, "nodes": len(node_books), "edges": len(edge_books)}
+    logger.info("Rebuilt social circles store: %s", counts)
+    return counts
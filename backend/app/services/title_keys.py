@@ -0,0 +1,73 @@
+"""Persisted title lookup keys for duplicate and set detection.
+
+Duplicate detection compares scoring.normalize_title() forms and set
+detection compares set_detection.set_title_key() forms plus the parsed
+volume number. Each is several regexes per title, and both checks used to
+re-run them for every book by the author on every request. Book stores the
+results (normalized_title, set_title, volume_number), kept current by a
+validator on Book.title, and (author_id, normalized_title) is indexed so
+exact duplicates are a single index lookup.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select, update
+
+from app.models.book import Book
+from app.services.scoring import normalize_title
+from app.services.set_detection import extract_volume_number, set_title_key
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def title_keys(title: str) -> dict[str, Any]:
+    """Compute the lookup key columns for a title.
+
+    Args:
+        title: Full book title
+
+    Returns:
+        Dict of normalized_title, set_title and volume_number
+    """
+    return {
+        "normalized_title": normalize_title(title),
+        "set_title": set_title_key(title),
+        "volume_number": extract_volume_number(title),
+    }
+
+
+def backfill_title_keys(db: Session, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """Fill the key columns for books that don't have them yet.
+
+    Reads only (id, title) and writes each batch with one executemany
+    UPDATE. Does NOT commit the session.
+
+    Returns:
+        Number of books updated
+    """
+    updated = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Book.id, Book.title)
+            .where(Book.normalized_title.is_(None), Book.id > last_id)
+            .order_by(Book.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        db.execute(update(Book), [{"id": row.id, **title_keys(row.title)} for row in rows])
+        updated += len(rows)
+        last_id = rows[-1].id
+
+    if updated:
+        logger.info(f"Backfilled title keys for {updated} books")
+    return updated
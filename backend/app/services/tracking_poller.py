@@ -6,7 +6,8 @@ from datetime import UTC, datetime
 from sqlalchemy.orm import Session
 
 from app.models import Book, Notification, User
-from app.services.carriers import TrackingStatus, get_carrier
+from app.services.carriers import CarrierClient, TrackingStatus, get_carrier
+from app.services.carriers.pool import fetch_tracking_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +47,11 @@ def poll_all_active_tracking(db: Session, batch_size: int = DEFAULT_BATCH_SIZE)
     """Poll all active tracking numbers and update statuses.
 
     Processes books in batches to prevent Lambda timeout with large datasets.
-    Each carrier API call can take up to 15 seconds, so batch_size controls
-    the maximum number of books processed per invocation.
+    Lookups are grouped by carrier into multi-number requests where the
+    carrier supports them, and the carrier calls (up to 15 seconds each) run
+    concurrently, bounded per carrier (see carriers.pool), so a batch takes
+    about as long as its slowest round of calls; batch_size still bounds the
+    work per invocation.
 
     Args:
         db: Database session
@@ -82,48 +86,59 @@ def poll_all_active_tracking(db: Session, batch_size: int = DEFAULT_BATCH_SIZE)
     )
     stats["remaining"] = max(0, total_active - len(active_books))
 
+    # Resolve carriers here; unknown carriers count as errors like fetch failures
+    lookups: list[tuple[Book, CarrierClient, str]] = []
     for book in active_books:
         stats["checked"] += 1
-
+        tracking_number = book.tracking_number
+        if not tracking_number:  # excluded by the query
+            continue
         try:
-            carrier = get_carrier(book.tracking_carrier)
-            result = carrier.fetch_tracking(book.tracking_number)
-
-            # Check if status changed
-            if result.status != book.tracking_status:
-                stats["changed"] += 1
-                logger.info(
-                    f"Book {book.id} tracking status changed: "
-                    f"{book.tracking_status} -> {result.status}"
-                )
-                book.tracking_status = result.status
-
-            # Handle delivery tracking
-            if result.status == TrackingStatus.DELIVERED:
-                if book.tracking_delivered_at is None:
-                    book.tracking_delivered_at = datetime.now(UTC)
-                    logger.info(f"Book {book.id} marked as delivered")
-                else:
-                    # Check if 7+ days since delivery - deactivate
-                    delivered_at = book.tracking_delivered_at
-                    if delivered_at.tzinfo is None:
-                        delivered_at = delivered_at.replace(tzinfo=UTC)
-                    days_since_delivery = (datetime.now(UTC) - delivered_at).days
-                    if days_since_delivery >= 7:
-                        book.tracking_active = False
-                        stats["deactivated"] += 1
-                        logger.info(
-                            f"Book {book.id} tracking deactivated "
-                            f"({days_since_delivery} days after delivery)"
-                        )
-
-            # Update last checked timestamp
-            book.tracking_last_checked = datetime.now(UTC)
-
+            lookups.append((book, get_carrier(book.tracking_carrier), tracking_number))
         except Exception as e:
             stats["errors"] += 1
             logger.error(f"Error polling tracking for book {book.id}: {e}")
 
+    results = fetch_tracking_concurrently(
+        [(carrier, tracking_number) for _, carrier, tracking_number in lookups]
+    )
+
+    for (book, _, _), result in zip(lookups, results, strict=True):
+        if isinstance(result, Exception):
+            stats["errors"] += 1
+            logger.error(f"Error polling tracking for book {book.id}: {result}")
+            continue
+
+        # Check if status changed
+        if result.status != book.tracking_status:
+            stats["changed"] += 1
+            logger.info(
+                f"Book {book.id} tracking status changed: {book.tracking_status} -> {result.status}"
+            )
+            book.tracking_status = result.status
+
+        # Handle delivery tracking
+        if result.status == TrackingStatus.DELIVERED:
+            if book.tracking_delivered_at is None:
+                book.tracking_delivered_at = datetime.now(UTC)
+                logger.info(f"Book {book.id} marked as delivered")
+            else:
+                # Check if 7+ days since delivery - deactivate
+                delivered_at = book.tracking_delivered_at
+                if delivered_at.tzinfo is None:
+                    delivered_at = delivered_at.replace(tzinfo=UTC)
+                days_since_delivery = (datetime.now(UTC) - delivered_at).days
+                if days_since_delivery >= 7:
+                    book.tracking_active = False
+                    stats["deactivated"] += 1
+                    logger.info(
+                        f"Book {book.id} tracking deactivated "
+                        f"({days_since_delivery} days after delivery)"
+                    )
+
+        # Update last checked timestamp
+        book.tracking_last_checked = datetime.now(UTC)
+
     db.commit()
     logger.info(f"Tracking poll complete: {stats}")
     return stats
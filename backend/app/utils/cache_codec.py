@@ -0,0 +1,96 @@
+"""Binary codec for Redis cache entries.
+
+Small values are stored as plain JSON bytes, exactly as before, so they stay
+readable in redis-cli and entries written by older code still decode. Values
+whose JSON exceeds COMPRESS_THRESHOLD_BYTES are zlib-compressed behind a
+versioned header::
+
+    MAGIC (4 bytes) | version (1 byte) | flags (1 byte) | payload
+
+MAGIC starts with a NUL byte, which can never begin a JSON document, so the
+two formats can't be confused. Bumping CODEC_VERSION makes older entries
+undecodable, which callers treat as a cache miss.
+
+JSON is produced by pydantic-core (handles datetimes, Decimals and models
+without a ``default=`` hook). decode_json_bytes() returns the raw JSON so
+callers can send a cached document straight to the client without parsing
+it.
+"""
+
+import json
+import zlib
+from typing import Any
+
+from pydantic_core import to_json
+
+MAGIC = b"\x00bmx"
+CODEC_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+FLAG_ZLIB = 0x01
+
+# JSON smaller than this is stored uncompressed (zlib overhead isn't worth it)
+COMPRESS_THRESHOLD_BYTES = 4096
+# Favour speed: level 3 gets most of the ratio of level 6 on JSON at ~2x the speed
+COMPRESSION_LEVEL = 3
+
+
+class CodecError(ValueError):
+    """Raised when a cache entry can't be decoded (corrupt or other version)."""
+
+
+def dumps_json(value: Any) -> bytes:
+    """Serialize value to compact JSON bytes (str() for unknown types)."""
+    return to_json(value, fallback=str)
+
+
+def pack(json_bytes: bytes) -> bytes:
+    """Wrap already-serialized JSON for storage, compressing it if large."""
+    if len(json_bytes) < COMPRESS_THRESHOLD_BYTES:
+        return json_bytes
+    header = MAGIC + bytes((CODEC_VERSION, FLAG_ZLIB))
+    return header + zlib.compress(json_bytes, COMPRESSION_LEVEL)
+
+
+def encode(value: Any) -> bytes:
+    """Serialize and pack value for storage."""
+    return pack(dumps_json(value))
+
+
+def decode_json_bytes(blob: bytes | str) -> bytes:
+    """Return the JSON document stored in blob, decompressing if needed.
+
+    Raises:
+        CodecError: If the header is from another codec version or the
+            payload is corrupt.
+    """
+    if isinstance(blob, str):
+        return blob.encode()
+    if not blob.startswith(MAGIC):
+        return blob
+
+    if len(blob) < HEADER_SIZE:
+        raise CodecError("Truncated cache entry header")
+    version, flags = blob[len(MAGIC)], blob[len(MAGIC) + 1]
+    if version != CODEC_VERSION:
+        raise CodecError(f"Unsupported cache codec version {version}")
+
+    payload = blob[HEADER_SIZE:]
+    if flags & FLAG_ZLIB:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise CodecError(f"Corrupt cache entry: {e}") from e
+    return payload
+
+
+def decode(blob: bytes | str) -> Any:
+    """Decode a stored entry back into Python values.
+
+    Raises:
+        CodecError: If the entry can't be decoded.
+    """
+    try:
+        return json.loads(decode_json_bytes(blob))
+    except json.JSONDecodeError as e:
+        raise CodecError(f"Invalid JSON in cache entry: {e}") from e
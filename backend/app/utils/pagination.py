@@ -0,0 +1,200 @@
+"""Keyset (cursor) pagination and row-count helpers.
+
+Keyset pagination orders by ``(sort_column, id)`` and resumes after the last
+row of the previous page instead of using OFFSET, so page N costs the same as
+page 1. The cursor is an opaque URL-safe token carrying the last row's sort
+value and ID plus the sort it was issued for.
+
+Ordering in cursor mode is always NULLs-last (in both directions) so walks
+behave identically on PostgreSQL and SQLite: non-NULL values are paged with a
+row-value comparison an index on ``(sort_column, id)`` can serve, then the
+NULL block is paged by id.
+"""
+
+import base64
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import ColumnElement, DateTime, func, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Query, Session
+
+logger = logging.getLogger(__name__)
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, row_id: int) -> str:
+    """Encode the position after a row as an opaque cursor token."""
+    if isinstance(value, date | datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    payload = {"s": sort_by, "o": sort_order, "v": value, "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, sort_by: str, sort_order: str, column: InstrumentedAttribute
+) -> tuple[Any, int]:
+    """Decode a cursor into (sort value, id) for the given column.
+
+    Raises:
+        ValueError: If the token is malformed or was issued for another sort.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        cursor_sort, cursor_order = payload["s"], payload["o"]
+        value, row_id = payload["v"], int(payload["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Malformed cursor") from e
+
+    if cursor_sort != sort_by or cursor_order != sort_order:
+        raise ValueError("Cursor was issued for a different sort")
+
+    if value is None:
+        return None, row_id
+
+    python_type = column.type.python_type
+    try:
+        if python_type is datetime:
+            value = datetime.fromisoformat(value)
+        elif python_type is date:
+            value = date.fromisoformat(value)
+        elif python_type is Decimal:
+            value = Decimal(value)
+        else:
+            value = python_type(value)
+    except (ValueError, TypeError, ArithmeticError) as e:
+        raise ValueError("Malformed cursor value") from e
+    return value, row_id
+
+
+def _sort_key(column: InstrumentedAttribute, dialect_name: str) -> ColumnElement:
+    """The expression keyset pages are ordered and compared on.
+
+    SQLite stores datetimes as text in whatever format wrote them
+    (CURRENT_TIMESTAMP has no fraction, SQLAlchemy binds always do), so equal
+    instants don't compare equal as strings; compare julianday() numbers there.
+    """
+    if dialect_name == "sqlite" and isinstance(column.type, DateTime):
+        return func.julianday(column)
+    return column.expression
+
+
+def _sort_value(column: InstrumentedAttribute, value: Any, dialect_name: str) -> ColumnElement:
+    """Bind a cursor value the same way _sort_key presents the column."""
+    bound = literal(value, column.type)
+    if dialect_name == "sqlite" and isinstance(column.type, DateTime):
+        return func.julianday(bound)
+    return bound
+
+
+def keyset_order(
+    column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    desc: bool,
+    dialect_name: str,
+):
+    """ORDER BY clauses for the non-NULL part of a keyset walk: column, then id.
+
+    Matches an index on (column, id) - scanned backwards when desc.
+    """
+    key = _sort_key(column, dialect_name)
+    if desc:
+        return [key.desc(), id_column.desc()]
+    return [key.asc(), id_column.asc()]
+
+
+def keyset_after(
+    column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    value: Any,
+    row_id: int,
+    desc: bool,
+    dialect_name: str,
+):
+    """Filter selecting rows strictly after a non-NULL (value, row_id) in keyset_order.
+
+    A row-value comparison, so PostgreSQL can start an index scan on
+    (column, id) at the cursor. Rows with a NULL column never match.
+    """
+    key = tuple_(_sort_key(column, dialect_name), id_column)
+    bound = tuple_(_sort_value(column, value, dialect_name), literal(row_id))
+    return key < bound if desc else key > bound
+
+
+def keyset_before(column: InstrumentedAttribute, value: Any, dialect_name: str):
+    """Filter selecting rows whose column is strictly before value.
+
+    Compares the way keyset_order sorts, so it can bound a keyset walk from
+    above. Rows with a NULL column never match.
+    """
+    return _sort_key(column, dialect_name) < _sort_value(column, value, dialect_name)
+
+
+def fetch_keyset_page(
+    query: Query,
+    column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    after: tuple[Any, int] | None,
+    desc: bool,
+    limit: int,
+) -> list[Any]:
+    """Fetch up to limit rows after a cursor position, NULL sort values last.
+
+    Non-NULL values are read first in keyset_order; once they run out the
+    page continues into the NULL block in id order. Each part is a plain
+    index range scan, which a single ``NULLS LAST`` + ``OR col IS NULL``
+    query is not.
+    """
+    dialect_name = query.session.get_bind().dialect.name
+    rows: list[Any] = []
+
+    if after is None or after[0] is not None:
+        non_null = query.filter(column.is_not(None))
+        if after is not None:
+            non_null = non_null.filter(keyset_after(column, id_column, *after, desc, dialect_name))
+        rows = (
+            non_null.order_by(*keyset_order(column, id_column, desc, dialect_name))
+            .limit(limit)
+            .all()
+        )
+        if len(rows) >= limit:
+            return rows
+
+    null_block = query.filter(column.is_(None))
+    if after is not None and after[0] is None:
+        # Already in the trailing NULL block - only the id tie-breaker remains
+        null_block = null_block.filter(id_column < after[1] if desc else id_column > after[1])
+    id_order = id_column.desc() if desc else id_column.asc()
+    return rows + null_block.order_by(id_order).limit(limit - len(rows)).all()
+
+
+def estimate_count(db: Session, query: Query) -> int:
+    """Estimate a query's row count from the PostgreSQL planner.
+
+    Uses ``EXPLAIN (FORMAT JSON)`` so no rows are scanned. On other dialects
+    (SQLite in tests), or if the plan can't be read, falls back to an exact
+    ``count()``.
+    """
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql":
+        compiled = query.order_by(None).statement.compile(dialect=bind.dialect)
+        plan: Any
+        try:
+            # Savepoint so a failed EXPLAIN doesn't abort the request's transaction
+            with db.begin_nested():
+                plan = (
+                    db.connection()
+                    .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params)
+                    .scalar()
+                )
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            logger.warning(f"Row estimate failed, falling back to count(): {e}")
+    return query.count()
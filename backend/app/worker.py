@@ -38,6 +38,7 @@ from app.services.entity_validation import validate_and_associate_entities
 from app.services.scoring import calculate_and_persist_book_scores
 from app.utils.markdown_parser import parse_analysis_markdown
 from app.version import get_version
+from app.workers.sqs_batch import process_sqs_records
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -111,6 +112,9 @@ def handler(event: dict, context) -> dict:
     Returns:
         Dict with batch item failures for partial batch response,
         or version info if version check requested
+
+    Messages in a batch run concurrently, up to ANALYSIS_WORKER_CONCURRENCY
+    at a time; each job opens its own DB session.
     """
     # Handle version check (for smoke tests)
     if event.get("version"):
@@ -124,35 +128,28 @@ def handler(event: dict, context) -> dict:
             ),
         }
 
-    batch_item_failures = []
-
-    for record in event.get("Records", []):
-        message_id = record.get("messageId", "unknown")
-
-        try:
-            # Parse message body
-            body = json.loads(record["body"])
-            job_id = body["job_id"]
-            book_id = body["book_id"]
-            # SQS message can override model (for testing); otherwise use None
-            # to signal that process_analysis_job should read from config
-            model_override = body.get("model")
+    batch_item_failures = process_sqs_records(
+        event.get("Records", []), _process_record, settings.analysis_worker_concurrency
+    )
+    return {"batchItemFailures": batch_item_failures}
 
-            logger.info(
-                f"Processing job {job_id} for book {book_id}, model_override={model_override}"
-            )
 
-            # Process the job
-            process_analysis_job(job_id, book_id, model_override)
+def _process_record(record: dict) -> None:
+    """Process one SQS analysis job message."""
+    # Parse message body
+    body = json.loads(record["body"])
+    job_id = body["job_id"]
+    book_id = body["book_id"]
+    # SQS message can override model (for testing); otherwise use None
+    # to signal that process_analysis_job should read from config
+    model_override = body.get("model")
 
-            logger.info(f"Successfully processed job {job_id}")
+    logger.info(f"Processing job {job_id} for book {book_id}, model_override={model_override}")
 
-        except Exception as e:
-            logger.error(f"Failed to process message {message_id}: {e}", exc_info=True)
-            # Report this message as failed for partial batch failure
-            batch_item_failures.append({"itemIdentifier": message_id})
+    # Process the job
+    process_analysis_job(job_id, book_id, model_override)
 
-    return {"batchItemFailures": batch_item_failures}
+    logger.info(f"Successfully processed job {job_id}")
 
 
 def process_analysis_job(job_id: str, book_id: int, model: str | None = None) -> None:
@@ -0,0 +1,47 @@
+"""Concurrent processing of SQS event batches for worker Lambdas.
+
+Worker handlers pass their per-message function and a concurrency limit.
+Messages run on a bounded thread pool, so a batch of Bedrock-bound jobs
+takes about as long as its slowest round instead of the sum of all jobs.
+Each message function must open its own DB session (sessions are not
+thread-safe). The limit keeps parallel model calls within the account's
+Bedrock throttling quota; 1 processes messages one at a time.
+"""
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def process_sqs_records(
+    records: list[dict], process_record: Callable[[dict], None], max_concurrency: int
+) -> list[dict]:
+    """Process SQS records, at most max_concurrency at a time.
+
+    Args:
+        records: The event's Records
+        process_record: Handles one record; raises if it failed
+        max_concurrency: Maximum records processed at once
+
+    Returns:
+        batchItemFailures entries for the records that raised, in record order
+    """
+
+    def process(record: dict) -> dict | None:
+        message_id = record.get("messageId", "unknown")
+        try:
+            process_record(record)
+        except Exception as e:
+            logger.error(f"Failed to process message {message_id}: {e}", exc_info=True)
+            # Report this message as failed for partial batch failure
+            return {"itemIdentifier": message_id}
+        return None
+
+    if max_concurrency <= 1 or len(records) <= 1:
+        outcomes = [process(record) for record in records]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(records))) as executor:
+            outcomes = list(executor.map(process, records))
+    return [failure for failure in outcomes if failure is not None]
@@ -1,54 +1,121 @@
 """Tracking dispatcher Lambda handler.
 
 Queries active tracking books and dispatches their IDs to SQS for processing.
+Books are grouped by carrier into multi-book messages, sent with
+send_message_batch; carriers whose circuit is open are skipped.
 """
 
 import json
 import logging
 import os
+from collections import defaultdict
 
 from sqlalchemy.orm import Session
 
 from app.db import SessionLocal
 from app.models import Book
 from app.services.aws_clients import get_sqs_client
+from app.services.circuit_breaker import is_circuit_open
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Book IDs per SQS message (one worker invocation polls them together)
+BOOKS_PER_MESSAGE = 10
+
+# SQS send_message_batch limit
+SQS_BATCH_SIZE = 10
+
+
+def build_tracking_messages(books_by_carrier: dict[str, list[int]]) -> list[dict]:
+    """Split each carrier's book IDs into message bodies of BOOKS_PER_MESSAGE.
+
+    Args:
+        books_by_carrier: Carrier name -> book IDs
+
+    Returns:
+        Message bodies: {"carrier": name, "book_ids": [...]}
+    """
+    messages = []
+    for carrier, book_ids in books_by_carrier.items():
+        for i in range(0, len(book_ids), BOOKS_PER_MESSAGE):
+            messages.append({"carrier": carrier, "book_ids": book_ids[i : i + BOOKS_PER_MESSAGE]})
+    return messages
+
 
 def dispatch_tracking_jobs(db: Session, queue_url: str) -> dict:
-    """Query active tracking books and send their IDs to SQS.
+    """Query active tracking books and send their IDs to SQS, grouped by carrier.
 
     Args:
         db: Database session
         queue_url: SQS queue URL for tracking jobs
 
     Returns:
-        Dictionary with dispatch count
+        Dictionary with counts: dispatched (books), messages, failed (books
+        in messages SQS rejected), skipped_open_circuit, skipped_no_carrier
 
     """
     sqs = get_sqs_client()
 
     books = (
-        db.query(Book.id)
+        db.query(Book.id, Book.tracking_carrier)
         .filter(
             Book.tracking_active,
             Book.tracking_number.isnot(None),
         )
+        .order_by(Book.tracking_carrier, Book.id)
         .all()
     )
 
-    dispatched = 0
-    for (book_id,) in books:
-        sqs.send_message(
-            QueueUrl=queue_url,
-            MessageBody=json.dumps({"book_id": book_id}),
-        )
-        dispatched += 1
+    books_by_carrier: dict[str, list[int]] = defaultdict(list)
+    skipped_no_carrier = 0
+    for book_id, carrier in books:
+        if carrier:
+            books_by_carrier[carrier].append(book_id)
+        else:
+            skipped_no_carrier += 1
+
+    # One circuit check per carrier instead of one per book in the worker
+    skipped_open_circuit = 0
+    for carrier in list(books_by_carrier):
+        if is_circuit_open(db, carrier):
+            skipped = books_by_carrier.pop(carrier)
+            skipped_open_circuit += len(skipped)
+            logger.warning(f"Circuit open for {carrier}, skipping {len(skipped)} books")
 
-    logger.info(f"Dispatched {dispatched} tracking jobs to SQS")
-    return {"dispatched": dispatched}
+    messages = build_tracking_messages(books_by_carrier)
+
+    dispatched = 0
+    failed = 0
+    for i in range(0, len(messages), SQS_BATCH_SIZE):
+        batch = messages[i : i + SQS_BATCH_SIZE]
+        entries = [
+            {"Id": str(idx), "MessageBody": json.dumps(msg)} for idx, msg in enumerate(batch)
+        ]
+        response = sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+
+        failed_ids = {entry["Id"] for entry in response.get("Failed", [])}
+        if failed_ids:
+            logger.error(
+                f"Failed to send {len(failed_ids)} tracking messages: {response['Failed']}"
+            )
+        for idx, msg in enumerate(batch):
+            if str(idx) in failed_ids:
+                failed += len(msg["book_ids"])
+            else:
+                dispatched += len(msg["book_ids"])
+
+    logger.info(
+        f"Dispatched {dispatched} tracking jobs to SQS in {len(messages)} messages "
+        f"({skipped_open_circuit} skipped for open circuits)"
+    )
+    return {
+        "dispatched": dispatched,
+        "messages": len(messages),
+        "failed": failed,
+        "skipped_open_circuit": skipped_open_circuit,
+        "skipped_no_carrier": skipped_no_carrier,
+    }
 
 
 def handler(event: dict, context) -> dict:
@@ -1,22 +1,42 @@
 """Tracking worker Lambda handler.
 
 Processes SQS messages, fetches carrier tracking information, and updates the database.
+Messages are either {"book_id": id} or, from the dispatcher, a carrier group
+{"carrier": name, "book_ids": [...]}. When some books in a group fail, the
+message is acknowledged and only the failed IDs are sent back to the queue
+(with an "attempt" count), so the books that succeeded aren't re-polled.
 """
 
 import json
 import logging
+import os
 from datetime import UTC, datetime
 
 from sqlalchemy.orm import Session
 
 from app.db import SessionLocal
 from app.models import Book
-from app.services.carriers import get_carrier
-from app.services.circuit_breaker import is_circuit_open, record_failure, record_success
+from app.services.aws_clients import get_sqs_client
+from app.services.carriers import CarrierClient, TrackingResult, get_carrier
+from app.services.carriers.pool import fetch_tracking_concurrently
+from app.services.circuit_breaker import (
+    flush_circuit_state,
+    is_circuit_open,
+    record_failure,
+    record_success,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Attempts at a carrier group's failed books before the message is left to
+# SQS redelivery and the DLQ (matches the queue's maxReceiveCount)
+MAX_GROUP_ATTEMPTS = 3
+
+# Delay before re-enqueued books are retried (the queue's visibility timeout,
+# i.e. how long SQS would wait before redelivering the whole message)
+REQUEUE_DELAY_SECONDS = 120
+
 
 def process_tracking_job(db: Session, book_id: int) -> dict:
     """Process a single tracking job.
@@ -37,30 +57,148 @@ def process_tracking_job(db: Session, book_id: int) -> dict:
         logger.warning(f"Book {book_id} not found")
         return {"success": False, "error": "Book not found"}
 
-    if not book.tracking_carrier:
+    carrier_name = book.tracking_carrier
+    if not carrier_name:
         logger.warning(f"Book {book_id} has no tracking carrier")
         return {"success": False, "error": "No carrier"}
 
-    if is_circuit_open(db, book.tracking_carrier):
-        raise Exception(f"Circuit open for {book.tracking_carrier}")
+    if is_circuit_open(db, carrier_name):
+        raise Exception(f"Circuit open for {carrier_name}")
+
+    return _update_tracking(db, book, carrier_name)
+
+
+def _update_tracking(db: Session, book: Book, carrier_name: str) -> dict:
+    """Fetch tracking for a book from its carrier and store the status.
+
+    Records success or failure on the carrier's circuit breaker.
+
+    Raises:
+        Exception: On carrier API errors (after recording the failure)
 
+    """
+    book_id = book.id
     try:
-        carrier = get_carrier(book.tracking_carrier)
+        carrier = get_carrier(carrier_name)
         result = carrier.fetch_tracking(book.tracking_number)
-        book.tracking_status = result.status
-        book.tracking_last_checked = datetime.now(UTC)
-        if result.status == "Delivered" and book.tracking_delivered_at is None:
-            book.tracking_delivered_at = datetime.now(UTC)
+        _apply_tracking_result(book, result)
         db.commit()
-        record_success(db, book.tracking_carrier)
+        record_success(db, carrier_name)
         logger.info(f"Book {book_id} tracking updated: {result.status}")
         return {"success": True, "status": result.status}
     except Exception as e:
-        record_failure(db, book.tracking_carrier)
+        record_failure(db, carrier_name)
         logger.error(f"Failed to fetch tracking for book {book_id}: {e}")
         raise
 
 
+def _apply_tracking_result(book: Book, result: TrackingResult) -> None:
+    """Store a fetched tracking result on the book (caller commits)."""
+    book.tracking_status = result.status
+    book.tracking_last_checked = datetime.now(UTC)
+    if result.status == "Delivered" and book.tracking_delivered_at is None:
+        book.tracking_delivered_at = datetime.now(UTC)
+
+
+def process_tracking_batch(db: Session, book_ids: list[int]) -> dict:
+    """Process a carrier-grouped tracking message.
+
+    Loads the books in one query and checks each carrier's circuit once,
+    then fetches all their tracking (one multi-number request per carrier
+    where supported, concurrent and bounded per carrier otherwise) and
+    commits the updates together. Missing books and books without a
+    carrier are skipped, as in process_tracking_job, as are books without a
+    tracking number. A book that fails, or whose carrier's circuit is open,
+    doesn't affect the others.
+
+    Args:
+        db: Database session
+        book_ids: IDs of the books to update tracking for
+
+    Returns:
+        Dictionary with counts updated, skipped and the failed book IDs
+
+    """
+    books = db.query(Book).filter(Book.id.in_(book_ids)).order_by(Book.id).all()
+    skipped = len(book_ids) - len(books)
+    failed: list[int] = []
+    circuit_open: dict[str, bool] = {}
+    lookups: list[tuple[Book, str, CarrierClient, str]] = []
+
+    for book in books:
+        carrier_name = book.tracking_carrier
+        tracking_number = book.tracking_number
+        if not carrier_name:
+            logger.warning(f"Book {book.id} has no tracking carrier")
+            skipped += 1
+            continue
+        if not tracking_number:
+            logger.warning(f"Book {book.id} has no tracking number")
+            skipped += 1
+            continue
+        if carrier_name not in circuit_open:
+            circuit_open[carrier_name] = is_circuit_open(db, carrier_name)
+        if circuit_open[carrier_name]:
+            logger.warning(f"Book {book.id}: circuit open for {carrier_name}")
+            failed.append(book.id)
+            continue
+        try:
+            lookups.append((book, carrier_name, get_carrier(carrier_name), tracking_number))
+        except Exception as e:
+            record_failure(db, carrier_name)
+            logger.error(f"No carrier client for book {book.id}: {e}")
+            failed.append(book.id)
+
+    results = fetch_tracking_concurrently(
+        [(carrier, tracking_number) for _, _, carrier, tracking_number in lookups]
+    )
+
+    outcomes: list[tuple[str, bool]] = []
+    for (book, carrier_name, _, _), result in zip(lookups, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to fetch tracking for book {book.id}: {result}")
+            failed.append(book.id)
+            outcomes.append((carrier_name, False))
+        else:
+            _apply_tracking_result(book, result)
+            logger.info(f"Book {book.id} tracking updated: {result.status}")
+            outcomes.append((carrier_name, True))
+    db.commit()
+
+    # Circuit breaker bookkeeping in fetch order, after the updates are saved
+    for carrier_name, succeeded in outcomes:
+        if succeeded:
+            record_success(db, carrier_name)
+        else:
+            record_failure(db, carrier_name)
+
+    updated = sum(succeeded for _, succeeded in outcomes)
+    return {"updated": updated, "skipped": skipped, "failed": sorted(failed)}
+
+
+def requeue_failed_books(body: dict, failed: list[int]) -> None:
+    """Send a carrier group's failed book IDs back to the queue as a new message.
+
+    Raises:
+        Exception: On the group's last attempt, or if the queue isn't
+            configured, so SQS redelivers the message (and eventually moves it
+            to the DLQ) instead
+    """
+    attempt = body.get("attempt", 1)
+    if attempt >= MAX_GROUP_ATTEMPTS:
+        raise Exception(f"Tracking failed for books {failed} after {attempt} attempts")
+    queue_url = os.environ.get("TRACKING_QUEUE_URL")
+    if not queue_url:
+        raise Exception(f"Tracking failed for books {failed} (TRACKING_QUEUE_URL not set)")
+
+    get_sqs_client().send_message(
+        QueueUrl=queue_url,
+        MessageBody=json.dumps({**body, "book_ids": failed, "attempt": attempt + 1}),
+        DelaySeconds=REQUEUE_DELAY_SECONDS,
+    )
+    logger.info(f"Re-enqueued {len(failed)} failed tracking books (attempt {attempt + 1})")
+
+
 def handler(event: dict, context) -> dict:
     """Lambda handler for SQS trigger.
 
@@ -76,11 +214,18 @@ def handler(event: dict, context) -> dict:
     for record in event.get("Records", []):
         try:
             body = json.loads(record["body"])
-            book_id = body["book_id"]
             db = SessionLocal()
             try:
-                process_tracking_job(db, book_id)
+                if "book_ids" in body:
+                    failed = process_tracking_batch(db, body["book_ids"])["failed"]
+                    if failed:
+                        requeue_failed_books(body, failed)
+                else:
+                    process_tracking_job(db, body["book_id"])
             finally:
+                # Circuit changes are written behind; save them before the
+                # container can be frozen
+                flush_circuit_state(db)
                 db.close()
         except Exception as e:
             logger.error(f"Failed to process record: {e}")
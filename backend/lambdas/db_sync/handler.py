@@ -19,17 +19,36 @@ Environment Variables:
 import json
 import logging
 import os
+import queue
+import re
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 
 import boto3
 import psycopg2
 from psycopg2 import sql
-from psycopg2.extras import Json
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# COPY pipe buffering: bytes per queued chunk, and chunks in flight. Bounds
+# the memory a table copy holds at ~1 MB regardless of table size.
+COPY_CHUNK_BYTES = 64 * 1024
+COPY_QUEUE_CHUNKS = 16
+
+# Prod column types whose values go into staging JSONB columns unchanged
+JSON_TYPES = {"json", "jsonb"}
+# Prod text columns may hold JSON or plain strings; adapted per row in Python
+TEXT_TYPES = {"text", "character varying", "character"}
+
+# Backslash escapes in COPY text format
+_COPY_ESCAPE_RE = re.compile(r"\\(x[0-9a-fA-F]{1,2}|[0-7]{1,3}|.)", re.DOTALL)
+_COPY_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+_COPY_NULL = b"\\N"
+
 
 def get_secret(secret_arn: str, region: str = "us-west-2") -> dict:
     """Retrieve database credentials from Secrets Manager."""
@@ -93,76 +112,240 @@ def get_jsonb_columns(conn, table: str) -> set[str]:
         return {row[0] for row in cur.fetchall()}
 
 
-def adapt_row_for_insert(row: tuple, columns: list[str], jsonb_cols: set[str]) -> tuple:
-    """Convert values in JSONB columns to Json for psycopg2 insertion.
+def get_column_types(conn, table: str) -> dict[str, str]:
+    """Get column name -> information_schema data_type for a table."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = 'public' AND table_name = %s
+        """,
+            (table,),
+        )
+        return dict(cur.fetchall())
+
+
+def plan_jsonb_columns(
+    columns: list[str], jsonb_cols: set[str], source_types: dict[str, str]
+) -> tuple[set[str], list[int]]:
+    """Decide how each staging JSONB column is filled from prod.
+
+    Handles schema divergence where prod may have different types:
+    - json/jsonb -> jsonb: copied as-is
+    - text -> jsonb: parse JSON string or wrap raw value (adapt_copy_line)
+    - numeric, text[], etc. -> jsonb: converted with to_jsonb() in the SELECT
 
     Args:
-        row: Tuple of values from SELECT
-        columns: List of column names in same order as row
-        jsonb_cols: Set of column names that are JSONB type in staging
+        columns: Column names in COPY order
+        jsonb_cols: Column names that are JSONB type in staging
+        source_types: Prod data_type per column name
 
     Returns:
-        Tuple with JSONB values wrapped in Json()
+        (columns to wrap in to_jsonb(), positions of text columns to adapt)
+    """
+    to_jsonb: set[str] = set()
+    text_positions: list[int] = []
+    for position, col in enumerate(columns):
+        if col not in jsonb_cols:
+            continue
+        source_type = source_types.get(col)
+        if source_type in JSON_TYPES:
+            continue
+        if source_type in TEXT_TYPES:
+            text_positions.append(position)
+        else:
+            to_jsonb.add(col)
+    return to_jsonb, text_positions
 
-    Handles schema divergence where prod may have different types:
-    - numeric -> jsonb: wrap number in Json()
-    - text[] -> jsonb: convert list to Json()
-    - text -> jsonb: parse JSON string or wrap raw value
+
+def _unescape_copy_text(field: str) -> str:
+    """Decode a COPY text-format field (not NULL)."""
+
+    def replace(match: re.Match) -> str:
+        code = match.group(1)
+        if code[0] == "x" and len(code) > 1:
+            return chr(int(code[1:], 16))
+        if code[0] in "01234567":
+            return chr(int(code, 8))
+        return _COPY_ESCAPES.get(code, code)
+
+    return _COPY_ESCAPE_RE.sub(replace, field)
+
+
+def _escape_copy_text(value: str) -> str:
+    """Encode a value as a COPY text-format field."""
+    return (
+        value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    )
+
+
+def adapt_copy_line(line: bytes, text_positions: list[int]) -> bytes:
+    """Make text fields at text_positions valid JSON for a JSONB column.
+
+    A field that already parses as JSON is kept; anything else is wrapped
+    as a JSON string. NULLs pass through.
+
+    Args:
+        line: One COPY text-format row, without the trailing newline
+        text_positions: Field positions that come from prod text columns
     """
-    adapted = []
-    for col, value in zip(columns, row, strict=True):
-        if col in jsonb_cols and value is not None:
-            # Handle different source types that need conversion to JSONB
-            if isinstance(value, str):
-                # Could be a JSON string from prod - try to parse, else wrap raw
-                try:
-                    import json as json_module
+    fields = line.split(b"\t")
+    for position in text_positions:
+        field = fields[position]
+        if field == _COPY_NULL:
+            continue
+        value = _unescape_copy_text(field.decode())
+        try:
+            json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            fields[position] = _escape_copy_text(json.dumps(value)).encode()
+    return b"\t".join(fields)
 
-                    parsed = json_module.loads(value)
-                    adapted.append(Json(parsed))
-                except (json_module.JSONDecodeError, TypeError):
-                    adapted.append(Json(value))
+
+class CopyPipe:
+    """Bounded in-memory pipe from COPY ... TO STDOUT to COPY ... FROM STDIN.
+
+    The producer thread's copy_expert() calls write(); the consumer's
+    copy_expert() calls read(). At most max_chunks chunks of ~chunk_bytes
+    are buffered, so memory stays flat however large the table is.
+    """
+
+    def __init__(
+        self,
+        transform_line: Callable[[bytes], bytes] | None = None,
+        chunk_bytes: int = COPY_CHUNK_BYTES,
+        max_chunks: int = COPY_QUEUE_CHUNKS,
+    ):
+        self.rows = 0
+        self._transform_line = transform_line
+        self._chunk_bytes = chunk_bytes
+        self._queue: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self._cancelled = threading.Event()
+        self._pending = bytearray()
+        self._partial = b""
+        self._buffer = b""
+        self._eof = False
+
+    # Producer side
+
+    def write(self, data: bytes | str) -> int:
+        if isinstance(data, str):
+            data = data.encode()
+        size = len(data)
+        if self._transform_line:
+            lines = (self._partial + data).split(b"\n")
+            self._partial = lines.pop()
+            data = b"".join(self._transform_line(line) + b"\n" for line in lines)
+        self.rows += data.count(b"\n")
+        self._pending += data
+        if len(self._pending) >= self._chunk_bytes:
+            self._put(bytes(self._pending))
+            self._pending.clear()
+        return size
+
+    def close(self) -> None:
+        """Flush buffered data and signal end of stream."""
+        if self._partial:
+            self._pending += self._transform_line(self._partial)
+            self._partial = b""
+        if self._pending:
+            self._put(bytes(self._pending))
+            self._pending.clear()
+        self._put(None)
+
+    def fail(self, error: BaseException) -> None:
+        """Make the consumer's read() raise error."""
+        try:
+            self._put(error)
+        except RuntimeError:
+            pass  # Consumer already gone
+
+    def _put(self, item: bytes | BaseException | None) -> None:
+        while True:
+            if self._cancelled.is_set():
+                raise RuntimeError("COPY consumer stopped")
+            try:
+                self._queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    # Consumer side
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._buffer and not self._eof:
+            item = self._queue.get()
+            if item is None:
+                self._eof = True
+            elif isinstance(item, BaseException):
+                raise item
             else:
-                # Numbers, lists, dicts, etc. - wrap directly
-                adapted.append(Json(value))
-        else:
-            adapted.append(value)
-    return tuple(adapted)
+                self._buffer = item
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def cancel(self) -> None:
+        """Stop the producer (its next write() raises)."""
+        self._cancelled.set()
 
 
 def copy_table_data(prod_conn, staging_conn, table: str, columns: list[str]) -> int:
-    """Copy data from production table to staging table."""
+    """Stream a table from production to staging with COPY.
+
+    COPY ... TO STDOUT on prod runs in a thread, feeding COPY ... FROM STDIN
+    on staging through a bounded CopyPipe. Rows are never all in memory and
+    are loaded without per-row round trips.
+    """
     # Get JSONB columns from STAGING schema (target) to handle schema divergence
     # If prod has TEXT[] but staging has JSONB, we need staging's column types
     jsonb_cols = get_jsonb_columns(staging_conn, table)
+    to_jsonb: set[str] = set()
+    text_positions: list[int] = []
     if jsonb_cols:
         logger.info(f"Table {table} has JSONB columns in staging: {jsonb_cols}")
-
-    # Get data from production
-    with prod_conn.cursor() as prod_cur:
-        column_list = sql.SQL(", ").join(sql.Identifier(c) for c in columns)
-        query = sql.SQL("SELECT {} FROM {}").format(column_list, sql.Identifier(table))
-        prod_cur.execute(query)
-        rows = prod_cur.fetchall()
-
-    if not rows:
-        return 0
-
-    # Adapt rows to handle JSONB columns (wrap values in Json() for psycopg2)
-    adapted_rows = [adapt_row_for_insert(row, columns, jsonb_cols) for row in rows]
-
-    # Insert into staging
-    with staging_conn.cursor() as staging_cur:
-        placeholders = sql.SQL(", ").join(sql.Placeholder() for _ in columns)
-        column_list = sql.SQL(", ").join(sql.Identifier(c) for c in columns)
-        insert_query = sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
-            sql.Identifier(table), column_list, placeholders
+        to_jsonb, text_positions = plan_jsonb_columns(
+            columns, jsonb_cols, get_column_types(prod_conn, table)
         )
 
-        staging_cur.executemany(insert_query, adapted_rows)
-        staging_conn.commit()
+    select_list = sql.SQL(", ").join(
+        sql.SQL("to_jsonb({})").format(sql.Identifier(c)) if c in to_jsonb else sql.Identifier(c)
+        for c in columns
+    )
+    copy_out = sql.SQL("COPY (SELECT {} FROM {}) TO STDOUT").format(
+        select_list, sql.Identifier(table)
+    )
+    copy_in = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table), sql.SQL(", ").join(sql.Identifier(c) for c in columns)
+    )
 
-    return len(rows)
+    pipe = CopyPipe(
+        (lambda line: adapt_copy_line(line, text_positions)) if text_positions else None
+    )
+
+    def produce() -> None:
+        try:
+            with prod_conn.cursor() as prod_cur:
+                prod_cur.copy_expert(copy_out, pipe)
+            pipe.close()
+        except BaseException as e:
+            pipe.fail(e)
+
+    producer = threading.Thread(target=produce, name=f"copy-{table}", daemon=True)
+    producer.start()
+    try:
+        with staging_conn.cursor() as staging_cur:
+            staging_cur.copy_expert(copy_in, pipe, size=COPY_CHUNK_BYTES)
+    except BaseException:
+        pipe.cancel()
+        producer.join()
+        raise
+    producer.join()
+    staging_conn.commit()
+
+    return pipe.rows
 
 
 def get_table_ddl(conn, table: str) -> str:
@@ -489,7 +672,7 @@ def sync_databases(prod_secret: dict, staging_secret: dict, create_tables: bool
     3. For each table:
        - Create table in staging if it doesn't exist (when create_tables=True)
        - Truncate staging table
-       - Copy all data from prod to staging
+       - Stream all data from prod to staging with COPY (timed per table)
     4. Validate sync results
     5. Report results
     """
@@ -554,10 +737,14 @@ def sync_databases(prod_secret: dict, staging_secret: dict, create_tables: bool
                     staging_conn.commit()
 
                 # Copy data
+                started = time.monotonic()
                 rows_copied = copy_table_data(prod_conn, staging_conn, table, columns)
-                results["tables_synced"].append({"table": table, "rows": rows_copied})
+                seconds = round(time.monotonic() - started, 3)
+                results["tables_synced"].append(
+                    {"table": table, "rows": rows_copied, "seconds": seconds}
+                )
                 results["total_rows"] += rows_copied
-                logger.info(f"Synced {table}: {rows_copied} rows")
+                logger.info(f"Synced {table}: {rows_copied} rows in {seconds}s")
 
             except Exception as e:
                 logger.error(f"Failed to sync table {table}: {e}")
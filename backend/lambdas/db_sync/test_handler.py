@@ -1,128 +1,198 @@
 """Tests for db_sync handler functions."""
 
-from handler import adapt_row_for_insert
-from psycopg2.extras import Json
-
-
-class TestAdaptRowForInsert:
-    """Tests for adapt_row_for_insert() JSONB handling."""
-
-    def test_empty_list_in_jsonb_column_is_wrapped(self):
-        """Empty list [] in JSONB column should be wrapped with Json()."""
-        row = (1, "test", [])
-        columns = ["id", "name", "issues"]
-        jsonb_cols = {"issues"}
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result[0] == 1
-        assert result[1] == "test"
-        assert isinstance(result[2], Json)
-        assert result[2].adapted == []
-
-    def test_string_list_in_jsonb_column_is_wrapped(self):
-        """String list ["a", "b"] in JSONB column should be wrapped with Json()."""
-        row = (1, "test", ["issue1", "issue2"])
-        columns = ["id", "name", "issues"]
-        jsonb_cols = {"issues"}
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result[0] == 1
-        assert result[1] == "test"
-        assert isinstance(result[2], Json)
-        assert result[2].adapted == ["issue1", "issue2"]
-
-    def test_dict_in_jsonb_column_is_wrapped(self):
-        """Dict in JSONB column should be wrapped with Json() (original working case)."""
-        row = (1, "test", {"key": "value"})
-        columns = ["id", "name", "metadata"]
-        jsonb_cols = {"metadata"}
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result[0] == 1
-        assert result[1] == "test"
-        assert isinstance(result[2], Json)
-        assert result[2].adapted == {"key": "value"}
-
-    def test_list_of_dicts_in_jsonb_column_is_wrapped(self):
-        """List of dicts in JSONB column should be wrapped with Json()."""
-        row = (1, "test", [{"id": 1}, {"id": 2}])
-        columns = ["id", "name", "items"]
-        jsonb_cols = {"items"}
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result[0] == 1
-        assert result[1] == "test"
-        assert isinstance(result[2], Json)
-        assert result[2].adapted == [{"id": 1}, {"id": 2}]
-
-    def test_non_jsonb_column_unchanged(self):
-        """Non-JSONB columns should pass through unchanged."""
-        row = (1, "test", ["not", "jsonb"])
-        columns = ["id", "name", "tags"]
-        jsonb_cols = set()  # No JSONB columns
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result[0] == 1
-        assert result[1] == "test"
-        assert result[2] == ["not", "jsonb"]  # Unchanged, not wrapped
-        assert not isinstance(result[2], Json)
-
-    def test_null_value_in_jsonb_column_unchanged(self):
-        """NULL values in JSONB columns should pass through as None."""
-        row = (1, "test", None)
-        columns = ["id", "name", "issues"]
-        jsonb_cols = {"issues"}
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result[0] == 1
-        assert result[1] == "test"
-        assert result[2] is None
-        assert not isinstance(result[2], Json)
-
-    def test_multiple_jsonb_columns(self):
-        """Multiple JSONB columns should all be wrapped."""
-        row = (1, [], {"key": "value"}, "normal")
-        columns = ["id", "issues", "metadata", "name"]
-        jsonb_cols = {"issues", "metadata"}
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result[0] == 1
-        assert isinstance(result[1], Json)
-        assert result[1].adapted == []
-        assert isinstance(result[2], Json)
-        assert result[2].adapted == {"key": "value"}
-        assert result[3] == "normal"
-        assert not isinstance(result[3], Json)
-
-    def test_empty_row(self):
-        """Empty row should return empty tuple."""
-        row = ()
-        columns = []
-        jsonb_cols = set()
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result == ()
-
-    def test_jsonb_with_nested_structure(self):
-        """Complex nested JSONB should be wrapped correctly."""
-        nested_data = {
-            "users": [{"id": 1, "roles": ["admin", "user"]}],
-            "settings": {"enabled": True, "limit": 100},
-        }
-        row = (1, nested_data)
-        columns = ["id", "config"]
-        jsonb_cols = {"config"}
-
-        result = adapt_row_for_insert(row, columns, jsonb_cols)
-
-        assert result[0] == 1
-        assert isinstance(result[1], Json)
-        assert result[1].adapted == nested_data
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from handler import (
+    CopyPipe,
+    _unescape_copy_text,
+    adapt_copy_line,
+    copy_table_data,
+    plan_jsonb_columns,
+)
+
+
+class TestPlanJsonbColumns:
+    """Tests for plan_jsonb_columns() JSONB handling."""
+
+    def test_json_source_copied_as_is(self):
+        """jsonb/json prod columns need no conversion."""
+        to_jsonb, text_positions = plan_jsonb_columns(
+            ["id", "metadata", "config"],
+            {"metadata", "config"},
+            {"id": "integer", "metadata": "jsonb", "config": "json"},
+        )
+
+        assert to_jsonb == set()
+        assert text_positions == []
+
+    def test_array_and_numeric_sources_use_to_jsonb(self):
+        """text[] and numeric prod columns are converted in the SELECT."""
+        to_jsonb, text_positions = plan_jsonb_columns(
+            ["id", "issues", "score"],
+            {"issues", "score"},
+            {"id": "integer", "issues": "ARRAY", "score": "numeric"},
+        )
+
+        assert to_jsonb == {"issues", "score"}
+        assert text_positions == []
+
+    def test_text_source_adapted_per_row(self):
+        """text prod columns are adapted in the COPY stream, by position."""
+        to_jsonb, text_positions = plan_jsonb_columns(
+            ["id", "name", "notes"],
+            {"notes"},
+            {"id": "integer", "name": "text", "notes": "character varying"},
+        )
+
+        assert to_jsonb == set()
+        assert text_positions == [2]
+
+    def test_non_jsonb_columns_unchanged(self):
+        """Columns that aren't JSONB in staging are never converted."""
+        assert plan_jsonb_columns(["id", "tags"], set(), {"tags": "ARRAY"}) == (set(), [])
+
+
+class TestAdaptCopyLine:
+    """Tests for adapt_copy_line() text -> JSONB adaptation."""
+
+    def test_json_string_kept(self):
+        """Text that already parses as JSON is passed through."""
+        line = b'1\t{"key": "value"}\t[1, 2]'
+
+        assert adapt_copy_line(line, [1, 2]) == line
+
+    def test_plain_text_wrapped_as_json_string(self):
+        """Text that isn't JSON becomes a JSON string."""
+        assert adapt_copy_line(b"1\tnot json", [1]) == b'1\t"not json"'
+
+    def test_null_unchanged(self):
+        """NULL fields pass through as NULL."""
+        assert adapt_copy_line(b"1\t\\N", [1]) == b"1\t\\N"
+
+    def test_escapes_round_trip(self):
+        """COPY escapes are decoded before parsing and re-encoded after."""
+        line = b"1\tline one\\nC:\\\\path\\ttab"
+
+        result = adapt_copy_line(line, [1])
+
+        field = result.split(b"\t")[1].decode()
+        assert "\n" not in field and "\t" not in field
+        assert json.loads(_unescape_copy_text(field)) == "line one\nC:\\path\ttab"
+
+    def test_other_fields_untouched(self):
+        """Only the listed positions are adapted."""
+        assert adapt_copy_line(b"plain\tplain", [1]) == b'plain\t"plain"'
+
+
+class TestCopyPipe:
+    """Tests for the bounded COPY pipe."""
+
+    def test_round_trip_and_row_count(self):
+        pipe = CopyPipe(chunk_bytes=4)
+        pipe.write(b"1\ta\n")
+        pipe.write("2\tb\n")
+        pipe.close()
+
+        data = b""
+        while chunk := pipe.read(3):
+            data += chunk
+
+        assert data == b"1\ta\n2\tb\n"
+        assert pipe.rows == 2
+
+    def test_transform_applied_per_line(self):
+        pipe = CopyPipe(transform_line=bytes.upper)
+        pipe.write(b"ab\ncd")
+        pipe.write(b"e\n")
+        pipe.close()
+
+        assert pipe.read() + pipe.read() == b"AB\nCDE\n"
+        assert pipe.read() == b""
+
+    def test_bounded_buffer_blocks_producer(self):
+        pipe = CopyPipe(chunk_bytes=1, max_chunks=2)
+        written = []
+
+        def produce():
+            for i in range(10):
+                pipe.write(b"%d\n" % i)
+                written.append(i)
+            pipe.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        producer.join(timeout=0.2)
+        assert producer.is_alive()
+        assert len(written) <= 3
+
+        rows = b""
+        while chunk := pipe.read():
+            rows += chunk
+        producer.join()
+        assert rows.splitlines() == [b"%d" % i for i in range(10)]
+
+    def test_producer_failure_raised_in_consumer(self):
+        pipe = CopyPipe()
+        pipe.fail(ValueError("prod COPY failed"))
+
+        with pytest.raises(ValueError, match="prod COPY failed"):
+            pipe.read()
+
+    def test_cancel_stops_producer(self):
+        pipe = CopyPipe(chunk_bytes=1, max_chunks=1)
+        pipe.write(b"1\n")
+        pipe.cancel()
+
+        with pytest.raises(RuntimeError, match="consumer stopped"):
+            pipe.write(b"2\n")
+
+
+def _connection(cursor):
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    return conn
+
+
+class TestCopyTableData:
+    """Tests for copy_table_data() streaming between connections."""
+
+    def test_streams_rows_from_prod_to_staging(self):
+        rows = [b"%d\tbook %d\n" % (i, i) for i in range(1000)]
+        prod_cur = MagicMock()
+        prod_cur.copy_expert.side_effect = lambda _sql, f: [f.write(r) for r in rows]
+        received = []
+
+        def copy_in(_sql, f, size):
+            while chunk := f.read(size):
+                received.append(chunk)
+
+        staging_cur = MagicMock()
+        staging_cur.fetchall.return_value = []  # No JSONB columns
+        staging_cur.copy_expert.side_effect = copy_in
+        staging_conn = _connection(staging_cur)
+
+        copied = copy_table_data(_connection(prod_cur), staging_conn, "books", ["id", "title"])
+
+        assert copied == 1000
+        assert b"".join(received) == b"".join(rows)
+        staging_conn.commit.assert_called_once()
+
+    def test_prod_failure_propagates(self):
+        prod_cur = MagicMock()
+        prod_cur.copy_expert.side_effect = RuntimeError("connection lost")
+
+        def copy_in(_sql, f, size):
+            while f.read(size):
+                pass
+
+        staging_cur = MagicMock()
+        staging_cur.fetchall.return_value = []
+        staging_cur.copy_expert.side_effect = copy_in
+        staging_conn = _connection(staging_cur)
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            copy_table_data(_connection(prod_cur), staging_conn, "books", ["id"])
+        staging_conn.commit.assert_not_called()
@@ -5,16 +5,23 @@ This script measures response time metrics for the /api/v1/social-circles endpoi
 across different max_books parameter values. Supports concurrent request mode for
 realistic load testing with staggered request launches.
 
+With --memory it instead builds the graph in-process against the configured
+database (BMX_DATABASE_URL) and reports peak Python heap usage (tracemalloc)
+of building the full graph from each input strategy: hydrating full Book rows
+(the old builder), the column-only streamed scan, and the adjacency store.
+
 Usage:
     python backend/scripts/benchmark_social_circles.py
     python backend/scripts/benchmark_social_circles.py --iterations 20 --env prod
     python backend/scripts/benchmark_social_circles.py --concurrent 5 --iterations 50
     python backend/scripts/benchmark_social_circles.py --dry-run
     python backend/scripts/benchmark_social_circles.py --env prod --confirm-production
+    python backend/scripts/benchmark_social_circles.py --memory --iterations 3
 
 Output:
     JSON with timing metrics (min, max, avg, p95, p99) for each max_books value,
     plus throughput metrics (total time, requests/second) in concurrent mode.
+    In --memory mode, JSON with peak memory and build time per strategy.
 """
 
 # ruff: noqa: T201
@@ -25,6 +32,8 @@ import json
 import statistics
 import sys
 import time
+import tracemalloc
+from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
@@ -42,6 +51,9 @@ DEFAULT_MAX_BOOKS_VALUES = [100, 500, 1000, 5000]
 # Endpoint path
 ENDPOINT_PATH = "/api/v1/social-circles"
 
+# Graph input strategies compared in --memory mode
+MEMORY_STRATEGIES = ["orm_full", "streamed_scan", "store"]
+
 
 @dataclass
 class TimingMetrics:
@@ -266,6 +278,114 @@ def result_to_dict(result: BenchmarkResult) -> dict:
     return d
 
 
+@dataclass
+class MemoryResult:
+    """Peak memory and build time for one graph input strategy."""
+
+    strategy: str
+    iterations: int
+    total_books: int
+    peak_kib: float
+    avg_ms: float
+
+
+def measure_memory(build: Callable[[], int], iterations: int) -> tuple[int, float, float]:
+    """Run build repeatedly, tracking peak traced memory and mean duration.
+
+    Args:
+        build: Zero-argument callable returning the number of books processed.
+        iterations: Number of runs.
+
+    Returns:
+        Tuple of (total_books, peak_kib, avg_ms).
+    """
+    peak = 0
+    timings: list[float] = []
+    total_books = 0
+    for _ in range(iterations):
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            total_books = build()
+            timings.append((time.perf_counter() - start) * 1000)
+            _, run_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak = max(peak, run_peak)
+    return total_books, round(peak / 1024, 1), round(statistics.mean(timings), 2)
+
+
+def run_memory_benchmark(iterations: int, max_books: int | None) -> list[dict]:
+    """Compare peak memory of the graph input strategies in-process.
+
+    Args:
+        iterations: Runs per strategy (the peak across runs is reported).
+        max_books: Optional cap passed to the builder.
+
+    Returns:
+        List of MemoryResult dictionaries.
+    """
+    # Add backend root to path so the app package is importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+    from app.db.session import SessionLocal
+    from app.enums import OWNED_STATUSES
+    from app.models import Book
+    from app.services.social_circles import (
+        _assemble_graph,
+        _GraphInputs,
+        build_social_circles_graph,
+    )
+
+    db = SessionLocal()
+
+    def orm_full() -> int:
+        # What the builder used to do: hydrate every column of every owned
+        # book, then assemble the same graph the other strategies return
+        query = db.query(Book).filter(Book.status.in_(OWNED_STATUSES))
+        if max_books is not None:
+            query = query.limit(max_books)
+        books = query.all()
+
+        inputs = _GraphInputs(total_books=len(books))
+        for book in books:
+            if book.author_id:
+                inputs.author_books[book.author_id].append(book.id)
+                if book.publisher_id:
+                    inputs.author_publishers[book.author_id].add(book.publisher_id)
+                    inputs.publisher_authors[book.publisher_id].add(book.author_id)
+                    inputs.publisher_books[book.publisher_id].add(book.id)
+                if book.binder_id:
+                    inputs.author_binders[book.author_id].add(book.binder_id)
+                    inputs.binder_books[book.binder_id].add(book.id)
+        inputs.truncated = max_books is not None and len(books) == max_books
+        graph = _assemble_graph(db, inputs, True, 1, None)
+        return graph.meta.total_books
+
+    def streamed_scan() -> int:
+        return build_social_circles_graph(db, max_books=max_books, source="books").meta.total_books
+
+    def store() -> int:
+        return build_social_circles_graph(db, max_books=max_books).meta.total_books
+
+    builders = {"orm_full": orm_full, "streamed_scan": streamed_scan, "store": store}
+
+    results = []
+    try:
+        for strategy in MEMORY_STRATEGIES:
+            print(f"\nMeasuring {strategy}...")
+            total_books, peak_kib, avg_ms = measure_memory(builders[strategy], iterations)
+            # Start each strategy from a clean identity map
+            db.expunge_all()
+            print(f"  books={total_books}, peak={peak_kib} KiB, avg={avg_ms}ms")
+            results.append(
+                asdict(MemoryResult(strategy, iterations, total_books, peak_kib, avg_ms))
+            )
+    finally:
+        db.close()
+    return results
+
+
 async def main_async(args: argparse.Namespace) -> list[dict]:
     """Run all benchmarks asynchronously.
 
@@ -341,6 +461,7 @@ Examples:
   python backend/scripts/benchmark_social_circles.py --dry-run
   python backend/scripts/benchmark_social_circles.py --dry-run --concurrent 10
   python backend/scripts/benchmark_social_circles.py --env prod --confirm-production
+  python backend/scripts/benchmark_social_circles.py --memory --iterations 3
         """,
     )
     parser.add_argument(
@@ -388,6 +509,11 @@ Examples:
         dest="confirm_production",
         help="Skip the production safety confirmation prompt",
     )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Measure in-process peak memory per graph input strategy (uses BMX_DATABASE_URL)",
+    )
     parser.add_argument(
         "--stagger-ms",
         type=int,
@@ -409,6 +535,22 @@ Examples:
         )
         args.concurrent = 100
 
+    # Memory mode: in-process against the local database, no HTTP requests
+    if args.memory:
+        max_books = args.max_books[0] if args.max_books else None
+        output = {
+            "benchmark": "social_circles_memory",
+            "max_books": max_books,
+            "results": run_memory_benchmark(args.iterations, max_books),
+        }
+        json_output = json.dumps(output, indent=2)
+        if args.output:
+            Path(args.output).write_text(json_output)
+            print(f"\nResults written to {args.output}")
+        else:
+            print(json_output)
+        return
+
     # Resolve config values used in both dry-run and real runs
     base_url = ENVIRONMENTS[args.env]
     max_books_values = args.max_books if args.max_books else DEFAULT_MAX_BOOKS_VALUES
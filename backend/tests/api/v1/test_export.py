@@ -0,0 +1,220 @@
+"""Tests for the streaming CSV and NDJSON exports."""
+
+import csv
+import io
+import json
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import update
+
+from app.api.v1 import export
+from app.models import Author, Binder, Book, BookTombstone, Publisher
+
+
+@pytest.fixture
+def books(db):
+    author = Author(name="Charles Dickens")
+    publisher = Publisher(name="Chapman & Hall", tier="TIER_1")
+    binder = Binder(name="Riviere & Son")
+    db.add_all([author, publisher, binder])
+    db.flush()
+    db.add_all(
+        [
+            Book(
+                title=f"Bleak House, Vol. {i}",
+                author_id=author.id,
+                publisher_id=publisher.id,
+                binder_id=binder.id,
+                binding_authenticated=True,
+                value_mid=Decimal("250"),
+                inventory_type="PRIMARY",
+            )
+            for i in range(1, 6)
+        ]
+        + [Book(title="Loose Leaf", inventory_type="EXTENDED")]
+    )
+    db.commit()
+
+
+class TestExportStreaming:
+    """Exports stream in batches with related names joined in."""
+
+    def test_csv_rows_across_batches(self, client, books, monkeypatch):
+        monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)
+
+        response = client.get("/api/v1/export/csv")
+
+        assert response.status_code == 200
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0] == export.CSV_HEADERS
+        assert [row[0] for row in rows[1:]] == ["1", "2", "3", "4", "5"]
+        assert rows[1][1:4] == ["Bleak House, Vol. 1", "Charles Dickens", "Chapman & Hall"]
+        assert rows[1][8] == "$250.00"
+        assert rows[1][15] == "AUTHENTICATED Riviere & Son"
+
+    def test_ndjson_one_book_per_line(self, client, books, monkeypatch):
+        monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)
+
+        response = client.get("/api/v1/export/json", params={"inventory_type": "PRIMARY"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["title"] for r in records] == [f"Bleak House, Vol. {i}" for i in range(1, 6)]
+        assert records[0]["publisher_tier"] == "TIER_1"
+        assert records[0]["binder"] == "Riviere & Son"
+
+    def test_empty_export(self, client):
+        assert client.get("/api/v1/export/csv").text.splitlines() == [",".join(export.CSV_HEADERS)]
+        assert client.get("/api/v1/export/json").text == ""
+
+
+@pytest.fixture
+def stale_books(db, books):
+    """Mark all but the last PRIMARY book as last updated in 2020, that one in 2025."""
+    last_id = max(b.id for b in db.query(Book).filter(Book.inventory_type == "PRIMARY"))
+    db.execute(
+        update(Book).where(Book.id != last_id).values(updated_at=datetime(2020, 1, 1, tzinfo=UTC))
+    )
+    db.execute(
+        update(Book).where(Book.id == last_id).values(updated_at=datetime(2025, 1, 1, tzinfo=UTC))
+    )
+    db.commit()
+
+
+class TestIncrementalExport:
+    """updated_since limits the export to recently changed books."""
+
+    def test_ndjson_updated_since(self, client, stale_books):
+        response = client.get(
+            "/api/v1/export/json", params={"updated_since": "2024-01-01T00:00:00Z"}
+        )
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["title"] for r in records] == ["Bleak House, Vol. 5"]
+        assert records[0]["value_mid"] == 250.0
+        assert records[0]["updated_at"] is not None
+
+    def test_parquet_typed_columns(self, client, stale_books, monkeypatch):
+        monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)
+
+        full = pq.read_table(io.BytesIO(client.get("/api/v1/export/parquet").content))
+        assert full.num_rows == 5
+        assert str(full.schema.field("value_mid").type) == "decimal128(10, 2)"
+        assert full.column("value_mid")[0].as_py() == Decimal("250.00")
+        assert str(full.schema.field("updated_at").type) == "timestamp[us, tz=UTC]"
+        assert full.column("updated_at")[0].as_py() == datetime(2020, 1, 1, tzinfo=UTC)
+
+        response = client.get(
+            "/api/v1/export/parquet", params={"updated_since": "2024-01-01T00:00:00Z"}
+        )
+        incremental = pq.read_table(io.BytesIO(response.content))
+        assert incremental.column("title").to_pylist() == ["Bleak House, Vol. 5"]
+
+
+class TestChangeFeed:
+    """/export/changes pages through upserts and tombstoned deletes."""
+
+    def _drain(self, client, **params):
+        """Follow next_cursor until has_more is false; return all pages."""
+        pages = [client.get("/api/v1/export/changes", params=params).json()]
+        while pages[-1]["has_more"]:
+            cursor = pages[-1]["next_cursor"]
+            pages.append(
+                client.get(
+                    "/api/v1/export/changes", params={"cursor": cursor, "limit": params["limit"]}
+                ).json()
+            )
+        return pages
+
+    def test_pages_cover_every_book_once(self, client, db, books):
+        # One shared timestamp: pages split on the id tie-breaker. (Set via
+        # SQLAlchemy; SQLite's CURRENT_TIMESTAMP text doesn't compare equal.)
+        db.execute(update(Book).values(updated_at=datetime(2024, 1, 1, tzinfo=UTC)))
+        db.commit()
+        pages = self._drain(client, limit=2)
+
+        titles = [r["title"] for page in pages for r in page["upserts"]]
+        assert len(pages) == 3
+        assert sorted(titles) == sorted(
+            [f"Bleak House, Vol. {i}" for i in range(1, 6)] + ["Loose Leaf"]
+        )
+        assert pages[0]["upserts"][0]["inventory_type"] in ("PRIMARY", "EXTENDED")
+
+    def test_cursor_picks_up_later_updates_and_deletes(self, client, db, stale_books):
+        watermark = self._drain(client, limit=10)[-1]["next_cursor"]
+        empty = client.get("/api/v1/export/changes", params={"cursor": watermark}).json()
+        assert empty["upserts"] == [] and empty["deletes"] == []
+        assert empty["next_cursor"] == watermark
+
+        edited, deleted = db.query(Book).order_by(Book.id).limit(2).all()
+        deleted_id = deleted.id
+        db.execute(
+            update(Book)
+            .where(Book.id == edited.id)
+            .values(title="Bleak House (revised)", updated_at=datetime(2025, 6, 1, tzinfo=UTC))
+        )
+        db.delete(deleted)
+        db.flush()
+        db.execute(update(BookTombstone).values(deleted_at=datetime(2025, 6, 1, tzinfo=UTC)))
+        db.commit()
+
+        changes = client.get("/api/v1/export/changes", params={"cursor": watermark}).json()
+        assert [r["title"] for r in changes["upserts"]] == ["Bleak House (revised)"]
+        assert [d["id"] for d in changes["deletes"]] == [deleted_id]
+
+    def test_since_filters_both_streams(self, client, stale_books):
+        changes = client.get(
+            "/api/v1/export/changes", params={"since": "2024-01-01T00:00:00Z"}
+        ).json()
+
+        assert [r["title"] for r in changes["upserts"]] == ["Bleak House, Vol. 5"]
+        assert changes["deletes"] == []
+        assert changes["has_more"] is False
+
+    def test_late_commit_behind_cursor_is_not_skipped(self, client, db, stale_books, monkeypatch):
+        """A row committed after a page was read, stamped before its rows, still arrives."""
+        now = datetime.now(UTC)
+        recent = db.query(Book).order_by(Book.id).first()
+        recent.updated_at = now - timedelta(seconds=5)
+        db.commit()
+
+        page = client.get("/api/v1/export/changes", params={"since": "2024-06-01T00:00:00Z"})
+        # Still inside the settle window: held back, cursor stays before it
+        assert [r["title"] for r in page.json()["upserts"]] == ["Bleak House, Vol. 5"]
+
+        # A long transaction commits with a timestamp older than `recent`
+        late = Book(
+            title="Late Commit", inventory_type="PRIMARY", updated_at=now - timedelta(seconds=10)
+        )
+        db.add(late)
+        db.commit()
+
+        # Once both have settled, the next page returns them in timestamp order
+        monkeypatch.setattr(export, "CHANGES_SETTLE_SECONDS", 0)
+        changes = client.get(
+            "/api/v1/export/changes", params={"cursor": page.json()["next_cursor"]}
+        ).json()
+        assert [r["id"] for r in changes["upserts"]] == [late.id, recent.id]
+
+    def test_unsettled_changes_are_held_back(self, client, db, books):
+        """Rows written within the settle window aren't returned yet."""
+        db.execute(update(Book).values(updated_at=datetime.now(UTC)))
+        db.delete(db.query(Book).first())
+        db.commit()
+
+        changes = client.get("/api/v1/export/changes").json()
+
+        assert changes == {
+            "upserts": [],
+            "deletes": [],
+            "next_cursor": ".",
+            "has_more": False,
+        }
+
+    def test_invalid_cursor(self, client):
+        response = client.get("/api/v1/export/changes", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
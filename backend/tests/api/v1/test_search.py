@@ -1,9 +1,18 @@
 """Tests for search API pagination - Issue #862."""
 
+import os
+
+import pytest
 from sqlalchemy.orm import Session
 
 from app.models import Author, Book, BookAnalysis
 
+# The substring fallback only runs off PostgreSQL (CI sets DATABASE_URL)
+sqlite_only = pytest.mark.skipif(
+    bool(os.environ.get("DATABASE_URL")),
+    reason="Exercises the non-PostgreSQL search fallback",
+)
+
 
 def create_test_books(db: Session, count: int, keyword: str = "searchable") -> list[Book]:
     """Create test books with searchable content."""
@@ -95,6 +104,74 @@ class TestSearchPaginationScopeAll:
 
         assert data["total"] == 14
 
+    def test_books_precede_analyses_in_id_order(self, client, db):
+        """Combined results list books by ID, then analyses by ID."""
+        books = create_test_books(db, 3)
+        create_test_analyses(db, books)
+        db.commit()
+
+        response = client.get("/api/v1/search?q=searchable&scope=all&per_page=10")
+        assert response.status_code == 200
+        results = response.json()["results"]
+
+        types = [r["type"] for r in results]
+        assert types == ["book"] * 3 + ["analysis"] * 3
+        assert [r["id"] for r in results[:3]] == sorted(b.id for b in books)
+        assert results[3]["book_id"] == books[0].id
+        assert results[3]["title"] == books[0].title
+        assert results[0]["author"] == "Test Author"
+
+    def test_page_straddles_books_and_analyses(self, client, db):
+        """A page boundary inside the union returns the tail of books then analyses."""
+        books = create_test_books(db, 4)
+        create_test_analyses(db, books)
+        db.commit()
+
+        response = client.get("/api/v1/search?q=searchable&scope=all&page=2&per_page=3")
+        assert response.status_code == 200
+        results = response.json()["results"]
+
+        assert [r["type"] for r in results] == ["book", "analysis", "analysis"]
+
+    def test_total_reported_past_last_page(self, client, db):
+        """Total stays accurate when the requested page is empty."""
+        books = create_test_books(db, 2)
+        create_test_analyses(db, books)
+        db.commit()
+
+        response = client.get("/api/v1/search?q=searchable&scope=all&page=5&per_page=5")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["results"] == []
+        assert data["total"] == 4
+
+    def test_no_matches(self, client, db):
+        """No matches returns an empty page with zero total."""
+        create_test_books(db, 2)
+        db.commit()
+
+        response = client.get("/api/v1/search?q=nomatchterm&scope=all")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["results"] == []
+        assert data["total"] == 0
+
+    def test_analysis_snippet_from_summary(self, client, db):
+        """Analysis snippets are cut from the executive summary."""
+        books = create_test_books(db, 1)
+        create_test_analyses(db, books)
+        db.commit()
+
+        response = client.get("/api/v1/search?q=summary&scope=all")
+        assert response.status_code == 200
+        results = response.json()["results"]
+
+        assert len(results) == 1
+        assert results[0]["type"] == "analysis"
+        assert "summary" in results[0]["snippet"]
+
 
 class TestSearchPaginationScopeBooks:
     """Test pagination when scope=books."""
@@ -209,3 +286,43 @@ class TestSearchEagerLoading:
 
         for result in results:
             assert "Book" in result["title"]
+
+
+class TestSearchFullTextFallback:
+    """Full-text search falls back to substring matching off PostgreSQL."""
+
+    @sqlite_only
+    def test_relevance_sort_falls_back_to_id_on_sqlite(self, client, db):
+        """sort=relevance needs ts_rank; SQLite reports and uses ID order."""
+        create_test_books(db, 5)
+        db.commit()
+
+        response = client.get("/api/v1/search?q=searchable&scope=books&sort=relevance")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["sort"] == "id"
+        ids = [r["id"] for r in data["results"]]
+        assert ids == sorted(ids)
+
+    def test_invalid_sort_rejected(self, client):
+        """Unknown sort modes are rejected by validation."""
+        response = client.get("/api/v1/search?q=searchable&sort=newest")
+        assert response.status_code == 422
+
+    def test_substring_snippet_used_without_tsvector(self, client, db):
+        """Snippets come from _get_snippet when ts_headline is unavailable."""
+        create_test_books(db, 1)
+        db.commit()
+
+        response = client.get("/api/v1/search?q=searchable&scope=books")
+        assert response.status_code == 200
+        snippet = response.json()["results"][0]["snippet"]
+        assert "searchable" in snippet
+
+    @sqlite_only
+    def test_build_tsquery_returns_none_on_sqlite(self, db):
+        """No tsquery is built for non-PostgreSQL dialects."""
+        from app.api.v1.search import _build_tsquery
+
+        assert _build_tsquery(db, "dickens") is None
@@ -22,6 +22,14 @@ class TestSocialCirclesEndpoint:
         assert data["nodes"] == []
         assert data["edges"] == []
 
+    def test_unfiltered_request_reports_cache_status(self, client, db):
+        """Unfiltered requests go through the graph cache (MISS without Redis)."""
+        response = client.get("/api/v1/social-circles")
+
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.headers["content-type"] == "application/json"
+
     def test_endpoint_returns_valid_structure(self, client, db):
         """Response structure matches schema."""
         # Create minimal test data
@@ -388,7 +396,7 @@ class TestMaxBooksQueryParam:
         assert response.status_code == 422  # Validation error
 
     def test_max_books_default_value(self, client, db):
-        """max_books should default to 5000."""
+        """max_books should default to no cap."""
         # Create a few books to verify the endpoint works
         author = Author(name="Test Author")
         db.add(author)
@@ -400,7 +408,7 @@ class TestMaxBooksQueryParam:
         # Default request without max_books parameter
         response = client.get("/api/v1/social-circles")
         assert response.status_code == 200
-        # If default is 5000, we should get all our books (just 1)
+        # With no cap we should get all our books (just 1)
         data = response.json()
         assert data["meta"]["total_books"] == 1
 
@@ -4,7 +4,7 @@ import os
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -15,9 +15,13 @@ from app.auth import (
     require_editor,
     require_viewer,
 )
+from app.cache import local_cache
 from app.db import get_db
+from app.db.migration_sql import MIGRATION_C4D9E2F1A8B3_SQL
 from app.main import app
 from app.models.base import Base
+from app.services.circuit_breaker import reset_circuit_state
+from app.services.reference_cache import reference_cache
 
 
 # Mock viewer user for tests (lowest privilege level)
@@ -70,10 +74,39 @@ else:
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def _clear_local_cache():
+    """Keep the in-process cache tier from leaking values between tests."""
+    local_cache.clear()
+    yield
+    local_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_reference_cache():
+    """Entity lists (and their match indexes) are cached per process."""
+    yield
+    reference_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit_state():
+    """Circuit breaker state is held per process; each test starts closed."""
+    reset_circuit_state()
+    yield
+    reset_circuit_state()
+
+
 @pytest.fixture(scope="function")
 def db():
     """Create a fresh database for each test."""
     Base.metadata.create_all(bind=engine)
+    if engine.dialect.name == "postgresql":
+        # create_all() doesn't know about triggers; /search needs the
+        # trigger-maintained search_vector columns to match anything.
+        with engine.begin() as conn:
+            for statement in MIGRATION_C4D9E2F1A8B3_SQL:
+                conn.execute(text(statement))
     db = TestingSessionLocal()
     try:
         yield db
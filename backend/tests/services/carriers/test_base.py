@@ -112,3 +112,25 @@ class TestCarrierClientInterface:
         # Can call on class without instance
         assert TestCarrier.can_handle("TEST12345") is True
         assert TestCarrier.can_handle("OTHER12345") is False
+
+    def test_fetch_tracking_batch_defaults_to_single_lookups(self):
+        """Default fetch_tracking_batch calls fetch_tracking per number."""
+        from app.services.carriers.base import CarrierClient, TrackingResult
+
+        class SingleCarrier(CarrierClient):
+            name = "Single"
+
+            def fetch_tracking(self, tracking_number: str) -> TrackingResult:
+                return TrackingResult(status=f"Status {tracking_number}")
+
+            @classmethod
+            def can_handle(cls, tracking_number: str) -> bool:
+                return True
+
+        results = SingleCarrier().fetch_tracking_batch(["A1", "B2"])
+
+        assert SingleCarrier.max_batch_size == 1
+        assert {number: r.status for number, r in results.items()} == {
+            "A1": "Status A1",
+            "B2": "Status B2",
+        }
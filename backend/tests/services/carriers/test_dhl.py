@@ -72,13 +72,13 @@ class TestDHLFetchTracking:
             ]
         }
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.dhl.get_http_client") as mock_client:
             mock_http = MagicMock()
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status.return_value = None
             mock_http.get.return_value = mock_response_obj
-            mock_client.return_value.__enter__.return_value = mock_http
+            mock_client.return_value = mock_http
 
             result = client.fetch_tracking("1234567890")
 
@@ -108,13 +108,13 @@ class TestDHLFetchTracking:
             ]
         }
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.dhl.get_http_client") as mock_client:
             mock_http = MagicMock()
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status.return_value = None
             mock_http.get.return_value = mock_response_obj
-            mock_client.return_value.__enter__.return_value = mock_http
+            mock_client.return_value = mock_http
 
             result = client.fetch_tracking("1234567890")
 
@@ -139,13 +139,13 @@ class TestDHLFetchTracking:
             ]
         }
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.dhl.get_http_client") as mock_client:
             mock_http = MagicMock()
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status.return_value = None
             mock_http.get.return_value = mock_response_obj
-            mock_client.return_value.__enter__.return_value = mock_http
+            mock_client.return_value = mock_http
 
             result = client.fetch_tracking("1234567890")
 
@@ -157,13 +157,13 @@ class TestDHLFetchTracking:
         """Handle tracking number not found."""
         mock_response = {"shipments": []}
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.dhl.get_http_client") as mock_client:
             mock_http = MagicMock()
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status.return_value = None
             mock_http.get.return_value = mock_response_obj
-            mock_client.return_value.__enter__.return_value = mock_http
+            mock_client.return_value = mock_http
 
             result = client.fetch_tracking("1234567890")
 
@@ -174,14 +174,14 @@ class TestDHLFetchTracking:
         """Handle API HTTP errors gracefully."""
         import httpx
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.dhl.get_http_client") as mock_client:
             mock_http = MagicMock()
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_http.get.side_effect = httpx.HTTPStatusError(
                 "Server error", request=MagicMock(), response=mock_response
             )
-            mock_client.return_value.__enter__.return_value = mock_http
+            mock_client.return_value = mock_http
 
             result = client.fetch_tracking("1234567890")
 
@@ -192,10 +192,10 @@ class TestDHLFetchTracking:
         """Handle network timeout gracefully."""
         import httpx
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.dhl.get_http_client") as mock_client:
             mock_http = MagicMock()
             mock_http.get.side_effect = httpx.TimeoutException("Connection timed out")
-            mock_client.return_value.__enter__.return_value = mock_http
+            mock_client.return_value = mock_http
 
             result = client.fetch_tracking("1234567890")
 
@@ -204,13 +204,13 @@ class TestDHLFetchTracking:
 
     def test_malformed_response(self, client):
         """Handle malformed JSON response."""
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.dhl.get_http_client") as mock_client:
             mock_http = MagicMock()
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = {"unexpected": "format"}
             mock_response_obj.raise_for_status.return_value = None
             mock_http.get.return_value = mock_response_obj
-            mock_client.return_value.__enter__.return_value = mock_http
+            mock_client.return_value = mock_http
 
             result = client.fetch_tracking("1234567890")
 
@@ -231,13 +231,13 @@ class TestDHLFetchTracking:
             ]
         }
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.dhl.get_http_client") as mock_client:
             mock_http = MagicMock()
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status.return_value = None
             mock_http.get.return_value = mock_response_obj
-            mock_client.return_value.__enter__.return_value = mock_http
+            mock_client.return_value = mock_http
 
             client.fetch_tracking("12345-67890")
 
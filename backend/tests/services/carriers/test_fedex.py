@@ -3,6 +3,8 @@
 from datetime import date
 from unittest.mock import MagicMock, patch
 
+import httpx
+
 from app.services.carriers.fedex import FedExClient
 
 
@@ -65,7 +67,7 @@ class TestFedExClientName:
 class TestFedExFetchTrackingSuccess:
     """Tests for successful FedEx tracking responses."""
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_in_transit_status(self, mock_client_class):
         """Parse in-transit status from FedEx response."""
         mock_response = MagicMock()
@@ -91,8 +93,6 @@ class TestFedExFetchTrackingSuccess:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -103,7 +103,7 @@ class TestFedExFetchTrackingSuccess:
         assert result.location == "Memphis, TN"
         assert result.error is None
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_delivered_status(self, mock_client_class):
         """Parse delivered status from FedEx response."""
         mock_response = MagicMock()
@@ -129,8 +129,6 @@ class TestFedExFetchTrackingSuccess:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -142,7 +140,7 @@ class TestFedExFetchTrackingSuccess:
         assert result.location == "New York, NY"
         assert result.error is None
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_exception_status(self, mock_client_class):
         """Parse exception status from FedEx response."""
         mock_response = MagicMock()
@@ -167,8 +165,6 @@ class TestFedExFetchTrackingSuccess:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -178,7 +174,7 @@ class TestFedExFetchTrackingSuccess:
         assert result.status_detail == "Delivery exception - Customer not available"
         assert result.location == "Los Angeles, CA"
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_normalizes_tracking_number(self, mock_client_class):
         """Tracking number is normalized before API call."""
         mock_response = MagicMock()
@@ -196,8 +192,6 @@ class TestFedExFetchTrackingSuccess:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -215,7 +209,7 @@ class TestFedExFetchTrackingSuccess:
 class TestFedExFetchTrackingErrors:
     """Tests for FedEx tracking error handling."""
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_http_error(self, mock_client_class):
         """Handle HTTP errors gracefully."""
         import httpx
@@ -226,8 +220,6 @@ class TestFedExFetchTrackingErrors:
         mock_client.post.side_effect = httpx.HTTPStatusError(
             "Server error", request=MagicMock(), response=mock_response
         )
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -237,15 +229,13 @@ class TestFedExFetchTrackingErrors:
         assert result.error is not None
         assert "500" in result.error
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_network_error(self, mock_client_class):
         """Handle network errors gracefully."""
         import httpx
 
         mock_client = MagicMock()
         mock_client.post.side_effect = httpx.ConnectError("Connection refused")
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -254,7 +244,7 @@ class TestFedExFetchTrackingErrors:
         assert result.status == "Unknown"
         assert result.error is not None
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_invalid_json_response(self, mock_client_class):
         """Handle malformed JSON responses gracefully."""
         mock_response = MagicMock()
@@ -263,8 +253,6 @@ class TestFedExFetchTrackingErrors:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -273,7 +261,7 @@ class TestFedExFetchTrackingErrors:
         assert result.status == "Unknown"
         assert result.error is not None
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_empty_package_list(self, mock_client_class):
         """Handle empty package list in response."""
         mock_response = MagicMock()
@@ -282,8 +270,6 @@ class TestFedExFetchTrackingErrors:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -293,7 +279,7 @@ class TestFedExFetchTrackingErrors:
         assert result.error is not None
         assert "not found" in result.error.lower()
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_fetch_missing_response_keys(self, mock_client_class):
         """Handle missing keys in response gracefully."""
         mock_response = MagicMock()
@@ -302,8 +288,6 @@ class TestFedExFetchTrackingErrors:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -316,7 +300,7 @@ class TestFedExFetchTrackingErrors:
 class TestFedExDateParsing:
     """Tests for FedEx date parsing edge cases."""
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_parse_various_date_formats(self, mock_client_class):
         """Handle various date formats from FedEx API."""
         mock_response = MagicMock()
@@ -335,8 +319,6 @@ class TestFedExDateParsing:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -346,7 +328,7 @@ class TestFedExDateParsing:
         assert result.status == "In Transit"
         # Date might be None if format is unexpected, but no error
 
-    @patch("app.services.carriers.fedex.httpx.Client")
+    @patch("app.services.carriers.fedex.get_http_client")
     def test_missing_estimated_delivery(self, mock_client_class):
         """Handle missing estimated delivery date."""
         mock_response = MagicMock()
@@ -364,8 +346,6 @@ class TestFedExDateParsing:
 
         mock_client = MagicMock()
         mock_client.post.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
         mock_client_class.return_value = mock_client
 
         client = FedExClient()
@@ -374,3 +354,50 @@ class TestFedExDateParsing:
         assert result.status == "In Transit"
         assert result.estimated_delivery is None
         assert result.error is None
+
+
+class TestFedExFetchTrackingBatch:
+    """Tests for multi-number FedEx track requests."""
+
+    @patch("app.services.carriers.fedex.get_http_client")
+    def test_one_request_for_all_numbers(self, mock_client_class):
+        """All numbers go in one request; results are matched by trackingNbr."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "TrackPackagesResponse": {
+                "packageList": [
+                    {"trackingNbr": "123456789012", "keyStatus": "Delivered"},
+                    {"trackingNbr": "123456789012345", "keyStatus": "In transit"},
+                ]
+            }
+        }
+
+        mock_client = MagicMock()
+        mock_client.post.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        results = FedExClient().fetch_tracking_batch(
+            ["1234 5678 9012", "123456789012345", "999999999999"]
+        )
+
+        mock_client.post.assert_called_once()
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert payload["TrackPackagesRequest"]["trackingInfoList"] == [
+            {"trackingNumber": "123456789012"},
+            {"trackingNumber": "123456789012345"},
+            {"trackingNumber": "999999999999"},
+        ]
+        assert results["1234 5678 9012"].status == "Delivered"
+        assert results["123456789012345"].status == "In Transit"
+        assert results["999999999999"].error == "Tracking number not found"
+
+    @patch("app.services.carriers.fedex.get_http_client")
+    def test_connection_error_applies_to_every_number(self, mock_client_class):
+        """A failed request returns the error for each number."""
+        mock_client = MagicMock()
+        mock_client.post.side_effect = httpx.ConnectError("Connection refused")
+        mock_client_class.return_value = mock_client
+
+        results = FedExClient().fetch_tracking_batch(["123456789012", "123456789013"])
+
+        assert all(r.error.startswith("Connection error") for r in results.values())
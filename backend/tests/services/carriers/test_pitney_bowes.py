@@ -67,8 +67,8 @@ class TestFetchTracking:
             "estimatedDeliveryDate": "2026-01-05",
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("UPAA1234567890")
 
@@ -89,8 +89,8 @@ class TestFetchTracking:
             "deliveredAt": "2026-01-04T14:30:00Z",
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("UPAA1234567890")
 
@@ -110,8 +110,8 @@ class TestFetchTracking:
             "currentLocation": "Los Angeles, CA",
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("UPAA1234567890")
 
@@ -126,9 +126,9 @@ class TestFetchTracking:
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = Exception("Internal Server Error")
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value.get.return_value.raise_for_status.side_effect = Exception(
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value.raise_for_status.side_effect = Exception(
                 "Internal Server Error"
             )
 
@@ -144,9 +144,9 @@ class TestFetchTracking:
         mock_response.status_code = 404
         mock_response.raise_for_status.side_effect = Exception("Not Found")
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value.get.return_value.raise_for_status.side_effect = Exception(
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value.raise_for_status.side_effect = Exception(
                 "Not Found"
             )
 
@@ -163,8 +163,8 @@ class TestFetchTracking:
             "status": "IN_TRANSIT",
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_http_client = mock_client.return_value.__enter__.return_value
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_http_client = mock_client.return_value
             mock_http_client.get.return_value = mock_response
 
             client.fetch_tracking("upaa-1234-5678-90")
@@ -183,8 +183,8 @@ class TestFetchTracking:
             "status": "IN_TRANSIT",
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_http_client = mock_client.return_value.__enter__.return_value
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_http_client = mock_client.return_value
             mock_http_client.get.return_value = mock_response
 
             client.fetch_tracking("UPAA1234567890")
@@ -203,8 +203,8 @@ class TestFetchTracking:
             "statusDescription": "Order is being processed",
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("UPAA1234567890")
 
@@ -221,8 +221,8 @@ class TestFetchTracking:
             # No location, estimatedDeliveryDate, or statusDescription
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.pitney_bowes.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("UPAA1234567890")
 
@@ -0,0 +1,158 @@
+"""Tests for shared carrier HTTP clients and the concurrent fetch stage."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.carriers import CarrierClient, TrackingResult, pool
+from app.services.carriers.pool import (
+    close_http_clients,
+    fetch_tracking_concurrently,
+    get_http_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    close_http_clients()
+    yield
+    close_http_clients()
+
+
+class _SlowCarrier(CarrierClient):
+    """Carrier stub that sleeps per request and records peak concurrency."""
+
+    def __init__(self, name, delay=0.05, max_batch_size=1):
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self.batches = []
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_tracking(self, tracking_number):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if tracking_number == "bad":
+            raise RuntimeError("carrier down")
+        return TrackingResult(status=f"status {tracking_number}")
+
+    def fetch_tracking_batch(self, tracking_numbers):
+        self.batches.append(list(tracking_numbers))
+        if "down" in tracking_numbers:
+            raise RuntimeError("carrier down")
+        # One request for the whole chunk; "lost" is missing from the response
+        return {
+            number: TrackingResult(status=f"status {number}")
+            for number in tracking_numbers
+            if number != "lost"
+        }
+
+    @classmethod
+    def can_handle(cls, tracking_number):
+        return True
+
+
+class TestHttpClients:
+    """One keep-alive client per carrier."""
+
+    def test_client_shared_per_carrier(self):
+        ups = get_http_client("UPS")
+
+        assert get_http_client("UPS") is ups
+        assert get_http_client("DHL") is not ups
+
+    def test_close_discards_clients(self):
+        ups = get_http_client("UPS")
+        close_http_clients()
+
+        assert ups.is_closed
+        assert get_http_client("UPS") is not ups
+
+
+class TestFetchTrackingConcurrently:
+    """Bounded per-carrier concurrency; results in lookup order."""
+
+    def test_results_in_order_with_exceptions(self):
+        carrier = _SlowCarrier("UPS", delay=0)
+
+        results = fetch_tracking_concurrently([(carrier, "1"), (carrier, "bad"), (carrier, "3")])
+
+        assert results[0].status == "status 1"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].status == "status 3"
+
+    def test_per_carrier_limit(self, monkeypatch):
+        monkeypatch.setitem(pool.CARRIER_CONCURRENCY, "UPS", 2)
+        ups = _SlowCarrier("UPS")
+        dhl = _SlowCarrier("DHL")
+
+        fetch_tracking_concurrently([(ups, str(i)) for i in range(6)] + [(dhl, "1"), (dhl, "2")])
+
+        assert ups.peak == 2
+        assert dhl.peak == 2
+
+    def test_runs_in_about_one_round(self):
+        carriers = [_SlowCarrier(name, delay=0.2) for name in ("UPS", "DHL", "USPS")]
+        lookups = [(carrier, str(i)) for carrier in carriers for i in range(3)]
+
+        started = time.monotonic()
+        fetch_tracking_concurrently(lookups)
+
+        # Sequentially this would take 9 x 0.2s
+        assert time.monotonic() - started < 1.0
+
+    def test_empty(self):
+        assert fetch_tracking_concurrently([]) == []
+
+    def test_carrier_mock_without_limit_config(self):
+        carrier = MagicMock(max_batch_size=1)
+        carrier.fetch_tracking.return_value = TrackingResult(status="Delivered")
+
+        assert fetch_tracking_concurrently([(carrier, "1Z")])[0].status == "Delivered"
+
+
+class TestBatchedCarriers:
+    """Carriers with max_batch_size > 1 get multi-number requests."""
+
+    def test_numbers_chunked_per_carrier(self):
+        ups = _SlowCarrier("UPS", delay=0, max_batch_size=3)
+        dhl = _SlowCarrier("DHL", delay=0)
+        lookups = [(ups, str(i)) for i in range(7)] + [(dhl, "a"), (dhl, "b")]
+
+        results = fetch_tracking_concurrently(lookups)
+
+        assert sorted(ups.batches) == [["0", "1", "2"], ["3", "4", "5"]]
+        assert dhl.batches == []
+        assert [r.status for r in results] == [f"status {n}" for _, n in lookups]
+
+    def test_duplicate_numbers_fetched_once(self):
+        ups = _SlowCarrier("UPS", delay=0, max_batch_size=10)
+
+        results = fetch_tracking_concurrently([(ups, "1"), (ups, "2"), (ups, "1")])
+
+        assert ups.batches == [["1", "2"]]
+        assert results[0] is results[2]
+
+    def test_failed_request_fails_its_chunk(self):
+        ups = _SlowCarrier("UPS", delay=0, max_batch_size=2)
+
+        results = fetch_tracking_concurrently([(ups, "1"), (ups, "down"), (ups, "3")])
+
+        assert all(isinstance(r, RuntimeError) for r in results[:2])
+        assert results[2].status == "status 3"
+
+    def test_missing_number_is_an_error(self):
+        ups = _SlowCarrier("UPS", delay=0, max_batch_size=2)
+
+        results = fetch_tracking_concurrently([(ups, "1"), (ups, "lost")])
+
+        assert results[0].status == "status 1"
+        assert isinstance(results[1], LookupError)
@@ -82,8 +82,8 @@ class TestFetchTracking:
             }
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("AB123456789GB")
 
@@ -112,8 +112,8 @@ class TestFetchTracking:
             }
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("AB123456789GB")
 
@@ -142,8 +142,8 @@ class TestFetchTracking:
             }
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("AB123456789GB")
 
@@ -171,8 +171,8 @@ class TestFetchTracking:
             }
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("AB123456789GB")
 
@@ -189,8 +189,8 @@ class TestFetchTracking:
             "httpMessage": "Tracking information not found",
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("AB123456789GB")
 
@@ -203,9 +203,9 @@ class TestFetchTracking:
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = Exception("Internal Server Error")
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value.get.return_value.raise_for_status.side_effect = Exception(
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value.raise_for_status.side_effect = Exception(
                 "Internal Server Error"
             )
 
@@ -218,10 +218,8 @@ class TestFetchTracking:
         """Handle network timeout."""
         import httpx
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.side_effect = (
-                httpx.TimeoutException("Timeout")
-            )
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.side_effect = httpx.TimeoutException("Timeout")
 
             result = client.fetch_tracking("AB123456789GB")
 
@@ -241,8 +239,8 @@ class TestFetchTracking:
             }
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             client.fetch_tracking("ab 123 456 789 gb")
@@ -270,8 +268,8 @@ class TestFetchTracking:
             }
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("AB123456789GB")
 
@@ -291,8 +289,8 @@ class TestFetchTracking:
             }
         }
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        with patch("app.services.carriers.royal_mail.get_http_client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
 
             result = client.fetch_tracking("AB123456789GB")
 
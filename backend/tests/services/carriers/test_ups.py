@@ -81,11 +81,11 @@ class TestUPSCarrierFetchTracking:
             ]
         }
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status = MagicMock()
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response_obj
+            mock_client.return_value.post.return_value = mock_response_obj
 
             carrier = UPSCarrier()
             result = carrier.fetch_tracking("1Z12345E0205271688")
@@ -108,11 +108,11 @@ class TestUPSCarrierFetchTracking:
             ]
         }
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status = MagicMock()
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response_obj
+            mock_client.return_value.post.return_value = mock_response_obj
 
             carrier = UPSCarrier()
             result = carrier.fetch_tracking("1Z12345E0205271688")
@@ -134,11 +134,11 @@ class TestUPSCarrierFetchTracking:
             ]
         }
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status = MagicMock()
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response_obj
+            mock_client.return_value.post.return_value = mock_response_obj
 
             carrier = UPSCarrier()
             result = carrier.fetch_tracking("1Z12345E0205271688")
@@ -151,15 +151,13 @@ class TestUPSCarrierFetchTracking:
 
         from app.services.carriers.ups import UPSCarrier
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 500
-            mock_client.return_value.__enter__.return_value.post.side_effect = (
-                httpx.HTTPStatusError(
-                    message="Server Error",
-                    request=MagicMock(),
-                    response=mock_response,
-                )
+            mock_client.return_value.post.side_effect = httpx.HTTPStatusError(
+                message="Server Error",
+                request=MagicMock(),
+                response=mock_response,
             )
 
             carrier = UPSCarrier()
@@ -175,9 +173,9 @@ class TestUPSCarrierFetchTracking:
 
         from app.services.carriers.ups import UPSCarrier
 
-        with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.post.side_effect = (
-                httpx.TimeoutException("Connection timed out")
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
+            mock_client.return_value.post.side_effect = httpx.TimeoutException(
+                "Connection timed out"
             )
 
             carrier = UPSCarrier()
@@ -192,11 +190,11 @@ class TestUPSCarrierFetchTracking:
 
         mock_response = {"trackDetails": []}
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status = MagicMock()
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response_obj
+            mock_client.return_value.post.return_value = mock_response_obj
 
             carrier = UPSCarrier()
             result = carrier.fetch_tracking("1Z12345E0205271688")
@@ -209,16 +207,73 @@ class TestUPSCarrierFetchTracking:
 
         mock_response = {"trackDetails": [{"packageStatus": "In Transit"}]}
 
-        with patch("httpx.Client") as mock_client:
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
             mock_response_obj.raise_for_status = MagicMock()
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response_obj
+            mock_client.return_value.post.return_value = mock_response_obj
 
             carrier = UPSCarrier()
             carrier.fetch_tracking("1z 1234-5e02 0527-1688")
 
             # Verify the API was called with normalized number
-            call_args = mock_client.return_value.__enter__.return_value.post.call_args
+            call_args = mock_client.return_value.post.call_args
             payload = call_args[1]["json"]
             assert payload["TrackingNumber"] == ["1Z12345E0205271688"]
+
+
+class TestUPSCarrierFetchTrackingBatch:
+    """Test multi-number UPS status requests."""
+
+    def test_one_request_for_all_numbers(self):
+        """All numbers go in one request; results are matched by trackingNumber."""
+        from app.services.carriers.ups import UPSCarrier
+
+        mock_response = {
+            "trackDetails": [
+                {"trackingNumber": "1Z999AA10123456784", "packageStatus": "Delivered"},
+                {"trackingNumber": "1Z12345E0205271688", "packageStatus": "In Transit"},
+            ]
+        }
+
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
+            mock_response_obj = MagicMock()
+            mock_response_obj.json.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response_obj
+
+            results = UPSCarrier().fetch_tracking_batch(
+                ["1z12345e0205271688", "1Z999AA10123456784", "1Z0000000000000000"]
+            )
+
+            payload = mock_client.return_value.post.call_args.kwargs["json"]
+            assert payload["TrackingNumber"] == [
+                "1Z12345E0205271688",
+                "1Z999AA10123456784",
+                "1Z0000000000000000",
+            ]
+            assert mock_client.return_value.post.call_count == 1
+
+        assert results["1z12345e0205271688"].status == "In Transit"
+        assert results["1Z999AA10123456784"].status == "Delivered"
+        assert results["1Z0000000000000000"].error == "Tracking number not found"
+
+    def test_http_error_applies_to_every_number(self):
+        """A failed request returns the error for each number."""
+        import httpx
+
+        from app.services.carriers.ups import UPSCarrier
+
+        with patch("app.services.carriers.ups.get_http_client") as mock_client:
+            mock_response = MagicMock()
+            mock_response.status_code = 503
+            mock_client.return_value.post.side_effect = httpx.HTTPStatusError(
+                message="Service Unavailable",
+                request=MagicMock(),
+                response=mock_response,
+            )
+
+            results = UPSCarrier().fetch_tracking_batch(
+                ["1Z12345E0205271688", "1Z999AA10123456784"]
+            )
+
+        assert [r.error for r in results.values()] == ["UPS API returned 503"] * 2
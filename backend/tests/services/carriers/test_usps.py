@@ -81,7 +81,7 @@ class TestUSPSFetchTracking:
         """Verify client name is set correctly."""
         assert usps_client.name == "USPS"
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_in_transit(self, mock_client_class, usps_client):
         """Parse 'In Transit' status from USPS response."""
         mock_response = Mock()
@@ -100,8 +100,6 @@ class TestUSPSFetchTracking:
         """
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -110,7 +108,7 @@ class TestUSPSFetchTracking:
         assert result.status == "In Transit"
         assert result.error is None
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_delivered(self, mock_client_class, usps_client):
         """Parse 'Delivered' status from USPS response."""
         mock_response = Mock()
@@ -126,8 +124,6 @@ class TestUSPSFetchTracking:
         """
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -137,7 +133,7 @@ class TestUSPSFetchTracking:
         assert result.location == "NEW YORK, NY 10001"
         assert result.error is None
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_with_expected_delivery(self, mock_client_class, usps_client):
         """Parse expected delivery date from USPS response."""
         mock_response = Mock()
@@ -154,8 +150,6 @@ class TestUSPSFetchTracking:
         """
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -164,7 +158,7 @@ class TestUSPSFetchTracking:
         assert result.status == "In Transit"
         assert result.estimated_delivery == date(2026, 1, 3)
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_out_for_delivery(self, mock_client_class, usps_client):
         """Parse 'Out for Delivery' status."""
         mock_response = Mock()
@@ -180,8 +174,6 @@ class TestUSPSFetchTracking:
         """
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -190,7 +182,7 @@ class TestUSPSFetchTracking:
         assert result.status == "Out for Delivery"
         assert result.location == "BROOKLYN, NY 11201"
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_exception_alert(self, mock_client_class, usps_client):
         """Parse exception/alert status."""
         mock_response = Mock()
@@ -206,8 +198,6 @@ class TestUSPSFetchTracking:
         """
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -216,12 +206,10 @@ class TestUSPSFetchTracking:
         assert result.status == "Exception"
         assert "No authorized recipient" in result.status_detail
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_http_error(self, mock_client_class, usps_client):
         """Handle HTTP errors gracefully."""
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.side_effect = httpx.HTTPStatusError(
             "Error", request=Mock(), response=Mock(status_code=500)
         )
@@ -233,12 +221,10 @@ class TestUSPSFetchTracking:
         assert result.error is not None
         assert "500" in result.error or "Error" in result.error
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_connection_error(self, mock_client_class, usps_client):
         """Handle connection errors gracefully."""
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.side_effect = httpx.ConnectError("Connection failed")
         mock_client_class.return_value = mock_client
 
@@ -247,7 +233,7 @@ class TestUSPSFetchTracking:
         assert result.status == "Unknown"
         assert result.error is not None
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_invalid_response(self, mock_client_class, usps_client):
         """Handle malformed XML response."""
         mock_response = Mock()
@@ -255,8 +241,6 @@ class TestUSPSFetchTracking:
         mock_response.text = "Not valid XML <><><>"
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -265,7 +249,7 @@ class TestUSPSFetchTracking:
         assert result.status == "Unknown"
         assert result.error is not None
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_no_tracking_info(self, mock_client_class, usps_client):
         """Handle response with no tracking info found."""
         mock_response = Mock()
@@ -281,8 +265,6 @@ class TestUSPSFetchTracking:
         """
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -291,7 +273,7 @@ class TestUSPSFetchTracking:
         assert result.status == "Unknown"
         assert "not yet available" in result.error or "incorrect" in result.error
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_fetch_extracts_location(self, mock_client_class, usps_client):
         """Extract location from tracking details."""
         mock_response = Mock()
@@ -307,8 +289,6 @@ class TestUSPSFetchTracking:
         """
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -316,7 +296,7 @@ class TestUSPSFetchTracking:
 
         assert result.location == "SEATTLE, WA 98101"
 
-    @patch("app.services.carriers.usps.httpx.Client")
+    @patch("app.services.carriers.usps.get_http_client")
     def test_normalizes_tracking_number(self, mock_client_class, usps_client):
         """Tracking number should be normalized before API call."""
         mock_response = Mock()
@@ -330,8 +310,6 @@ class TestUSPSFetchTracking:
         """
 
         mock_client = Mock()
-        mock_client.__enter__ = Mock(return_value=mock_client)
-        mock_client.__exit__ = Mock(return_value=False)
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
 
@@ -341,3 +319,65 @@ class TestUSPSFetchTracking:
         # Verify the API was called with normalized number
         call_args = mock_client.get.call_args
         assert "9400111899223100001234" in str(call_args)
+
+
+class TestUSPSFetchTrackingBatch:
+    """Tests for multi-number USPS tracking requests."""
+
+    @patch("app.services.carriers.usps.get_http_client")
+    def test_one_request_for_all_numbers(self, mock_client_class):
+        """Numbers are sent as comma-separated tLabels and matched by TrackInfo ID."""
+        mock_response = Mock()
+        mock_response.text = """
+        <TrackResponse>
+            <TrackInfo ID="9400111899223100005678">
+                <TrackSummary>Your item was delivered at 2:15 pm on January 2, 2026</TrackSummary>
+            </TrackInfo>
+            <TrackInfo ID="9400111899223100001234">
+                <TrackSummary>Your item is in transit to the destination.</TrackSummary>
+            </TrackInfo>
+            <TrackInfo ID="9400111899223100009999">
+                <Error><Description>The tracking number may be incorrect.</Description></Error>
+            </TrackInfo>
+        </TrackResponse>
+        """
+
+        mock_client = Mock()
+        mock_client.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        results = USPSClient().fetch_tracking_batch(
+            [
+                "9400 1118 9922 3100 0012 34",
+                "9400111899223100005678",
+                "9400111899223100009999",
+                "9400111899223100000000",
+            ]
+        )
+
+        mock_client.get.assert_called_once()
+        url = mock_client.get.call_args.args[0]
+        assert url.endswith(
+            "tLabels=9400111899223100001234,9400111899223100005678,"
+            "9400111899223100009999,9400111899223100000000"
+        )
+        assert results["9400 1118 9922 3100 0012 34"].status == "In Transit"
+        assert results["9400111899223100005678"].status == "Delivered"
+        assert results["9400111899223100009999"].error == "The tracking number may be incorrect."
+        assert results["9400111899223100000000"].error == "No tracking information in response"
+
+    @patch("app.services.carriers.usps.get_http_client")
+    def test_invalid_xml_applies_to_every_number(self, mock_client_class):
+        """An unparseable response returns the error for each number."""
+        mock_response = Mock()
+        mock_response.text = "<html>Service unavailable"
+
+        mock_client = Mock()
+        mock_client.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        results = USPSClient().fetch_tracking_batch(
+            ["9400111899223100001234", "9400111899223100005678"]
+        )
+
+        assert all("Failed to parse USPS response" in r.error for r in results.values())
@@ -1,11 +1,17 @@
 """Tests for circuit breaker service."""
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, update
 
 from app.models.carrier_circuit import CarrierCircuit
+from app.services import circuit_breaker
 from app.services.circuit_breaker import (
     FAILURE_THRESHOLD,
     OPEN_DURATION_MINUTES,
+    flush_circuit_state,
     is_circuit_open,
     record_failure,
     record_success,
@@ -57,6 +63,7 @@ class TestRecordFailure:
     def test_records_first_failure(self, db):
         """Records first failure for new carrier."""
         record_failure(db, "UPS")
+        flush_circuit_state(db)
         circuit = db.get(CarrierCircuit, "UPS")
         assert circuit is not None
         assert circuit.failure_count == 1
@@ -70,6 +77,7 @@ class TestRecordFailure:
         db.commit()
 
         record_failure(db, "FEDEX")
+        flush_circuit_state(db)
         db.refresh(circuit)
         assert circuit.failure_count == 2
         assert circuit.circuit_open_until is None
@@ -83,6 +91,7 @@ class TestRecordFailure:
         db.add(circuit)
         db.commit()
 
+        # Opening the circuit is written through without a flush
         record_failure(db, "USPS")
         db.refresh(circuit)
         assert circuit.failure_count == FAILURE_THRESHOLD
@@ -90,12 +99,12 @@ class TestRecordFailure:
 
     def test_circuit_open_until_correct_duration(self, db):
         """Sets circuit_open_until to correct duration from now."""
+        circuit = CarrierCircuit(carrier_name="DHL", failure_count=FAILURE_THRESHOLD - 1)
+        db.add(circuit)
+        db.commit()
+
         before = datetime.now(UTC)
         record_failure(db, "DHL")
-        circuit = db.get(CarrierCircuit, "DHL")
-        # Manually trigger threshold
-        circuit.failure_count = FAILURE_THRESHOLD
-        record_failure(db, "DHL")
         db.refresh(circuit)
         after = datetime.now(UTC)
 
@@ -116,6 +125,7 @@ class TestRecordFailure:
 
         before = datetime.now(UTC)
         record_failure(db, "ONTRAC")
+        flush_circuit_state(db)
         db.refresh(circuit)
         after = datetime.now(UTC)
 
@@ -134,6 +144,7 @@ class TestRecordFailure:
 
         before = datetime.now(UTC)
         record_failure(db, "LASERSHIP")
+        flush_circuit_state(db)
         db.refresh(circuit)
         after = datetime.now(UTC)
 
@@ -170,6 +181,7 @@ class TestRecordSuccess:
         db.commit()
 
         record_success(db, "UPS")
+        flush_circuit_state(db)
         db.refresh(circuit)
         assert circuit.failure_count == 0
 
@@ -185,6 +197,7 @@ class TestRecordSuccess:
         db.commit()
 
         record_success(db, "FEDEX")
+        flush_circuit_state(db)
         db.refresh(circuit)
         assert circuit.circuit_open_until is None
 
@@ -200,6 +213,7 @@ class TestRecordSuccess:
         db.commit()
 
         record_success(db, "USPS")
+        flush_circuit_state(db)
         db.refresh(circuit)
         assert circuit.failure_count == 0
         assert circuit.circuit_open_until is None
@@ -218,6 +232,7 @@ class TestRecordSuccess:
 
         before = datetime.now(UTC)
         record_success(db, "DHL")
+        flush_circuit_state(db)
         db.refresh(circuit)
         after = datetime.now(UTC)
 
@@ -248,6 +263,7 @@ class TestCircuitBreakerIntegration:
         record_success(db, carrier)
         assert is_circuit_open(db, carrier) is False
 
+        flush_circuit_state(db)
         circuit = db.get(CarrierCircuit, carrier)
         assert circuit.failure_count == 0
 
@@ -265,3 +281,90 @@ class TestCircuitBreakerIntegration:
         record_success(db, "CARRIER_A")
         assert is_circuit_open(db, "CARRIER_A") is False
         assert is_circuit_open(db, "CARRIER_B") is False
+
+
+class TestInMemoryState:
+    """State is served from memory and synced with the table periodically."""
+
+    @pytest.fixture
+    def statements(self, db):
+        """SQL statements executed while the test runs."""
+        executed = []
+
+        def record(conn, cursor, statement, *args):
+            executed.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        yield executed
+        event.remove(db.get_bind(), "before_cursor_execute", record)
+
+    def test_healthy_carrier_calls_do_no_io_between_syncs(self, db, statements):
+        """is_circuit_open and record_success read the table once per interval."""
+        assert is_circuit_open(db, "UPS") is False
+        statements.clear()
+
+        for _ in range(50):
+            assert is_circuit_open(db, "UPS") is False
+            record_success(db, "UPS")
+
+        assert statements == []
+
+    def test_open_from_another_container_seen_after_sync(self, db, monkeypatch):
+        """A circuit opened elsewhere is picked up at the next sync."""
+        db.add(CarrierCircuit(carrier_name="UPS", failure_count=0))
+        db.commit()
+        assert is_circuit_open(db, "UPS") is False
+
+        db.execute(
+            update(CarrierCircuit)
+            .where(CarrierCircuit.carrier_name == "UPS")
+            .values(circuit_open_until=datetime.now(UTC) + timedelta(minutes=5))
+        )
+        db.commit()
+        assert is_circuit_open(db, "UPS") is False
+
+        monkeypatch.setattr(circuit_breaker, "SYNC_INTERVAL_SECONDS", 0)
+        assert is_circuit_open(db, "UPS") is True
+
+    def test_failures_add_to_counts_from_other_containers(self, db):
+        """Written-behind failures are a delta, not an overwrite."""
+        db.add(CarrierCircuit(carrier_name="DHL", failure_count=0))
+        db.commit()
+        record_failure(db, "DHL")
+
+        # Another container recorded a failure in the meantime
+        db.execute(
+            update(CarrierCircuit)
+            .where(CarrierCircuit.carrier_name == "DHL")
+            .values(failure_count=1)
+        )
+        db.commit()
+        flush_circuit_state(db)
+
+        circuit = db.get(CarrierCircuit, "DHL")
+        db.refresh(circuit)
+        assert circuit.failure_count == 2
+        assert is_circuit_open(db, "DHL") is False
+
+    def test_failure_after_reset_is_kept(self, db):
+        """A reset followed by a failure writes a count of one."""
+        db.add(CarrierCircuit(carrier_name="USPS", failure_count=2))
+        db.commit()
+
+        record_success(db, "USPS")
+        record_failure(db, "USPS")
+        flush_circuit_state(db)
+
+        circuit = db.get(CarrierCircuit, "USPS")
+        db.refresh(circuit)
+        assert circuit.failure_count == 1
+
+    def test_flush_errors_keep_changes_pending(self, db):
+        """A failed flush is logged and retried at the next flush."""
+        record_failure(db, "UPS")
+        with patch.object(db, "commit", side_effect=RuntimeError("db down")):
+            flush_circuit_state(db)
+
+        flush_circuit_state(db)
+
+        assert db.get(CarrierCircuit, "UPS").failure_count == 1
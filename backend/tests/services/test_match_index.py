@@ -0,0 +1,132 @@
+"""Tests for the fuzzy matching indexes.
+
+The indexes only prune: every key that can reach the threshold must be a
+candidate. Checked against brute-force scoring on seeded random names.
+"""
+
+import random
+
+import pytest
+from rapidfuzz import fuzz
+
+from app.services.listing import jaccard_similarity, match_reference, normalize_name
+from app.services.match_index import NgramIndex, TokenIndex, sort_tokens
+
+WORDS = [
+    "smith",
+    "elder",
+    "macmillan",
+    "chapman",
+    "hall",
+    "riviere",
+    "son",
+    "john",
+    "murray",
+    "bell",
+    "daldy",
+    "sangorski",
+    "sutcliffe",
+    "a",
+    "co",
+]
+
+
+def _typo(rng, word):
+    """Drop, duplicate or swap a character to make near-miss names."""
+    if len(word) < 2:
+        return word
+    i = rng.randrange(len(word) - 1)
+    return rng.choice(
+        [
+            word[:i] + word[i + 1 :],
+            word[:i] + word[i] + word[i:],
+            word[:i] + word[i + 1] + word[i] + word[i + 2 :],
+        ]
+    )
+
+
+def _names(rng, count):
+    names = []
+    for _ in range(count):
+        words = rng.sample(WORDS, rng.randint(1, 3))
+        if rng.random() < 0.4:
+            words = [_typo(rng, w) for w in words]
+        names.append(" ".join(words))
+    return names + ["", "x"]
+
+
+@pytest.fixture
+def rng():
+    return random.Random(1850)  # noqa: S311 - reproducible test inputs
+
+
+class TestNgramIndex:
+    """Candidates cover every key with ratio >= threshold."""
+
+    @pytest.mark.parametrize("threshold", [2 / 3, 0.7, 0.75, 0.8, 0.9, 1.0])
+    @pytest.mark.parametrize("scorer", ["ratio", "token_sort_ratio"])
+    def test_candidates_cover_all_matches(self, rng, threshold, scorer):
+        keys = _names(rng, 300)
+        prepare = sort_tokens if scorer == "token_sort_ratio" else str
+        index = NgramIndex(prepare(k) for k in keys)
+        score = getattr(fuzz, scorer)
+
+        for query in _names(rng, 60):
+            candidates = index.candidates(prepare(query), threshold)
+            expected = {i for i, key in enumerate(keys) if score(query, key) / 100 >= threshold}
+            assert expected <= set(candidates), query
+            assert candidates == sorted(candidates)
+
+    def test_prunes_unrelated_keys(self):
+        index = NgramIndex(["macmillan", "chapman and hall", "zaehnsdorf"])
+        assert index.candidates("macmilan", 0.8) == [0]
+
+    def test_low_threshold_is_not_indexed(self):
+        index = NgramIndex(["macmillan"])
+        assert index.candidates("macmillan", 0.6) is None
+
+
+class TestTokenIndex:
+    """Exact lookups and shared-token candidates."""
+
+    def test_exact_returns_first_position(self):
+        index = TokenIndex(["john murray", "smith elder", "john murray"])
+        assert index.exact("john murray") == 0
+        assert index.exact("murray") is None
+
+    def test_candidates_share_a_token(self):
+        index = TokenIndex(["john murray", "smith elder", "john bell", ""])
+        assert index.candidates("john") == [0, 2]
+        assert index.candidates("") == []
+
+
+def _scan_match_reference(name, records, threshold):
+    """The pre-index implementation of match_reference."""
+    normalized_input = normalize_name(name)
+    best_match = None
+    best_similarity = 0.0
+    for record_id, record_name in records:
+        normalized_record = normalize_name(record_name)
+        if normalized_input == normalized_record:
+            return {"id": record_id, "name": record_name, "similarity": 1.0}
+        similarity = jaccard_similarity(normalized_input, normalized_record)
+        if similarity > best_similarity:
+            best_similarity = similarity
+            best_match = {"id": record_id, "name": record_name, "similarity": similarity}
+    if best_match and best_similarity >= threshold:
+        return best_match
+    return None
+
+
+class TestMatchReference:
+    """Indexed match_reference returns what the full scan returned."""
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.5, 0.7, 0.9])
+    def test_matches_full_scan(self, rng, threshold):
+        records = list(enumerate(name.title() for name in _names(rng, 200)))
+        index = TokenIndex(normalize_name(record_name) for _, record_name in records)
+
+        for query in _names(rng, 60):
+            expected = _scan_match_reference(query, records, threshold)
+            assert match_reference(query, records, threshold, index=index) == expected
+            assert match_reference(query, records, threshold) == expected
@@ -0,0 +1,120 @@
+"""Tests for the shared reference-data cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.reference_cache import ReferenceCache, generation_key
+
+
+def _client(generations=("0", "0", "0")):
+    """Redis stub whose MGET returns (author, publisher, binder) generations."""
+    client = MagicMock()
+    client.mget.return_value = list(generations)
+    return client
+
+
+@pytest.fixture
+def add_publisher(db):
+    from app.models.publisher import Publisher
+
+    def _add(name):
+        db.add(Publisher(name=name))
+        db.flush()
+
+    return _add
+
+
+class TestReferenceCache:
+    """Snapshots are reused until the TTL or a generation bump."""
+
+    def test_snapshot_reused_and_normalized_once(self, db, add_publisher):
+        add_publisher("Macmillan, London")
+        cache = ReferenceCache(ttl=300, check_interval=0)
+
+        with patch("app.services.reference_cache.get_redis", return_value=None):
+            first = cache.get(db, "publisher")
+            second = cache.get(db, "publisher")
+
+        assert second is first
+        ((_, name, normalized, _, book_count),) = first.entities
+        assert name == "Macmillan, London"
+        assert normalized == "Macmillan"
+        assert book_count == 0
+
+    def test_generation_bump_on_another_container_reloads(self, db, add_publisher):
+        add_publisher("Macmillan")
+        cache = ReferenceCache(ttl=300, check_interval=0)
+        client = _client()
+
+        with patch("app.services.reference_cache.get_redis", return_value=client):
+            first = cache.get(db, "publisher")
+            add_publisher("Smith, Elder")
+            assert cache.get(db, "publisher") is first
+
+            # Another container invalidated publishers
+            client.mget.return_value = ["0", "1", "0"]
+            second = cache.get(db, "publisher")
+
+        assert second is not first
+        assert second.generation == 1
+        assert len(second.entities) == 2
+
+    def test_generation_read_throttled(self, db, add_publisher):
+        add_publisher("Macmillan")
+        cache = ReferenceCache(ttl=300, check_interval=60)
+        client = _client()
+
+        with patch("app.services.reference_cache.get_redis", return_value=client):
+            cache.get(db, "publisher")
+            cache.get(db, "author")
+            cache.get(db, "publisher")
+
+        client.mget.assert_called_once()
+
+    def test_invalidate_bumps_generation(self, db, add_publisher):
+        add_publisher("Macmillan")
+        cache = ReferenceCache(ttl=300, check_interval=60)
+        client = _client()
+
+        with patch("app.services.reference_cache.get_redis", return_value=client):
+            first = cache.get(db, "publisher")
+            cache.invalidate("publisher")
+            client.mget.return_value = ["0", "1", "0"]
+            second = cache.get(db, "publisher")
+
+        client.incr.assert_called_once_with(generation_key("publisher"))
+        assert second is not first
+        assert second.generation == 1
+
+    def test_redis_errors_fall_back_to_ttl(self, db, add_publisher):
+        add_publisher("Macmillan")
+        cache = ReferenceCache(ttl=300, check_interval=0)
+        client = _client()
+        client.mget.side_effect = ConnectionError("down")
+
+        with patch("app.services.reference_cache.get_redis", return_value=client):
+            first = cache.get(db, "publisher")
+            assert cache.get(db, "publisher") is first
+
+        assert first.generation is None
+
+    def test_index_built_once_per_snapshot(self, db, add_publisher):
+        add_publisher("Macmillan")
+        cache = ReferenceCache(ttl=300, check_interval=0)
+        build = MagicMock(return_value="index")
+
+        with patch("app.services.reference_cache.get_redis", return_value=None):
+            snapshot = cache.get(db, "publisher")
+            assert snapshot.index("names", build) == "index"
+            assert cache.get(db, "publisher").index("names", build) == "index"
+
+        build.assert_called_once_with(snapshot.entities)
+
+    def test_unknown_entity_type_raises(self, db):
+        cache = ReferenceCache(ttl=300, check_interval=0)
+        with (
+            patch("app.services.reference_cache.get_redis", return_value=None),
+            pytest.raises(ValueError, match="Unknown entity type"),
+        ):
+            cache.get(db, "collector")  # type: ignore[arg-type]
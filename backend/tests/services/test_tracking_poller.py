@@ -67,7 +67,7 @@ class TestPollAllActiveTracking:
         db.commit()
 
         with patch("app.services.tracking_poller.get_carrier") as mock_get_carrier:
-            mock_carrier = MagicMock()
+            mock_carrier = MagicMock(max_batch_size=1)
             mock_carrier.fetch_tracking.return_value = TrackingResult(status="In Transit")
             mock_get_carrier.return_value = mock_carrier
 
@@ -109,7 +109,7 @@ class TestPollAllActiveTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(status="In Transit")
         mock_get_carrier.return_value = mock_carrier
 
@@ -134,7 +134,7 @@ class TestPollAllActiveTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(status="In Transit")
         mock_get_carrier.return_value = mock_carrier
 
@@ -158,7 +158,7 @@ class TestPollAllActiveTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(status="In Transit")
         mock_get_carrier.return_value = mock_carrier
 
@@ -190,7 +190,7 @@ class TestPollAllActiveTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(status="Delivered")
         mock_get_carrier.return_value = mock_carrier
 
@@ -218,7 +218,7 @@ class TestPollAllActiveTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(status="Delivered")
         mock_get_carrier.return_value = mock_carrier
 
@@ -246,7 +246,7 @@ class TestPollAllActiveTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(status="Delivered")
         mock_get_carrier.return_value = mock_carrier
 
@@ -270,7 +270,7 @@ class TestPollAllActiveTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.side_effect = Exception("API Error")
         mock_get_carrier.return_value = mock_carrier
 
@@ -377,7 +377,7 @@ class TestRefreshSingleBookTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(status="In Transit")
         mock_get_carrier.return_value = mock_carrier
 
@@ -428,7 +428,7 @@ class TestRefreshSingleBookTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(status="In Transit")
         mock_get_carrier.return_value = mock_carrier
 
@@ -452,7 +452,7 @@ class TestRefreshSingleBookTracking:
         db.add(book)
         db.commit()
 
-        mock_carrier = MagicMock()
+        mock_carrier = MagicMock(max_batch_size=1)
         mock_carrier.fetch_tracking.return_value = TrackingResult(
             status="In Transit",
             status_detail="Package is on the way",
@@ -0,0 +1,159 @@
+"""Tests for the set-based collection scorer."""
+
+import dataclasses
+from decimal import Decimal
+
+from sqlalchemy import event
+
+from app.models import Author, Binder, Book, Publisher
+from app.services.batch_scoring import (
+    calculate_and_persist_all_scores,
+    load_scoring_rows,
+    score_collection,
+)
+from app.services.scoring import calculate_and_persist_book_scores
+
+
+def _build_collection(db):
+    """A collection exercising every collection-impact factor."""
+    darwin = Author(name="Charles Darwin", tier="TIER_1")
+    dickens = Author(name="Charles Dickens", tier="TIER_2")
+    murray = Publisher(name="John Murray", tier="TIER_1")
+    chapman = Publisher(name="Chapman & Hall", tier="TIER_2")
+    riviere = Binder(name="Riviere", tier="TIER_1")
+    db.add_all([darwin, dickens, murray, chapman, riviere])
+    db.flush()
+
+    books = [
+        # Duplicate titles by the same author (both owned)
+        Book(
+            title="On the Origin of Species",
+            author_id=darwin.id,
+            publisher_id=murray.id,
+            binder_id=riviere.id,
+            status="ON_HAND",
+            year_start=1859,
+            condition_grade="FINE",
+            purchase_price=Decimal("300"),
+            value_mid=Decimal("1000"),
+        ),
+        Book(
+            title="On the Origin of Species.",
+            author_id=darwin.id,
+            publisher_id=murray.id,
+            status="IN_TRANSIT",
+            year_start=1860,
+            purchase_price=Decimal("900"),
+            value_mid=Decimal("800"),
+        ),
+        # Evaluating book by an author with owned books
+        Book(
+            title="The Descent of Man",
+            author_id=darwin.id,
+            status="EVALUATING",
+            year_start=1871,
+            condition_grade="POOR",
+        ),
+        # Three-volume set: two volumes owned, third being evaluated
+        Book(
+            title="Bleak House, Vol. 1",
+            author_id=dickens.id,
+            publisher_id=chapman.id,
+            status="ON_HAND",
+            volumes=3,
+        ),
+        Book(
+            title="Bleak House, Vol. 2",
+            author_id=dickens.id,
+            publisher_id=chapman.id,
+            status="ON_HAND",
+            volumes=3,
+        ),
+        Book(
+            title="Bleak House, Vol. 3",
+            author_id=dickens.id,
+            publisher_id=chapman.id,
+            status="EVALUATING",
+            volumes=3,
+        ),
+        # REMOVED books don't count towards sets or owned totals
+        Book(title="Bleak House, Vol. 1", author_id=dickens.id, status="REMOVED", volumes=3),
+        # No author
+        Book(title="Anonymous Tracts", status="ON_HAND", year_start=1790, is_complete=False),
+    ]
+    db.add_all(books)
+    db.commit()
+    return books
+
+
+class TestScoreCollection:
+    """score_collection matches calculate_and_persist_book_scores."""
+
+    def test_matches_per_book_scorer(self, db):
+        books = _build_collection(db)
+
+        batch_scores, errors = score_collection(load_scoring_rows(db))
+
+        assert errors == []
+        for book in books:
+            expected = calculate_and_persist_book_scores(book, db)
+            assert batch_scores[book.id] == expected, book.title
+        db.rollback()
+
+    def test_factors_are_applied(self, db):
+        books = _build_collection(db)
+        by_title = {b.title: b for b in books if b.status != "REMOVED"}
+
+        scores, _ = score_collection(load_scoring_rows(db))
+
+        # Duplicate penalty: collection impact = +15 (second work) - 40
+        assert scores[by_title["On the Origin of Species."].id]["collection_impact"] == -25
+        # Set completion: +25, and already 2 owned Dickens books (no presence bonus)
+        assert scores[by_title["Bleak House, Vol. 3"].id]["collection_impact"] == 25
+        # No author: counts as a new author
+        assert scores[by_title["Anonymous Tracts"].id]["collection_impact"] == 30
+
+    def test_malformed_row_only_fails_that_book(self, db):
+        """A row that breaks the column pass is reported; the rest still score."""
+        _build_collection(db)
+        rows = load_scoring_rows(db)
+        expected, _ = score_collection(rows)
+        bad = dataclasses.replace(rows[0], value_mid="not-a-decimal")
+
+        scores, errors = score_collection([bad, *rows[1:]])
+
+        assert [e["book_id"] for e in errors] == [bad.id]
+        assert bad.id not in scores
+        assert scores == {book_id: s for book_id, s in expected.items() if book_id != bad.id}
+
+
+class TestCalculateAndPersistAllScores:
+    """Scores are written back with a single bulk UPDATE."""
+
+    def test_persists_scores_in_one_update(self, db):
+        books = _build_collection(db)
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            updated, errors = calculate_and_persist_all_scores(db)
+            db.commit()
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        assert updated == len(books)
+        assert errors == []
+        assert sum(1 for s in statements if s.lstrip().upper().startswith("SELECT")) == 1
+        assert sum(1 for s in statements if s.lstrip().upper().startswith("UPDATE")) == 1
+
+        for book in books:
+            db.refresh(book)
+            assert book.overall_score is not None
+            assert book.scores_calculated_at is not None
+            assert book.overall_score == (
+                book.investment_grade + book.strategic_fit + book.collection_impact
+            )
@@ -1,6 +1,8 @@
 """Book API tests."""
 
+import os
 from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -33,6 +35,203 @@ class TestListBooks:
         assert data["per_page"] == 10
 
 
+class TestListBooksCursor:
+    """Tests for keyset pagination on GET /api/v1/books."""
+
+    def _create_books(self, db, values):
+        for i, value in enumerate(values):
+            db.add(Book(title=f"Book {i:02d}", value_mid=value))
+        db.commit()
+
+    def _walk(self, client, query):
+        """Follow next_cursor until exhausted, returning all titles in order."""
+        titles = []
+        cursor = ""
+        for _ in range(20):
+            response = client.get(f"/api/v1/books?{query}&cursor={cursor}")
+            assert response.status_code == 200
+            data = response.json()
+            titles.extend(item["title"] for item in data["items"])
+            if data["next_cursor"] is None:
+                return titles
+            cursor = data["next_cursor"]
+        raise AssertionError("cursor walk did not terminate")
+
+    def test_walk_covers_every_book_once(self, client, db):
+        """Following cursors visits every row exactly once in sort order."""
+        self._create_books(db, [None] * 7)
+
+        titles = self._walk(client, "per_page=3&sort_by=title")
+
+        assert titles == [f"Book {i:02d}" for i in range(7)]
+
+    def test_walk_with_duplicate_and_null_sort_values(self, client, db):
+        """Ties break on id (in the sort direction) and NULL sort values come last."""
+        self._create_books(db, [50, None, 50, 10, None, 50, 30])
+
+        titles = self._walk(client, "per_page=2&sort_by=value_mid&sort_order=desc")
+
+        assert len(titles) == 7
+        assert len(set(titles)) == 7
+        assert titles[:3] == ["Book 05", "Book 02", "Book 00"]
+        assert titles[-2:] == ["Book 04", "Book 01"]
+
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    @pytest.mark.parametrize("sort_by", ["created_at", "updated_at"])
+    def test_walk_terminates_on_server_timestamps(self, client, db, sort_by, sort_order):
+        """Rows sharing a database-set timestamp are each visited exactly once."""
+        self._create_books(db, [None] * 5)
+
+        titles = self._walk(client, f"per_page=2&sort_by={sort_by}&sort_order={sort_order}")
+
+        assert sorted(titles) == [f"Book {i:02d}" for i in range(5)]
+
+    def test_last_page_has_no_next_cursor(self, client, db):
+        """A page that exhausts the results returns next_cursor=None."""
+        self._create_books(db, [None] * 2)
+
+        data = client.get("/api/v1/books?per_page=5&cursor=").json()
+
+        assert len(data["items"]) == 2
+        assert data["next_cursor"] is None
+
+    def test_cursor_for_other_sort_rejected(self, client, db):
+        """Cursors are bound to the sort they were issued for."""
+        self._create_books(db, [None] * 3)
+        first = client.get("/api/v1/books?per_page=1&sort_by=title&cursor=").json()
+
+        response = client.get(
+            f"/api/v1/books?per_page=1&sort_by=created_at&cursor={first['next_cursor']}"
+        )
+
+        assert response.status_code == 400
+
+    def test_total_mode_none_skips_count(self, client, db):
+        """total_mode=none returns null total and pages."""
+        self._create_books(db, [None] * 2)
+
+        data = client.get("/api/v1/books?total_mode=none").json()
+
+        assert data["total"] is None
+        assert data["pages"] is None
+        assert len(data["items"]) == 2
+
+    @pytest.mark.skipif(
+        bool(os.environ.get("DATABASE_URL")),
+        reason="PostgreSQL returns planner estimates",
+    )
+    def test_total_mode_estimate_falls_back_to_exact_on_sqlite(self, client, db):
+        """Planner estimates are PostgreSQL-only; SQLite counts exactly."""
+        self._create_books(db, [None] * 4)
+
+        data = client.get("/api/v1/books?total_mode=estimate&per_page=3").json()
+
+        assert data["total"] == 4
+        assert data["pages"] == 2
+
+
+class TestListBooksSparseFields:
+    """Tests for fields= projection on GET /api/v1/books."""
+
+    def _create_book(self, db, **kwargs):
+        from app.models import Author
+
+        author = Author(name="Charles Dickens")
+        db.add(author)
+        db.flush()
+        book = Book(title="Bleak House", author_id=author.id, year_start=1853, **kwargs)
+        db.add(book)
+        db.flush()
+        return book
+
+    def test_only_requested_fields_returned(self, client, db):
+        """Items contain exactly id plus the requested fields."""
+        self._create_book(db, value_mid=Decimal("250.00"))
+        db.commit()
+
+        response = client.get("/api/v1/books?fields=title,value_mid,era")
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+
+        assert set(item) == {"id", "title", "value_mid", "era"}
+        assert item["title"] == "Bleak House"
+        assert item["value_mid"] == "250.00"
+        assert item["era"] == "Victorian"
+
+    def test_relationship_and_computed_fields(self, client, db):
+        """author, image_count, has_analysis and primary_image_url come from SQL."""
+        book = self._create_book(db)
+        db.add_all(
+            [
+                BookImage(book_id=book.id, s3_key="a.jpg", display_order=0),
+                BookImage(book_id=book.id, s3_key="b.jpg", display_order=1, is_primary=True),
+            ]
+        )
+        db.add(BookAnalysis(book_id=book.id, full_markdown="# Analysis"))
+        db.commit()
+        primary = db.query(BookImage).filter(BookImage.s3_key == "b.jpg").one()
+
+        response = client.get(
+            "/api/v1/books?fields=author,publisher,image_count,has_analysis,"
+            "has_eval_runbook,primary_image_url"
+        )
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+
+        assert item["author"] == {"id": book.author_id, "name": "Charles Dickens"}
+        assert item["publisher"] is None
+        assert item["image_count"] == 2
+        assert item["has_analysis"] is True
+        assert item["has_eval_runbook"] is False
+        assert item["primary_image_url"].endswith(f"/books/{book.id}/images/{primary.id}/file")
+
+    def test_matches_full_response_values(self, client, db):
+        """Projected values equal the same keys in the full response."""
+        book = self._create_book(db, status="ON_HAND", value_low=Decimal("10.5"))
+        db.add(BookImage(book_id=book.id, s3_key="a.jpg", display_order=0))
+        db.commit()
+        fields = ["title", "status", "value_low", "author", "era", "primary_image_url"]
+
+        full = client.get("/api/v1/books").json()["items"][0]
+        sparse = client.get(f"/api/v1/books?fields={','.join(fields)}").json()["items"][0]
+
+        for name in fields:
+            assert sparse[name] == full[name], name
+
+    def test_author_search_filter_with_author_field(self, client, db):
+        """Author search join and author projection don't collide."""
+        self._create_book(db)
+        db.commit()
+
+        response = client.get("/api/v1/books?q=dickens&fields=author")
+        assert response.status_code == 200
+        assert response.json()["items"][0]["author"]["name"] == "Charles Dickens"
+
+    def test_cursor_pagination_with_fields(self, client, db):
+        """Keyset cursors work on projected rows."""
+        for i in range(3):
+            db.add(Book(title=f"Book {i}"))
+        db.commit()
+
+        first = client.get("/api/v1/books?fields=title&per_page=2&cursor=").json()
+        second = client.get(
+            f"/api/v1/books?fields=title&per_page=2&cursor={first['next_cursor']}"
+        ).json()
+
+        assert [i["title"] for i in first["items"] + second["items"]] == [
+            "Book 0",
+            "Book 1",
+            "Book 2",
+        ]
+        assert second["next_cursor"] is None
+
+    def test_unknown_field_rejected(self, client):
+        """Fields outside the sparse whitelist return 400."""
+        response = client.get("/api/v1/books?fields=title,search_vector")
+        assert response.status_code == 400
+        assert "search_vector" in response.json()["detail"]
+
+
 class TestCreateBook:
     """Tests for POST /api/v1/books."""
 
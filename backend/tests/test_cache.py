@@ -105,6 +105,264 @@ class TestCachedDecorator:
         assert result == {"data": "value"}
 
 
+class TestCacheKeys:
+    """Tests for argument-aware and tagged cache keys."""
+
+    def test_arguments_produce_distinct_keys(self):
+        """Calls with different arguments are cached separately."""
+        from app.cache import cached
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = None
+
+        with patch("app.cache.get_redis", return_value=mock_redis):
+
+            @cached(key="test:args", ttl=60)
+            def my_func(db, days=30):
+                return {"days": days}
+
+            my_func("session-1", days=30)
+            my_func("session-2", 30)
+            my_func("session-1", days=90)
+
+        keys = [c.args[0] for c in mock_redis.get.call_args_list]
+        assert all(k.startswith("test:args:") for k in keys)
+        # Same arguments (db excluded, positional == keyword) -> same key
+        assert keys[0] == keys[1]
+        assert keys[0] != keys[2]
+
+    def test_tag_generations_appended_to_key(self):
+        """Tagged entries are keyed by each tag's current generation."""
+        from app.cache import get_or_compute
+
+        mock_redis = MagicMock()
+        mock_redis.mget.return_value = ["3", None]
+        mock_redis.get.return_value = None
+
+        get_or_compute(
+            mock_redis, "test:key", lambda: {"a": 1}, tags=("books", "entities"), local=False
+        )
+
+        mock_redis.mget.assert_called_once_with(["cache:tag:books", "cache:tag:entities"])
+        mock_redis.get.assert_called_once_with("test:key:g3.0")
+
+    def test_invalidate_tags_bumps_generation(self):
+        """invalidate_tags increments each tag's generation, then the local tier's."""
+        from app.cache import invalidate_tags
+
+        mock_redis = MagicMock()
+
+        with patch("app.cache.get_redis", return_value=mock_redis):
+            invalidate_tags("books", "entities")
+
+        assert [c.args[0] for c in mock_redis.incr.call_args_list] == [
+            "cache:tag:books",
+            "cache:tag:entities",
+            "cache:local:generation",
+        ]
+
+    def test_invalidate_tags_without_redis_is_noop(self):
+        """invalidate_tags does nothing when Redis is unavailable."""
+        from app.cache import invalidate_tags
+
+        with patch("app.cache.get_redis", return_value=None):
+            invalidate_tags("books")
+
+
+class TestSingleFlight:
+    """Tests for lock-protected recompute and stale-while-revalidate."""
+
+    def test_miss_with_lock_held_waits_for_result(self):
+        """When another caller holds the lock, wait for its value instead of computing."""
+        from app.cache import get_or_compute
+
+        mock_redis = MagicMock()
+        mock_redis.get.side_effect = [None, None, '{"from": "holder"}']
+        mock_redis.set.return_value = None  # Lock not acquired
+        compute = MagicMock(return_value={"from": "me"})
+
+        with patch("app.cache.LOCK_POLL_SECONDS", 0):
+            result = get_or_compute(mock_redis, "test:key", compute)
+
+        assert result == {"from": "holder"}
+        compute.assert_not_called()
+        mock_redis.setex.assert_not_called()
+
+    def test_wait_timeout_computes_anyway(self):
+        """If the lock holder never delivers, compute rather than fail."""
+        from app.cache import get_or_compute
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = None
+        mock_redis.set.return_value = None
+
+        with patch("app.cache.LOCK_WAIT_SECONDS", 0):
+            result = get_or_compute(mock_redis, "test:key", lambda: {"data": 1})
+
+        assert result == {"data": 1}
+        mock_redis.setex.assert_called_once()
+
+    def test_miss_takes_lock_computes_and_releases(self):
+        """The lock winner computes, stores, and releases its own lock."""
+        from app.cache import get_or_compute
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = None
+        mock_redis.set.return_value = True
+
+        result = get_or_compute(mock_redis, "test:key", lambda: {"data": 1}, ttl=60)
+
+        assert result == {"data": 1}
+        lock_call = mock_redis.set.call_args
+        assert lock_call.args[0] == "test:key:lock"
+        assert lock_call.kwargs["nx"] is True
+        token = lock_call.args[1]
+        release = mock_redis.eval.call_args
+        assert release.args[2:] == ("test:key:lock", token)
+
+    def test_stale_value_served_while_another_caller_refreshes(self):
+        """An expired entry is returned as-is when the refresh lock is taken."""
+        from app.cache import get_or_compute
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = '{"stale": true}'
+        mock_redis.exists.return_value = 0  # Freshness marker expired
+        mock_redis.set.return_value = None
+        compute = MagicMock(return_value={"stale": False})
+
+        result = get_or_compute(mock_redis, "test:key", compute, ttl=60, stale_ttl=120)
+
+        assert result == {"stale": True}
+        compute.assert_not_called()
+
+    def test_stale_value_refreshed_by_lock_winner(self):
+        """The caller that wins the lock recomputes an expired entry."""
+        from app.cache import get_or_compute
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = '{"stale": true}'
+        mock_redis.exists.return_value = 0
+        mock_redis.set.return_value = True
+
+        result = get_or_compute(
+            mock_redis, "test:key", lambda: {"stale": False}, ttl=60, stale_ttl=120
+        )
+
+        assert result == {"stale": False}
+        # Value kept for ttl + stale_ttl, freshness marker for ttl
+        mock_redis.setex.assert_called_once()
+        assert mock_redis.setex.call_args.args[:2] == ("test:key", 180)
+        mock_redis.set.assert_any_call("test:key:fresh", "1", ex=60)
+
+    def test_fresh_value_returned_without_lock(self):
+        """A fresh entry is a plain hit - no lock, no recompute."""
+        from app.cache import get_or_compute
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = '{"fresh": true}'
+        mock_redis.exists.return_value = 1
+
+        result = get_or_compute(mock_redis, "test:key", MagicMock(), ttl=60, stale_ttl=120)
+
+        assert result == {"fresh": True}
+        mock_redis.set.assert_not_called()
+
+
+class TestLocalCache:
+    """Tests for the in-process tier in front of Redis."""
+
+    @staticmethod
+    def _client(generation="0"):
+        client = MagicMock()
+        client.mget.return_value = [generation]
+        return client
+
+    def test_repeat_hit_served_without_redis_get(self):
+        """Second lookup is answered locally - no Redis GET, no recompute."""
+        from app.cache import get_or_compute
+
+        client = self._client()
+        client.get.return_value = None
+        compute = MagicMock(return_value={"data": 1})
+
+        first = get_or_compute(client, "test:key", compute, ttl=60)
+        second = get_or_compute(client, "test:key", compute, ttl=60)
+
+        assert first == second == {"data": 1}
+        compute.assert_called_once()
+        client.get.assert_called_once_with("test:key")
+
+    def test_lru_eviction(self):
+        """The least recently used entry is dropped when full."""
+        from app.cache import LocalCache
+
+        cache = LocalCache(max_entries=2, ttl=60, check_interval=60)
+        client = self._client()
+        assert cache.get(client, "a") is None  # Reads the generation
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        assert cache.get(client, "a") == 1  # a is now most recent
+        cache.set("c", 3, 60)
+
+        assert cache.get(client, "b") is None
+        assert cache.get(client, "a") == 1
+        assert cache.get(client, "c") == 3
+
+    def test_entry_ttl_capped_by_tier_ttl(self):
+        """Entries expire after min(entry ttl, tier ttl)."""
+        from app.cache import LocalCache
+
+        cache = LocalCache(max_entries=10, ttl=0, check_interval=60)
+        client = self._client()
+        cache.get(client, "a")
+        cache.set("a", 1, 300)
+
+        assert cache.get(client, "a") is None
+
+    def test_generation_change_clears_entries(self):
+        """A bumped generation (write on another container) drops local entries."""
+        from app.cache import LocalCache
+
+        cache = LocalCache(max_entries=10, ttl=60, check_interval=0)
+        client = self._client("1")
+        cache.get(client, "a")
+        cache.set("a", 1, 60)
+        assert cache.get(client, "a") == 1
+
+        client.mget.return_value = ["2"]
+        assert cache.get(client, "a") is None
+
+    def test_unreadable_generation_disables_tier(self):
+        """If the generation can't be read, nothing is served or stored locally."""
+        from app.cache import LocalCache
+
+        cache = LocalCache(max_entries=10, ttl=60, check_interval=0)
+        client = self._client()
+        cache.get(client, "a")
+        cache.set("a", 1, 60)
+
+        client.mget.side_effect = Exception("Connection refused")
+        assert cache.get(client, "a") is None
+        cache.set("a", 1, 60)
+        client.mget.side_effect = None
+        assert cache.get(client, "a") is None
+
+    def test_invalidate_local_clears_and_bumps_generation(self):
+        """invalidate_local clears this container and signals the others."""
+        from app.cache import get_or_compute, invalidate_local
+
+        client = self._client()
+        client.get.return_value = None
+        compute = MagicMock(return_value={"data": 1})
+        get_or_compute(client, "test:key", compute, ttl=60)
+
+        invalidate_local(client)
+        get_or_compute(client, "test:key", compute, ttl=60)
+
+        client.incr.assert_called_once_with("cache:local:generation")
+        assert compute.call_count == 2
+
+
 class TestGetRedis:
     """Tests for get_redis function."""
 
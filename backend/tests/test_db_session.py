@@ -1,6 +1,10 @@
 """Tests for database session configuration."""
 
-from sqlalchemy.pool import NullPool
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.pool import NullPool, QueuePool
 
 
 class TestDatabaseConfiguration:
@@ -22,3 +26,103 @@ class TestDatabaseConfiguration:
         assert isinstance(engine.pool, NullPool), (
             f"Expected NullPool but got {type(engine.pool).__name__}"
         )
+
+
+@pytest.fixture
+def session_module(monkeypatch):
+    """app.db.session with a clean engine/secret cache, restored afterwards."""
+    from app.db import session
+
+    monkeypatch.setattr(session, "_engine", None)
+    monkeypatch.setattr(session, "_engine_url", None)
+    monkeypatch.setattr(session, "_secret_cache", None)
+    monkeypatch.setattr(session, "_secret_cache_time", 0.0)
+    yield session
+
+
+def _mock_secrets_client(db_password="pw1"):  # noqa: S107
+    client = MagicMock()
+    client.get_secret_value.return_value = {
+        "SecretString": json.dumps(
+            {
+                "username": "app",
+                "password": db_password,
+                "host": "db.internal",
+                "port": 5432,
+                "dbname": "bluemoxon",
+            }
+        )
+    }
+    return client
+
+
+class TestPersistentPoolMode:
+    """BMX_DATABASE_POOL_MODE=persistent keeps a connection per warm container."""
+
+    def test_persistent_mode_uses_queue_pool_with_pre_ping(self, session_module, monkeypatch):
+        monkeypatch.setattr(session_module.settings, "database_pool_mode", "persistent")
+
+        engine = session_module.get_engine()
+
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == 1
+        assert engine.pool._pre_ping is True
+        assert engine.pool._max_overflow == session_module.PERSISTENT_POOL_MAX_OVERFLOW
+
+    @pytest.mark.parametrize(
+        "setting", ["analysis_worker_concurrency", "eval_runbook_worker_concurrency"]
+    )
+    def test_overflow_covers_concurrent_worker_jobs(self, session_module, monkeypatch, setting):
+        monkeypatch.setattr(session_module.settings, "database_pool_mode", "persistent")
+        monkeypatch.setattr(session_module.settings, setting, 8)
+
+        pool = session_module.get_engine().pool
+
+        # All 8 jobs hold a session, with the usual headroom left over
+        assert pool.size() + pool._max_overflow == 8 + session_module.PERSISTENT_POOL_MAX_OVERFLOW
+
+    def test_engine_reused_across_calls(self, session_module):
+        assert session_module.get_engine() is session_module.get_engine()
+
+    def test_session_binds_to_current_engine(self, session_module):
+        db = session_module.SessionLocal()
+        try:
+            assert db.get_bind() is session_module.get_engine()
+        finally:
+            db.close()
+
+
+class TestSecretRefresh:
+    """Secrets Manager credentials are cached with a TTL."""
+
+    def test_secret_fetched_once_within_ttl(self, session_module, monkeypatch):
+        monkeypatch.setattr(session_module.settings, "database_secret_arn", "arn:secret")
+        client = _mock_secrets_client()
+
+        with patch("app.db.session.boto3.client", return_value=client):
+            first = session_module.get_engine()
+            second = session_module.get_engine()
+
+        assert first is second
+        assert client.get_secret_value.call_count == 1
+
+    def test_rotated_secret_replaces_engine(self, session_module, monkeypatch):
+        monkeypatch.setattr(session_module.settings, "database_secret_arn", "arn:secret")
+        monkeypatch.setattr(session_module.settings, "database_secret_ttl_seconds", 0)
+
+        with patch("app.db.session.boto3.client", return_value=_mock_secrets_client("pw1")):
+            first = session_module.get_engine()
+        with patch("app.db.session.boto3.client", return_value=_mock_secrets_client("pw2")):
+            second = session_module.get_engine()
+
+        assert first is not second
+        assert second.url.password == "pw2"
+
+    def test_proxy_host_overrides_secret_host(self, session_module, monkeypatch):
+        monkeypatch.setattr(session_module.settings, "database_secret_arn", "arn:secret")
+        monkeypatch.setattr(session_module.settings, "database_proxy_host", "proxy.internal")
+
+        with patch("app.db.session.boto3.client", return_value=_mock_secrets_client()):
+            url = session_module.get_database_url()
+
+        assert "@proxy.internal:5432/" in url
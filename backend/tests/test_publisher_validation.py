@@ -3,13 +3,13 @@
 import pytest
 
 from app.services.publisher_validation import (
-    PUBLISHER_CACHE_TTL_SECONDS,
     auto_correct_publisher_name,
     fuzzy_match_publisher,
     get_or_create_publisher,
     invalidate_publisher_cache,
     normalize_publisher_name,
 )
+from app.services.reference_cache import REFERENCE_CACHE_TTL_SECONDS, reference_cache
 
 
 class TestAutoCorrectPublisherName:
@@ -369,7 +369,6 @@ class TestPublisherCaching:
 
     def test_cache_avoids_repeated_db_queries(self, db):
         """Verify that multiple fuzzy_match_publisher calls use cache, not DB."""
-        import app.services.publisher_validation as pv
         from app.models.publisher import Publisher
 
         # Create some publishers
@@ -381,22 +380,20 @@ class TestPublisherCaching:
         invalidate_publisher_cache()
 
         # Verify cache is empty
-        assert pv._publisher_cache is None
+        assert "publisher" not in reference_cache._snapshots
 
         # First call should populate cache
         fuzzy_match_publisher(db, "Harper")
 
         # Verify cache is now populated
-        assert pv._publisher_cache is not None
-        cache_after_first_call = pv._publisher_cache
-        cache_time_after_first = pv._publisher_cache_time
+        cache_after_first_call = reference_cache._snapshots.get("publisher")
+        assert cache_after_first_call is not None
 
         # Second call should use same cache (not re-query)
         fuzzy_match_publisher(db, "Macmillan")
 
         # Cache should be the exact same object (not re-queried)
-        assert pv._publisher_cache is cache_after_first_call
-        assert pv._publisher_cache_time == cache_time_after_first
+        assert reference_cache._snapshots.get("publisher") is cache_after_first_call
 
     def test_cache_invalidation_forces_db_query(self, db):
         """Verify that invalidate_publisher_cache forces a fresh DB query."""
@@ -450,4 +447,4 @@ class TestPublisherCaching:
 
     def test_cache_ttl_constant_is_set(self):
         """Verify cache TTL is configured."""
-        assert PUBLISHER_CACHE_TTL_SECONDS == 300  # 5 minutes
+        assert REFERENCE_CACHE_TTL_SECONDS == 300  # 5 minutes
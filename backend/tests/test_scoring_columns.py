@@ -0,0 +1,217 @@
+"""Property tests: columnar scoring agrees with the scalar scoring functions.
+
+Inputs are drawn from a seeded RNG over value pools that include every
+branch boundary (discount thresholds, era edges, invalid grades, None).
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.services import scoring, tiered_scoring
+from app.services.scoring_columns import (
+    all_scores_columns,
+    collection_impact_columns,
+    combined_score_columns,
+    investment_grade_columns,
+    price_position_columns,
+    quality_score_columns,
+    strategic_fit_columns,
+    strategic_fit_score_columns,
+)
+
+CASES = 500
+
+TIERS = [None, "TIER_1", "TIER_2", "TIER_3", "OTHER"]
+GRADES = [None, "", "FINE", "NEAR_FINE", "VERY_GOOD", "GOOD", "FAIR", "POOR", "Very Good"]
+YEARS = [None, 1650, 1799, 1800, 1836, 1837, 1900, 1901, 1902, 2020]
+VALUES = [None, Decimal("0"), Decimal("-5"), Decimal("100"), Decimal("1000"), Decimal("333.33")]
+# Prices hitting the exact discount thresholds for a value of 100
+PRICES = [None, Decimal("0"), Decimal("100"), Decimal("120")] + [
+    Decimal(100 - pct) for pct in (0, 19, 20, 29, 30, 40, 50, 60, 69, 70, 85)
+]
+
+
+def _columns(rng, n, **pools):
+    return {name: [rng.choice(pool) for _ in range(n)] for name, pool in pools.items()}
+
+
+@pytest.fixture
+def rng():
+    return random.Random(1859)  # noqa: S311 - reproducible test inputs
+
+
+class TestScoringColumns:
+    """Columnar versions of app.services.scoring."""
+
+    def test_investment_grade(self, rng):
+        cols = _columns(rng, CASES, purchase_prices=PRICES, values_mid=VALUES)
+        # Also cover random decimal prices against random values
+        cols["purchase_prices"] += [Decimal(rng.randint(0, 3000)) / 3 for _ in range(CASES)]
+        cols["values_mid"] += [Decimal(rng.randint(1, 2000)) for _ in range(CASES)]
+
+        result = investment_grade_columns(**cols)
+
+        expected = [
+            scoring.calculate_investment_grade(p, v)
+            for p, v in zip(cols["purchase_prices"], cols["values_mid"], strict=True)
+        ]
+        assert result == expected
+
+    def test_strategic_fit(self, rng):
+        cols = _columns(
+            rng,
+            CASES,
+            publisher_tiers=TIERS,
+            binder_tiers=TIERS,
+            year_starts=YEARS,
+            is_complete=[True, False],
+            condition_grades=GRADES,
+            author_priority_scores=[0, 5, 10, 15, 50],
+        )
+
+        result = strategic_fit_columns(**cols)
+
+        expected = [
+            scoring.calculate_strategic_fit(p, b, y, c, g, a)
+            for p, b, y, c, g, a in zip(*cols.values(), strict=True)
+        ]
+        assert result == expected
+
+    def test_collection_impact(self, rng):
+        cols = _columns(
+            rng,
+            CASES,
+            author_book_counts=[0, 1, 2, 7],
+            is_duplicate=[True, False],
+            completes_set=[True, False],
+        )
+
+        result = collection_impact_columns(**cols)
+
+        expected = [
+            scoring.calculate_collection_impact(count, dup, completes, 1)
+            for count, dup, completes in zip(*cols.values(), strict=True)
+        ]
+        assert result == expected
+
+    def test_all_scores(self, rng):
+        cols = _columns(
+            rng,
+            CASES,
+            purchase_prices=PRICES,
+            values_mid=VALUES,
+            publisher_tiers=TIERS,
+            binder_tiers=TIERS,
+            year_starts=YEARS,
+            is_complete=[True, False],
+            condition_grades=GRADES,
+            author_priority_scores=[0, 5, 10, 15],
+            author_book_counts=[0, 1, 2],
+            is_duplicate=[True, False],
+            completes_set=[True, False],
+        )
+
+        result = all_scores_columns(**cols)
+
+        for i in range(CASES):
+            expected = scoring.calculate_all_scores(*(column[i] for column in cols.values()), 1)
+            assert {name: column[i] for name, column in result.items()} == expected
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="equal lengths"):
+            investment_grade_columns([Decimal("1")], [])
+
+    def test_empty_columns(self):
+        assert collection_impact_columns([], [], []) == []
+
+
+class TestTieredScoringColumns:
+    """Columnar versions of app.services.tiered_scoring."""
+
+    def test_quality_score(self, rng):
+        cols = _columns(
+            rng,
+            CASES,
+            publisher_tiers=TIERS,
+            binder_tiers=TIERS,
+            year_starts=YEARS,
+            condition_grades=GRADES,
+            is_complete=[True, False],
+            author_priority_scores=[-20, 0, 5, 15, 40],
+            is_duplicate=[True, False],
+            author_preferred=[True, False],
+            publisher_preferred=[True, False],
+            binder_preferred=[True, False],
+        )
+
+        result = quality_score_columns(**cols)
+
+        expected = [
+            tiered_scoring.calculate_quality_score(
+                publisher_tier=p,
+                binder_tier=b,
+                year_start=y,
+                condition_grade=g,
+                is_complete=c,
+                author_priority_score=a,
+                volume_count=1,
+                is_duplicate=d,
+                author_preferred=ap,
+                publisher_preferred=pp,
+                binder_preferred=bp,
+            )
+            for p, b, y, g, c, a, d, ap, pp, bp in zip(*cols.values(), strict=True)
+        ]
+        assert result == expected
+
+    def test_quality_score_preferred_defaults_to_false(self):
+        result = quality_score_columns(
+            ["TIER_1"], ["TIER_1"], [1850], ["FINE"], [True], [15], [False]
+        )
+        assert result == [
+            tiered_scoring.calculate_quality_score(
+                "TIER_1", "TIER_1", 1850, "FINE", True, 15, 1, False
+            )
+        ]
+
+    def test_strategic_fit_score(self, rng):
+        cols = _columns(
+            rng,
+            CASES,
+            publisher_matches_author_requirement=[True, False],
+            author_book_counts=[0, 1, 2, 9],
+            completes_set=[True, False],
+        )
+
+        result = strategic_fit_score_columns(**cols)
+
+        expected = [
+            tiered_scoring.calculate_strategic_fit_score(m, count, c)
+            for m, count, c in zip(*cols.values(), strict=True)
+        ]
+        assert result == expected
+
+    def test_combined_score(self, rng):
+        quality = [rng.randint(0, 100) for _ in range(CASES)]
+        strategic = [rng.randint(0, 100) for _ in range(CASES)]
+
+        result = combined_score_columns(quality, strategic)
+
+        expected = [
+            tiered_scoring.calculate_combined_score(q, s)
+            for q, s in zip(quality, strategic, strict=True)
+        ]
+        assert result == expected
+
+    def test_price_position(self, rng):
+        cols = _columns(rng, CASES, asking_prices=PRICES, fmv_mids=VALUES)
+
+        result = price_position_columns(**cols)
+
+        expected = [
+            tiered_scoring.calculate_price_position(a, f)
+            for a, f in zip(*cols.values(), strict=True)
+        ]
+        assert result == expected
@@ -304,6 +304,47 @@ class TestScopeRestriction:
         assert len(binder_nodes) == 0
 
 
+class TestBooksScan:
+    """Tests for the column-only streamed scan (source="books")."""
+
+    def _add_books(self, db, count):
+        author = Author(name="Scan Author", birth_year=1830, death_year=1890)
+        publisher = Publisher(name="Scan Publisher")
+        db.add_all([author, publisher])
+        db.flush()
+        db.add_all(
+            Book(
+                title=f"Book {i}", author_id=author.id, publisher_id=publisher.id, status="ON_HAND"
+            )
+            for i in range(count)
+        )
+        db.add(Book(title="Evaluating", author_id=author.id, status="EVALUATING"))
+        db.commit()
+
+    def test_scan_streams_all_owned_books_without_cap(self, db, monkeypatch):
+        """Without max_books every owned book is scanned, across several batches."""
+        import app.services.social_circles as social_circles
+
+        monkeypatch.setattr(social_circles, "SCAN_BATCH_SIZE", 2)
+        self._add_books(db, 5)
+
+        result = build_social_circles_graph(db, source="books")
+
+        assert result.meta.total_books == 5
+        assert result.meta.truncated is False
+        author_node = next(n for n in result.nodes if n.type.value == "author")
+        assert author_node.book_count == 5
+
+    def test_scan_respects_max_books(self, db):
+        """An explicit max_books still caps the scan and marks it truncated."""
+        self._add_books(db, 5)
+
+        result = build_social_circles_graph(db, max_books=3, source="books")
+
+        assert result.meta.total_books == 3
+        assert result.meta.truncated is True
+
+
 class TestBookSocialCirclesSummary:
     """Tests for #1867: Book social circles summary."""
 
@@ -335,3 +335,42 @@ class TestGetOrBuildGraph:
 
         mock_build.assert_called_once_with(db)
         assert result == mock_build.return_value
+
+
+class TestGetGraphJson:
+    """Tests for the pre-serialized graph path used by the API."""
+
+    @patch("app.services.social_circles_cache.get_redis")
+    @patch("app.services.social_circles.build_social_circles_graph")
+    def test_hit_returns_stored_json_without_building(self, mock_build, mock_redis):
+        """Cache hit returns the stored document as bytes - no build, no parse."""
+        from app.services.social_circles_cache import get_graph_json
+        from app.utils.cache_codec import encode
+
+        document = {"nodes": [{"id": "author:1"}] * 500, "edges": [], "meta": {}}
+        client = MagicMock()
+        client.get.return_value = encode(document)
+        mock_redis.return_value = client
+
+        body, is_hit = get_graph_json(MagicMock(), True, 1, 5000)
+
+        assert is_hit is True
+        assert json.loads(body) == document
+        mock_build.assert_not_called()
+
+    @patch("app.services.social_circles_cache.get_redis")
+    def test_miss_builds_caches_and_returns_same_document(self, mock_redis, db):
+        """Cache miss serializes once, stores it compressed, and returns it."""
+        from app.services.social_circles_cache import get_graph_json
+        from app.utils.cache_codec import decode_json_bytes
+
+        client = MagicMock()
+        client.get.return_value = None
+        mock_redis.return_value = client
+
+        body, is_hit = get_graph_json(db, True, 1, 5000)
+
+        assert is_hit is False
+        assert set(json.loads(body)) == {"nodes", "edges", "meta"}
+        stored = client.setex.call_args[0][2]
+        assert decode_json_bytes(stored) == body
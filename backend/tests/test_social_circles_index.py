@@ -0,0 +1,125 @@
+"""Tests for the indexed social circles graph view."""
+
+from datetime import UTC, datetime
+
+from app.schemas.social_circles import (
+    ConnectionType,
+    NodeType,
+    SocialCircleEdge,
+    SocialCircleNode,
+    SocialCirclesMeta,
+    SocialCirclesResponse,
+)
+from app.services.social_circles_index import GraphIndex, get_graph_index
+
+
+def _node(node_id):
+    entity_type, entity_id = node_id.split(":")
+    return SocialCircleNode(
+        id=node_id,
+        entity_id=int(entity_id),
+        name=node_id,
+        type=NodeType(entity_type),
+        book_count=1,
+    )
+
+
+def _edge(source, target, strength, conn_type=ConnectionType.publisher):
+    return SocialCircleEdge(
+        id=f"e:{source}:{target}:{conn_type.value}",
+        source=source,
+        target=target,
+        type=conn_type,
+        strength=strength,
+    )
+
+
+def _graph():
+    nodes = [_node(n) for n in ("author:1", "author:2", "publisher:1", "binder:1")]
+    edges = [
+        _edge("author:1", "publisher:1", 4),
+        _edge("author:1", "binder:1", 8, ConnectionType.binder),
+        _edge("author:1", "author:2", 4, ConnectionType.shared_publisher),
+        _edge("author:2", "publisher:1", 6),
+        # Dangling edge: other end isn't a node in the graph
+        _edge("author:1", "publisher:99", 10),
+    ]
+    meta = SocialCirclesMeta(
+        total_books=3,
+        total_authors=2,
+        total_publishers=1,
+        total_binders=1,
+        date_range=(1800, 1900),
+        generated_at=datetime.now(UTC),
+    )
+    return SocialCirclesResponse(nodes=nodes, edges=edges, meta=meta)
+
+
+def _scan_edges(graph, node_id):
+    """Reference implementation: the linear scan the index replaces."""
+    return sorted(
+        (e for e in graph.edges if e.source == node_id or e.target == node_id),
+        key=lambda e: e.strength,
+        reverse=True,
+    )
+
+
+class TestGraphIndex:
+    """GraphIndex lookups agree with scanning the flat lists."""
+
+    def test_node_lookup(self):
+        index = GraphIndex(_graph())
+        assert index.node("publisher:1").name == "publisher:1"
+        assert index.node("author:404") is None
+
+    def test_edges_match_linear_scan(self):
+        graph = _graph()
+        index = GraphIndex(graph)
+        for node in graph.nodes:
+            assert index.edges_of(node.id) == _scan_edges(graph, node.id)
+            assert index.degree(node.id) == len(_scan_edges(graph, node.id))
+
+    def test_ties_keep_graph_order(self):
+        index = GraphIndex(_graph())
+        strengths_and_targets = [(e.strength, e.target) for e in index.edges_of("author:1")]
+        assert strengths_and_targets == [
+            (10, "publisher:99"),
+            (8, "binder:1"),
+            (4, "publisher:1"),
+            (4, "author:2"),
+        ]
+
+    def test_neighbors_skip_unknown_nodes(self):
+        index = GraphIndex(_graph())
+        neighbor_ids = [node.id for node, _edge in index.neighbors("author:1")]
+        assert neighbor_ids == ["binder:1", "publisher:1", "author:2"]
+
+    def test_edges_of_any_deduplicates(self):
+        graph = _graph()
+        index = GraphIndex(graph)
+        edges = index.edges_of_any(["author:2", "publisher:1"])
+        assert [e.id for e in edges] == [
+            "e:author:2:publisher:1:publisher",
+            "e:author:1:publisher:1:publisher",
+            "e:author:1:author:2:shared_publisher",
+        ]
+
+    def test_unknown_node_has_no_edges(self):
+        index = GraphIndex(_graph())
+        assert index.edges_of("author:404") == []
+        assert index.degree("author:404") == 0
+
+
+class TestGetGraphIndex:
+    """The index is built once per graph object."""
+
+    def test_reuses_index_for_same_graph(self):
+        graph = _graph()
+        assert get_graph_index(graph) is get_graph_index(graph)
+
+    def test_new_graph_gets_new_index(self):
+        first = get_graph_index(_graph())
+        second_graph = _graph()
+        second = get_graph_index(second_graph)
+        assert second is not first
+        assert second.graph is second_graph
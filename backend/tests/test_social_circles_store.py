@@ -0,0 +1,274 @@
+"""Tests for the incrementally maintained social circles adjacency store."""
+
+from app.models import (
+    Author,
+    Binder,
+    Book,
+    Publisher,
+    SocialCircleEdgeBooks,
+    SocialCircleNodeBooks,
+)
+from app.services import social_circles_store
+from app.services.social_circles import build_social_circles_graph
+from app.services.social_circles_store import bulk_book_change, rebuild_store
+
+
+def _nodes(db):
+    return {(n.entity_type, n.entity_id): n.book_ids for n in db.query(SocialCircleNodeBooks)}
+
+
+def _edges(db):
+    return {
+        (e.author_id, e.target_type, e.target_id): e.book_ids
+        for e in db.query(SocialCircleEdgeBooks)
+    }
+
+
+def _graph_summary(graph):
+    nodes = {(n.id, tuple(sorted(n.book_ids))) for n in graph.nodes}
+    edges = {(e.id, e.strength, tuple(sorted(e.shared_book_ids or []))) for e in graph.edges}
+    return nodes, edges, graph.meta.total_books
+
+
+def _entities(db):
+    author = Author(name="Charles Dickens", birth_year=1812, death_year=1870)
+    other_author = Author(name="Wilkie Collins", birth_year=1824, death_year=1889)
+    publisher = Publisher(name="Chapman & Hall")
+    binder = Binder(name="Riviere")
+    db.add_all([author, other_author, publisher, binder])
+    db.flush()
+    return author, other_author, publisher, binder
+
+
+class TestIncrementalMaintenance:
+    """Book writes keep the store in sync without a rebuild."""
+
+    def test_insert_adds_nodes_and_edges(self, db):
+        author, _, publisher, binder = _entities(db)
+        book = Book(
+            title="Bleak House",
+            author_id=author.id,
+            publisher_id=publisher.id,
+            binder_id=binder.id,
+            status="ON_HAND",
+        )
+        db.add(book)
+        db.commit()
+
+        assert _nodes(db) == {
+            ("author", author.id): [book.id],
+            ("publisher", publisher.id): [book.id],
+            ("binder", binder.id): [book.id],
+        }
+        assert _edges(db) == {
+            (author.id, "publisher", publisher.id): [book.id],
+            (author.id, "binder", binder.id): [book.id],
+        }
+
+    def test_unowned_and_authorless_books_ignored(self, db):
+        author, _, publisher, _ = _entities(db)
+        db.add_all(
+            [
+                Book(title="Evaluating", author_id=author.id, status="EVALUATING"),
+                Book(title="No Author", publisher_id=publisher.id, status="ON_HAND"),
+            ]
+        )
+        db.commit()
+
+        assert _nodes(db) == {}
+        assert _edges(db) == {}
+
+    def test_status_change_removes_book(self, db):
+        author, _, publisher, _ = _entities(db)
+        keep = Book(title="Keep", author_id=author.id, publisher_id=publisher.id, status="ON_HAND")
+        drop = Book(title="Drop", author_id=author.id, publisher_id=publisher.id, status="ON_HAND")
+        db.add_all([keep, drop])
+        db.commit()
+
+        drop.status = "REMOVED"
+        db.commit()
+
+        assert _nodes(db)[("author", author.id)] == [keep.id]
+        assert _edges(db) == {(author.id, "publisher", publisher.id): [keep.id]}
+
+    def test_author_change_moves_book_after_expiry(self, db):
+        author, other_author, publisher, _ = _entities(db)
+        book = Book(title="The Moonstone", author_id=author.id, publisher_id=publisher.id)
+        book.status = "ON_HAND"
+        db.add(book)
+        db.commit()
+
+        # Attributes are expired after commit; the old value must still be seen
+        book.author_id = other_author.id
+        db.commit()
+
+        assert _nodes(db) == {
+            ("author", other_author.id): [book.id],
+            ("publisher", publisher.id): [book.id],
+        }
+        assert _edges(db) == {(other_author.id, "publisher", publisher.id): [book.id]}
+
+    def test_untracked_change_leaves_store_alone(self, db):
+        author, _, _, _ = _entities(db)
+        book = Book(title="Little Dorrit", author_id=author.id, status="ON_HAND")
+        db.add(book)
+        db.commit()
+
+        book.title = "Little Dorrit (First Edition)"
+        db.commit()
+
+        assert _nodes(db) == {("author", author.id): [book.id]}
+
+    def test_delete_removes_rows(self, db):
+        author, _, publisher, _ = _entities(db)
+        book = Book(title="Hard Times", author_id=author.id, publisher_id=publisher.id)
+        book.status = "IN_TRANSIT"
+        db.add(book)
+        db.commit()
+
+        db.delete(book)
+        db.commit()
+
+        assert _nodes(db) == {}
+        assert _edges(db) == {}
+
+    def test_bulk_book_change(self, db):
+        author, other_author, publisher, _ = _entities(db)
+        books = [
+            Book(title=f"Vol {i}", author_id=author.id, publisher_id=publisher.id, status="ON_HAND")
+            for i in range(3)
+        ]
+        db.add_all(books)
+        db.commit()
+        book_ids = sorted(b.id for b in books)
+
+        with bulk_book_change(db, Book.author_id == author.id):
+            db.query(Book).filter(Book.author_id == author.id).update(
+                {"author_id": other_author.id}, synchronize_session=False
+            )
+        db.commit()
+
+        assert _nodes(db) == {
+            ("author", other_author.id): book_ids,
+            ("publisher", publisher.id): book_ids,
+        }
+        assert _edges(db) == {(other_author.id, "publisher", publisher.id): book_ids}
+
+    def test_concurrent_first_write_merges_into_existing_row(self, db, monkeypatch):
+        """If another writer creates the row first, the delta merges into it."""
+        author, _, _, _ = _entities(db)
+        db.commit()
+
+        def lose_race(connection, table, key, book_ids):
+            # The other transaction's row appears between our SELECT and INSERT
+            connection.execute(table.insert().values(**key, book_ids=[999]))
+            return False
+
+        monkeypatch.setattr(social_circles_store, "_insert_if_absent", lose_race)
+        book = Book(title="Hard Times", author_id=author.id, status="ON_HAND")
+        db.add(book)
+        db.commit()
+
+        assert _nodes(db) == {("author", author.id): sorted([book.id, 999])}
+
+
+class TestStoreGraphParity:
+    """The store-backed graph matches the full books scan."""
+
+    def _populate(self, db):
+        author, other_author, publisher, binder = _entities(db)
+        db.add_all(
+            [
+                Book(
+                    title="A",
+                    author_id=author.id,
+                    publisher_id=publisher.id,
+                    binder_id=binder.id,
+                    status="ON_HAND",
+                    year_start=1850,
+                ),
+                Book(
+                    title="B",
+                    author_id=author.id,
+                    publisher_id=publisher.id,
+                    status="IN_TRANSIT",
+                    year_start=1855,
+                ),
+                Book(
+                    title="C",
+                    author_id=other_author.id,
+                    publisher_id=publisher.id,
+                    status="ON_HAND",
+                    year_start=1860,
+                ),
+                Book(title="D", author_id=other_author.id, status="EVALUATING"),
+            ]
+        )
+        db.commit()
+
+    def test_store_matches_scan(self, db):
+        self._populate(db)
+
+        from_store = build_social_circles_graph(db, source="store")
+        from_books = build_social_circles_graph(db, source="books")
+
+        assert _graph_summary(from_store) == _graph_summary(from_books)
+        assert from_store.meta.total_books == 3
+
+    def test_max_books_falls_back_to_truncated_scan(self, db):
+        self._populate(db)
+
+        graph = build_social_circles_graph(db, max_books=2)
+
+        assert graph.meta.total_books == 2
+        assert graph.meta.truncated is True
+
+
+class TestRebuildStore:
+    """rebuild_store() repairs a drifted store."""
+
+    def test_rebuild_restores_store(self, db):
+        author, _, publisher, binder = _entities(db)
+        book = Book(
+            title="Our Mutual Friend",
+            author_id=author.id,
+            publisher_id=publisher.id,
+            binder_id=binder.id,
+            status="ON_HAND",
+        )
+        db.add(book)
+        db.commit()
+        expected_nodes, expected_edges = _nodes(db), _edges(db)
+
+        # Simulate drift: a write that bypassed the store
+        db.query(SocialCircleNodeBooks).delete()
+        db.add(
+            SocialCircleEdgeBooks(author_id=999, target_type="binder", target_id=1, book_ids=[1])
+        )
+        db.commit()
+
+        counts = rebuild_store(db)
+
+        assert counts == {"books": 1, "nodes": 3, "edges": 2}
+        assert _nodes(db) == expected_nodes
+        assert _edges(db) == expected_edges
+
+    def test_admin_endpoint_rebuilds_store(self, client, db):
+        author, _, publisher, _ = _entities(db)
+        db.add(
+            Book(
+                title="Dombey and Son",
+                author_id=author.id,
+                publisher_id=publisher.id,
+                status="ON_HAND",
+            )
+        )
+        db.commit()
+        db.query(SocialCircleNodeBooks).delete()
+        db.commit()
+
+        response = client.post("/api/v1/admin/maintenance/social-circles-rebuild")
+
+        assert response.status_code == 200
+        assert response.json() == {"books": 1, "nodes": 2, "edges": 1}
+        assert set(_nodes(db)) == {("author", author.id), ("publisher", publisher.id)}
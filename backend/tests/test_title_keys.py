@@ -0,0 +1,144 @@
+"""Tests for the persisted title lookup keys."""
+
+from sqlalchemy import update
+
+from app.enums import BookStatus
+from app.models import Author, Book
+from app.services.scoring import find_duplicate_title, normalize_title
+from app.services.set_detection import (
+    detect_set_completion,
+    extract_volume_number,
+    find_set_members,
+    set_title_key,
+)
+from app.services.title_keys import backfill_title_keys, title_keys
+
+
+def _author(db, name="Thomas Carlyle"):
+    author = Author(name=name)
+    db.add(author)
+    db.flush()
+    return author
+
+
+class TestTitleKeys:
+    """Book keeps its key columns in step with its title."""
+
+    def test_keys_match_the_normalizers(self):
+        title = "The French Revolution, Vol. III"
+        assert title_keys(title) == {
+            "normalized_title": normalize_title(title),
+            "set_title": set_title_key(title),
+            "volume_number": extract_volume_number(title),
+        }
+
+    def test_set_on_create_and_title_change(self, db):
+        book = Book(title="Sartor Resartus, Volume II")
+        db.add(book)
+        db.commit()
+        assert book.normalized_title == "sartor resartus volume ii"
+        assert book.set_title == "sartor resartus"
+        assert book.volume_number == 2
+
+        book.title = "Past and Present"
+        db.commit()
+        db.refresh(book)
+        assert book.normalized_title == "past and present"
+        assert book.set_title == "past and present"
+        assert book.volume_number is None
+
+    def test_backfill_fills_only_missing_keys(self, db):
+        books = [Book(title=f"Heroes and Hero-Worship, Part {i}") for i in range(1, 6)]
+        db.add_all(books)
+        db.commit()
+        db.execute(
+            update(Book)
+            .where(Book.id != books[0].id)
+            .values(normalized_title=None, set_title=None, volume_number=None)
+        )
+
+        assert backfill_title_keys(db, batch_size=2) == 4
+        db.commit()
+
+        for i, book in enumerate(books, start=1):
+            db.refresh(book)
+            assert book.normalized_title == f"heroes and heroworship part {i}"
+            assert book.volume_number == i
+        assert backfill_title_keys(db) == 0
+
+
+class TestFindDuplicateTitle:
+    """find_duplicate_title reads the stored keys."""
+
+    def test_exact_and_similar_matches(self, db):
+        author = _author(db)
+        owned = Book(title="The Life of John Sterling", author_id=author.id, status="ON_HAND")
+        candidate = Book(title="Life of John Sterling", author_id=author.id, status="EVALUATING")
+        db.add_all([owned, candidate])
+        db.commit()
+
+        assert find_duplicate_title(candidate, db) == "The Life of John Sterling"
+
+        candidate.title = "Life of John Sterling, with Portrait"
+        db.commit()
+        # 4 of 6 tokens shared: below the default threshold
+        assert find_duplicate_title(candidate, db) is None
+        assert find_duplicate_title(candidate, db, threshold=0.6) == owned.title
+
+    def test_ignores_unowned_and_other_authors(self, db):
+        author = _author(db)
+        other = _author(db, "Jane Welsh Carlyle")
+        book = Book(title="Chartism", author_id=author.id, status="ON_HAND")
+        db.add_all(
+            [
+                book,
+                Book(title="Chartism", author_id=author.id, status=BookStatus.EVALUATING),
+                Book(title="Chartism", author_id=other.id, status="ON_HAND"),
+            ]
+        )
+        db.commit()
+
+        assert find_duplicate_title(book, db) is None
+
+    def test_unbackfilled_rows_still_match(self, db):
+        author = _author(db)
+        owned = Book(title="Latter-Day Pamphlets", author_id=author.id, status="ON_HAND")
+        candidate = Book(title="Latter-Day Pamphlets", author_id=author.id, status="EVALUATING")
+        db.add_all([owned, candidate])
+        db.commit()
+        db.execute(update(Book).values(normalized_title=None))
+        db.expire_all()
+
+        assert find_duplicate_title(candidate, db) == "Latter-Day Pamphlets"
+
+
+class TestSetDetectionKeys:
+    """Set detection matches on the stored set keys."""
+
+    def test_completes_set_from_stored_keys(self, db):
+        author = _author(db)
+        db.add_all(
+            [
+                Book(title="Frederick the Great, Vol. 1", author_id=author.id, volumes=3),
+                Book(title="Frederick the Great, Vol. 2", author_id=author.id, volumes=3),
+            ]
+        )
+        db.commit()
+
+        members = find_set_members(db, author.id, "Frederick the Great")
+        assert len(members) == 2
+        assert detect_set_completion(db, author.id, "Frederick the Great, Vol. 3", 3) is True
+
+    def test_unbackfilled_rows_fall_back_to_title(self, db):
+        author = _author(db)
+        db.add_all(
+            [
+                Book(title="Frederick the Great, Vol. 1", author_id=author.id, volumes=3),
+                Book(title="Frederick the Great, Vol. 2", author_id=author.id, volumes=3),
+            ]
+        )
+        db.commit()
+        db.execute(update(Book).values(set_title=None, volume_number=None))
+        db.expire_all()
+
+        assert detect_set_completion(db, author.id, "Frederick the Great, Vol. 3", 3) is True
@@ -0,0 +1,66 @@
+"""Tests for the Redis cache entry codec."""
+
+import json
+import zlib
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.utils.cache_codec import (
+    CODEC_VERSION,
+    COMPRESS_THRESHOLD_BYTES,
+    MAGIC,
+    CodecError,
+    decode,
+    decode_json_bytes,
+    encode,
+)
+
+
+class TestEncode:
+    """encode() keeps small values as JSON and compresses large ones."""
+
+    def test_small_value_stored_as_plain_json(self):
+        blob = encode({"data": "value"})
+        assert json.loads(blob) == {"data": "value"}
+
+    def test_large_value_compressed_with_header(self):
+        value = {"items": ["x" * 100] * (COMPRESS_THRESHOLD_BYTES // 50)}
+        blob = encode(value)
+
+        assert blob.startswith(MAGIC)
+        assert blob[len(MAGIC)] == CODEC_VERSION
+        assert len(blob) < len(json.dumps(value))
+        assert decode(blob) == value
+
+    def test_non_json_types_serialized(self):
+        assert decode(encode({"d": date(2024, 5, 1), "v": Decimal("1.50")})) == {
+            "d": "2024-05-01",
+            "v": "1.50",
+        }
+
+
+class TestDecode:
+    """decode() reads both formats and rejects unreadable entries."""
+
+    def test_legacy_json_string(self):
+        assert decode('{"cached": true}') == {"cached": True}
+
+    def test_json_bytes_passthrough(self):
+        large = {"items": ["y" * 100] * (COMPRESS_THRESHOLD_BYTES // 50)}
+        assert json.loads(decode_json_bytes(encode(large))) == large
+
+    def test_other_version_rejected(self):
+        blob = MAGIC + bytes((CODEC_VERSION + 1, 1)) + zlib.compress(b"{}")
+        with pytest.raises(CodecError, match="version"):
+            decode(blob)
+
+    def test_corrupt_payload_rejected(self):
+        blob = MAGIC + bytes((CODEC_VERSION, 1)) + b"not zlib"
+        with pytest.raises(CodecError):
+            decode(blob)
+
+    def test_invalid_json_rejected(self):
+        with pytest.raises(CodecError):
+            decode(b"{not json")
@@ -0,0 +1,90 @@
+"""Tests for keyset pagination helpers."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import Book
+from app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_before,
+    keyset_order,
+)
+
+
+class TestCursorRoundTrip:
+    """encode_cursor/decode_cursor preserve typed sort values."""
+
+    def test_string_value(self):
+        cursor = encode_cursor("title", "asc", "Middlemarch", 7)
+        assert decode_cursor(cursor, "title", "asc", Book.title) == ("Middlemarch", 7)
+
+    def test_decimal_value(self):
+        cursor = encode_cursor("value_mid", "desc", Decimal("125.50"), 3)
+        assert decode_cursor(cursor, "value_mid", "desc", Book.value_mid) == (
+            Decimal("125.50"),
+            3,
+        )
+
+    def test_date_value(self):
+        cursor = encode_cursor("purchase_date", "asc", date(2024, 5, 1), 9)
+        assert decode_cursor(cursor, "purchase_date", "asc", Book.purchase_date) == (
+            date(2024, 5, 1),
+            9,
+        )
+
+    def test_null_value(self):
+        cursor = encode_cursor("year_start", "asc", None, 4)
+        assert decode_cursor(cursor, "year_start", "asc", Book.year_start) == (None, 4)
+
+
+class TestCursorValidation:
+    """Malformed or mismatched cursors raise ValueError."""
+
+    def test_garbage_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor!!", "title", "asc", Book.title)
+
+    def test_sort_mismatch_rejected(self):
+        cursor = encode_cursor("title", "asc", "A", 1)
+        with pytest.raises(ValueError, match="different sort"):
+            decode_cursor(cursor, "title", "desc", Book.title)
+
+    def test_bad_value_type_rejected(self):
+        cursor = encode_cursor("year_start", "asc", "eighteen-fifty", 1)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "year_start", "asc", Book.year_start)
+
+
+class TestKeysetPredicates:
+    """keyset_after/keyset_before/keyset_order compile to index-friendly SQL."""
+
+    def _sql(self, clause):
+        return str(clause.compile(dialect=postgresql.dialect()))
+
+    def test_after_is_row_value_comparison(self):
+        clause = keyset_after(Book.title, Book.id, "M", 7, False, "postgresql")
+        assert self._sql(clause) == "(books.title, books.id) > (%(param_1)s, %(param_2)s)"
+
+    def test_desc_after_compares_less_than(self):
+        clause = keyset_after(Book.title, Book.id, "M", 7, True, "postgresql")
+        assert " < " in self._sql(clause)
+
+    def test_order_is_plain_column_then_id(self):
+        order = [self._sql(c) for c in keyset_order(Book.title, Book.id, True, "postgresql")]
+        assert order == ["books.title DESC", "books.id DESC"]
+
+    def test_sqlite_datetimes_compared_as_julianday(self):
+        clause = keyset_after(Book.created_at, Book.id, datetime(2026, 1, 1), 1, False, "sqlite")
+        assert self._sql(clause).count("julianday") == 2
+
+    def test_before_bounds_the_sort_key(self):
+        bound = datetime(2026, 1, 1)
+        assert self._sql(keyset_before(Book.updated_at, bound, "postgresql")) == (
+            "books.updated_at < %(param_1)s"
+        )
+        assert self._sql(keyset_before(Book.updated_at, bound, "sqlite")).count("julianday") == 2
@@ -0,0 +1,112 @@
+"""Tests for the streaming Parquet writer, read back with pyarrow."""
+
+import io
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pyarrow.parquet as pq
+import pytest
+
+from app.utils.parquet_writer import MAGIC, Column, ParquetWriter
+
+COLUMNS = [
+    Column("id", "int64"),
+    Column("year", "int32"),
+    Column("flag", "bool"),
+    Column("title", "string"),
+    Column("purchased", "date"),
+    Column("updated_at", "timestamp"),
+    Column("price", "decimal", 10, 2),
+    Column("pct", "decimal", 6, 2),
+]
+
+
+def _write(batches, columns=COLUMNS):
+    writer = ParquetWriter(columns)
+    parts = [writer.start()]
+    parts += [writer.row_group(rows) for rows in batches]
+    parts.append(writer.finish())
+    return pq.ParquetFile(io.BytesIO(b"".join(parts)))
+
+
+class TestParquetWriter:
+    """Files written by ParquetWriter read back through pyarrow."""
+
+    def test_types_round_trip(self):
+        rows = [
+            {
+                "id": 2**40,
+                "year": 1859,
+                "flag": True,
+                "title": "Origin of Species — 1st ed.",
+                "purchased": date(2024, 2, 29),
+                "updated_at": datetime(2025, 6, 1, 12, 30, 0, 123456, tzinfo=UTC),
+                "price": Decimal("12345678.90"),
+                "pct": Decimal("-12.50"),
+            },
+            {
+                "id": -1,
+                "year": -50,
+                "flag": False,
+                "title": "",
+                "purchased": date(1969, 12, 31),
+                # Naive datetimes are taken as UTC
+                "updated_at": datetime(1960, 1, 1),
+                "price": Decimal("0.01"),
+                "pct": Decimal("9999.99"),
+            },
+        ]
+
+        table = _write([rows]).read()
+
+        assert [str(f.type) for f in table.schema] == [
+            "int64",
+            "int32",
+            "bool",
+            "string",
+            "date32[day]",
+            "timestamp[us, tz=UTC]",
+            "decimal128(10, 2)",
+            "decimal128(6, 2)",
+        ]
+        rows[1]["updated_at"] = datetime(1960, 1, 1, tzinfo=UTC)
+        assert table.to_pylist() == rows
+
+    def test_nulls(self):
+        rows = [{"id": i, "title": None if i % 3 else f"t{i}"} for i in range(20)]
+        rows.append({})
+
+        table = _write([rows]).read()
+
+        assert table.column("id").to_pylist() == [*range(20), None]
+        assert table.column("title").to_pylist() == [r.get("title") for r in rows]
+        assert table.column("price").null_count == 21
+
+    def test_one_row_group_per_batch(self):
+        batches = [[{"id": i} for i in range(start, start + 3)] for start in (0, 3, 6)]
+
+        parquet = _write([*batches, []])
+
+        assert parquet.metadata.num_row_groups == 3
+        assert parquet.metadata.num_rows == 9
+        assert parquet.read().column("id").to_pylist() == list(range(9))
+
+    def test_empty_file(self):
+        parquet = _write([])
+
+        assert parquet.metadata.num_rows == 0
+        assert parquet.schema_arrow.names == [c.name for c in COLUMNS]
+
+    def test_output_starts_and_ends_with_magic(self):
+        writer = ParquetWriter(COLUMNS)
+
+        assert writer.start() == MAGIC
+        assert writer.finish().endswith(MAGIC)
+
+    @pytest.mark.parametrize(
+        "column",
+        [Column("x", "float"), Column("x", "decimal", 19, 2), Column("x", "decimal")],
+    )
+    def test_unsupported_columns_raise(self, column):
+        with pytest.raises(ValueError, match="x"):
+            ParquetWriter([column])
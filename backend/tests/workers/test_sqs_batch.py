@@ -0,0 +1,134 @@
+"""Tests for concurrent SQS batch processing in the worker handlers."""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+from app.services import aws_clients
+from app.services.bedrock import get_bedrock_client
+from app.workers.sqs_batch import process_sqs_records
+
+
+def _records(count):
+    return [
+        {"messageId": f"msg-{i}", "body": json.dumps({"job_id": f"job-{i}", "book_id": i})}
+        for i in range(count)
+    ]
+
+
+class _Recorder:
+    """Job stub that sleeps, records peak concurrency and fails selected books."""
+
+    def __init__(self, delay=0.05, fail_books=()):
+        self.delay = delay
+        self.fail_books = set(fail_books)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, job_id, book_id, *args):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if book_id in self.fail_books:
+            raise RuntimeError(f"Bedrock error for book {book_id}")
+
+
+class TestProcessSqsRecords:
+    """Bounded concurrency and batchItemFailures."""
+
+    def test_failures_reported_in_record_order(self):
+        def process(record):
+            if json.loads(record["body"])["book_id"] % 2:
+                raise RuntimeError("failed")
+
+        failures = process_sqs_records(_records(5), process, max_concurrency=3)
+
+        assert failures == [{"itemIdentifier": "msg-1"}, {"itemIdentifier": "msg-3"}]
+
+    def test_malformed_record_fails_alone(self):
+        records = [{"messageId": "bad", "body": "not json"}, *_records(1)]
+
+        failures = process_sqs_records(records, lambda r: json.loads(r["body"]), 2)
+
+        assert failures == [{"itemIdentifier": "bad"}]
+
+    def test_concurrency_is_bounded(self):
+        job = _Recorder()
+
+        process_sqs_records(
+            _records(6), lambda r: job(None, json.loads(r["body"])["book_id"]), max_concurrency=2
+        )
+
+        assert job.peak == 2
+
+    def test_concurrency_one_is_sequential(self):
+        job = _Recorder(delay=0.01)
+
+        process_sqs_records(_records(3), lambda r: job(None, 0), max_concurrency=1)
+
+        assert job.peak == 1
+
+
+class TestWorkerHandlers:
+    """Analysis and eval workers run their batches through the pool."""
+
+    def test_analysis_worker_runs_jobs_concurrently(self):
+        from app import worker
+
+        job = _Recorder(delay=0.2, fail_books={2})
+        with (
+            patch.object(worker, "process_analysis_job", job),
+            patch.object(worker.settings, "analysis_worker_concurrency", 4),
+        ):
+            started = time.monotonic()
+            result = worker.handler({"Records": _records(4)}, None)
+            elapsed = time.monotonic() - started
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "msg-2"}]}
+        assert job.peak == 4
+        # Sequentially this would take 4 x 0.2s
+        assert elapsed < 0.6
+
+    def test_eval_worker_uses_its_own_limit(self):
+        from app import eval_worker
+
+        job = _Recorder(fail_books={0})
+        with (
+            patch.object(eval_worker, "process_eval_runbook_job", job),
+            patch.object(eval_worker.get_settings(), "eval_runbook_worker_concurrency", 2),
+        ):
+            result = eval_worker.handler({"Records": _records(5)}, None)
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "msg-0"}]}
+        assert job.peak == 2
+
+
+class TestClientCreation:
+    """Cold-container jobs share the cached clients without racing to create them."""
+
+    def test_concurrent_jobs_create_clients_one_at_a_time(self):
+        creating = _Recorder(delay=0.02)
+
+        def create(service_name, **kwargs):
+            creating(None, 0)
+            return object()
+
+        def process(record):
+            return get_bedrock_client(), aws_clients.get_s3_client()
+
+        get_bedrock_client.cache_clear()
+        aws_clients.get_s3_client.cache_clear()
+        try:
+            with patch.object(aws_clients.boto3, "client", side_effect=create):
+                failures = process_sqs_records(_records(4), process, max_concurrency=4)
+        finally:
+            get_bedrock_client.cache_clear()
+            aws_clients.get_s3_client.cache_clear()
+
+        assert failures == []
+        assert creating.peak == 1
@@ -52,25 +52,104 @@ def sample_books(db):
     return [book1, book2, book3, book4]
 
 
-def test_dispatch_tracking_jobs_sends_message_per_active_book(db, sample_books):
-    """Test that dispatch_tracking_jobs sends one SQS message per active book."""
+def _sent_messages(mock_sqs):
+    """Message bodies from every send_message_batch call."""
+    return [
+        json.loads(entry["MessageBody"])
+        for call in mock_sqs.send_message_batch.call_args_list
+        for entry in call[1]["Entries"]
+    ]
+
+
+def test_dispatch_tracking_jobs_groups_books_by_carrier(db, sample_books):
+    """Test that dispatch_tracking_jobs sends one message per carrier group in one batch."""
     mock_sqs = MagicMock()
+    mock_sqs.send_message_batch.return_value = {"Successful": [], "Failed": []}
 
     with patch("app.workers.tracking_dispatcher.get_sqs_client", return_value=mock_sqs):
         result = dispatch_tracking_jobs(db, "https://sqs.us-east-1.amazonaws.com/123/queue")
 
     assert result["dispatched"] == 2
-    assert mock_sqs.send_message.call_count == 2
+    assert result["messages"] == 2
+    assert mock_sqs.send_message_batch.call_count == 1
+    mock_sqs.send_message.assert_not_called()
 
-    # Verify message bodies contain correct book IDs
-    calls = mock_sqs.send_message.call_args_list
-    sent_book_ids = []
-    for call in calls:
-        body = json.loads(call[1]["MessageBody"])
-        sent_book_ids.append(body["book_id"])
+    messages = {msg["carrier"]: msg["book_ids"] for msg in _sent_messages(mock_sqs)}
+    assert messages == {"UPS": [sample_books[0].id], "FedEx": [sample_books[1].id]}
 
-    assert sample_books[0].id in sent_book_ids
-    assert sample_books[1].id in sent_book_ids
+
+def test_dispatch_tracking_jobs_splits_large_groups(db):
+    """Test that a carrier's books are split into messages and SQS batches of 10."""
+    db.add_all(
+        Book(
+            title=f"Book {i}",
+            tracking_active=True,
+            tracking_number=f"1Z{i}",
+            tracking_carrier="UPS",
+        )
+        for i in range(205)
+    )
+    db.commit()
+    mock_sqs = MagicMock()
+    mock_sqs.send_message_batch.return_value = {"Successful": [], "Failed": []}
+
+    with patch("app.workers.tracking_dispatcher.get_sqs_client", return_value=mock_sqs):
+        result = dispatch_tracking_jobs(db, "https://sqs.us-east-1.amazonaws.com/123/queue")
+
+    assert result["dispatched"] == 205
+    assert result["messages"] == 21
+    assert mock_sqs.send_message_batch.call_count == 3
+    messages = _sent_messages(mock_sqs)
+    assert [len(msg["book_ids"]) for msg in messages] == [10] * 20 + [5]
+    assert len({book_id for msg in messages for book_id in msg["book_ids"]}) == 205
+
+
+def test_dispatch_tracking_jobs_skips_open_circuits(db, sample_books):
+    """Test that books of carriers with an open circuit are not dispatched."""
+    mock_sqs = MagicMock()
+    mock_sqs.send_message_batch.return_value = {"Successful": [], "Failed": []}
+
+    with (
+        patch("app.workers.tracking_dispatcher.get_sqs_client", return_value=mock_sqs),
+        patch(
+            "app.workers.tracking_dispatcher.is_circuit_open",
+            side_effect=lambda _db, carrier: carrier == "UPS",
+        ),
+    ):
+        result = dispatch_tracking_jobs(db, "https://sqs.us-east-1.amazonaws.com/123/queue")
+
+    assert result["dispatched"] == 1
+    assert result["skipped_open_circuit"] == 1
+    assert [msg["carrier"] for msg in _sent_messages(mock_sqs)] == ["FedEx"]
+
+
+def test_dispatch_tracking_jobs_counts_failed_entries(db, sample_books):
+    """Test that books in messages SQS rejected are counted as failed."""
+    mock_sqs = MagicMock()
+    mock_sqs.send_message_batch.return_value = {
+        "Successful": [{"Id": "1"}],
+        "Failed": [{"Id": "0", "Code": "InternalError", "SenderFault": False}],
+    }
+
+    with patch("app.workers.tracking_dispatcher.get_sqs_client", return_value=mock_sqs):
+        result = dispatch_tracking_jobs(db, "https://sqs.us-east-1.amazonaws.com/123/queue")
+
+    assert result["dispatched"] == 1
+    assert result["failed"] == 1
+
+
+def test_dispatch_tracking_jobs_skips_books_without_carrier(db):
+    """Test that active books without a carrier are not dispatched."""
+    db.add(Book(title="No carrier", tracking_active=True, tracking_number="123"))
+    db.commit()
+    mock_sqs = MagicMock()
+
+    with patch("app.workers.tracking_dispatcher.get_sqs_client", return_value=mock_sqs):
+        result = dispatch_tracking_jobs(db, "https://sqs.us-east-1.amazonaws.com/123/queue")
+
+    assert result["dispatched"] == 0
+    assert result["skipped_no_carrier"] == 1
+    mock_sqs.send_message_batch.assert_not_called()
 
 
 def test_dispatch_tracking_jobs_skips_books_without_tracking_number(db, sample_books):
@@ -103,7 +182,7 @@ def test_dispatch_tracking_jobs_no_books(db):
         result = dispatch_tracking_jobs(db, "https://sqs.us-east-1.amazonaws.com/123/queue")
 
     assert result["dispatched"] == 0
-    mock_sqs.send_message.assert_not_called()
+    mock_sqs.send_message_batch.assert_not_called()
 
 
 def test_handler_raises_error_without_queue_url():
@@ -123,7 +202,7 @@ def test_handler_dispatches_jobs(db, sample_books, monkeypatch):
             result = handler({}, None)
 
     assert result["dispatched"] == 2
-    assert mock_sqs.send_message.call_count == 2
+    assert mock_sqs.send_message_batch.call_count == 1
 
 
 def test_dispatch_message_format(db, sample_books):
@@ -134,11 +213,11 @@ def test_dispatch_message_format(db, sample_books):
         dispatch_tracking_jobs(db, "https://sqs.us-east-1.amazonaws.com/123/queue")
 
     # Verify message structure
-    call_args = mock_sqs.send_message.call_args_list
-    for call in call_args:
+    for call in mock_sqs.send_message_batch.call_args_list:
         assert "QueueUrl" in call[1]
-        assert "MessageBody" in call[1]
+        for entry in call[1]["Entries"]:
+            assert set(entry) == {"Id", "MessageBody"}
 
-        body = json.loads(call[1]["MessageBody"])
-        assert "book_id" in body
-        assert isinstance(body["book_id"], int)
+            body = json.loads(entry["MessageBody"])
+            assert isinstance(body["carrier"], str)
+            assert all(isinstance(book_id, int) for book_id in body["book_ids"])
@@ -7,7 +7,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from app.models import Book
-from app.workers.tracking_worker import handler, process_tracking_job
+from app.models.carrier_circuit import CarrierCircuit
+from app.workers.tracking_worker import handler, process_tracking_batch, process_tracking_job
 
 
 @pytest.fixture
@@ -29,7 +30,7 @@ def test_process_tracking_job_success(db, sample_book):
     mock_result = MagicMock()
     mock_result.status = "Delivered"
 
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.return_value = mock_result
 
     with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
@@ -51,7 +52,7 @@ def test_process_tracking_job_sets_delivered_at(db, sample_book):
     mock_result = MagicMock()
     mock_result.status = "Delivered"
 
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.return_value = mock_result
 
     with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
@@ -73,7 +74,7 @@ def test_process_tracking_job_does_not_overwrite_delivered_at(db, sample_book):
     mock_result = MagicMock()
     mock_result.status = "Delivered"
 
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.return_value = mock_result
 
     with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
@@ -114,7 +115,7 @@ def test_process_tracking_job_circuit_open(db, sample_book):
 
 def test_process_tracking_job_carrier_api_failure(db, sample_book):
     """Test process_tracking_job records failure and raises exception on carrier error."""
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.side_effect = Exception("API Error")
 
     with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
@@ -131,7 +132,7 @@ def test_process_tracking_job_calls_record_success(db, sample_book):
     mock_result = MagicMock()
     mock_result.status = "In Transit"
 
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.return_value = mock_result
 
     with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
@@ -147,7 +148,7 @@ def test_handler_processes_messages(db, sample_book):
     mock_result = MagicMock()
     mock_result.status = "In Transit"
 
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.return_value = mock_result
 
     event = {
@@ -167,12 +168,28 @@ def test_handler_processes_messages(db, sample_book):
     assert result["batchItemFailures"] == []
 
 
+def test_handler_writes_circuit_failures_before_returning(db, sample_book):
+    """Test that written-behind circuit failures are flushed by the handler."""
+    mock_carrier = MagicMock(max_batch_size=1)
+    mock_carrier.fetch_tracking.side_effect = Exception("API Error")
+    carrier_name = sample_book.tracking_carrier
+
+    event = {"Records": [{"messageId": "msg-123", "body": json.dumps({"book_id": sample_book.id})}]}
+
+    with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
+        with patch("app.workers.tracking_worker.SessionLocal", return_value=db):
+            result = handler(event, None)
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "msg-123"}]
+    assert db.get(CarrierCircuit, carrier_name).failure_count == 1
+
+
 def test_handler_returns_failed_items(db, sample_book):
     """Test handler returns failed message IDs in batchItemFailures."""
     mock_result = MagicMock()
     mock_result.status = "In Transit"
 
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.return_value = mock_result
 
     event = {
@@ -196,7 +213,7 @@ def test_handler_returns_failed_items(db, sample_book):
 
 def test_handler_returns_failed_items_on_exception(db, sample_book):
     """Test handler returns message ID on actual exception."""
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.side_effect = Exception("API Error")
 
     event = {
@@ -237,7 +254,7 @@ def test_handler_multiple_messages(db):
     mock_result = MagicMock()
     mock_result.status = "In Transit"
 
-    mock_carrier = MagicMock()
+    mock_carrier = MagicMock(max_batch_size=1)
     mock_carrier.fetch_tracking.return_value = mock_result
 
     event = {
@@ -260,3 +277,206 @@ def test_handler_multiple_messages(db):
 
     assert result["batchItemFailures"] == []
     assert mock_carrier.fetch_tracking.call_count == 2
+
+
+def test_process_tracking_batch_updates_all_books(db):
+    """Test process_tracking_batch loads the books once and checks the circuit once."""
+    books = [
+        Book(title=f"Book {i}", tracking_number=f"1Z{i}", tracking_carrier="UPS") for i in range(3)
+    ]
+    db.add_all(books)
+    db.commit()
+
+    mock_result = MagicMock()
+    mock_result.status = "In Transit"
+    mock_carrier = MagicMock(max_batch_size=1)
+    mock_carrier.fetch_tracking.return_value = mock_result
+
+    with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
+        with patch("app.workers.tracking_worker.is_circuit_open", return_value=False) as mock_open:
+            result = process_tracking_batch(db, [b.id for b in books] + [99999])
+
+    assert result == {"updated": 3, "skipped": 1, "failed": []}
+    assert mock_open.call_count == 1
+    for book in books:
+        db.refresh(book)
+        assert book.tracking_status == "In Transit"
+
+
+def test_process_tracking_batch_skips_books_without_tracking_number(db):
+    """Test that books without a tracking number are skipped, not sent to the carrier."""
+    tracked = Book(title="Tracked", tracking_number="1Z0", tracking_carrier="UPS")
+    untracked = Book(title="Untracked", tracking_carrier="UPS")
+    db.add_all([tracked, untracked])
+    db.commit()
+
+    mock_result = MagicMock()
+    mock_result.status = "In Transit"
+    mock_carrier = MagicMock(max_batch_size=1)
+    mock_carrier.fetch_tracking.return_value = mock_result
+
+    with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
+        with patch("app.workers.tracking_worker.is_circuit_open", return_value=False):
+            result = process_tracking_batch(db, [tracked.id, untracked.id])
+
+    assert result == {"updated": 1, "skipped": 1, "failed": []}
+    mock_carrier.fetch_tracking.assert_called_once_with("1Z0")
+
+
+def test_process_tracking_batch_records_failures_per_book(db):
+    """Test that failed fetches are recorded per book without failing the others."""
+    books = [
+        Book(title=f"Book {i}", tracking_number=f"1Z{i}", tracking_carrier="UPS") for i in range(3)
+    ]
+    db.add_all(books)
+    db.commit()
+
+    mock_result = MagicMock()
+    mock_result.status = "In Transit"
+    mock_carrier = MagicMock(max_batch_size=1)
+    mock_carrier.fetch_tracking.side_effect = lambda number: (
+        mock_result if number == "1Z0" else Exception("API Error")
+    )
+
+    with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
+        with patch("app.workers.tracking_worker.is_circuit_open", return_value=False):
+            with (
+                patch("app.workers.tracking_worker.record_failure") as mock_failure,
+                patch("app.workers.tracking_worker.record_success") as mock_success,
+            ):
+                result = process_tracking_batch(db, [b.id for b in books])
+
+    assert result == {"updated": 1, "skipped": 0, "failed": [books[1].id, books[2].id]}
+    assert mock_failure.call_count == 2
+    mock_success.assert_called_once_with(db, "UPS")
+    db.refresh(books[0])
+    assert books[0].tracking_status == "In Transit"
+
+
+def test_process_tracking_batch_skips_fetch_when_circuit_open(db):
+    """Test that no carrier call is made for a carrier with an open circuit."""
+    book = Book(title="Book", tracking_number="1Z0", tracking_carrier="UPS")
+    db.add(book)
+    db.commit()
+    mock_carrier = MagicMock(max_batch_size=1)
+
+    with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
+        with patch("app.workers.tracking_worker.is_circuit_open", return_value=True):
+            result = process_tracking_batch(db, [book.id])
+
+    assert result["failed"] == [book.id]
+    mock_carrier.fetch_tracking.assert_not_called()
+
+
+def test_handler_processes_carrier_group_messages(db):
+    """Test handler accepts dispatcher carrier-group messages."""
+    book = Book(title="Book 1", tracking_number="1Z123", tracking_carrier="UPS")
+    db.add(book)
+    db.commit()
+
+    mock_result = MagicMock()
+    mock_result.status = "Delivered"
+    mock_carrier = MagicMock(max_batch_size=1)
+    mock_carrier.fetch_tracking.return_value = mock_result
+
+    event = {
+        "Records": [
+            {
+                "messageId": "msg-1",
+                "body": json.dumps({"carrier": "UPS", "book_ids": [book.id]}),
+            }
+        ]
+    }
+
+    with patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier):
+        with patch("app.workers.tracking_worker.is_circuit_open", return_value=False):
+            with patch("app.workers.tracking_worker.SessionLocal", return_value=db):
+                result = handler(event, None)
+
+    assert result["batchItemFailures"] == []
+    mock_carrier.fetch_tracking.assert_called_once_with("1Z123")
+
+
+def _group_event(book_ids, **extra):
+    body = {"carrier": "UPS", "book_ids": book_ids, **extra}
+    return {"Records": [{"messageId": "msg-1", "body": json.dumps(body)}]}
+
+
+def _failing_group(db):
+    """Three UPS books; fetching tracking for all but the first fails."""
+    books = [
+        Book(title=f"Book {i}", tracking_number=f"1Z{i}", tracking_carrier="UPS") for i in range(3)
+    ]
+    db.add_all(books)
+    db.commit()
+    mock_result = MagicMock()
+    mock_result.status = "In Transit"
+    mock_carrier = MagicMock(max_batch_size=1)
+    mock_carrier.fetch_tracking.side_effect = lambda number: (
+        mock_result if number == "1Z0" else Exception("API Error")
+    )
+    return books, mock_carrier
+
+
+def test_handler_requeues_only_failed_books(db, monkeypatch):
+    """Test a partly failed carrier group is acknowledged and its failures re-enqueued."""
+    monkeypatch.setenv("TRACKING_QUEUE_URL", "https://sqs.example/tracking")
+    books, mock_carrier = _failing_group(db)
+    book_ids = [b.id for b in books]
+    mock_sqs = MagicMock()
+
+    with (
+        patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier),
+        patch("app.workers.tracking_worker.is_circuit_open", return_value=False),
+        patch("app.workers.tracking_worker.SessionLocal", return_value=db),
+        patch("app.workers.tracking_worker.get_sqs_client", return_value=mock_sqs),
+    ):
+        result = handler(_group_event(book_ids), None)
+
+    assert result["batchItemFailures"] == []
+    mock_sqs.send_message.assert_called_once()
+    sent = mock_sqs.send_message.call_args.kwargs
+    assert sent["QueueUrl"] == "https://sqs.example/tracking"
+    assert json.loads(sent["MessageBody"]) == {
+        "carrier": "UPS",
+        "book_ids": book_ids[1:],
+        "attempt": 2,
+    }
+
+
+def test_handler_fails_message_on_last_attempt(db, monkeypatch):
+    """Test failures on the last attempt go back to SQS redelivery (and the DLQ)."""
+    monkeypatch.setenv("TRACKING_QUEUE_URL", "https://sqs.example/tracking")
+    books, mock_carrier = _failing_group(db)
+    book_ids = [b.id for b in books]
+    mock_sqs = MagicMock()
+
+    with (
+        patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier),
+        patch("app.workers.tracking_worker.is_circuit_open", return_value=False),
+        patch("app.workers.tracking_worker.SessionLocal", return_value=db),
+        patch("app.workers.tracking_worker.get_sqs_client", return_value=mock_sqs),
+    ):
+        result = handler(_group_event(book_ids, attempt=3), None)
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "msg-1"}]
+    mock_sqs.send_message.assert_not_called()
+    assert db.get(Book, book_ids[0]).tracking_status == "In Transit"
+
+
+def test_handler_fails_message_when_requeue_fails(db, monkeypatch):
+    """Test the whole message is retried if the failed books can't be re-enqueued."""
+    monkeypatch.setenv("TRACKING_QUEUE_URL", "https://sqs.example/tracking")
+    books, mock_carrier = _failing_group(db)
+    mock_sqs = MagicMock()
+    mock_sqs.send_message.side_effect = Exception("SQS unavailable")
+
+    with (
+        patch("app.workers.tracking_worker.get_carrier", return_value=mock_carrier),
+        patch("app.workers.tracking_worker.is_circuit_open", return_value=False),
+        patch("app.workers.tracking_worker.SessionLocal", return_value=db),
+        patch("app.workers.tracking_worker.get_sqs_client", return_value=mock_sqs),
+    ):
+        result = handler(_group_event([b.id for b in books]), None)
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "msg-1"}]
@@ -414,7 +414,10 @@ module "lambda" {
       BMX_ENTITY_MATCH_THRESHOLD_AUTHOR    = tostring(var.entity_match_threshold_author)
       # ElastiCache for dashboard caching (#1002)
       BMX_REDIS_URL = var.enable_elasticache ? module.elasticache[0].redis_endpoint : ""
+      # Connection reuse across warm invocations (null = NullPool, persistent = pre-pinged pool)
+      BMX_DATABASE_POOL_MODE = var.database_pool_mode
     },
+    var.database_proxy_host != null ? { BMX_DATABASE_PROXY_HOST = var.database_proxy_host } : {},
     # Database secret ARN (use module output for staging, explicit ARN for prod)
     var.enable_database ? {
       BMX_DATABASE_SECRET_ARN = module.database_secret[0].arn
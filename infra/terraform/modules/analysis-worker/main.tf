@@ -54,7 +54,8 @@ resource "aws_lambda_function" "worker" {
   environment {
     variables = merge(
       {
-        ENVIRONMENT = var.environment
+        ENVIRONMENT                 = var.environment
+        ANALYSIS_WORKER_CONCURRENCY = tostring(var.job_concurrency)
       },
       var.environment_variables
     )
@@ -93,7 +94,7 @@ resource "aws_lambda_function" "worker" {
 resource "aws_lambda_event_source_mapping" "sqs_trigger" {
   event_source_arn = aws_sqs_queue.jobs.arn
   function_name    = aws_lambda_function.worker.arn
-  batch_size       = 1 # Process one job at a time
+  batch_size       = var.batch_size
 
   # Only succeed if function completes successfully
   function_response_types = ["ReportBatchItemFailures"]
@@ -76,6 +76,18 @@ variable "reserved_concurrency" {
   default     = 5
 }
 
+variable "batch_size" {
+  description = "SQS messages per invocation (jobs run in waves of job_concurrency; size the timeout for the slowest wave)"
+  type        = number
+  default     = 1
+}
+
+variable "job_concurrency" {
+  description = "Jobs an invocation runs at once; parallel Bedrock calls peak at reserved_concurrency x job_concurrency"
+  type        = number
+  default     = 1
+}
+
 variable "runtime" {
   description = "Lambda runtime"
   type        = string
@@ -141,6 +141,21 @@ resource "aws_iam_role_policy" "worker_sqs" {
   })
 }
 
+# Re-enqueues the failed books of a partly failed carrier group
+resource "aws_iam_role_policy" "worker_sqs_requeue" {
+  name = "sqs-requeue"
+  role = aws_iam_role.worker.id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect   = "Allow"
+      Action   = ["sqs:SendMessage"]
+      Resource = aws_sqs_queue.jobs.arn
+    }]
+  })
+}
+
 resource "aws_iam_role_policy" "worker_secrets" {
   count = length(var.secrets_arns) > 0 ? 1 : 0
   name  = "secrets-access"
@@ -237,7 +252,7 @@ resource "aws_lambda_function" "worker" {
 
   environment {
     variables = merge(
-      { ENVIRONMENT = var.environment },
+      { ENVIRONMENT = var.environment, TRACKING_QUEUE_URL = aws_sqs_queue.jobs.url },
       var.environment_variables
     )
   }
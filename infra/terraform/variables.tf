@@ -86,6 +86,23 @@ variable "db_password" {
   default     = null
 }
 
+variable "database_pool_mode" {
+  type        = string
+  description = "API Lambda DB pooling: 'null' (connection per request) or 'persistent' (one pre-pinged connection per warm container)"
+  default     = "persistent"
+
+  validation {
+    condition     = contains(["null", "persistent"], var.database_pool_mode)
+    error_message = "database_pool_mode must be 'null' or 'persistent'."
+  }
+}
+
+variable "database_proxy_host" {
+  type        = string
+  description = "Optional RDS Proxy / pgbouncer endpoint used instead of the host in the database secret"
+  default     = null
+}
+
 variable "database_secret_arn" {
   type        = string
   description = "Explicit database secret ARN (for prod where database is managed externally)"